@@ -43,6 +43,9 @@ def load_environment() -> None:
 def clear_session() -> None:
     """Clear all session data for a fresh start."""
     if SESSION_DIR.exists():
+        from haytham.state.vector_db import release_state_db
+
+        release_state_db(SESSION_DIR / "vector_db")
         shutil.rmtree(SESSION_DIR)
     SESSION_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -139,11 +142,11 @@ def get_artifact_counts() -> dict[str, int]:
     """
     try:
         # Lazy import to avoid circular deps
-        from haytham.state.vector_db import SystemStateDB
+        from haytham.state.vector_db import get_state_db
 
         db_path = SESSION_DIR / "vector_db"
         if db_path.exists():
-            db = SystemStateDB(str(db_path))
+            db = get_state_db(str(db_path))
             return {
                 "capabilities": len(db.get_capabilities()),
                 "decisions": len(db.get_decisions()),
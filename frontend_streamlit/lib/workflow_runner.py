@@ -7,9 +7,10 @@ Uses callbacks for progress updates instead of Chainlit messages.
 import json
 import logging
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any
 
 from lib.session_utils import load_environment, setup_paths
 
@@ -18,12 +19,10 @@ load_environment()
 
 from haytham.agents.utils.web_search import reset_session_counter
 from haytham.session.session_manager import SessionManager
+from haytham.workflow.dag_executor import run_workflows
 from haytham.workflow.stage_registry import WorkflowType, get_stage_registry
-from haytham.workflow.workflow_factories import (
-    WORKFLOW_TERMINAL_STAGES,
-    create_idea_validation_workflow,
-    create_workflow_for_type,
-)
+from haytham.workflow.stage_stream import StreamUpdate
+from haytham.workflow.workflow_factories import WORKFLOW_TERMINAL_STAGES
 
 logger = logging.getLogger(__name__)
 
@@ -60,8 +59,7 @@ class WorkflowConfig:
 
     workflow_type: WorkflowType
     workflow_slug: str  # e.g., "idea-validation"
-    factory_fn: Callable  # e.g., create_idea_validation_workflow
-    factory_kwargs: dict = field(default_factory=dict)
+    run_kwargs: dict = field(default_factory=dict)  # Passed to run_workflows
     pre_run: Callable | None = None  # Called with (session_manager, session_dir)
     post_run: Callable | None = None  # Called with (state, session_dir) -> recommendation
 
@@ -86,17 +84,22 @@ def run_workflow(
     session_dir: Path,
     on_stage_start: Callable[[StageProgress], None] | None = None,
     on_stage_complete: Callable[[StageProgress], None] | None = None,
+    on_stage_stream: Callable[[StageProgress, StreamUpdate], None] | None = None,
 ) -> WorkflowResult:
     """Run a workflow synchronously using the provided config.
 
     Creates session manager, runs workflow, returns result.
     Calls back on_stage_start/on_stage_complete for UI updates.
+    Stages run through ``run_workflows``, so ``WORKFLOW_EXECUTION_MODE``
+    selects linear or DAG execution.
 
     Args:
         config: Workflow configuration
         session_dir: Path to session directory
         on_stage_start: Callback when a stage starts
         on_stage_complete: Callback when a stage completes
+        on_stage_stream: Callback with throttled incremental agent output for
+            the running stage. Called from agent threads, not the caller's.
 
     Returns:
         WorkflowResult with status and stage progress
@@ -116,6 +119,7 @@ def run_workflow(
 
     # Stage progress tracking
     stages_progress: list[StageProgress] = []
+    running: dict[str, StageProgress] = {}
 
     def handle_stage_start(stage_name: str, index: int, total: int):
         """Handle stage start callback from workflow."""
@@ -130,6 +134,7 @@ def run_workflow(
             total_stages=total,
         )
 
+        running[stage_name] = progress
         logger.info(f"Stage started: {display_name} ({index + 1}/{total})")
 
         if on_stage_start:
@@ -138,6 +143,16 @@ def run_workflow(
             except Exception as e:
                 logger.error(f"on_stage_start callback error: {e}")
 
+    def handle_stage_stream(update: StreamUpdate):
+        """Handle incremental agent output for the running stage."""
+        progress = running.get(update.stage)
+        if progress is None or on_stage_stream is None:
+            return
+        try:
+            on_stage_stream(progress, update)
+        except Exception as e:
+            logger.error(f"on_stage_stream callback error: {e}")
+
     def handle_stage_complete(stage_name: str, index: int, total: int, result: dict):
         """Handle stage complete callback from workflow."""
         slug, display_name, display_index = _get_stage_display_info(stage_name)
@@ -161,43 +176,42 @@ def run_workflow(
             except Exception as e:
                 logger.error(f"on_stage_complete callback error: {e}")
 
-    # Create and run workflow
+    # Run workflow (records workflow completion in the run tracker)
     try:
-        app = config.factory_fn(
-            session_manager=session_manager,
-            on_stage_start=handle_stage_start,
-            on_stage_complete=handle_stage_complete,
-            enable_tracking=False,
-            **config.factory_kwargs,
-        )
-
-        # Run to completion
         terminal_stage = WORKFLOW_TERMINAL_STAGES[config.workflow_type]
         logger.info(f"Running {config.workflow_slug} workflow to terminal stage: {terminal_stage}")
 
-        action, result, state = app.run(halt_after=[terminal_stage])
+        result = run_workflows(
+            [config.workflow_type],
+            session_manager,
+            on_stage_start=handle_stage_start,
+            on_stage_complete=handle_stage_complete,
+            on_stage_stream=handle_stage_stream if on_stage_stream else None,
+            **config.run_kwargs,
+        )
 
-        final_status = state.get(f"{terminal_stage}_status", "completed")
+        final_status = result.statuses.get(terminal_stage, "failed")
         execution_time = time.time() - start_time
 
         # Run post-run hook (e.g., extract recommendation, count stories)
         recommendation = None
         if config.post_run:
-            recommendation = config.post_run(state, session_dir)
+            recommendation = config.post_run(result.state, session_dir)
 
         logger.info(
             f"{config.workflow_slug} workflow completed in {execution_time:.1f}s "
             f"(status={final_status})"
         )
 
-        if final_status == "completed":
-            session_manager.run_tracker.record_workflow_complete(config.workflow_slug)
+        # First error in stage order (e.g., OVERRIDABLE entry conditions)
+        error = next(iter(result.errors.values()), None)
 
         return WorkflowResult(
             workflow_type=config.workflow_slug,
             status="completed" if final_status == "completed" else "failed",
             stages=stages_progress,
             execution_time=execution_time,
+            error=None if final_status == "completed" else error,
             recommendation=recommendation,
         )
 
@@ -226,6 +240,9 @@ def _idea_validation_pre_run(
     if clear_existing and session_dir.exists():
         import shutil
 
+        from haytham.state.vector_db import release_state_db
+
+        release_state_db(session_dir / "vector_db")
         shutil.rmtree(session_dir)
         session_dir.mkdir(parents=True, exist_ok=True)
 
@@ -291,26 +308,17 @@ def run_idea_validation(
     on_stage_complete: Callable[[StageProgress], None] | None = None,
     clear_existing: bool = True,
     archetype: str | None = None,
+    on_stage_stream: Callable[[StageProgress, StreamUpdate], None] | None = None,
 ) -> WorkflowResult:
     """Run Idea Validation workflow synchronously."""
     config = WorkflowConfig(
         workflow_type=WorkflowType.IDEA_VALIDATION,
         workflow_slug="idea-validation",
-        factory_fn=create_idea_validation_workflow,
-        factory_kwargs={"system_goal": system_goal, "archetype": archetype},
+        run_kwargs={"system_goal": system_goal, "archetype": archetype or ""},
         pre_run=lambda sm, sd: _idea_validation_pre_run(sm, sd, system_goal, clear_existing),
         post_run=_extract_recommendation,
     )
-    return run_workflow(config, session_dir, on_stage_start, on_stage_complete)
-
-
-def _factory_for_type(workflow_type: WorkflowType) -> Callable:
-    """Return a factory callable that delegates to create_workflow_for_type."""
-
-    def _factory(**kwargs):
-        return create_workflow_for_type(workflow_type, **kwargs)
-
-    return _factory
+    return run_workflow(config, session_dir, on_stage_start, on_stage_complete, on_stage_stream)
 
 
 def run_mvp_specification(
@@ -318,58 +326,58 @@ def run_mvp_specification(
     on_stage_start: Callable[[StageProgress], None] | None = None,
     on_stage_complete: Callable[[StageProgress], None] | None = None,
     force_override: bool = False,
+    on_stage_stream: Callable[[StageProgress, StreamUpdate], None] | None = None,
 ) -> WorkflowResult:
     """Run MVP Specification workflow synchronously."""
     config = WorkflowConfig(
         workflow_type=WorkflowType.MVP_SPECIFICATION,
         workflow_slug="mvp-specification",
-        factory_fn=_factory_for_type(WorkflowType.MVP_SPECIFICATION),
-        factory_kwargs={"force_override": force_override},
+        run_kwargs={"force_override": force_override},
     )
-    return run_workflow(config, session_dir, on_stage_start, on_stage_complete)
+    return run_workflow(config, session_dir, on_stage_start, on_stage_complete, on_stage_stream)
 
 
 def run_build_buy_analysis(
     session_dir: Path,
     on_stage_start: Callable[[StageProgress], None] | None = None,
     on_stage_complete: Callable[[StageProgress], None] | None = None,
+    on_stage_stream: Callable[[StageProgress, StreamUpdate], None] | None = None,
 ) -> WorkflowResult:
     """Run Build vs Buy Analysis workflow synchronously."""
     config = WorkflowConfig(
         workflow_type=WorkflowType.BUILD_BUY_ANALYSIS,
         workflow_slug="build-buy-analysis",
-        factory_fn=_factory_for_type(WorkflowType.BUILD_BUY_ANALYSIS),
     )
-    return run_workflow(config, session_dir, on_stage_start, on_stage_complete)
+    return run_workflow(config, session_dir, on_stage_start, on_stage_complete, on_stage_stream)
 
 
 def run_architecture_decisions(
     session_dir: Path,
     on_stage_start: Callable[[StageProgress], None] | None = None,
     on_stage_complete: Callable[[StageProgress], None] | None = None,
+    on_stage_stream: Callable[[StageProgress, StreamUpdate], None] | None = None,
 ) -> WorkflowResult:
     """Run Architecture Decisions workflow synchronously."""
     config = WorkflowConfig(
         workflow_type=WorkflowType.ARCHITECTURE_DECISIONS,
         workflow_slug="architecture-decisions",
-        factory_fn=_factory_for_type(WorkflowType.ARCHITECTURE_DECISIONS),
     )
-    return run_workflow(config, session_dir, on_stage_start, on_stage_complete)
+    return run_workflow(config, session_dir, on_stage_start, on_stage_complete, on_stage_stream)
 
 
 def run_story_generation(
     session_dir: Path,
     on_stage_start: Callable[[StageProgress], None] | None = None,
     on_stage_complete: Callable[[StageProgress], None] | None = None,
+    on_stage_stream: Callable[[StageProgress, StreamUpdate], None] | None = None,
 ) -> WorkflowResult:
     """Run Story Generation workflow synchronously."""
     config = WorkflowConfig(
         workflow_type=WorkflowType.STORY_GENERATION,
         workflow_slug="story-generation",
-        factory_fn=_factory_for_type(WorkflowType.STORY_GENERATION),
         post_run=_count_stories,
     )
-    return run_workflow(config, session_dir, on_stage_start, on_stage_complete)
+    return run_workflow(config, session_dir, on_stage_start, on_stage_complete, on_stage_stream)
 
 
 def get_workflow_status(session_dir: Path) -> dict[str, Any]:
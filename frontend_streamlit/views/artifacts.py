@@ -18,11 +18,11 @@ SESSION_DIR = get_session_dir()
 def load_capabilities():
     """Load capabilities from VectorDB."""
     try:
-        from haytham.state.vector_db import SystemStateDB
+        from haytham.state.vector_db import get_state_db
 
         db_path = SESSION_DIR / "vector_db"
         if db_path.exists():
-            db = SystemStateDB(str(db_path))
+            db = get_state_db(str(db_path))
             caps = db.get_capabilities()
             return caps
     except Exception as e:
@@ -34,11 +34,11 @@ def load_capabilities():
 def load_decisions():
     """Load decisions from VectorDB."""
     try:
-        from haytham.state.vector_db import SystemStateDB
+        from haytham.state.vector_db import get_state_db
 
         db_path = SESSION_DIR / "vector_db"
         if db_path.exists():
-            db = SystemStateDB(str(db_path))
+            db = get_state_db(str(db_path))
             return db.get_decisions()
     except Exception as e:
         st.error(f"Error loading decisions: {e}")
@@ -49,11 +49,11 @@ def load_decisions():
 def load_entities():
     """Load entities from VectorDB."""
     try:
-        from haytham.state.vector_db import SystemStateDB
+        from haytham.state.vector_db import get_state_db
 
         db_path = SESSION_DIR / "vector_db"
         if db_path.exists():
-            db = SystemStateDB(str(db_path))
+            db = get_state_db(str(db_path))
             return db.get_entities()
     except Exception as e:
         st.error(f"Error loading entities: {e}")
@@ -28,11 +28,11 @@ def load_startup_idea():
 def load_artifact_counts():
     """Load artifact counts from VectorDB."""
     try:
-        from haytham.state.vector_db import SystemStateDB
+        from haytham.state.vector_db import get_state_db
 
         db_path = SESSION_DIR / "vector_db"
         if db_path.exists():
-            db = SystemStateDB(str(db_path))
+            db = get_state_db(str(db_path))
             return {
                 "capabilities": len(db.get_capabilities()),
                 "decisions": len(db.get_decisions()),
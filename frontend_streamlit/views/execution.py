@@ -6,11 +6,41 @@ setup_paths()
 load_environment()
 
 import json  # noqa: E402
+import threading  # noqa: E402
 
 import streamlit as st  # noqa: E402
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx  # noqa: E402
 
 SESSION_DIR = get_session_dir()
 
+# Characters of streamed agent output shown under the running stage
+STREAM_PREVIEW_CHARS = 600
+
+
+def stream_to_placeholders(stage_placeholders: dict):
+    """Build an on_stage_stream callback rendering live output per stage.
+
+    Updates arrive on agent threads (already throttled by the workflow), so
+    the callback attaches this script run's context before drawing.
+    """
+    ctx = get_script_run_ctx()
+
+    def on_stage_stream(progress, update):
+        placeholder = stage_placeholders.get(progress.stage_slug)
+        if placeholder is None or update.final:
+            return  # on_stage_complete replaces the preview
+        add_script_run_ctx(threading.current_thread(), ctx)
+        with placeholder.container():
+            st.markdown(f"Running: **{progress.display_name}**...")
+            if update.tools:
+                st.caption("Tools: " + ", ".join(update.tools[-3:]))
+            preview = "\n\n".join(update.text.values())[-STREAM_PREVIEW_CHARS:]
+            if preview:
+                st.text(preview)
+
+    return on_stage_stream
+
+
 # Center the Streamlit "running" indicator while workflows execute
 # (inspired by streamlit-extras customize_running)
 st.markdown(
@@ -635,6 +665,7 @@ if new_idea:
         session_dir=SESSION_DIR,
         on_stage_start=on_stage_start,
         on_stage_complete=on_stage_complete,
+        on_stage_stream=stream_to_placeholders(stage_placeholders),
         clear_existing=True,
         archetype=st.session_state.get("idea_archetype"),
     )
@@ -795,6 +826,7 @@ if run_mvp:
         session_dir=SESSION_DIR,
         on_stage_start=on_stage_start,
         on_stage_complete=on_stage_complete,
+        on_stage_stream=stream_to_placeholders(stage_placeholders),
         force_override=force_override,
     )
 
@@ -941,6 +973,7 @@ if run_build_buy:
         session_dir=SESSION_DIR,
         on_stage_start=on_stage_start,
         on_stage_complete=on_stage_complete,
+        on_stage_stream=stream_to_placeholders(stage_placeholders),
     )
 
     if result.status == "completed":
@@ -1050,6 +1083,7 @@ if run_architecture:
         session_dir=SESSION_DIR,
         on_stage_start=on_stage_start,
         on_stage_complete=on_stage_complete,
+        on_stage_stream=stream_to_placeholders(stage_placeholders),
     )
 
     if result.status == "completed":
@@ -1161,6 +1195,7 @@ if run_story:
         session_dir=SESSION_DIR,
         on_stage_start=on_stage_start,
         on_stage_complete=on_stage_complete,
+        on_stage_stream=stream_to_placeholders(stage_placeholders),
     )
 
     if result.status == "completed":
@@ -16,6 +16,8 @@ from strands.hooks import (
     HookRegistry,
 )
 
+from haytham.agents.utils.prompt_cache import cache_hit_ratio, result_usage
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,15 +75,18 @@ class HaythamAgentHooks(HookProvider):
 
     def _log_cache_metrics(self, agent_name: str, result) -> None:
         """Log Bedrock prompt/tool cache hit/write metrics."""
-        metrics = getattr(result, "metrics", None)
-        usage = getattr(metrics, "accumulated_usage", None) if metrics else None
+        usage = result_usage(result)
         if not usage:
             return
 
         cache_write = usage.get("cacheWriteInputTokens", 0)
         cache_read = usage.get("cacheReadInputTokens", 0)
         if cache_write or cache_read:
-            logger.info(f"Agent {agent_name} cache: write={cache_write} read={cache_read} tokens")
+            ratio = cache_hit_ratio(usage.get("inputTokens", 0), cache_read, cache_write)
+            logger.info(
+                f"Agent {agent_name} cache: write={cache_write} read={cache_read} tokens "
+                f"({ratio:.0%} of input read from cache)"
+            )
 
     def _record_span_attributes(self, agent_name: str, stop_reason: str) -> None:
         """Record execution metadata to current OTEL span if available."""
@@ -11,7 +11,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from haytham.state import SystemStateDB, TitanEmbedder
+from haytham.state import SystemStateDB, TitanEmbedder, get_state_db
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +60,7 @@ class StateReaderAgent:
         Returns:
             Configured StateReaderAgent instance
         """
-        db = SystemStateDB(db_path, embedder=embedder)
+        db = get_state_db(db_path, embedder=embedder)
         return cls(db)
 
     # ==========================================================================
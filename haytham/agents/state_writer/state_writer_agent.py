@@ -20,6 +20,7 @@ from haytham.state import (
     create_constraint,
     create_decision,
     create_entity,
+    get_state_db,
 )
 
 logger = logging.getLogger(__name__)
@@ -78,7 +79,7 @@ class StateWriterAgent:
         Returns:
             Configured StateWriterAgent instance
         """
-        db = SystemStateDB(db_path, embedder=embedder)
+        db = get_state_db(db_path, embedder=embedder)
         return cls(db)
 
     # ==========================================================================
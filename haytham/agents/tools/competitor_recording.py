@@ -1,8 +1,9 @@
 """Competitor analysis recording tools.
 
 Server-side accumulator for structured data captured alongside the competitor
-analysis agent's markdown prose.  Follows the same accumulator + clear/get
-lifecycle pattern as ``recommendation.py``.
+analysis agent's markdown prose.  Follows the same context-scoped accumulator
++ clear/get lifecycle pattern as ``recommendation.py``, so concurrent
+validations do not mix their competitors.
 
 The agent calls ``record_competitor``, ``record_sentiment``, and
 ``record_market_positioning`` as it works.  The stage executor brackets each
@@ -10,39 +11,61 @@ run with ``clear_competitor_accumulator()`` before and
 ``get_competitor_data()`` after to harvest the structured fields.
 """
 
+from contextvars import ContextVar
+
 from strands import tool
 
 # ---------------------------------------------------------------------------
-# Module-level accumulator (same pattern as recommendation.py)
+# Context-scoped accumulator (same pattern as recommendation.py)
 # ---------------------------------------------------------------------------
 
-_accumulator: dict = {
-    "competitors": [],
-    "sentiment": [],
-    "market_positioning": {},
-}
+_accumulator: ContextVar[dict] = ContextVar("competitor_accumulator")
 
 _JTBD_MATCH_VALUES = frozenset({"Direct", "Adjacent", "Unrelated"})
 _REVENUE_TAG_VALUES = frozenset({"Priced", "Freemium-Dominant", "No-Pricing-Found"})
 _SWITCHING_COST_VALUES = frozenset({"Low", "Medium", "High"})
 
 
+def _new_accumulator() -> dict:
+    return {"competitors": [], "sentiment": [], "market_positioning": {}}
+
+
+def _get_accumulator() -> dict:
+    """Return the accumulator for the current context, creating it if unset."""
+    try:
+        return _accumulator.get()
+    except LookupError:
+        acc = _new_accumulator()
+        _accumulator.set(acc)
+        return acc
+
+
 def clear_competitor_accumulator() -> None:
     """Reset the accumulator to empty state."""
-    _accumulator["competitors"] = []
-    _accumulator["sentiment"] = []
-    _accumulator["market_positioning"] = {}
+    _accumulator.set(_new_accumulator())
 
 
 def get_competitor_data() -> dict:
     """Return a copy of the current accumulator state."""
+    acc = _get_accumulator()
     return {
-        "competitors": list(_accumulator["competitors"]),
-        "sentiment": list(_accumulator["sentiment"]),
-        "market_positioning": dict(_accumulator["market_positioning"]),
+        "competitors": list(acc["competitors"]),
+        "sentiment": list(acc["sentiment"]),
+        "market_positioning": dict(acc["market_positioning"]),
     }
 
 
+def restore_competitor_data(data: dict) -> None:
+    """Replace the accumulator with previously captured ``get_competitor_data()`` output."""
+    _accumulator.set(
+        {
+            "competitors": list(data.get("competitors", [])),
+            "sentiment": list(data.get("sentiment", [])),
+            "market_positioning": dict(data.get("market_positioning", {})),
+        }
+    )
+
+
 # ---------------------------------------------------------------------------
 # @tool functions (scalar parameters, no LLM calls)
 # ---------------------------------------------------------------------------
@@ -78,7 +101,8 @@ def record_competitor(
             f"Re-call with a valid value."
         )
 
-    _accumulator["competitors"].append(
+    acc = _get_accumulator()
+    acc["competitors"].append(
         {
             "name": name,
             "url": url,
@@ -87,7 +111,7 @@ def record_competitor(
             "jtbd_match": jtbd_match,
         }
     )
-    n = len(_accumulator["competitors"])
+    n = len(acc["competitors"])
     return f"Recorded competitor '{name}' (JTBD: {jtbd_match}). Total competitors: {n}"
 
 
@@ -113,7 +137,8 @@ def record_sentiment(
     Returns:
         Confirmation message.
     """
-    _accumulator["sentiment"].append(
+    acc = _get_accumulator()
+    acc["sentiment"].append(
         {
             "competitor": competitor,
             "love": love,
@@ -122,7 +147,7 @@ def record_sentiment(
             "source": source,
         }
     )
-    n = len(_accumulator["sentiment"])
+    n = len(acc["sentiment"])
     return f"Recorded sentiment for '{competitor}'. Total sentiment entries: {n}"
 
 
@@ -167,7 +192,7 @@ def record_market_positioning(
             f"Re-call with a valid value."
         )
 
-    _accumulator["market_positioning"] = {
+    _get_accumulator()["market_positioning"] = {
         "revenue_evidence_tag": revenue_evidence_tag,
         "switching_cost": switching_cost,
         "price_range_low": price_range_low,
@@ -5,8 +5,9 @@ The agent records knockouts, dimension scores, and counter-signals via scalar-
 parameter tools. The verdict is computed deterministically by
 ``build_scorer_output()`` after the agent finishes.
 
-A module-level ``_scorecard`` accumulator collects items across tool calls
-(same pattern as ``context_retrieval.py``).  Lifecycle helpers
+A context-scoped ``_scorecard`` accumulator collects items across tool calls,
+so concurrent validations (Streamlit sessions, DAG stages) each see their
+own scorecard.  Lifecycle helpers
 ``init_scorecard()`` / ``clear_scorecard()`` / ``get_scorecard()`` are plain
 functions used by the stage executor to bracket each agent run.
 ``init_scorecard(risk_level=...)`` pre-sets authoritative upstream values
@@ -26,6 +27,7 @@ Decision rules (Robert Cooper Stage-Gate inspired):
 
 import json
 import re
+from contextvars import ContextVar
 
 from strands import tool
 
@@ -127,11 +129,12 @@ def _validate_evidence(score: int, evidence: str) -> str | None:
 # ---------------------------------------------------------------------------
 # Module-level scorecard accumulator
 # ---------------------------------------------------------------------------
-# Uses a plain module-level dict instead of threading.local() because the
-# Strands SDK runs agents in a ThreadPoolExecutor worker thread. Thread-local
-# storage would isolate the main thread (init/clear/build) from the worker
-# thread (tools). The init -> agent run -> build -> clear lifecycle ensures
-# there's no concurrent access.
+# Held in a ContextVar rather than threading.local(): the Strands SDK runs
+# agents and tools in worker threads, but copies the caller's context into
+# them, so tools mutate the same scorecard object the caller initialized.
+# Separate threads (sessions) and copied contexts that re-initialize get
+# their own scorecard. Callers must init/clear before running the agent so
+# the scorecard exists in their context before it is copied.
 
 
 def _new_scorecard() -> dict:
@@ -144,18 +147,22 @@ def _new_scorecard() -> dict:
     }
 
 
-_scorecard: dict = _new_scorecard()
+_scorecard: ContextVar[dict] = ContextVar("scorecard")
 
 
 def _get_scorecard() -> dict:
-    """Return the current scorecard."""
-    return _scorecard
+    """Return the scorecard for the current context, creating it if unset."""
+    try:
+        return _scorecard.get()
+    except LookupError:
+        sc = _new_scorecard()
+        _scorecard.set(sc)
+        return sc
 
 
 def clear_scorecard() -> None:
     """Reset the scorecard accumulator to empty state."""
-    global _scorecard
-    _scorecard = _new_scorecard()
+    _scorecard.set(_new_scorecard())
 
 
 def init_scorecard(*, risk_level: str) -> None:
@@ -172,12 +179,11 @@ def init_scorecard(*, risk_level: str) -> None:
     Raises:
         ValueError: If risk_level is empty or not a valid level.
     """
-    global _scorecard
     if not risk_level or risk_level.upper() not in ("HIGH", "MEDIUM", "LOW"):
         raise ValueError(f"risk_level must be HIGH, MEDIUM, or LOW, got: {risk_level!r}")
     sc = _new_scorecard()
     sc["risk_level"] = risk_level.upper()
-    _scorecard = sc
+    _scorecard.set(sc)
 
 
 def get_scorecard() -> dict:
@@ -185,6 +191,13 @@ def get_scorecard() -> dict:
     return dict(_get_scorecard())
 
 
+def restore_scorecard(data: dict) -> None:
+    """Replace the scorecard with previously captured ``get_scorecard()`` output."""
+    sc = _new_scorecard()
+    sc.update({key: data[key] for key in sc if key in data})
+    _scorecard.set(sc)
+
+
 # ---------------------------------------------------------------------------
 # Scalar-parameter @tool functions (Nova Lite v1 compatible)
 # ---------------------------------------------------------------------------
@@ -13,6 +13,8 @@ from pathlib import Path
 
 import yaml
 
+from haytham.project.yaml_store import load_yaml
+
 from .metric_patterns import (
     RE_COMPOSITE,
     RE_RECOMMENDATION,
@@ -90,7 +92,7 @@ def _load_system_goal(session_dir: Path) -> str:
     project_file = session_dir / "project.yaml"
     if project_file.exists():
         try:
-            data = yaml.safe_load(project_file.read_text())
+            data = load_yaml(project_file, shared=True) or {}
             return data.get("system_goal", "")
         except (yaml.YAMLError, OSError):
             pass
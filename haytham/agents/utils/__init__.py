@@ -3,10 +3,19 @@ Utilities package for Haytham agents.
 
 This package provides shared utilities including:
 - logging_utils: Comprehensive logging infrastructure for agent interactions
+- log_writer: Background writer shared by the agent and phase loggers
 - phase_logger: Phase-level logging for phased workflow execution
 - prompt_loader: Utility for loading agent system prompts with caching
+- tokenizer: Per-provider token counting for context budgets
 """
 
+# Import log writer
+from haytham.agents.utils.log_writer import (
+    LogWriter,
+    get_log_writer,
+    reset_log_writer,
+)
+
 # Import logging utilities
 from haytham.agents.utils.logging_utils import (
     AgentLogger,
@@ -34,6 +43,14 @@ from haytham.agents.utils.prompt_loader import (
     preload_prompts,
 )
 
+# Import tokenizer utilities
+from haytham.agents.utils.tokenizer import (
+    Tokenizer,
+    count_tokens,
+    get_tokenizer,
+    register_tokenizer,
+)
+
 __all__ = [
     # Logging utilities
     "SessionManager",
@@ -42,6 +59,10 @@ __all__ = [
     "estimate_tokens",
     "get_session_manager",
     "create_agent_logger",
+    # Log writer
+    "LogWriter",
+    "get_log_writer",
+    "reset_log_writer",
     # Phase logging utilities
     "PhaseLogger",
     "PhaseLogEntry",
@@ -53,4 +74,9 @@ __all__ = [
     "preload_prompts",
     "PromptLoadError",
     "AVAILABLE_AGENTS",
+    # Tokenizer utilities
+    "Tokenizer",
+    "count_tokens",
+    "get_tokenizer",
+    "register_tokenizer",
 ]
@@ -17,6 +17,7 @@ AWS Credentials:
 import logging
 import os
 
+import boto3
 from botocore.config import Config
 from strands.models.bedrock import BedrockModel
 from strands.models.model import CacheConfig
@@ -87,6 +88,8 @@ def create_bedrock_model(
     streaming: bool = True,
     temperature: float = 0.7,
     max_tokens: int | None = None,
+    boto_session: boto3.Session | None = None,
+    max_pool_connections: int | None = None,
     **kwargs,
 ) -> BedrockModel:
     """
@@ -117,6 +120,11 @@ def create_bedrock_model(
                    env var, or 5000 if not set. Amazon Nova models support up to
                    10,000 output tokens; default of 5000 provides headroom for
                    complex agents while staying well under the limit.
+        boto_session: Existing boto3 session to build the client from. Reusing
+                     one skips reloading botocore's service definitions. Its
+                     region is used when region_name is not given.
+        max_pool_connections: HTTP connection pool size of the boto3 client
+                     (botocore default: 10).
         **kwargs: Additional arguments passed to BedrockModel.
 
     Returns:
@@ -134,6 +142,8 @@ def create_bedrock_model(
         model_id = get_model_id_for_tier("light")
 
     # Get region from environment if not provided
+    if region_name is None and boto_session is not None:
+        region_name = boto_session.region_name
     if region_name is None:
         region_name = os.getenv("AWS_REGION")
         if not region_name:
@@ -155,6 +165,7 @@ def create_bedrock_model(
             "max_attempts": 3,  # Transport-level retry for network/HTTP errors only
             "mode": "standard",  # Standard mode with exponential backoff
         },
+        **({"max_pool_connections": max_pool_connections} if max_pool_connections else {}),
     )
 
     logger.info(
@@ -170,9 +181,13 @@ def create_bedrock_model(
     # cache_config with strategy="auto" injects cachePoint at optimal
     # positions (system prompt, last assistant turn), reducing latency and
     # cost for repeated invocations.
+    # BedrockModel rejects region_name together with boto_session
+    if boto_session is not None and boto_session.region_name == region_name:
+        kwargs["boto_session"] = boto_session
+    else:
+        kwargs["region_name"] = region_name
     model = BedrockModel(
         model_id=model_id,
-        region_name=region_name,
         boto_client_config=boto_config,
         streaming=streaming,
         temperature=temperature,
@@ -9,6 +9,8 @@ preserving essential information for downstream agents.
 import logging
 import re
 
+from haytham.agents.utils.tokenizer import Tokenizer, count_tokens, get_tokenizer
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,14 +22,17 @@ class ContextSummarizer:
     dramatically reducing token count.
     """
 
-    def __init__(self, target_tokens: int = 3000):
+    def __init__(self, target_tokens: int = 3000, tokenizer: Tokenizer | None = None):
         """
         Initialize the context summarizer.
 
         Args:
             target_tokens: Target token count for summary (default: 3000)
+            tokenizer: Tokenizer used to measure outputs (default: the
+                active provider's, see ``haytham.agents.utils.tokenizer``)
         """
         self.target_tokens = target_tokens
+        self.tokenizer = tokenizer
         logger.info(f"ContextSummarizer initialized with target: {target_tokens} tokens")
 
     def summarize_agent_outputs(
@@ -56,7 +61,7 @@ class ContextSummarizer:
             )
 
             # Calculate original size
-            original_tokens = sum(len(output) // 4 for output in agent_outputs.values())
+            original_tokens = sum(self._count_tokens(output) for output in agent_outputs.values())
             logger.info(f"Original context size: ~{original_tokens:,} tokens")
 
             # Handle preserve_agents parameter (Requirement 5.1, 5.4, 5.5)
@@ -110,7 +115,7 @@ class ContextSummarizer:
                         summary = f"## {formatted_name} [PRESERVED]\n\n{output}"
                         logger.debug(
                             f"Preserved {agent_name} in full: "
-                            f"{len(output)} chars (~{len(output) // 4} tokens)"
+                            f"{len(output)} chars (~{self._count_tokens(output)} tokens)"
                         )
                     else:
                         # Summarize
@@ -120,7 +125,7 @@ class ContextSummarizer:
                         logger.debug(
                             f"Summarized {agent_name}: "
                             f"{len(output)} chars → {len(summary)} chars "
-                            f"(~{len(output) // 4} → ~{len(summary) // 4} tokens)"
+                            f"(~{self._count_tokens(output)} → ~{self._count_tokens(summary)} tokens)"
                         )
 
                     summaries.append(summary)
@@ -138,7 +143,7 @@ class ContextSummarizer:
             combined = "\n\n---\n\n".join(summaries)
 
             # Log completion with statistics (Requirement 4.3)
-            summary_tokens = len(combined) // 4
+            summary_tokens = self._count_tokens(combined)
             reduction = (1 - summary_tokens / original_tokens) * 100 if original_tokens > 0 else 0
 
             logger.info(
@@ -216,7 +221,17 @@ class ContextSummarizer:
                 else:
                     break
 
-        return "".join(summary_parts)
+        # Section sizes above are estimated in characters; enforce the token
+        # target on the body. The header is kept: ContextLoader parses the
+        # agent name back out of it.
+        tokenizer = self.tokenizer or get_tokenizer()
+        header, body = summary_parts[0], "".join(summary_parts[1:])
+        body_tokens = max(target_tokens - tokenizer.count(header), 0)
+        return header + tokenizer.truncate(body, body_tokens)
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens in text with this summarizer's tokenizer."""
+        return count_tokens(text, self.tokenizer)
 
     def _extract_metrics(self, output: str) -> list[str]:
         """
@@ -408,7 +423,7 @@ class ContextSummarizer:
                 "tokens_per_agent": 0,
             }
 
-        original_tokens = sum(len(output) // 4 for output in agent_outputs.values())
+        original_tokens = sum(self._count_tokens(output) for output in agent_outputs.values())
 
         # Estimate summary size
         estimated_summary_tokens = min(self.target_tokens, original_tokens // 3)
@@ -10,6 +10,8 @@ import json
 import logging
 from pathlib import Path
 
+from haytham.agents.utils.tokenizer import count_tokens
+
 logger = logging.getLogger(__name__)
 
 
@@ -163,7 +165,7 @@ class FileContextManager:
             return agent_outputs
 
         if summarize_if_large and agent_outputs:
-            total_tokens = sum(len(output) // 4 for output in agent_outputs.values())
+            total_tokens = sum(count_tokens(output) for output in agent_outputs.values())
 
             logger.info(
                 f"Total context size: ~{total_tokens:,} tokens "
@@ -260,18 +262,21 @@ class FileContextManager:
 
         agents_info = []
         total_chars = 0
+        total_tokens = 0
 
         for agent_name, output in agent_outputs.items():
             char_count = len(output)
+            token_count = count_tokens(output)
             total_chars += char_count
+            total_tokens += token_count
             agents_info.append(
-                {"name": agent_name, "chars": char_count, "estimated_tokens": char_count // 4}
+                {"name": agent_name, "chars": char_count, "estimated_tokens": token_count}
             )
 
         return {
             "agent_count": len(agent_outputs),
             "total_chars": total_chars,
-            "estimated_total_tokens": total_chars // 4,
+            "estimated_total_tokens": total_tokens,
             "agents": sorted(agents_info, key=lambda x: x["chars"], reverse=True),
         }
 
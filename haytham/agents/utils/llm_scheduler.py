@@ -0,0 +1,326 @@
+"""Process-wide admission control for LLM agent calls.
+
+Every agent invocation (``run_agent``, the story detail pass, ...) runs
+inside ``get_llm_scheduler().slot(tier)``. Calls are grouped into lanes by
+provider and model tier; each lane enforces:
+
+- a concurrency limit adjusted by AIMD: +1/limit per successful call, halved
+  (at most once per cooldown) when a call fails with a throttling error,
+  bounded by ``[1, max_concurrency]``;
+- a token bucket admitting at most ``requests_per_minute`` calls per minute,
+  with bursts up to ``max_concurrency``;
+- queue-depth and wait-time metrics (``LLMScheduler.metrics()``).
+
+Callers may start as many threads as they like -- the lane decides how many
+reach the provider at once -- so large story sets use whatever throughput
+the quota allows instead of a fixed four workers.
+
+Settings (env vars; the per-lane forms ``<NAME>_<PROVIDER>_<TIER>`` and
+``<NAME>_<PROVIDER>`` take precedence, e.g. ``LLM_MAX_CONCURRENCY_BEDROCK_HEAVY``):
+    LLM_MAX_CONCURRENCY      -- Concurrency ceiling per lane (default 16)
+    LLM_INITIAL_CONCURRENCY  -- Starting limit before AIMD adapts (default 4)
+    LLM_REQUESTS_PER_MINUTE  -- Agent calls admitted per minute; 0 disables
+                                the bucket (defaults per provider, see
+                                ``_DEFAULT_REQUESTS_PER_MINUTE``)
+"""
+
+import logging
+import math
+import os
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_CONCURRENCY = 16
+_DEFAULT_INITIAL_CONCURRENCY = 4
+
+# Conservative on-demand quotas; raise them to match the account's limits.
+_DEFAULT_REQUESTS_PER_MINUTE: dict[str, float] = {
+    "bedrock": 50,
+    "anthropic": 50,
+    "openai": 500,
+    "ollama": 0,
+}
+
+_DECREASE_FACTOR = 0.5
+_DECREASE_COOLDOWN_SECONDS = 2.0
+_MAX_BACKOFF_SECONDS = 60.0
+
+_THROTTLING_INDICATORS = [
+    "throttlingexception",
+    "throttled",
+    "too many requests",
+    "too many tokens",
+    "rate exceeded",
+    "rate limit",
+    "ratelimit",
+    "servicequotaexceeded",
+]
+
+_THROTTLING_TYPES = {"ThrottlingException", "RateLimitError", "ServiceQuotaExceededException"}
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Check if an error means the provider is throttling requests.
+
+    Walks the exception chain (``__cause__``) like the other error
+    classifiers, since Strands wraps provider errors.
+    """
+    current: BaseException | None = error
+    while current:
+        if type(current).__name__ in _THROTTLING_TYPES:
+            return True
+        message = str(current).lower()
+        if any(indicator in message for indicator in _THROTTLING_INDICATORS):
+            return True
+        current = current.__cause__
+    return False
+
+
+def backoff_delay(attempt: int, base: float) -> float:
+    """Exponential backoff with jitter for retry *attempt* (0-based)."""
+    delay = min(_MAX_BACKOFF_SECONDS, base * (2**attempt))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _lane_env(name: str, provider: str, tier: str) -> str:
+    for key in (f"{name}_{provider.upper()}_{tier.upper()}", f"{name}_{provider.upper()}", name):
+        raw = os.getenv(key, "").strip()
+        if raw:
+            return raw
+    return ""
+
+
+def _lane_number(name: str, provider: str, tier: str, default: float) -> float:
+    raw = _lane_env(name, provider, tier)
+    try:
+        value = float(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid number for %s=%r, using default %s", name, raw, default)
+        return default
+    return value if value >= 0 else default
+
+
+@dataclass(frozen=True)
+class LaneSettings:
+    """Resolved limits for one provider/tier lane."""
+
+    max_concurrency: int
+    initial_concurrency: int
+    requests_per_minute: float
+
+    @classmethod
+    def from_env(cls, provider: str, tier: str) -> "LaneSettings":
+        """Build settings from ``LLM_*`` environment variables."""
+        max_concurrency = max(
+            1, int(_lane_number("LLM_MAX_CONCURRENCY", provider, tier, _DEFAULT_MAX_CONCURRENCY))
+        )
+        initial = int(
+            _lane_number("LLM_INITIAL_CONCURRENCY", provider, tier, _DEFAULT_INITIAL_CONCURRENCY)
+        )
+        return cls(
+            max_concurrency=max_concurrency,
+            initial_concurrency=min(max(1, initial), max_concurrency),
+            requests_per_minute=_lane_number(
+                "LLM_REQUESTS_PER_MINUTE",
+                provider,
+                tier,
+                _DEFAULT_REQUESTS_PER_MINUTE.get(provider, 0),
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class LaneStats:
+    """Point-in-time metrics for one lane."""
+
+    limit: float
+    in_flight: int
+    queued: int
+    max_queue_depth: int
+    completed: int
+    throttled: int
+    failed: int
+    total_wait_seconds: float
+
+
+class Lane:
+    """Concurrency limiter plus token bucket for one provider/tier pair."""
+
+    def __init__(self, settings: LaneSettings):
+        self.settings = settings
+        self._cond = threading.Condition()
+        self._limit = float(settings.initial_concurrency)
+        self._in_flight = 0
+        self._queued = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._throttled = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._last_decrease = -math.inf
+        self._rate = settings.requests_per_minute / 60.0
+        self._tokens = float(settings.max_concurrency)
+        self._refilled_at = time.monotonic()
+
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    def _take_token(self) -> float:
+        """Consume a bucket token; return 0, or seconds until one is available."""
+        if self._rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        capacity = float(self.settings.max_concurrency)
+        self._tokens = min(capacity, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+    def acquire(self) -> None:
+        """Block until the lane admits another call."""
+        started = time.monotonic()
+        with self._cond:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+            try:
+                while True:
+                    if self._in_flight < int(self._limit):
+                        wait = self._take_token()
+                        if wait == 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+            finally:
+                self._queued -= 1
+            self._in_flight += 1
+            self._total_wait += time.monotonic() - started
+
+    def release(self, outcome: str = "ok") -> None:
+        """Return a slot and adapt the limit.
+
+        Args:
+            outcome: ``"ok"`` (additive increase), ``"throttled"``
+                (multiplicative decrease) or ``"error"`` (no change).
+        """
+        with self._cond:
+            self._in_flight -= 1
+            if outcome == "throttled":
+                self._throttled += 1
+                now = time.monotonic()
+                if now - self._last_decrease >= _DECREASE_COOLDOWN_SECONDS:
+                    self._last_decrease = now
+                    self._limit = max(1.0, self._limit * _DECREASE_FACTOR)
+                    logger.warning("LLM throttled; concurrency limit now %.1f", self._limit)
+            elif outcome == "error":
+                self._failed += 1
+            else:
+                self._completed += 1
+                self._limit = min(
+                    float(self.settings.max_concurrency), self._limit + 1 / self._limit
+                )
+            self._cond.notify_all()
+
+    def stats(self) -> LaneStats:
+        with self._cond:
+            return LaneStats(
+                limit=round(self._limit, 2),
+                in_flight=self._in_flight,
+                queued=self._queued,
+                max_queue_depth=self._max_queue_depth,
+                completed=self._completed,
+                throttled=self._throttled,
+                failed=self._failed,
+                total_wait_seconds=round(self._total_wait, 3),
+            )
+
+
+class LLMScheduler:
+    """Registry of lanes keyed by ``(provider, tier)``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lanes: dict[tuple[str, str], Lane] = {}
+        self._held = threading.local()
+
+    def lane(self, tier: str = "light", provider: str | None = None) -> Lane:
+        """Get (creating on first use) the lane for a provider and tier."""
+        if provider is None:
+            from .model_provider import get_active_provider
+
+            provider = get_active_provider().value
+        key = (provider, tier)
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is None:
+                lane = Lane(LaneSettings.from_env(provider, tier))
+                self._lanes[key] = lane
+            return lane
+
+    @contextmanager
+    def slot(self, tier: str = "light", provider: str | None = None) -> Iterator[Lane]:
+        """Hold a lane slot for the duration of one LLM call.
+
+        Re-entrant per thread: a call made while this thread already holds a
+        slot (e.g. an agent used as a tool) passes straight through instead
+        of deadlocking on its own lane.
+        """
+        lane = self.lane(tier, provider)
+        if getattr(self._held, "depth", 0):
+            self._held.depth += 1
+            try:
+                yield lane
+            finally:
+                self._held.depth -= 1
+            return
+
+        lane.acquire()
+        self._held.depth = 1
+        outcome = "ok"
+        try:
+            yield lane
+        except Exception as e:
+            outcome = "throttled" if is_throttling_error(e) else "error"
+            raise
+        finally:
+            self._held.depth = 0
+            lane.release(outcome)
+
+    def worker_count(self, n_tasks: int, tier: str = "light", provider: str | None = None) -> int:
+        """Threads worth starting for *n_tasks* calls on one lane."""
+        return max(1, min(n_tasks, self.lane(tier, provider).settings.max_concurrency))
+
+    def metrics(self) -> dict[str, LaneStats]:
+        """Stats per lane, keyed ``"provider/tier"``."""
+        with self._lock:
+            lanes = dict(self._lanes)
+        return {f"{provider}/{tier}": lane.stats() for (provider, tier), lane in lanes.items()}
+
+
+_scheduler: LLMScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Return the process-wide scheduler, creating it on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler()
+        return _scheduler
+
+
+def reset_llm_scheduler() -> None:
+    """Drop the process-wide scheduler so lanes re-read env settings."""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = None
@@ -0,0 +1,309 @@
+"""Background file writer for agent and stage logs.
+
+``AgentLogger`` and ``StageLogger`` log full prompts and responses. Writing
+them synchronously (open, append, close per entry) puts disk latency on
+every agent call, so the shared writer returned by ``get_log_writer()``
+queues writes and a single daemon thread performs them:
+
+- writes queued within ``LOG_FLUSH_INTERVAL`` are batched, with one open per
+  file per batch, and applied in submission order;
+- an appended file that would grow past ``LOG_MAX_BYTES`` is rotated first
+  (``file.1`` ... ``file.N``, keeping ``LOG_BACKUP_COUNT``), and rotated
+  files are gzip-compressed unless ``LOG_COMPRESS_ROTATED=false``;
+- ``write_blob`` gzips a payload on the writer thread (used for large
+  prompt/response bodies, see ``AgentLogger``);
+- ``flush()`` blocks until everything queued so far is on disk, and pending
+  writes are flushed at interpreter exit.
+
+The queue is bounded (``LOG_QUEUE_SIZE``), so a stalled disk slows producers
+down instead of growing memory without limit. Write errors are logged and
+never raised to the caller; a failed write does not affect the others in its
+batch. Text that is not valid UTF-8 (lone surrogates) is written with
+replacement characters.
+
+A ``LogWriter(background=False)`` performs the same operations inline; the
+loggers use one when constructed without a writer.
+
+Settings:
+    LOG_WRITER_ASYNC      -- Use the background thread for the shared writer (default true)
+    LOG_FLUSH_INTERVAL    -- Seconds to gather writes into one batch (default 0.2)
+    LOG_MAX_BYTES         -- Rotate appended files beyond this size; 0 disables (default 10 MB)
+    LOG_BACKUP_COUNT      -- Rotated files kept per log (default 5)
+    LOG_COMPRESS_ROTATED  -- Gzip rotated files (default true)
+    LOG_QUEUE_SIZE        -- Queued writes before producers block (default 10000)
+"""
+
+import atexit
+import gzip
+import logging
+import os
+import queue
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_FLUSH_INTERVAL = 0.2
+_DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+_DEFAULT_BACKUP_COUNT = 5
+_DEFAULT_QUEUE_SIZE = 10_000
+
+# Queue operations
+_APPEND = "append"
+_REPLACE = "replace"
+_BLOB = "blob"
+_FLUSH = "flush"
+_STOP = "stop"
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    try:
+        value = float(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid %s '%s', using default", name, raw)
+        return default
+    return value if value >= 0 else default
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = os.getenv(name, "").strip().lower()
+    if not raw:
+        return default
+    return raw in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class LogWriterSettings:
+    """Resolved writer settings."""
+
+    flush_interval: float = _DEFAULT_FLUSH_INTERVAL
+    max_bytes: int = _DEFAULT_MAX_BYTES
+    backup_count: int = _DEFAULT_BACKUP_COUNT
+    compress_rotated: bool = True
+    queue_size: int = _DEFAULT_QUEUE_SIZE
+
+    @classmethod
+    def from_env(cls) -> "LogWriterSettings":
+        """Build settings from ``LOG_*`` environment variables."""
+        return cls(
+            flush_interval=_env_number("LOG_FLUSH_INTERVAL", _DEFAULT_FLUSH_INTERVAL),
+            max_bytes=int(_env_number("LOG_MAX_BYTES", _DEFAULT_MAX_BYTES)),
+            backup_count=int(_env_number("LOG_BACKUP_COUNT", _DEFAULT_BACKUP_COUNT)),
+            compress_rotated=_env_flag("LOG_COMPRESS_ROTATED", True),
+            queue_size=max(1, int(_env_number("LOG_QUEUE_SIZE", _DEFAULT_QUEUE_SIZE))),
+        )
+
+
+class LogWriter:
+    """Appends, replaces and compresses log files, inline or on a thread.
+
+    Args:
+        background: Perform writes on a daemon thread.
+        settings: Writer settings (default: from the environment).
+    """
+
+    def __init__(self, background: bool = True, settings: LogWriterSettings | None = None):
+        self.background = background
+        self.settings = settings or LogWriterSettings.from_env()
+        self._io_lock = threading.Lock()
+        self.batches = 0
+        self.rotations = 0
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        if background:
+            self._queue = queue.Queue(maxsize=self.settings.queue_size)
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    # === Producer API ===
+
+    def append(self, path: Path | str, text: str) -> None:
+        """Append *text* to *path*, rotating the file if it grows too large."""
+        self._submit(_APPEND, Path(path), text)
+
+    def replace(self, path: Path | str, text: str) -> None:
+        """Replace *path* with *text* atomically (after earlier queued writes)."""
+        self._submit(_REPLACE, Path(path), text)
+
+    def write_blob(self, path: Path | str, text: str) -> None:
+        """Write *text* gzip-compressed to *path*."""
+        self._submit(_BLOB, Path(path), text)
+
+    def flush(self, timeout: float | None = 10.0) -> bool:
+        """Wait until all writes queued so far are on disk.
+
+        Returns:
+            False if the timeout expired first.
+        """
+        if not self._alive():
+            return True
+        done = threading.Event()
+        self._queue.put((_FLUSH, None, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Flush pending writes and stop the writer thread."""
+        if not self._alive():
+            return
+        self._queue.put((_STOP, None, None))
+        self._thread.join(timeout)
+
+    def _alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _submit(self, op: str, path: Path, payload: str) -> None:
+        if self._alive():
+            self._queue.put((op, path, payload))
+        else:
+            self._apply([(op, path, payload)])
+
+    # === Writer thread ===
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # Gather what arrives within the flush interval into one batch
+            deadline = self.settings.flush_interval
+            while batch[-1][0] not in (_FLUSH, _STOP):
+                try:
+                    batch.append(
+                        self._queue.get(timeout=deadline) if deadline else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                deadline = 0
+            # Drain anything else already queued without waiting
+            while batch[-1][0] not in (_FLUSH, _STOP):
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            control = batch.pop() if batch[-1][0] in (_FLUSH, _STOP) else None
+            if batch:
+                try:
+                    self._apply(batch)
+                except Exception as e:
+                    # The thread must survive, or flush() callers wait forever
+                    logger.error(f"Log writer batch failed: {e}", exc_info=True)
+            if control is None:
+                continue
+            op, _, done = control
+            if op == _FLUSH:
+                done.set()
+            else:
+                return
+
+    def _apply(self, batch: list[tuple[str, Path, str]]) -> None:
+        """Perform writes in order, coalescing consecutive appends per file."""
+        with self._io_lock:
+            self.batches += 1
+            pending: dict[Path, list[str]] = {}
+            for op, path, payload in batch:
+                if op == _APPEND:
+                    pending.setdefault(path, []).append(payload)
+                    continue
+                # Keep ordering: earlier appends to this file land first
+                if path in pending:
+                    self._perform(self._append, path, "".join(pending.pop(path)))
+                self._perform(self._replace if op == _REPLACE else self._blob, path, payload)
+            for path, chunks in pending.items():
+                self._perform(self._append, path, "".join(chunks))
+
+    def _perform(self, operation, path: Path, text: str) -> None:
+        """Run one write operation; errors are logged, never raised."""
+        try:
+            operation(path, text)
+        except Exception as e:
+            logger.error(f"Failed to write {path}: {e}", exc_info=True)
+
+    def _append(self, path: Path, text: str) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data = text.encode("utf-8", errors="replace")
+            max_bytes = self.settings.max_bytes
+            if max_bytes and path.exists():
+                size = path.stat().st_size
+                if size and size + len(data) > max_bytes:
+                    self._rotate(path)
+            with open(path, "ab") as f:
+                f.write(data)
+        except OSError as e:
+            logger.error(f"Failed to write log entry to {path}: {e}")
+
+    def _replace(self, path: Path, text: str) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8", errors="replace") as f:
+                    f.write(text)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.error(f"Failed to write {path}: {e}")
+
+    def _blob(self, path: Path, text: str) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(path, "wt", encoding="utf-8", errors="replace") as f:
+                f.write(text)
+        except OSError as e:
+            logger.error(f"Failed to write {path}: {e}")
+
+    def _backup(self, path: Path, index: int) -> Path:
+        name = f"{path.name}.{index}"
+        if self.settings.compress_rotated:
+            name += ".gz"
+        return path.with_name(name)
+
+    def _rotate(self, path: Path) -> None:
+        """Shift ``path.N`` backups up by one and move *path* to ``path.1``."""
+        keep = self.settings.backup_count
+        if keep <= 0:
+            path.unlink(missing_ok=True)
+            self.rotations += 1
+            return
+        self._backup(path, keep).unlink(missing_ok=True)
+        for index in range(keep - 1, 0, -1):
+            source = self._backup(path, index)
+            if source.exists():
+                os.replace(source, self._backup(path, index + 1))
+        target = self._backup(path, 1)
+        if self.settings.compress_rotated:
+            with open(path, "rb") as src, gzip.open(target, "wb") as dst:
+                dst.writelines(src)
+            path.unlink()
+        else:
+            os.replace(path, target)
+        self.rotations += 1
+
+
+_writer: LogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> LogWriter:
+    """Return the process-wide writer, starting it on first use."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = LogWriter(background=_env_flag("LOG_WRITER_ASYNC", True))
+        return _writer
+
+
+def reset_log_writer() -> None:
+    """Flush and drop the process-wide writer (settings are re-read on next use)."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+
+
+atexit.register(reset_log_writer)
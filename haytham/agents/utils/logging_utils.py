@@ -1,13 +1,22 @@
-"""Logging utilities for Haytham agents."""
+"""Logging utilities for Haytham agents.
+
+Agent log entries are handed to a ``LogWriter`` (see ``log_writer``);
+loggers from ``create_agent_logger()`` share the background writer, so
+logging a prompt does not wait on disk.
+"""
 
 import json
 import logging
+import os
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from haytham.agents.utils.log_writer import LogWriter, get_log_writer
+from haytham.agents.utils.tokenizer import count_tokens
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -134,24 +143,55 @@ class SessionManager:
         return self.current_session_dir
 
 
+def get_body_compress_threshold() -> int:
+    """Body size (chars) above which log bodies are stored gzipped, 0 = never.
+
+    Read from ``AGENT_LOG_COMPRESS_OVER`` (default 0).
+    """
+    raw = os.getenv("AGENT_LOG_COMPRESS_OVER")
+    try:
+        value = int(raw) if raw else 0
+    except ValueError:
+        logger.warning(f"Invalid AGENT_LOG_COMPRESS_OVER '{raw}', using default")
+        return 0
+    return max(0, value)
+
+
 class AgentLogger:
     """
     Structured logger for agent interactions.
 
     Logs all LLM interactions, inter-agent communications, and errors
     with timestamps, agent names, and metadata.
+
+    Bodies longer than ``compress_over`` characters are written gzipped to
+    ``<agent>_bodies/`` in the session directory and the log entry points
+    to that file.
     """
 
-    def __init__(self, agent_name: str, session_manager: SessionManager):
+    def __init__(
+        self,
+        agent_name: str,
+        session_manager: SessionManager,
+        writer: LogWriter | None = None,
+        compress_over: int | None = None,
+    ):
         """
         Initialize agent logger.
 
         Args:
             agent_name: Name of the agent (e.g., 'ceo', 'market_intelligence')
             session_manager: Session manager instance
+            writer: Log writer (default: write synchronously)
+            compress_over: Compress bodies longer than this many characters
+                (default: AGENT_LOG_COMPRESS_OVER; 0 disables)
         """
         self.agent_name = agent_name
         self.session_manager = session_manager
+        self.writer = writer or LogWriter(background=False)
+        self.compress_over = (
+            get_body_compress_threshold() if compress_over is None else compress_over
+        )
         self.token_usage: dict[str, int] = {
             "input_tokens": 0,
             "output_tokens": 0,
@@ -172,15 +212,9 @@ class AgentLogger:
             logger.warning(f"No active session, skipping log entry for {self.agent_name}")
             return
 
-        # Ensure session directory exists (in case it was deleted or not created)
-        try:
-            session_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            logger.error(f"Failed to create session directory {session_dir}: {e}")
-            return
-
-        # Create agent-specific log file
+        # Agent-specific log file; the writer creates the directory if needed
         log_file = session_dir / f"{self.agent_name}.log"
+        content = self._store_body(session_dir, entry.content)
 
         # Format log entry with clear delimiters
         log_text = f"""
@@ -190,7 +224,7 @@ AGENT: {entry.agent_name}
 TYPE: {entry.interaction_type}
 {"=" * 80}
 
-{entry.content}
+{content}
 
 METADATA:
 {json.dumps(entry.metadata, indent=2)}
@@ -199,12 +233,16 @@ METADATA:
 
 """
 
-        # Append to log file
-        try:
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(log_text)
-        except Exception as e:
-            logger.error(f"Failed to write log entry to {log_file}: {e}")
+        self.writer.append(log_file, log_text)
+
+    def _store_body(self, session_dir: Path, content: str) -> str:
+        """Move a large body to a gzipped file and return the text to log in its place."""
+        if not self.compress_over or len(content) <= self.compress_over:
+            return content
+        name = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}.txt.gz"
+        body_file = session_dir / f"{self.agent_name}_bodies" / name
+        self.writer.write_blob(body_file, content)
+        return f"[{len(content)} chars, gzip-compressed: {body_file.parent.name}/{name}]"
 
     def log_llm_input(self, prompt: str, metadata: dict[str, Any] | None = None) -> None:
         """
@@ -378,13 +416,6 @@ METADATA:
             logger.warning(f"No active session, skipping token summary for {self.agent_name}")
             return
 
-        # Ensure session directory exists
-        try:
-            session_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            logger.error(f"Failed to create session directory {session_dir}: {e}")
-            return
-
         summary_file = session_dir / f"{self.agent_name}_token_summary.json"
         summary_data = {
             "agent_name": self.agent_name,
@@ -392,22 +423,17 @@ METADATA:
             **self.token_usage,
         }
 
-        try:
-            with open(summary_file, "w") as f:
-                json.dump(summary_data, f, indent=2)
-            logger.info(
-                f"[{self.agent_name}] Token summary written: {self.token_usage['total_tokens']} total tokens"
-            )
-        except Exception as e:
-            logger.error(f"Failed to write token summary to {summary_file}: {e}")
+        self.writer.replace(summary_file, json.dumps(summary_data, indent=2))
+        logger.info(
+            f"[{self.agent_name}] Token summary written: {self.token_usage['total_tokens']} total tokens"
+        )
 
 
 def estimate_tokens(text: str) -> int:
     """
     Estimate token count for text.
 
-    Uses a simple heuristic: ~4 characters per token (average for English text).
-    This is an approximation - actual token counts may vary by model and tokenizer.
+    Uses the active provider's tokenizer (see ``haytham.agents.utils.tokenizer``).
 
     Args:
         text: Text to estimate tokens for
@@ -415,12 +441,7 @@ def estimate_tokens(text: str) -> int:
     Returns:
         Estimated token count
     """
-    if not text:
-        return 0
-
-    # Simple heuristic: 4 characters per token on average
-    # This is a rough approximation but works well enough for tracking
-    return len(text) // 4
+    return count_tokens(text)
 
 
 # Global session manager instance
@@ -447,6 +468,8 @@ def create_agent_logger(agent_name: str) -> AgentLogger:
     """
     Create an agent logger for the specified agent.
 
+    The logger writes through the shared background ``LogWriter``.
+
     Args:
         agent_name: Name of the agent
 
@@ -454,4 +477,4 @@ def create_agent_logger(agent_name: str) -> AgentLogger:
         AgentLogger instance
     """
     session_manager = get_session_manager()
-    return AgentLogger(agent_name, session_manager)
+    return AgentLogger(agent_name, session_manager, writer=get_log_writer())
@@ -11,10 +11,17 @@ Resolution order for model IDs:
   3. For bedrock: existing ``BEDROCK_*`` env vars via ``bedrock_config``
   4. Reasoning → heavy fallback
   5. ``PROVIDER_DEFAULTS`` smart defaults
+
+Bedrock models share their boto3 session and ``bedrock-runtime`` client
+through a process-wide ``ModelClientPool``, so agents created for parallel
+stages reuse warm HTTP connections instead of each building a client and
+opening its own. See ``ModelClientPool`` for why the other providers are not
+pooled.
 """
 
 import logging
 import os
+import threading
 from collections.abc import Callable
 from enum import Enum
 from typing import Any
@@ -185,9 +192,156 @@ def _strip_bedrock_kwargs(kwargs: dict) -> None:
         kwargs.pop(key, None)
 
 
+# ---------------------------------------------------------------------------
+# Shared client pool
+# ---------------------------------------------------------------------------
+
+_DEFAULT_MAX_CONNECTIONS = 32
+
+# Client-level settings that would be lost if the client were shared
+_UNPOOLED_BEDROCK_KWARGS = {"boto_session", "endpoint_url", "api_key"}
+
+
+def get_max_connections() -> int:
+    """Connection pool size per shared client from ``MODEL_CLIENT_MAX_CONNECTIONS``.
+
+    Defaults to 32; invalid or non-positive values fall back to the default.
+    """
+    raw = os.getenv("MODEL_CLIENT_MAX_CONNECTIONS")
+    try:
+        value = int(raw) if raw else _DEFAULT_MAX_CONNECTIONS
+    except ValueError:
+        logger.warning("Invalid MODEL_CLIENT_MAX_CONNECTIONS '%s', using default", raw)
+        return _DEFAULT_MAX_CONNECTIONS
+    return value if value > 0 else _DEFAULT_MAX_CONNECTIONS
+
+
+class ModelClientPool:
+    """Process-wide cache of provider clients shared across model instances.
+
+    Bedrock clients are thread-safe, so every model with the same region,
+    AWS profile, timeouts and pool size gets the same ``bedrock-runtime``
+    client. The client is built once per key and handed to each new model,
+    which keeps the per-model construction cost to a few milliseconds.
+
+    The Anthropic and OpenAI SDK clients used by Strands are asyncio clients
+    bound to the event loop they first run on, and each agent invocation runs
+    on its own loop, so those keep one client per model.
+    """
+
+    def __init__(self, max_connections: int | None = None):
+        self._max_connections = max_connections
+        self._lock = threading.Lock()
+        self._sessions: dict[tuple, Any] = {}
+        self._session_locks: dict[tuple, threading.Lock] = {}
+        self._clients: dict[tuple, Any] = {}
+
+    @property
+    def max_connections(self) -> int:
+        return self._max_connections or get_max_connections()
+
+    def bedrock_model(self, **kwargs):
+        """Create a Bedrock model that uses the pooled session and client.
+
+        Accepts the arguments of ``create_bedrock_model``. Models with their
+        own session, endpoint or API key are created unpooled, as are models
+        without a region (argument or ``AWS_REGION``) so the usual
+        configuration error is raised.
+        """
+        region = kwargs.pop("region_name", None) or os.getenv("AWS_REGION")
+        if not region or kwargs.keys() & _UNPOOLED_BEDROCK_KWARGS:
+            return create_bedrock_model(region_name=region, **kwargs)
+
+        max_connections = self.max_connections
+        session = _PooledBedrockSession(self, region, os.getenv("AWS_PROFILE") or None)
+        return create_bedrock_model(
+            region_name=region,
+            boto_session=session,
+            max_pool_connections=max_connections,
+            **kwargs,
+        )
+
+    def _bedrock_client(self, region: str, profile: str | None, config, **client_kwargs):
+        """Pooled ``bedrock-runtime`` client for *config*, built on first use."""
+        client_key = (
+            LLMProvider.BEDROCK,
+            region,
+            profile,
+            config.read_timeout,
+            config.connect_timeout,
+            config.max_pool_connections,
+        )
+        session_key = (region, profile)
+        with self._lock:
+            client = self._clients.get(client_key)
+            if client is not None:
+                return client
+            session_lock = self._session_locks.setdefault(session_key, threading.Lock())
+
+        # boto3 sessions are not thread-safe: build clients one at a time per
+        # session, without holding up lookups for other keys
+        with session_lock:
+            with self._lock:
+                client = self._clients.get(client_key)
+                session = self._sessions.get(session_key)
+            if client is not None:
+                return client
+            if session is None:
+                import boto3
+
+                session = boto3.Session(region_name=region, profile_name=profile)
+            client = session.client(config=config, **client_kwargs)
+            with self._lock:
+                self._sessions[session_key] = session
+                self._clients[client_key] = client
+        return client
+
+    def clear(self) -> None:
+        """Drop all pooled sessions and clients."""
+        with self._lock:
+            self._sessions.clear()
+            self._session_locks.clear()
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+
+class _PooledBedrockSession:
+    """Stands in for the boto3 session ``BedrockModel`` builds its client from.
+
+    ``BedrockModel`` always calls ``session.client(...)``; this returns the
+    pool's client for the requested configuration instead of a new one.
+    """
+
+    def __init__(self, pool: ModelClientPool, region_name: str, profile: str | None):
+        self._pool = pool
+        self.region_name = region_name
+        self._profile = profile
+
+    def client(self, service_name: str, config, region_name: str | None = None, **kwargs):
+        return self._pool._bedrock_client(
+            region_name or self.region_name,
+            self._profile,
+            config,
+            service_name=service_name,
+            region_name=region_name or self.region_name,
+            **kwargs,
+        )
+
+
+_client_pool = ModelClientPool()
+
+
+def get_client_pool() -> ModelClientPool:
+    """Return the process-wide ``ModelClientPool``."""
+    return _client_pool
+
+
 @_register_provider(LLMProvider.BEDROCK)
 def _create_bedrock(model_id, max_tokens, streaming, temperature, **kwargs):
-    return create_bedrock_model(
+    return _client_pool.bedrock_model(
         model_id=model_id,
         max_tokens=max_tokens,
         streaming=streaming,
@@ -26,6 +26,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from haytham.agents.utils.log_writer import LogWriter, get_log_writer
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -65,15 +67,21 @@ class StageLogger:
         ├── market-analysis/
         │   └── ...
         └── session_summary.json         # Overall session metrics
+
+    Writes go through a ``LogWriter``; the reads below flush it first, so
+    they always see earlier events.
     """
 
-    def __init__(self, base_log_dir: str | Path | None = None):
+    def __init__(self, base_log_dir: str | Path | None = None, writer: LogWriter | None = None):
         """
         Initialize stage logger.
 
         Args:
             base_log_dir: Base directory for logs (default: "session/logs")
+            writer: Log writer (default: write synchronously)
         """
+        self.writer = writer or LogWriter(background=False)
+
         if base_log_dir is None:
             self.base_log_dir = Path("session") / "logs"
         else:
@@ -97,11 +105,11 @@ class StageLogger:
             entry: Log entry to write
         """
         try:
-            with open(file_path, "a", encoding="utf-8") as f:
-                json.dump(entry.to_dict(), f)
-                f.write("\n")
-        except Exception as e:
+            line = json.dumps(entry.to_dict()) + "\n"
+        except (TypeError, ValueError) as e:
             logger.error(f"Failed to write log entry to {file_path}: {e}")
+            return
+        self.writer.append(file_path, line)
 
     def _write_json(self, file_path: Path, data: dict[str, Any]) -> None:
         """
@@ -112,10 +120,11 @@ class StageLogger:
             data: Data to write
         """
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
+            text = json.dumps(data, indent=2)
+        except (TypeError, ValueError) as e:
             logger.error(f"Failed to write JSON to {file_path}: {e}")
+            return
+        self.writer.replace(file_path, text)
 
     def log_stage_start(
         self,
@@ -399,6 +408,7 @@ class StageLogger:
         """
         stage_dir = self._get_stage_dir(stage_slug)
         metrics_file = stage_dir / "metrics.json"
+        self.writer.flush()
 
         if not metrics_file.exists():
             return None
@@ -418,6 +428,7 @@ class StageLogger:
             Session summary dictionary or None if not found
         """
         summary_file = self.base_log_dir / "session_summary.json"
+        self.writer.flush()
 
         if not summary_file.exists():
             return None
@@ -444,7 +455,7 @@ def get_stage_logger() -> StageLogger:
     global _stage_logger
 
     if _stage_logger is None:
-        _stage_logger = StageLogger()
+        _stage_logger = StageLogger(writer=get_log_writer())
         logger.info("Created global StageLogger instance")
 
     return _stage_logger
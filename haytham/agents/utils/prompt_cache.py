@@ -0,0 +1,88 @@
+"""Prompt cache hit accounting per workflow stage.
+
+Strands reports a Bedrock/Anthropic invocation's token usage in
+``result.metrics.accumulated_usage``: ``inputTokens`` (uncached input),
+``cacheReadInputTokens`` (input served from the prompt cache) and
+``cacheWriteInputTokens`` (input written to it). ``StageExecutor`` opens a
+``track_prompt_cache`` scope per stage, ``run_agent`` adds each agent's usage
+to it, and the stage logs its hit ratio and sets it on its span.
+
+The scope is a context variable, so agents run by ``run_parallel_agents``
+(which copies the context into its workers) count towards their stage.
+"""
+
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+
+def cache_hit_ratio(input_tokens: int, cache_read: int, cache_write: int) -> float:
+    """Share of all input tokens that were read from the prompt cache."""
+    total = input_tokens + cache_read + cache_write
+    return cache_read / total if total else 0.0
+
+
+class PromptCacheStats:
+    """Accumulated prompt cache usage of one stage; safe to share across threads.
+
+    Args:
+        label: What the usage belongs to (the stage slug).
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.invocations = 0
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self._lock = threading.Lock()
+
+    def add(self, usage: Mapping[str, Any]) -> None:
+        """Add one invocation's Strands usage dict."""
+        with self._lock:
+            self.invocations += 1
+            self.input_tokens += usage.get("inputTokens", 0) or 0
+            self.cache_read_tokens += usage.get("cacheReadInputTokens", 0) or 0
+            self.cache_write_tokens += usage.get("cacheWriteInputTokens", 0) or 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of this stage's input tokens served from the prompt cache."""
+        return cache_hit_ratio(self.input_tokens, self.cache_read_tokens, self.cache_write_tokens)
+
+    def summary(self) -> str:
+        """One-line report, e.g. for the stage log."""
+        return (
+            f"prompt cache {self.hit_ratio:.0%} hit "
+            f"(read={self.cache_read_tokens} write={self.cache_write_tokens} "
+            f"uncached={self.input_tokens} tokens, {self.invocations} invocation(s))"
+        )
+
+
+_current_stats: ContextVar[PromptCacheStats | None] = ContextVar("prompt_cache_stats", default=None)
+
+
+@contextmanager
+def track_prompt_cache(label: str) -> Iterator[PromptCacheStats]:
+    """Collect the usage recorded by ``record_cache_usage`` within this scope."""
+    stats = PromptCacheStats(label)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def record_cache_usage(usage: Mapping[str, Any] | None) -> None:
+    """Add an invocation's usage to the current scope (no-op outside one)."""
+    stats = _current_stats.get()
+    if stats is not None and usage:
+        stats.add(usage)
+
+
+def result_usage(result: Any) -> Mapping[str, Any] | None:
+    """Accumulated token usage of a Strands ``AgentResult``, if reported."""
+    metrics = getattr(result, "metrics", None)
+    return getattr(metrics, "accumulated_usage", None) if metrics else None
@@ -0,0 +1,265 @@
+"""Token counting for context budgeting.
+
+Replaces the ``len(text) // 4`` rule of thumb with a tokenizer chosen per
+LLM provider:
+
+- OpenAI: the model's tiktoken BPE encoding when ``tiktoken`` is installed
+  (it is not a core dependency); the approximation below otherwise.
+- Bedrock / Anthropic / Ollama: an approximation of a BPE tokenizer. Text is
+  split the way BPE pre-tokenizers split it (letter runs, digit runs,
+  symbols, line breaks) and each piece is costed separately: letter runs at
+  ~4 characters per token, CJK and other wide characters at one token each,
+  digits in groups of 3, every symbol and line break as one token. On
+  English prose this lands within a few percent of Claude's counts, where
+  the flat 4-characters rule undercounts markdown, numbers and JSON.
+
+Counts for longer texts are cached per (tokenizer, text hash), so the same
+stage output measured by the loader, the summarizer and the context builder
+is only tokenized once.
+
+Other providers can be plugged in with ``register_tokenizer``.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import re
+import threading
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Texts shorter than this are counted directly (hashing would cost as much)
+_CACHE_MIN_CHARS = 256
+_CACHE_MAX_ENTRIES = 4096
+
+_PIECE_RE = re.compile(r"[^\W\d_]+|\d+|\n+|[^\S\n]+|.", re.DOTALL)
+
+
+def _wide_chars(piece: str) -> int:
+    """Number of CJK and other East Asian wide characters in *piece*."""
+    if piece.isascii():
+        return 0
+    return sum(1 for ch in piece if unicodedata.east_asian_width(ch) in ("W", "F"))
+
+
+class Tokenizer(ABC):
+    """Counts and truncates text in model tokens.
+
+    Subclasses implement ``count``; ``truncate`` has a generic fallback.
+
+    Attributes:
+        name: Identifies the encoding (used as the count cache namespace).
+    """
+
+    name = "tokenizer"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Number of tokens in *text*."""
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of *text* that fits in *max_tokens* tokens."""
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.count(text[:mid]) <= max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low]
+
+
+class ApproximateTokenizer(Tokenizer):
+    """BPE-style approximation for providers without a local tokenizer.
+
+    Args:
+        name: Cache namespace, e.g. ``"claude-approx"``.
+        chars_per_token: Average characters per token inside a letter run.
+    """
+
+    def __init__(self, name: str = "approx", chars_per_token: float = 4.0):
+        self.name = name
+        self.chars_per_token = chars_per_token
+
+    def _piece_tokens(self, piece: str) -> int:
+        first = piece[0]
+        if first == "\n":
+            return 1
+        if first.isspace():
+            # A single space merges into the next word
+            return 0 if len(piece) == 1 else 1
+        if first.isdigit():
+            return math.ceil(len(piece) / 3)
+        if first.isalpha():
+            # CJK and similar scripts spend roughly one token per character
+            wide = _wide_chars(piece)
+            return wide + math.ceil((len(piece) - wide) / self.chars_per_token)
+        return 1
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return sum(self._piece_tokens(m.group()) for m in _PIECE_RE.finditer(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        used = 0
+        for match in _PIECE_RE.finditer(text):
+            piece = match.group()
+            cost = self._piece_tokens(piece)
+            if used + cost > max_tokens:
+                if piece[0].isalpha() and not _wide_chars(piece):
+                    # Keep the part of a long word that still fits
+                    keep = int((max_tokens - used) * self.chars_per_token)
+                    return text[: match.start() + keep]
+                return text[: match.start()]
+            used += cost
+        return text
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Exact counts from a tiktoken BPE encoding.
+
+    Args:
+        encoding: A ``tiktoken.Encoding``.
+    """
+
+    def __init__(self, encoding: Any):
+        self.encoding = encoding
+        self.name = f"tiktoken:{encoding.name}"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        tokens = self.encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self.encoding.decode(tokens[:max_tokens])
+
+
+# =============================================================================
+# Provider registry
+# =============================================================================
+
+_DEFAULT_TOKENIZER = ApproximateTokenizer()
+_CLAUDE_TOKENIZER = ApproximateTokenizer("claude-approx")
+
+# Keyed by LLMProvider value; each factory takes the model ID (or None)
+_TOKENIZER_FACTORIES: dict[str, Callable[[str | None], Tokenizer]] = {}
+_tokenizers: dict[tuple[str, str | None], Tokenizer] = {}
+_tokenizers_lock = threading.Lock()
+
+
+def register_tokenizer(provider: str, factory: Callable[[str | None], Tokenizer]) -> None:
+    """Use *factory* to build tokenizers for *provider* (an ``LLMProvider`` value)."""
+    with _tokenizers_lock:
+        _TOKENIZER_FACTORIES[provider] = factory
+        for key in [key for key in _tokenizers if key[0] == provider]:
+            del _tokenizers[key]
+
+
+def _openai_tokenizer(model_id: str | None) -> Tokenizer:
+    try:
+        import tiktoken
+    except ImportError:
+        logger.debug("tiktoken not installed, approximating OpenAI token counts")
+        return _DEFAULT_TOKENIZER
+    try:
+        encoding = tiktoken.encoding_for_model(model_id) if model_id else None
+    except KeyError:
+        encoding = None
+    return TiktokenTokenizer(encoding or tiktoken.get_encoding("o200k_base"))
+
+
+register_tokenizer("openai", _openai_tokenizer)
+register_tokenizer("anthropic", lambda model_id: _CLAUDE_TOKENIZER)
+register_tokenizer("bedrock", lambda model_id: _CLAUDE_TOKENIZER)
+register_tokenizer("ollama", lambda model_id: _DEFAULT_TOKENIZER)
+
+
+def get_tokenizer(provider: str | None = None, model_id: str | None = None) -> Tokenizer:
+    """Get the tokenizer for a provider and model.
+
+    Args:
+        provider: ``LLMProvider`` value; defaults to the ``LLM_PROVIDER`` env
+            var (read directly so counting never needs the provider SDKs).
+        model_id: Model ID, for providers with per-model encodings.
+
+    Returns:
+        Tokenizer; the generic approximation for unknown providers.
+    """
+    provider = (provider or os.getenv("LLM_PROVIDER", "bedrock")).strip().lower()
+    key = (provider, model_id)
+    with _tokenizers_lock:
+        tokenizer = _tokenizers.get(key)
+        if tokenizer is None:
+            factory = _TOKENIZER_FACTORIES.get(provider)
+            tokenizer = factory(model_id) if factory else _DEFAULT_TOKENIZER
+            _tokenizers[key] = tokenizer
+    return tokenizer
+
+
+# =============================================================================
+# Cached counting
+# =============================================================================
+
+_counts: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+_counts_lock = threading.Lock()
+
+
+def count_tokens(text: str | None, tokenizer: Tokenizer | None = None) -> int:
+    """Count tokens in *text*, caching results for longer texts.
+
+    Args:
+        text: Text to measure.
+        tokenizer: Tokenizer to use (default: ``get_tokenizer()``).
+
+    Returns:
+        Token count.
+    """
+    if not text:
+        return 0
+    tokenizer = tokenizer or get_tokenizer()
+    if len(text) < _CACHE_MIN_CHARS:
+        return tokenizer.count(text)
+
+    key = (
+        tokenizer.name,
+        hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+    )
+    with _counts_lock:
+        cached = _counts.get(key)
+        if cached is not None:
+            _counts.move_to_end(key)
+            return cached
+
+    count = tokenizer.count(text)
+    with _counts_lock:
+        _counts[key] = count
+        if len(_counts) > _CACHE_MAX_ENTRIES:
+            _counts.popitem(last=False)
+    return count
+
+
+def clear_token_cache() -> None:
+    """Drop cached counts and tokenizers (tests, provider switches)."""
+    with _counts_lock:
+        _counts.clear()
+    with _tokenizers_lock:
+        _tokenizers.clear()
@@ -12,10 +12,16 @@ to stage_executor, Streamlit, or downstream stages.
 import json
 import logging
 import re
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from strands import Agent
 
+from haytham.agents.utils.llm_scheduler import (
+    backoff_delay,
+    get_llm_scheduler,
+    is_throttling_error,
+)
 from haytham.agents.utils.model_provider import create_model
 from haytham.agents.utils.prompt_loader import load_agent_prompt
 
@@ -41,6 +47,13 @@ LAYER_DETAIL_PROMPTS: dict[int, str] = {
     5: "detail_realtime_prompt.txt",
 }
 
+# Scheduler lane for both passes; run_story_swarm defaults to the light model
+_SCHEDULER_TIER = "light"
+
+# Throttled detail calls are retried before falling back to the summary
+_DETAIL_THROTTLE_RETRIES = 3
+_DETAIL_RETRY_DELAY_SECONDS = 5
+
 
 def _extract_text(result) -> str:
     """Extract text from agent result."""
@@ -122,7 +135,8 @@ Generate all story skeletons now.
 """
 
     logger.info("Pass 1: Generating story skeletons...")
-    result = skeleton_agent(task)
+    with get_llm_scheduler().slot(_SCHEDULER_TIER):
+        result = skeleton_agent(task)
 
     # Extract structured output
     if hasattr(result, "structured_output") and isinstance(
@@ -189,7 +203,21 @@ Write the full markdown content for {skeleton.id}: {skeleton.title}.
 """
 
     try:
-        result = detail_agent(task)
+        scheduler = get_llm_scheduler()
+        for attempt in range(_DETAIL_THROTTLE_RETRIES + 1):
+            try:
+                with scheduler.slot(_SCHEDULER_TIER):
+                    result = detail_agent(task)
+                break
+            except Exception as e:
+                if attempt < _DETAIL_THROTTLE_RETRIES and is_throttling_error(e):
+                    delay = backoff_delay(attempt, _DETAIL_RETRY_DELAY_SECONDS)
+                    logger.warning(
+                        f"Detail agent throttled for {skeleton.id}, retrying in {delay:.1f}s"
+                    )
+                    time.sleep(delay)
+                    continue
+                raise
         content = _extract_text(result)
 
         if not content or content.strip() == "":
@@ -226,9 +254,11 @@ def _run_detail_pass(
     skeleton_summary = _build_skeleton_summary(skeletons)
     stories: list[StoryHybrid] = []
 
-    logger.info(f"Pass 2: Detailing {len(skeletons)} stories with max_workers=4...")
+    # Threads only wait for scheduler slots; the lane limits concurrent calls
+    max_workers = get_llm_scheduler().worker_count(len(skeletons), _SCHEDULER_TIER)
+    logger.info(f"Pass 2: Detailing {len(skeletons)} stories with max_workers={max_workers}...")
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_skeleton = {
             executor.submit(
                 _detail_single_story,
@@ -1,16 +1,28 @@
 """Backlog.md integration for Haytham.
 
-Provides Python wrappers for the Backlog.md CLI tool, enabling
-programmatic task management through human-readable markdown files.
+Provides Python access to Backlog.md task management through
+human-readable markdown files.
 
 Components:
+- BacklogStore: In-process reader/writer for the backlog folder
 - BacklogCLI: CLI wrapper for backlog commands
 - BacklogTask: Data class representing a task
+- BulkResult: Per-item report of create_drafts / add_labels_bulk
+- open_backlog: Returns the backend selected by BACKLOG_BACKEND
+- get_task_index: Cached, change-aware task index with capability -> story maps
 """
 
-from .cli import BacklogCLI, BacklogTask
+from .cli import BacklogCLI, BacklogTask, BulkItemResult, BulkResult
+from .index import TaskIndex, get_task_index
+from .store import BacklogStore, open_backlog
 
 __all__ = [
     "BacklogCLI",
+    "BacklogStore",
     "BacklogTask",
+    "BulkItemResult",
+    "BulkResult",
+    "TaskIndex",
+    "get_task_index",
+    "open_backlog",
 ]
@@ -52,6 +52,105 @@ class BacklogTask:
     is_draft: bool = False
 
 
+@dataclass
+class BulkItemResult:
+    """Outcome of one item of a bulk backlog operation.
+
+    Attributes:
+        key: The item's title (drafts) or task ID (labels)
+        task_id: ID of the created or updated task, None on failure
+        error: Why the item failed, None on success
+    """
+
+    key: str
+    task_id: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkResult:
+    """Per-item report of a bulk backlog operation, in input order."""
+
+    items: list[BulkItemResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[BulkItemResult]:
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self) -> list[BulkItemResult]:
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def ids(self) -> list[str]:
+        """IDs of successful items, in input order."""
+        return [item.task_id for item in self.items if item.ok and item.task_id]
+
+
+# Keyword arguments a draft spec may carry (create_task signature)
+DRAFT_SPEC_FIELDS = frozenset(
+    {
+        "title",
+        "description",
+        "priority",
+        "labels",
+        "acceptance_criteria",
+        "dependencies",
+        "parent_id",
+    }
+)
+_PRIORITIES = ("low", "medium", "high")
+
+
+def normalize_priority(priority) -> str:
+    """Map a free-form priority (e.g. LLM output like ``"High"``) to a valid one.
+
+    Unknown or missing values fall back to ``"medium"`` with a warning.
+    """
+    value = priority.strip().lower() if isinstance(priority, str) else ""
+    if value in _PRIORITIES:
+        return value
+    if priority is not None:
+        logger.warning("Unknown priority %r, using medium", priority)
+    return "medium"
+
+
+def validate_draft_spec(spec: dict) -> str | None:
+    """Check a ``create_drafts`` item. Returns an error message or None."""
+    if not isinstance(spec, dict):
+        return f"expected a dict, got {type(spec).__name__}"
+    unknown = set(spec) - DRAFT_SPEC_FIELDS
+    if unknown:
+        return f"unknown fields: {', '.join(sorted(unknown))}"
+    title = spec.get("title")
+    if not isinstance(title, str) or not title.strip():
+        return "title is required"
+    if spec.get("priority") not in (None, *_PRIORITIES):
+        return f"invalid priority {spec['priority']!r}"
+    for name in ("labels", "acceptance_criteria", "dependencies"):
+        values = spec.get(name) or []
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            return f"{name} must be a list of strings"
+    if any("," in label for label in spec.get("labels") or []):
+        return "labels cannot contain commas"
+    return None
+
+
+def validate_labels(labels) -> list[str] | None:
+    """Normalize an ``add_labels_bulk`` value to a label list, or None if invalid."""
+    if isinstance(labels, str):
+        labels = [labels]
+    if not isinstance(labels, list | tuple) or not labels:
+        return None
+    if not all(isinstance(lbl, str) and lbl.strip() and "," not in lbl for lbl in labels):
+        return None
+    return list(dict.fromkeys(labels))
+
+
 class BacklogCLIError(Exception):
     """Error from Backlog.md CLI execution."""
 
@@ -328,26 +427,70 @@ priorities:
         # Fallback: create draft file manually
         return self._create_draft_manually(title, **kwargs)
 
+    def create_drafts(self, specs: list[dict]) -> BulkResult:
+        """Create many drafts, validating every spec before creating any.
+
+        The CLI has no batch command, so valid drafts are still created one
+        call at a time; drafts the CLI fails on fall back to manual files
+        whose IDs are allocated in a single directory scan.
+
+        Args:
+            specs: One dict per draft with ``title`` and any other
+                ``create_task`` keyword arguments (see DRAFT_SPEC_FIELDS)
+
+        Returns:
+            BulkResult with one item per spec, in input order
+        """
+        result = BulkResult()
+        valid = []
+        for spec in specs:
+            error = validate_draft_spec(spec)
+            title = spec.get("title", "") if isinstance(spec, dict) else ""
+            item = BulkItemResult(key=str(title), error=error)
+            result.items.append(item)
+            if error is None:
+                valid.append((item, spec))
+
+        next_manual_id: int | None = None
+        for item, spec in valid:
+            fields = {k: v for k, v in spec.items() if k != "title"}
+            task_id = self.create_task(spec["title"], draft=True, **fields)
+            if task_id is None:
+                if next_manual_id is None:
+                    next_manual_id = int(self._get_next_draft_id())
+                task_id = self._create_draft_manually(
+                    spec["title"], draft_id=str(next_manual_id), **fields
+                )
+                if task_id:
+                    next_manual_id += 1
+            if task_id:
+                item.task_id = task_id
+            else:
+                item.error = "draft creation failed"
+        return result
+
     def _create_draft_manually(
         self,
         title: str,
         description: str = "",
-        priority: str = "medium",
+        priority: str | None = "medium",
         labels: list[str] | None = None,
         acceptance_criteria: list[str] | None = None,
         dependencies: list[str] | None = None,
         parent_id: str | None = None,
+        draft_id: str | None = None,
     ) -> str | None:
         """Manually create a draft file when CLI fails.
 
         Args:
             title: Task title
             description: Task description
-            priority: Priority level
+            priority: Priority level (None, as create_task accepts, means medium)
             labels: Task labels
             acceptance_criteria: List of acceptance criteria
             dependencies: List of dependency IDs
             parent_id: Parent task ID for subtasks
+            draft_id: Pre-allocated numeric draft ID (scans drafts/ if omitted)
 
         Returns:
             Draft ID if successful, None otherwise
@@ -357,7 +500,8 @@ priorities:
             drafts_dir.mkdir(parents=True, exist_ok=True)
 
             # Find next draft ID
-            draft_id = self._get_next_draft_id()
+            draft_id = draft_id or self._get_next_draft_id()
+            priority = priority or "medium"
 
             # Build markdown content
             labels_str = ", ".join(labels) if labels else ""
@@ -519,6 +663,37 @@ dependencies: [{deps_str}]
         result = self._run(["task", "edit", numeric_id, "-l", label])
         return result.returncode == 0
 
+    def add_labels_bulk(self, labels_by_task: dict[str, list[str] | str]) -> BulkResult:
+        """Add labels to many tasks, validating every entry first.
+
+        Issues one CLI call per task, with all of that task's labels.
+
+        Args:
+            labels_by_task: Task ID -> label or list of labels to add
+
+        Returns:
+            BulkResult with one item per task, in input order
+        """
+        result = BulkResult()
+        valid = []
+        for task_id, labels in labels_by_task.items():
+            normalized = validate_labels(labels)
+            item = BulkItemResult(key=task_id)
+            if normalized is None:
+                item.error = "labels must be non-empty strings without commas"
+            else:
+                valid.append((item, normalized))
+            result.items.append(item)
+
+        for item, labels in valid:
+            numeric_id = self._extract_numeric_id(item.key)
+            run = self._run(["task", "edit", numeric_id, "-l", ",".join(labels)])
+            if run.returncode == 0:
+                item.task_id = item.key
+            else:
+                item.error = run.stderr.strip() or f"exit code {run.returncode}"
+        return result
+
     def add_dependency(self, task_id: str, dependency_id: str) -> bool:
         """Add a dependency to a task.
 
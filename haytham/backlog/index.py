@@ -0,0 +1,198 @@
+"""Change-aware index over Backlog.md task files.
+
+Coverage, change impact and the architecture diff all need every task's
+status and ``implements:<capability>`` labels. Instead of listing and
+re-parsing the whole backlog on each Streamlit rerun, a process-wide
+TaskIndex per project keeps the parsed tasks and re-reads only files whose
+modification time, size or inode changed since the last lookup. Reverse
+maps (capability -> implementing stories) are rebuilt only when something
+changed.
+
+The index reads the task files directly, so it works the same whichever
+backend (see ``open_backlog``) wrote them. Drafts are not indexed, matching
+``list_tasks``.
+"""
+
+import copy
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from .cli import BacklogTask
+from .store import BacklogStore, _assignees, _id_sort_key
+
+logger = logging.getLogger(__name__)
+
+IMPLEMENTS_PREFIX = "implements:"
+
+
+@dataclass
+class _Entry:
+    signature: tuple[int, int, int]
+    task: BacklogTask
+    assignees: list[str]
+    implements: list[str]
+
+
+def implemented_capabilities(labels: list[str]) -> list[str]:
+    """Capability IDs referenced by ``implements:`` labels, in label order."""
+    return [
+        label[len(IMPLEMENTS_PREFIX) :] for label in labels if label.startswith(IMPLEMENTS_PREFIX)
+    ]
+
+
+class TaskIndex:
+    """Parsed view of ``backlog/tasks`` refreshed incrementally on access.
+
+    Lookups call ``refresh()`` first, which costs one directory scan and a
+    stat of every task file plus a parse of each added or modified file.
+    A caller making many lookups for one report should call ``refresh()``
+    once and pass ``refresh=False`` to the lookups. Returned tasks are copies
+    and may be mutated freely.
+    """
+
+    def __init__(self, project_dir: Path | str):
+        self.store = BacklogStore(project_dir)
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}  # file name -> entry
+        self._by_id: dict[str, _Entry] = {}
+        self._capability_stories: dict[str, list[str]] = {}
+        self.parse_count = 0  # files parsed so far, for diagnostics
+
+    def refresh(self) -> bool:
+        """Re-read task files that changed on disk.
+
+        Returns:
+            True if anything was added, changed or removed
+        """
+        with self._lock:
+            seen: dict[str, os.DirEntry] = {}
+            try:
+                with os.scandir(self.store.tasks_dir) as it:
+                    for entry in it:
+                        if entry.name.endswith(".md") and not entry.name.startswith("."):
+                            seen[entry.name] = entry
+            except FileNotFoundError:
+                pass
+
+            changed = set(self._entries) - set(seen)
+            for name in changed:
+                del self._entries[name]
+
+            for name, dir_entry in seen.items():
+                try:
+                    st = dir_entry.stat()
+                except FileNotFoundError:
+                    continue  # Replaced or removed mid-scan; next refresh catches it
+                signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+                cached = self._entries.get(name)
+                if cached is not None and cached.signature == signature:
+                    continue
+                try:
+                    meta, task, _ = self.store._parse(Path(dir_entry.path))
+                except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+                    logger.warning("Skipping unreadable backlog file %s: %s", name, e)
+                    self._entries.pop(name, None)
+                    changed.add(name)
+                    continue
+                self.parse_count += 1
+                self._entries[name] = _Entry(
+                    signature=signature,
+                    task=task,
+                    assignees=_assignees(meta),
+                    implements=implemented_capabilities(task.labels),
+                )
+                changed.add(name)
+
+            if changed:
+                self._rebuild_maps()
+            return bool(changed)
+
+    def _rebuild_maps(self) -> None:
+        ordered = sorted(self._entries.values(), key=lambda e: _id_sort_key(e.task.id))
+        self._by_id = {}
+        for entry in ordered:
+            self._by_id.setdefault(entry.task.id, entry)
+        self._capability_stories = {}
+        for entry in self._by_id.values():
+            for cap_id in dict.fromkeys(entry.implements):
+                self._capability_stories.setdefault(cap_id, []).append(entry.task.id)
+
+    # === Lookups ===
+
+    def tasks(
+        self,
+        status: str | None = None,
+        parent_id: str | None = None,
+        assignee: str | None = None,
+        *,
+        refresh: bool = True,
+    ) -> list[BacklogTask]:
+        """All tasks in ID order, optionally filtered like ``list_tasks``."""
+        if refresh:
+            self.refresh()
+        entries = list(self._by_id.values())
+        if status:
+            entries = [e for e in entries if e.task.status.lower() == status.lower()]
+        if parent_id:
+            parent = self.store._normalize_id(parent_id)
+            entries = [e for e in entries if e.task.parent_id == parent]
+        if assignee:
+            wanted = assignee.lstrip("@")
+            entries = [e for e in entries if wanted in e.assignees]
+        return [copy.deepcopy(e.task) for e in entries]
+
+    def get(self, task_id: str, *, refresh: bool = True) -> BacklogTask | None:
+        if refresh:
+            self.refresh()
+        entry = self._by_id.get(self.store._normalize_id(task_id))
+        return copy.deepcopy(entry.task) if entry else None
+
+    def status_by_id(self, *, refresh: bool = True) -> dict[str, str]:
+        """Task ID -> status."""
+        if refresh:
+            self.refresh()
+        return {task_id: e.task.status for task_id, e in self._by_id.items()}
+
+    def implements(self, task_id: str, *, refresh: bool = True) -> list[str]:
+        """Capability IDs a task implements."""
+        if refresh:
+            self.refresh()
+        entry = self._by_id.get(self.store._normalize_id(task_id))
+        return list(entry.implements) if entry else []
+
+    def capability_stories(self, *, refresh: bool = True) -> dict[str, list[str]]:
+        """Capability ID -> IDs of tasks implementing it, in task order."""
+        if refresh:
+            self.refresh()
+        return {cap_id: list(ids) for cap_id, ids in self._capability_stories.items()}
+
+    def stories_for_capability(self, cap_id: str, *, refresh: bool = True) -> list[str]:
+        if refresh:
+            self.refresh()
+        return list(self._capability_stories.get(cap_id, []))
+
+
+_registry: dict[Path, TaskIndex] = {}
+_registry_lock = threading.Lock()
+
+
+def get_task_index(project_dir: Path | str) -> TaskIndex:
+    """Get the process-wide TaskIndex for a project directory."""
+    key = Path(project_dir).resolve()
+    with _registry_lock:
+        index = _registry.get(key)
+        if index is None:
+            index = TaskIndex(key)
+            _registry[key] = index
+        return index
+
+
+def clear_task_index_registry() -> None:
+    """Drop every cached TaskIndex (mainly for tests)."""
+    with _registry_lock:
+        _registry.clear()
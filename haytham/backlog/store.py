@@ -0,0 +1,853 @@
+"""In-process Backlog.md backend.
+
+Reads and writes the Backlog.md markdown files directly instead of spawning
+the ``backlog`` CLI (a Node process) for every operation. Task files use the
+Backlog.md layout, so the CLI, board and browser keep working on the same
+folder:
+
+    backlog/
+    ├── config.yml
+    ├── tasks/task-1 - Implement-login.md
+    ├── drafts/draft-1 - Add-search.md
+    └── archive/tasks/
+
+Each file is YAML frontmatter (id, title, status, labels, dependencies, ...)
+followed by ``## Description``, ``## Acceptance Criteria`` and
+``## Implementation Notes`` sections. Frontmatter keys this module does not
+know about are preserved on rewrite. Legacy drafts written by
+``BacklogCLI._create_draft_manually`` (``drafts/1.md``) are read as well.
+
+``BacklogStore`` mirrors the task methods of ``BacklogCLI`` (return values
+and failure behaviour included), so callers can use either through
+``open_backlog``. Board, overview and export commands are CLI-only.
+"""
+
+import logging
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Literal
+
+import yaml
+
+from haytham.project.yaml_store import Dumper, SafeLoader
+
+from .cli import (
+    BacklogCLI,
+    BacklogTask,
+    BulkItemResult,
+    BulkResult,
+    validate_draft_spec,
+    validate_labels,
+)
+
+logger = logging.getLogger(__name__)
+
+_FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n?(.*)\Z", re.DOTALL)
+_SECTION_RE = re.compile(r"^##\s+(.+?)\s*$", re.MULTILINE)
+_AC_ITEM_RE = re.compile(r"^-\s*\[([ xX])\]\s*(?:#\d+\s+)?(.*)$")
+_ID_NUM_RE = re.compile(r"^(?:task|draft)-(\d+(?:\.\d+)*)$")
+
+# Sections rendered by this module, in file order
+_DESCRIPTION = "Description"
+_ACCEPTANCE = "Acceptance Criteria"
+_NOTES = "Implementation Notes"
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write via temp file and rename so readers never see partial files."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _atomic_write_many(writes: list[tuple[Path, str]]) -> None:
+    """Write several files as one batch.
+
+    Every file is staged to a temp file first; only when all of them are on
+    disk are they renamed into place, so a failure while staging leaves the
+    backlog untouched.
+    """
+    staged: list[tuple[str, Path]] = []
+    try:
+        for path, content in writes:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            staged.append((tmp, path))
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+    except BaseException:
+        for tmp, _ in staged:
+            Path(tmp).unlink(missing_ok=True)
+        raise
+    for tmp, path in staged:
+        os.replace(tmp, path)
+
+
+def _slug(title: str) -> str:
+    """Filename-safe form of a title, as Backlog.md names task files."""
+    return re.sub(r"[^\w.-]+", "-", title).strip("-")[:60] or "untitled"
+
+
+def _block(name: str, text: str) -> str:
+    return f"<!-- {name}:BEGIN -->\n{text}\n<!-- {name}:END -->\n"
+
+
+def _take_block(body: str, name: str) -> tuple[str | None, str]:
+    """Extract a ``<!-- NAME:BEGIN -->`` block; returns (inner text, rest of body)."""
+    match = re.search(
+        rf"<!--\s*{re.escape(name)}:BEGIN\s*-->\n?(.*?)\n?<!--\s*{re.escape(name)}:END\s*-->\n?",
+        body,
+        re.DOTALL,
+    )
+    if not match:
+        return None, body
+    return match.group(1), body[: match.start()] + body[match.end() :]
+
+
+def _split_sections(body: str) -> dict[str, str]:
+    """Map ``## Heading`` -> section text; text before any heading is under ""."""
+    headings = list(_SECTION_RE.finditer(body))
+    sections = {"": body[: headings[0].start()] if headings else body}
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(body)
+        sections[heading.group(1)] = body[heading.end() : end]
+    return sections
+
+
+def _assignees(meta: dict[str, Any]) -> list[str]:
+    assignees = meta.get("assignee") or []
+    if isinstance(assignees, str):
+        assignees = [assignees]
+    return [str(a).lstrip("@") for a in assignees]
+
+
+def _id_sort_key(task_id: str) -> tuple[int, ...]:
+    match = _ID_NUM_RE.match(task_id)
+    if not match:
+        return (0,)
+    return tuple(int(part) for part in match.group(1).split("."))
+
+
+class BacklogStore:
+    """Native reader/writer for a Backlog.md folder.
+
+    Thread-safe within a process: ID allocation and read-modify-write edits
+    are serialized by a per-store lock.
+
+    Example:
+        store = BacklogStore("/path/to/project")
+        store.init("My Project")
+        draft_id = store.create_draft("Add search", labels=["layer-1"])
+        store.add_label(draft_id, "needs-review")
+        store.promote_draft(draft_id)
+    """
+
+    def __init__(self, project_dir: Path | str):
+        """Initialize the store.
+
+        Args:
+            project_dir: Project root directory containing the backlog folder
+        """
+        self.project_dir = Path(project_dir)
+        self.backlog_dir = self.project_dir / "backlog"
+        self._lock = threading.RLock()
+
+    @property
+    def tasks_dir(self) -> Path:
+        return self.backlog_dir / "tasks"
+
+    @property
+    def drafts_dir(self) -> Path:
+        return self.backlog_dir / "drafts"
+
+    @property
+    def archive_dir(self) -> Path:
+        return self.backlog_dir / "archive" / "tasks"
+
+    # === Initialization ===
+
+    def init(self, project_name: str, skip_ai_setup: bool = True) -> bool:
+        """Create the Backlog.md folder structure and config.yml.
+
+        Args:
+            project_name: Name for the project
+            skip_ai_setup: Accepted for BacklogCLI compatibility; unused
+
+        Returns:
+            True if initialization succeeded
+        """
+        try:
+            for sub in ("tasks", "drafts", "completed", "archive/tasks", "decisions", "docs"):
+                (self.backlog_dir / sub).mkdir(parents=True, exist_ok=True)
+            config_file = self.backlog_dir / "config.yml"
+            if not config_file.exists():
+                config = {
+                    "project_name": project_name,
+                    "created_at": datetime.now().isoformat(),
+                    "statuses": ["To Do", "In Progress", "Done"],
+                    "priorities": ["high", "medium", "low"],
+                }
+                _atomic_write_text(config_file, yaml.dump(config, Dumper=Dumper, sort_keys=False))
+            return True
+        except OSError as e:
+            logger.warning("Failed to initialize backlog structure: %s", e)
+            return False
+
+    def is_initialized(self) -> bool:
+        """Check if Backlog.md is initialized in the project.
+
+        Returns:
+            True if backlog folder exists
+        """
+        return self.backlog_dir.exists()
+
+    # === File Format ===
+
+    def _parse(self, path: Path) -> tuple[dict[str, Any], BacklogTask, set[int]]:
+        """Parse a task file.
+
+        Returns:
+            Raw frontmatter, the task, and 1-based indexes of checked
+            acceptance criteria
+        """
+        text = path.read_text(encoding="utf-8")
+        match = _FRONTMATTER_RE.match(text)
+        meta: dict[str, Any] = {}
+        body = text
+        if match:
+            meta = yaml.load(match.group(1), Loader=SafeLoader) or {}
+            body = match.group(2)
+
+        is_draft = path.parent.name == "drafts"
+        task_id = str(meta.get("id") or "")
+        if not task_id:
+            # Legacy manual drafts are named "<n>.md"
+            stem = path.stem.split(" - ")[0]
+            task_id = (
+                stem if _ID_NUM_RE.match(stem) else f"{'draft' if is_draft else 'task'}-{stem}"
+            )
+
+        # Marker-delimited blocks may contain their own "## " headings
+        description, body = _take_block(body, "SECTION:DESCRIPTION")
+        notes, body = _take_block(body, "SECTION:NOTES")
+        criteria, body = _take_block(body, "AC")
+        sections = _split_sections(body)
+        if description is None:
+            description = sections.get(_DESCRIPTION)
+        if description is None:
+            # Legacy layout: "# Title" heading followed by free text
+            description = re.sub(r"\A\s*#\s+.*\n", "", sections.get("", ""))
+        if notes is None:
+            notes = sections.get(_NOTES, sections.get("Notes", ""))
+        if criteria is None:
+            criteria = sections.get(_ACCEPTANCE, "")
+
+        acceptance = []
+        checked = set()
+        for line in criteria.splitlines():
+            item = _AC_ITEM_RE.match(line.strip())
+            if item:
+                acceptance.append(item.group(2).strip())
+                if item.group(1) in "xX":
+                    checked.add(len(acceptance))
+
+        parent = meta.get("parent_task_id") or meta.get("parent")
+        task = BacklogTask(
+            id=task_id,
+            title=str(meta.get("title", "")),
+            status=str(meta.get("status", "To Do")),
+            priority=str(meta.get("priority", "medium")),
+            description=description.strip(),
+            labels=[str(label) for label in meta.get("labels") or []],
+            acceptance_criteria=acceptance,
+            dependencies=[str(dep) for dep in meta.get("dependencies") or []],
+            parent_id=str(parent) if parent else None,
+            notes=notes.strip(),
+            is_draft=is_draft,
+        )
+        return meta, task, checked
+
+    def _render(
+        self,
+        task: BacklogTask,
+        meta: dict[str, Any] | None = None,
+        checked: set[int] | None = None,
+    ) -> str:
+        """Render a task file, keeping unknown frontmatter keys from *meta*."""
+        front = dict(meta or {})
+        front.update(
+            {
+                "id": task.id,
+                "title": task.title,
+                "status": task.status,
+                "assignee": front.get("assignee", []),
+                "created_date": front.get("created_date")
+                or datetime.now().strftime("%Y-%m-%d %H:%M"),
+                "labels": task.labels,
+                "dependencies": task.dependencies,
+                "priority": task.priority,
+            }
+        )
+        front.pop("parent", None)
+        if task.parent_id:
+            front["parent_task_id"] = task.parent_id
+        else:
+            front.pop("parent_task_id", None)
+
+        parts = [
+            "---\n",
+            yaml.dump(
+                front, Dumper=Dumper, sort_keys=False, allow_unicode=True, default_flow_style=False
+            ),
+            "---\n\n",
+            f"## {_DESCRIPTION}\n\n",
+            _block("SECTION:DESCRIPTION", task.description),
+        ]
+        if task.acceptance_criteria:
+            checked = checked or set()
+            lines = [
+                f"- [{'x' if n in checked else ' '}] #{n} {criterion}"
+                for n, criterion in enumerate(task.acceptance_criteria, 1)
+            ]
+            parts.append(f"\n## {_ACCEPTANCE}\n")
+            parts.append(_block("AC", "\n".join(lines)))
+        if task.notes:
+            parts.append(f"\n## {_NOTES}\n\n")
+            parts.append(_block("SECTION:NOTES", task.notes))
+        return "".join(parts)
+
+    @staticmethod
+    def _task_path(directory: Path, task: BacklogTask) -> Path:
+        return directory / f"{task.id} - {_slug(task.title)}.md"
+
+    def _write_task(
+        self,
+        directory: Path,
+        task: BacklogTask,
+        meta: dict[str, Any] | None = None,
+        checked: set[int] | None = None,
+    ) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        path = self._task_path(directory, task)
+        _atomic_write_text(path, self._render(task, meta, checked))
+        return path
+
+    # === Lookup ===
+
+    @staticmethod
+    def _iter_files(directory: Path) -> list[Path]:
+        if not directory.exists():
+            return []
+        return sorted(p for p in directory.glob("*.md") if not p.name.startswith("."))
+
+    def _normalize_id(self, task_id: str) -> str:
+        """Accept "task-5", "5" or "draft-2" like the CLI does."""
+        task_id = task_id.strip()
+        if task_id.startswith(("task-", "draft-")):
+            return task_id
+        return f"task-{task_id}"
+
+    def _find(self, task_id: str) -> Path | None:
+        """Locate the file for a task or draft ID."""
+        task_id = self._normalize_id(task_id)
+        directory = self.drafts_dir if task_id.startswith("draft-") else self.tasks_dir
+        number = task_id.split("-", 1)[1]
+        for path in self._iter_files(directory):
+            stem = path.stem.split(" - ")[0]
+            if stem == task_id or stem == number:
+                return path
+        return None
+
+    def _next_id(self, prefix: Literal["task", "draft"]) -> str:
+        """Allocate the next ``<prefix>-N`` ID. Caller holds the lock."""
+        directories = (
+            [self.drafts_dir]
+            if prefix == "draft"
+            else [self.tasks_dir, self.archive_dir, self.backlog_dir / "completed"]
+        )
+        highest = 0
+        for directory in directories:
+            for path in self._iter_files(directory):
+                stem = path.stem.split(" - ")[0].removeprefix(f"{prefix}-")
+                head = stem.split(".")[0]
+                if head.isdigit():
+                    highest = max(highest, int(head))
+        return f"{prefix}-{highest + 1}"
+
+    def _edit(self, task_id: str, change) -> bool:
+        """Apply ``change(task)`` to a task file and rewrite it atomically."""
+        with self._lock:
+            path = self._find(task_id)
+            if path is None:
+                return False
+            try:
+                meta, task, checked = self._parse(path)
+                if change(task, checked) is False:
+                    return False
+                new_path = self._write_task(path.parent, task, meta, checked)
+                if new_path != path:
+                    path.unlink(missing_ok=True)
+                return True
+            except (OSError, yaml.YAMLError) as e:
+                logger.warning("Failed to update %s: %s", task_id, e)
+                return False
+
+    # === Task Creation ===
+
+    def create_task(
+        self,
+        title: str,
+        *,
+        description: str = "",
+        priority: Literal["low", "medium", "high"] | None = None,
+        labels: list[str] | None = None,
+        acceptance_criteria: list[str] | None = None,
+        dependencies: list[str] | None = None,
+        parent_id: int | str | None = None,
+        draft: bool = False,
+        status: str | None = None,
+    ) -> str | None:
+        """Create a new task or draft file.
+
+        Args:
+            title: Task title
+            description: Task description
+            priority: Priority level (low, medium, high)
+            labels: List of labels for categorization
+            acceptance_criteria: List of acceptance criteria
+            dependencies: List of dependency task IDs
+            parent_id: Parent task ID for subtasks
+            draft: Create as draft (requires promotion)
+            status: Initial status
+
+        Returns:
+            Task ID if successful (e.g., "task-1" or "draft-1"), None otherwise
+        """
+        task = self._new_task(
+            title,
+            description=description,
+            priority=priority,
+            labels=labels,
+            acceptance_criteria=acceptance_criteria,
+            dependencies=dependencies,
+            parent_id=parent_id,
+            draft=draft,
+            status=status,
+        )
+        with self._lock:
+            try:
+                task.id = self._next_id("draft" if draft else "task")
+                self._write_task(self.drafts_dir if draft else self.tasks_dir, task)
+            except OSError as e:
+                logger.warning("Failed to create task %r: %s", title, e)
+                return None
+        return task.id
+
+    def _new_task(
+        self,
+        title: str,
+        *,
+        description: str = "",
+        priority: str | None = None,
+        labels: list[str] | None = None,
+        acceptance_criteria: list[str] | None = None,
+        dependencies: list[str] | None = None,
+        parent_id: int | str | None = None,
+        draft: bool = False,
+        status: str | None = None,
+    ) -> BacklogTask:
+        """Build an unsaved task; the ID is assigned when it is written."""
+        return BacklogTask(
+            id="",
+            title=title,
+            status=status or ("Draft" if draft else "To Do"),
+            priority=priority or "medium",
+            description=description,
+            labels=list(labels or []),
+            acceptance_criteria=list(acceptance_criteria or []),
+            dependencies=[self._normalize_id(str(dep)) for dep in dependencies or []],
+            parent_id=self._normalize_id(str(parent_id)) if parent_id else None,
+            is_draft=draft,
+        )
+
+    def create_draft(self, title: str, **kwargs) -> str | None:
+        """Create a draft task (shorthand for create_task with draft=True).
+
+        Args:
+            title: Task title
+            **kwargs: Additional arguments for create_task
+
+        Returns:
+            Draft ID if successful, None otherwise
+        """
+        return self.create_task(title, draft=True, **kwargs)
+
+    def create_drafts(self, specs: list[dict]) -> BulkResult:
+        """Create many drafts in one batch.
+
+        Every spec is validated first; invalid ones are reported and skipped.
+        IDs for the rest are allocated with a single directory scan and all
+        files are written as one batch (see ``_atomic_write_many``): either
+        every valid draft is created or, on an I/O error, none is.
+
+        Args:
+            specs: One dict per draft with ``title`` and any other
+                ``create_task`` keyword arguments (see DRAFT_SPEC_FIELDS)
+
+        Returns:
+            BulkResult with one item per spec, in input order
+        """
+        result = BulkResult()
+        valid: list[tuple[BulkItemResult, BacklogTask]] = []
+        for spec in specs:
+            error = validate_draft_spec(spec)
+            title = spec.get("title", "") if isinstance(spec, dict) else ""
+            item = BulkItemResult(key=str(title), error=error)
+            result.items.append(item)
+            if error is None:
+                fields = {k: v for k, v in spec.items() if k != "title"}
+                valid.append((item, self._new_task(spec["title"], draft=True, **fields)))
+
+        if not valid:
+            return result
+
+        with self._lock:
+            first = int(self._next_id("draft").removeprefix("draft-"))
+            writes = []
+            for offset, (_, task) in enumerate(valid):
+                task.id = f"draft-{first + offset}"
+                writes.append((self._task_path(self.drafts_dir, task), self._render(task)))
+            try:
+                _atomic_write_many(writes)
+            except OSError as e:
+                logger.warning("Failed to write %d drafts: %s", len(writes), e)
+                for item, _ in valid:
+                    item.error = f"write failed: {e}"
+                return result
+
+        for item, task in valid:
+            item.task_id = task.id
+        return result
+
+    def promote_draft(self, draft_id: str) -> bool:
+        """Move a draft into the task list under a new task ID.
+
+        Args:
+            draft_id: Draft ID (e.g., "draft-1")
+
+        Returns:
+            True if successful
+        """
+        if not draft_id.startswith("draft-"):
+            draft_id = f"draft-{draft_id}"
+        with self._lock:
+            path = self._find(draft_id)
+            if path is None:
+                return False
+            try:
+                meta, task, checked = self._parse(path)
+                task.id = self._next_id("task")
+                task.is_draft = False
+                if task.status == "Draft":
+                    task.status = "To Do"
+                self._write_task(self.tasks_dir, task, meta, checked)
+                path.unlink()
+                return True
+            except (OSError, yaml.YAMLError) as e:
+                logger.warning("Failed to promote %s: %s", draft_id, e)
+                return False
+
+    # === Task Updates ===
+
+    def update_status(self, task_id: str, status: str) -> bool:
+        """Update task status.
+
+        Args:
+            task_id: Task ID (e.g., "task-1" or "1")
+            status: New status ("To Do", "In Progress", "Done")
+
+        Returns:
+            True if successful
+        """
+        return self._edit(task_id, lambda task, _: setattr(task, "status", status))
+
+    def _set_criterion(self, task_id: str, criteria_index: int, done: bool) -> bool:
+        def change(task: BacklogTask, checked: set[int]) -> bool:
+            if not 1 <= criteria_index <= len(task.acceptance_criteria):
+                return False
+            (checked.add if done else checked.discard)(criteria_index)
+            return True
+
+        return self._edit(task_id, change)
+
+    def check_acceptance_criteria(self, task_id: str, criteria_index: int) -> bool:
+        """Mark an acceptance criterion as complete.
+
+        Args:
+            task_id: Task ID
+            criteria_index: 1-based index of criterion to check
+
+        Returns:
+            True if successful
+        """
+        return self._set_criterion(task_id, criteria_index, True)
+
+    def uncheck_acceptance_criteria(self, task_id: str, criteria_index: int) -> bool:
+        """Unmark an acceptance criterion.
+
+        Args:
+            task_id: Task ID
+            criteria_index: 1-based index of criterion to uncheck
+
+        Returns:
+            True if successful
+        """
+        return self._set_criterion(task_id, criteria_index, False)
+
+    def add_notes(self, task_id: str, notes: str) -> bool:
+        """Add or replace task notes.
+
+        Args:
+            task_id: Task ID
+            notes: Notes content
+
+        Returns:
+            True if successful
+        """
+        return self._edit(task_id, lambda task, _: setattr(task, "notes", notes))
+
+    def append_notes(self, task_id: str, notes: str) -> bool:
+        """Append to existing notes.
+
+        Args:
+            task_id: Task ID
+            notes: Notes to append
+
+        Returns:
+            True if successful
+        """
+
+        def change(task: BacklogTask, _) -> None:
+            task.notes = f"{task.notes}\n\n{notes}" if task.notes else notes
+
+        return self._edit(task_id, change)
+
+    def add_label(self, task_id: str, label: str) -> bool:
+        """Add a label to a task (no-op if already present).
+
+        Args:
+            task_id: Task ID
+            label: Label to add
+
+        Returns:
+            True if successful
+        """
+
+        def change(task: BacklogTask, _) -> None:
+            if label not in task.labels:
+                task.labels.append(label)
+
+        return self._edit(task_id, change)
+
+    def add_labels_bulk(self, labels_by_task: dict[str, list[str] | str]) -> BulkResult:
+        """Add labels to many tasks and rewrite them as one batch.
+
+        Every entry is validated and every task located before anything is
+        written; unknown tasks and invalid labels are reported per item.
+
+        Args:
+            labels_by_task: Task ID -> label or list of labels to add
+
+        Returns:
+            BulkResult with one item per task, in input order
+        """
+        result = BulkResult()
+        with self._lock:
+            writes = []
+            updated = []
+            for task_id, labels in labels_by_task.items():
+                item = BulkItemResult(key=task_id)
+                result.items.append(item)
+                normalized = validate_labels(labels)
+                if normalized is None:
+                    item.error = "labels must be non-empty strings without commas"
+                    continue
+                path = self._find(task_id)
+                if path is None:
+                    item.error = f"task {task_id} not found"
+                    continue
+                try:
+                    meta, task, checked = self._parse(path)
+                except (OSError, yaml.YAMLError) as e:
+                    item.error = f"unreadable: {e}"
+                    continue
+                missing = [label for label in normalized if label not in task.labels]
+                item.task_id = task.id
+                if missing:
+                    task.labels.extend(missing)
+                    writes.append((path, self._render(task, meta, checked)))
+                updated.append(item)
+
+            try:
+                _atomic_write_many(writes)
+            except OSError as e:
+                logger.warning("Failed to write labels for %d tasks: %s", len(writes), e)
+                for item in updated:
+                    item.task_id = None
+                    item.error = f"write failed: {e}"
+        return result
+
+    def add_dependency(self, task_id: str, dependency_id: str) -> bool:
+        """Add a dependency to a task.
+
+        Args:
+            task_id: Task ID
+            dependency_id: Dependency task ID
+
+        Returns:
+            True if successful
+        """
+        dep = self._normalize_id(dependency_id)
+
+        def change(task: BacklogTask, _) -> None:
+            if dep not in task.dependencies:
+                task.dependencies.append(dep)
+
+        return self._edit(task_id, change)
+
+    def archive_task(self, task_id: str) -> bool:
+        """Move a task to ``backlog/archive/tasks``.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if successful
+        """
+        with self._lock:
+            path = self._find(task_id)
+            if path is None:
+                return False
+            try:
+                self.archive_dir.mkdir(parents=True, exist_ok=True)
+                os.replace(path, self.archive_dir / path.name)
+                return True
+            except OSError as e:
+                logger.warning("Failed to archive %s: %s", task_id, e)
+                return False
+
+    # === Task Queries ===
+
+    def _load_all(self, directory: Path) -> list[BacklogTask]:
+        """Parse every task file in *directory*, in ID order."""
+        tasks = []
+        for path in self._iter_files(directory):
+            try:
+                tasks.append(self._parse(path)[1])
+            except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+                logger.warning("Skipping unreadable backlog file %s: %s", path.name, e)
+        tasks.sort(key=lambda task: _id_sort_key(task.id))
+        return tasks
+
+    def get_task(self, task_id: str) -> BacklogTask | None:
+        """Get task details.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            BacklogTask if found, None otherwise
+        """
+        path = self._find(task_id)
+        if path is None:
+            return None
+        try:
+            return self._parse(path)[1]
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning("Failed to read %s: %s", task_id, e)
+            return None
+
+    def list_tasks(
+        self,
+        status: str | None = None,
+        parent_id: str | None = None,
+        assignee: str | None = None,
+    ) -> list[BacklogTask]:
+        """List tasks with optional filters.
+
+        Args:
+            status: Filter by status (case-insensitive)
+            parent_id: Filter by parent task
+            assignee: Filter by assignee
+
+        Returns:
+            List of matching tasks, in ID order. Served from the shared
+            TaskIndex, which re-parses only files changed since last call.
+        """
+        from .index import get_task_index
+
+        return get_task_index(self.project_dir).tasks(
+            status=status, parent_id=parent_id, assignee=assignee
+        )
+
+    def list_drafts(self) -> list[BacklogTask]:
+        """List all draft tasks.
+
+        Returns:
+            List of draft tasks, in ID order
+        """
+        return self._load_all(self.drafts_dir)
+
+    def search_tasks(
+        self,
+        query: str,
+        status: str | None = None,
+        priority: str | None = None,
+    ) -> list[BacklogTask]:
+        """Search task titles and descriptions by keyword (case-insensitive).
+
+        Args:
+            query: Search query
+            status: Filter by status
+            priority: Filter by priority
+
+        Returns:
+            List of matching tasks
+        """
+        needle = query.lower()
+        return [
+            t
+            for t in self.list_tasks(status=status)
+            if (needle in t.title.lower() or needle in t.description.lower())
+            and (not priority or t.priority == priority)
+        ]
+
+
+def open_backlog(
+    project_dir: Path | str, backend: str | None = None
+) -> "BacklogStore | BacklogCLI":
+    """Open the backlog of *project_dir* with the configured backend.
+
+    Args:
+        project_dir: Project root directory containing the backlog folder
+        backend: ``"native"`` (in-process, default) or ``"cli"`` (shell out to
+            the ``backlog`` binary). Defaults to the ``BACKLOG_BACKEND`` env var.
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = (backend or os.getenv("BACKLOG_BACKEND") or "native").strip().lower()
+    if backend == "native":
+        return BacklogStore(project_dir)
+    if backend == "cli":
+        return BacklogCLI(project_dir)
+    raise ValueError(f"Unknown BACKLOG_BACKEND {backend!r}; expected 'native' or 'cli'")
@@ -13,6 +13,7 @@ from typing import Any
 
 from haytham.agents.output_utils import extract_output_content
 from haytham.agents.utils.context_summarizer import ContextSummarizer
+from haytham.agents.utils.tokenizer import count_tokens
 from haytham.project.project_state import ProjectStateManager
 from haytham.workflow.stage_registry import (
     STAGES,
@@ -322,7 +323,8 @@ class ContextLoader:
     ) -> int:
         """Estimate token count for context.
 
-        Uses rough approximation: 1 token ≈ 4 characters.
+        Counts with the active provider's tokenizer (see
+        ``haytham.agents.utils.tokenizer``).
 
         Args:
             agent_outputs: Dict of agent outputs
@@ -331,14 +333,13 @@ class ContextLoader:
         Returns:
             Estimated token count
         """
-        total_chars = sum(len(output) for output in agent_outputs.values())
+        total_tokens = sum(count_tokens(output) for output in agent_outputs.values())
 
         if preferences:
             # Estimate preferences as JSON string
-            prefs_str = json.dumps(preferences)
-            total_chars += len(prefs_str)
+            total_tokens += count_tokens(json.dumps(preferences))
 
-        return total_chars // 4
+        return total_tokens
 
     def _summarize_outputs(self, agent_outputs: dict[str, str]) -> dict[str, str]:
         """Summarize agent outputs to reduce context size.
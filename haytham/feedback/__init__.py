@@ -9,7 +9,7 @@ This module provides two feedback systems:
 2. **Post-Workflow Feedback** (new):
    - FeedbackProcessor: Orchestrates complete feedback flow
    - FeedbackRouter: Routes feedback to affected stages using LLM
-   - CascadeEngine: Calculates downstream stages to revise
+   - CascadeEngine: Calculates downstream stages to revise from stage dependencies
    - RevisionExecutor: Re-invokes agents with feedback context
 
 The new post-workflow feedback system allows users to provide feedback
@@ -21,6 +21,7 @@ stages within the same workflow.
 from haytham.feedback.cascade_engine import (
     get_cascade_summary,
     get_downstream_stages,
+    get_stage_dependencies,
     get_stages_to_revise,
     is_cascade_needed,
 )
@@ -41,6 +42,7 @@ from haytham.feedback.feedback_router import (
 from haytham.feedback.revision_executor import (
     RevisionResult,
     execute_revision,
+    output_fingerprint,
 )
 from haytham.feedback.user_feedback_loop import (
     ChangeRequest,
@@ -60,12 +62,14 @@ __all__ = [
     "FeedbackRouteResult",
     # New post-workflow feedback - Cascade
     "get_downstream_stages",
+    "get_stage_dependencies",
     "get_stages_to_revise",
     "is_cascade_needed",
     "get_cascade_summary",
     # New post-workflow feedback - Executor
     "execute_revision",
     "RevisionResult",
+    "output_fingerprint",
     # New post-workflow feedback - Processor
     "FeedbackProcessor",
     "FeedbackResult",
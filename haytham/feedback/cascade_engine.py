@@ -4,8 +4,12 @@ This module calculates which stages need to be revised when feedback affects
 an earlier stage. Cascading only happens within the current workflow - changes
 to one workflow never cascade to another.
 
-Key Principle: If feedback affects stage N, all stages after N in the same
-workflow must also be re-run to maintain consistency.
+Key Principle: If feedback affects stage N, every stage in the same workflow
+that consumes N's output (directly or through another revised stage) must also
+be re-run to maintain consistency. Consumption follows the stage dependency
+graph used for DAG runs (``StageMetadata.required_context`` plus state reads,
+see ``dag_executor.build_stage_dag``), so stages that don't read a changed
+output are left alone.
 """
 
 import logging
@@ -13,6 +17,45 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def get_stage_dependencies(workflow_stages: list[str]) -> dict[str, list[str]]:
+    """Get the upstream stages each workflow stage consumes.
+
+    Args:
+        workflow_stages: Ordered list of all stages in the current workflow
+
+    Returns:
+        Dict mapping each stage slug to the slugs (within ``workflow_stages``)
+        whose output it reads. Stages unknown to the registry are assumed to
+        read every stage before them.
+
+    Example:
+        >>> deps = get_stage_dependencies(["idea-analysis", "market-context", "risk-assessment"])
+        >>> deps["risk-assessment"]
+        ['idea-analysis', 'market-context']
+    """
+    from haytham.workflow.dag_executor import build_stage_dag
+    from haytham.workflow.stage_registry import get_stage_registry
+    from haytham.workflow.workflow_specs import WORKFLOW_SPECS
+
+    registry = get_stage_registry()
+    known = {slug: registry.get_by_slug_safe(slug) for slug in workflow_stages}
+    workflow_types = dict.fromkeys(meta.workflow_type for meta in known.values() if meta)
+    nodes = build_stage_dag([WORKFLOW_SPECS[wt] for wt in workflow_types if wt in WORKFLOW_SPECS])
+    slug_by_action = {meta.action_name: slug for slug, meta in known.items() if meta}
+
+    dependencies = {}
+    for index, slug in enumerate(workflow_stages):
+        meta = known[slug]
+        node = nodes.get(meta.action_name) if meta else None
+        if node is None:
+            dependencies[slug] = workflow_stages[:index]
+        else:
+            dependencies[slug] = [
+                slug_by_action[action] for action in node.depends_on if action in slug_by_action
+            ]
+    return dependencies
+
+
 def get_downstream_stages(
     stage_slug: str,
     workflow_stages: list[str],
@@ -51,18 +94,19 @@ def get_stages_to_revise(
     """Get complete list of stages to revise including downstream cascade.
 
     When feedback affects one or more stages, this function calculates the
-    full set of stages that need revision. It finds the earliest affected
-    stage and includes all subsequent stages in the workflow.
+    full set of stages that need revision: the affected stages plus every
+    stage that depends on a stage being revised (see
+    ``get_stage_dependencies``).
 
-    This ensures consistency: if an early stage changes, all downstream
-    stages must be updated to reflect those changes.
+    This ensures consistency: if an early stage changes, all stages that
+    consume it must be updated to reflect those changes.
 
     Args:
         affected_stages: List of stages directly affected by feedback (from router)
         workflow_stages: Ordered list of all stages in the current workflow
 
     Returns:
-        List of stage slugs to revise, in execution order (earliest affected + all downstream)
+        List of stage slugs to revise, in workflow order
 
     Example:
         >>> stages = ["idea-analysis", "market-context", "risk-assessment", "validation-summary"]
@@ -70,9 +114,9 @@ def get_stages_to_revise(
         >>> get_stages_to_revise(["market-context"], stages)
         ['market-context', 'risk-assessment', 'validation-summary']
         >>>
-        >>> # Feedback affects multiple stages - cascade from earliest
-        >>> get_stages_to_revise(["risk-assessment", "market-context"], stages)
-        ['market-context', 'risk-assessment', 'validation-summary']
+        >>> # Stages that don't read the revised output are not re-run
+        >>> get_stages_to_revise(["system-traits"], ["mvp-scope", "capability-model", "system-traits"])
+        ['system-traits']
     """
     if not affected_stages:
         logger.warning("No affected stages provided, nothing to revise")
@@ -82,28 +126,31 @@ def get_stages_to_revise(
         logger.warning("No workflow stages provided, nothing to revise")
         return []
 
-    # Find the earliest affected stage
-    earliest_index = None
+    to_revise = set()
     for stage in affected_stages:
-        try:
-            index = workflow_stages.index(stage)
-            if earliest_index is None or index < earliest_index:
-                earliest_index = index
-        except ValueError:
+        if stage in workflow_stages:
+            to_revise.add(stage)
+        else:
             logger.warning(f"Affected stage '{stage}' not found in workflow stages")
-            continue
 
-    if earliest_index is None:
+    if not to_revise:
         logger.warning(f"None of the affected stages {affected_stages} found in workflow")
         return []
 
-    # Return earliest + all downstream stages
-    stages_to_revise = workflow_stages[earliest_index:]
+    # Propagate along dependency edges until no new stage is reached
+    dependencies = get_stage_dependencies(workflow_stages)
+    changed = True
+    while changed:
+        changed = False
+        for slug in workflow_stages:
+            if slug not in to_revise and any(dep in to_revise for dep in dependencies[slug]):
+                to_revise.add(slug)
+                changed = True
+
+    stages_to_revise = [slug for slug in workflow_stages if slug in to_revise]
 
     logger.info(
-        f"Cascade calculation: affected={affected_stages}, "
-        f"earliest_index={earliest_index}, "
-        f"stages_to_revise={stages_to_revise}"
+        f"Cascade calculation: affected={affected_stages}, stages_to_revise={stages_to_revise}"
     )
 
     return stages_to_revise
@@ -115,8 +162,8 @@ def is_cascade_needed(
 ) -> bool:
     """Check if cascading to downstream stages is needed.
 
-    Cascading is needed when the affected stage is not the last stage
-    in the workflow.
+    Cascading is needed when another stage in the workflow depends on
+    one of the affected stages.
 
     Args:
         affected_stages: List of stages directly affected by feedback
@@ -135,21 +182,8 @@ def is_cascade_needed(
     if not affected_stages or not workflow_stages:
         return False
 
-    # Find the earliest affected stage
-    earliest_index = None
-    for stage in affected_stages:
-        try:
-            index = workflow_stages.index(stage)
-            if earliest_index is None or index < earliest_index:
-                earliest_index = index
-        except ValueError:
-            continue
-
-    if earliest_index is None:
-        return False
-
-    # Cascade is needed if there are stages after the earliest affected one
-    return earliest_index < len(workflow_stages) - 1
+    stages_to_revise = get_stages_to_revise(affected_stages, workflow_stages)
+    return any(slug not in affected_stages for slug in stages_to_revise)
 
 
 def get_cascade_summary(
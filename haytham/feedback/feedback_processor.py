@@ -4,19 +4,25 @@ This module provides the FeedbackProcessor class which orchestrates the
 complete feedback processing flow:
 
 1. Routes feedback to affected stages using the LLM router
-2. Calculates cascade scope (downstream stages within the workflow)
-3. Executes revisions in order
+2. Calculates cascade scope (stages within the workflow that read a revised stage)
+3. Executes revisions, running independent stages concurrently
 4. Updates session with revised outputs
 
 The processor operates within a single workflow - feedback never affects
 stages in other workflows.
 """
 
+import contextvars
 import logging
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 
-from haytham.feedback.cascade_engine import get_cascade_summary, get_stages_to_revise
+from haytham.feedback.cascade_engine import (
+    get_cascade_summary,
+    get_stage_dependencies,
+    get_stages_to_revise,
+)
 from haytham.feedback.feedback_router import FeedbackRouteResult, route_feedback
 from haytham.feedback.revision_executor import (
     RevisionResult,
@@ -35,6 +41,8 @@ class FeedbackResult:
     Attributes:
         affected_stages: Stages directly affected by the feedback (from router)
         revised_stages: All stages that were revised (including cascade)
+        skipped_stages: Cascade stages left as-is because nothing they read
+            materially changed
         revision_results: Individual results for each stage revision
         reasoning: Router's reasoning for stage selection
         cascade_summary: Human-readable summary of what was affected
@@ -44,6 +52,7 @@ class FeedbackResult:
 
     affected_stages: list[str]
     revised_stages: list[str]
+    skipped_stages: list[str] = field(default_factory=list)
     revision_results: list[RevisionResult] = field(default_factory=list)
     reasoning: str = ""
     cascade_summary: str = ""
@@ -62,7 +71,9 @@ class FeedbackProcessor:
     This class manages the complete feedback loop:
     1. Routes feedback to determine which stages are affected
     2. Calculates which downstream stages need cascading updates
-    3. Executes revisions in order (earliest affected first)
+    3. Executes each revision once the stages it reads are done, running
+       independent stages concurrently and skipping cascade stages whose
+       inputs came back materially unchanged
     4. Provides progress callbacks for UI updates
 
     The processor ensures feedback only affects stages within the current
@@ -73,6 +84,7 @@ class FeedbackProcessor:
         workflow_type: Type of workflow being processed
         workflow_stages: Ordered list of stage slugs in the workflow
         system_goal: Original startup idea for context
+        max_workers: Maximum stages revised at once (None = all ready stages)
 
     Example:
         >>> processor = FeedbackProcessor(
@@ -96,6 +108,7 @@ class FeedbackProcessor:
         workflow_type: str,
         workflow_stages: list[str],
         system_goal: str,
+        max_workers: int | None = None,
     ):
         """Initialize the feedback processor.
 
@@ -104,11 +117,13 @@ class FeedbackProcessor:
             workflow_type: Type of workflow (e.g., "idea-validation")
             workflow_stages: Ordered list of stage slugs in this workflow
             system_goal: Original startup idea for context
+            max_workers: Maximum stages revised at once (None = all ready stages)
         """
         self.session_manager = session_manager
         self.workflow_type = workflow_type
         self.workflow_stages = workflow_stages
         self.system_goal = system_goal
+        self.max_workers = max_workers
 
     def process_feedback(
         self,
@@ -121,13 +136,14 @@ class FeedbackProcessor:
         This method:
         1. Routes feedback to determine affected stages
         2. Calculates cascade scope
-        3. Revises stages in order
+        3. Revises stages in dependency order
         4. Returns comprehensive results
 
         Args:
             feedback: User's feedback text
             on_stage_start: Optional callback when revision starts for a stage
-            on_stage_complete: Optional callback when revision completes for a stage
+            on_stage_complete: Optional callback when revision completes (or is
+                skipped) for a stage. Both callbacks run on the calling thread.
 
         Returns:
             FeedbackResult with affected stages, revised stages, and status
@@ -166,7 +182,7 @@ class FeedbackProcessor:
 
             logger.info(f"Will revise stages: {stages_to_revise}")
 
-            # Step 4: Execute revisions in order
+            # Step 4: Execute revisions
             revision_results = self._execute_revisions(
                 feedback=feedback,
                 affected_stages=route_result.affected_stages,
@@ -186,11 +202,13 @@ class FeedbackProcessor:
             else:
                 status = "failed"
 
-            revised_slugs = [r.stage_slug for r in revision_results if r.success]
+            revised_slugs = [r.stage_slug for r in revision_results if r.success and not r.skipped]
+            skipped_slugs = [r.stage_slug for r in revision_results if r.skipped]
 
             return FeedbackResult(
                 affected_stages=route_result.affected_stages,
                 revised_stages=revised_slugs,
+                skipped_stages=skipped_slugs,
                 revision_results=revision_results,
                 reasoning=route_result.reasoning,
                 cascade_summary=cascade_summary,
@@ -231,10 +249,14 @@ class FeedbackProcessor:
         on_stage_start: Callable[[str], None] | None = None,
         on_stage_complete: Callable[[str], None] | None = None,
     ) -> list[RevisionResult]:
-        """Execute revisions for all stages in order.
+        """Execute revisions for all stages, concurrently where independent.
 
-        Stages directly affected by feedback get the full feedback context.
-        Downstream stages (cascade) get context from revised upstream stages.
+        A stage starts once every stage it reads (among those being revised)
+        has finished. Stages directly affected by feedback get the full
+        feedback context. Downstream stages (cascade) get context from the
+        upstream stages whose output changed, and are skipped when none did.
+        A cascade stage whose upstream revision failed is not revised and
+        fails too, so its dependents are not reported as up to date.
 
         Args:
             feedback: Original user feedback
@@ -244,52 +266,112 @@ class FeedbackProcessor:
             on_stage_complete: Progress callback
 
         Returns:
-            List of RevisionResult for each stage
+            List of RevisionResult for each stage, in ``stages_to_revise`` order
         """
-        results = []
-        revised_so_far = []
-
-        for stage_slug in stages_to_revise:
-            logger.info(f"Revising stage '{stage_slug}'...")
-
-            if on_stage_start:
-                on_stage_start(stage_slug)
-
-            # Determine if this is a direct feedback or cascade revision
-            is_direct_feedback = stage_slug in affected_stages
-
-            # For cascade revisions, build context from revised upstream stages
-            upstream_context = None
-            if not is_direct_feedback and revised_so_far:
-                upstream_context = get_revision_context_for_stage(
-                    session_manager=self.session_manager,
-                    stage_slug=stage_slug,
-                    revised_stages=revised_so_far,
-                )
-
-            # Execute the revision
-            result = execute_revision(
-                stage_slug=stage_slug,
-                feedback=feedback if is_direct_feedback else None,
-                session_manager=self.session_manager,
-                system_goal=self.system_goal,
-                is_cascade=not is_direct_feedback,
-                upstream_context=upstream_context,
-            )
-
-            results.append(result)
-
-            if result.success:
-                revised_so_far.append(stage_slug)
-
-            if on_stage_complete:
-                on_stage_complete(stage_slug)
-
-            # Note: We continue even if a stage fails, to provide partial results
-            if not result.success:
-                logger.warning(f"Stage '{stage_slug}' revision failed: {result.error}")
-
-        return results
+        dependencies = get_stage_dependencies(self.workflow_stages)
+        upstream = {
+            slug: [dep for dep in dependencies.get(slug, []) if dep in stages_to_revise]
+            for slug in stages_to_revise
+        }
+        results: dict[str, RevisionResult] = {}
+        running: dict[Future, str] = {}
+
+        def notify(callback: Callable[[str], None] | None, stage_slug: str) -> None:
+            if callback:
+                try:
+                    callback(stage_slug)
+                except (TypeError, AttributeError, ValueError) as e:
+                    logger.error(f"Feedback progress callback failed: {e}")
+
+        def schedule(executor: ThreadPoolExecutor) -> None:
+            progressed = True
+            while progressed:
+                progressed = False
+                for stage_slug in stages_to_revise:
+                    if stage_slug in results or stage_slug in running.values():
+                        continue
+                    if any(dep not in results for dep in upstream[stage_slug]):
+                        continue
+
+                    is_direct_feedback = stage_slug in affected_stages
+                    failed_upstream = [
+                        dep for dep in upstream[stage_slug] if not results[dep].success
+                    ]
+                    if not is_direct_feedback and failed_upstream:
+                        logger.warning(
+                            f"Not revising '{stage_slug}': upstream revision of "
+                            f"'{failed_upstream[0]}' failed"
+                        )
+                        results[stage_slug] = RevisionResult(
+                            stage_slug=stage_slug,
+                            agent_name="",
+                            output="",
+                            success=False,
+                            error=f"Upstream stage '{failed_upstream[0]}' revision failed",
+                        )
+                        notify(on_stage_complete, stage_slug)
+                        progressed = True
+                        continue
+
+                    changed_upstream = [dep for dep in upstream[stage_slug] if results[dep].changed]
+                    if not is_direct_feedback and not changed_upstream:
+                        # Early cutoff: nothing this stage reads changed
+                        logger.info(f"Skipping '{stage_slug}': upstream output unchanged")
+                        results[stage_slug] = RevisionResult(
+                            stage_slug=stage_slug,
+                            agent_name="",
+                            output="",
+                            success=True,
+                            changed=False,
+                            skipped=True,
+                        )
+                        notify(on_stage_complete, stage_slug)
+                        progressed = True
+                        continue
+                    if self.max_workers is not None and len(running) >= self.max_workers:
+                        return
+
+                    logger.info(f"Revising stage '{stage_slug}'...")
+                    notify(on_stage_start, stage_slug)
+
+                    # For cascade revisions, build context from changed upstream stages
+                    upstream_context = None
+                    if not is_direct_feedback:
+                        upstream_context = get_revision_context_for_stage(
+                            session_manager=self.session_manager,
+                            stage_slug=stage_slug,
+                            revised_stages=changed_upstream,
+                        )
+
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        execute_revision,
+                        stage_slug=stage_slug,
+                        feedback=feedback if is_direct_feedback else None,
+                        session_manager=self.session_manager,
+                        system_goal=self.system_goal,
+                        is_cascade=not is_direct_feedback,
+                        upstream_context=upstream_context,
+                    )
+                    running[future] = stage_slug
+
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(stages_to_revise) or 1) as ex:
+            schedule(ex)
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage_slug = running.pop(future)
+                    result = future.result()
+                    results[stage_slug] = result
+
+                    notify(on_stage_complete, stage_slug)
+
+                    # Note: We continue even if a stage fails, to provide partial results
+                    if not result.success:
+                        logger.warning(f"Stage '{stage_slug}' revision failed: {result.error}")
+                schedule(ex)
+
+        return [results[slug] for slug in stages_to_revise]
 
     def get_workflow_stages_display(self) -> list[dict]:
         """Get display information for all workflow stages.
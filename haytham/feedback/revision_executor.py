@@ -8,10 +8,17 @@ Key Features:
 - Agents retain full tool access (web search, etc.) during revision
 - Revision prompts guide agents to focus on the feedback
 - Cascade prompts help downstream agents stay consistent
+- A stage's agents are revised concurrently
 - Outputs are saved back to the session, replacing originals
+- Each result records whether the stage output materially changed, so
+  downstream revisions can be cut off early (see ``output_fingerprint``)
 """
 
+import concurrent.futures
+import contextvars
+import hashlib
 import logging
+import re
 from collections.abc import Callable
 from dataclasses import dataclass
 
@@ -77,6 +84,9 @@ class RevisionResult:
         output: Revised output content
         success: Whether the revision succeeded
         error: Error message if revision failed
+        changed: Whether the stage output materially changed
+        skipped: True if the revision was not run because no upstream
+            output it reads had changed
     """
 
     stage_slug: str
@@ -84,6 +94,30 @@ class RevisionResult:
     output: str
     success: bool
     error: str | None = None
+    changed: bool = True
+    skipped: bool = False
+
+
+_BULLET_RE = re.compile(r"^\s*[*+•]\s+", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def output_fingerprint(text: str | None) -> str:
+    """Hash of an output with formatting-only differences normalized away.
+
+    Whitespace runs, blank lines and the bullet marker used (``*``, ``+``,
+    ``•`` or ``-``) do not change the fingerprint, so a revision that only reflows text counts
+    as unchanged.
+
+    Args:
+        text: Stage or agent output
+
+    Returns:
+        Hex SHA-256 digest of the normalized text
+    """
+    normalized = _BULLET_RE.sub("- ", text or "")
+    normalized = _WHITESPACE_RE.sub(" ", normalized).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
 def execute_revision(
@@ -142,6 +176,7 @@ def execute_revision(
                     output="",
                     success=True,  # Not a failure, just nothing to update
                     error=None,
+                    changed=False,
                 )
             raise ValueError(f"No previous output found for stage: {stage_slug}")
 
@@ -163,8 +198,7 @@ def execute_revision(
         # Use higher max_tokens for revisions since they include previous output in prompt
         REVISION_MAX_TOKENS = 4000
 
-        revised_outputs = []
-        for agent_name in agent_names:
+        def revise(agent_name: str) -> str:
             logger.info(
                 f"Invoking agent '{agent_name}' for revision with max_tokens={REVISION_MAX_TOKENS}"
             )
@@ -174,7 +208,6 @@ def execute_revision(
 
             # Extract the output text
             revised_output = _extract_agent_output(result)
-            revised_outputs.append(revised_output)
 
             # Save the revised output (replaces original)
             _save_revised_output(
@@ -185,9 +218,27 @@ def execute_revision(
             )
 
             logger.info(f"Agent '{agent_name}' revision complete, output saved")
+            return revised_output
+
+        if len(agent_names) == 1:
+            revised_outputs = [revise(agent_names[0])]
+        else:
+            # Agents of one stage revise independently; the LLM scheduler
+            # bounds how many reach the provider at once
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(agent_names)) as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, revise, agent_name)
+                    for agent_name in agent_names
+                ]
+            revised_outputs = [future.result() for future in futures]
 
         # Combine outputs if multiple agents
         combined_output = "\n\n".join(revised_outputs)
+        changed = output_fingerprint(
+            session_manager.load_stage_output(stage_slug)
+        ) != output_fingerprint(previous_output)
+        if not changed:
+            logger.info(f"Revision of '{stage_slug}' left its output materially unchanged")
 
         if on_progress:
             on_progress(stage_slug, "completed")
@@ -197,6 +248,7 @@ def execute_revision(
             agent_name=agent_names[0],  # Primary agent
             output=combined_output,
             success=True,
+            changed=changed,
         )
 
     except Exception as e:
@@ -211,6 +263,7 @@ def execute_revision(
             output="",
             success=False,
             error=str(e),
+            changed=False,
         )
 
 
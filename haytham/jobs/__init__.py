@@ -0,0 +1,22 @@
+"""Headless batch execution of Haytham workflows.
+
+Queue ideas on disk and run their workflows concurrently in worker
+processes, each job with its own session directory. See ``python -m
+haytham.jobs --help``.
+
+Components:
+- JobStore: On-disk job queue and status records
+- Job: One queued workflow run
+- JobRunner: Process pool that drains the queue
+- run_job: Runs a single job (worker entry point)
+"""
+
+from .runner import JobRunner, run_job
+from .store import Job, JobStore
+
+__all__ = [
+    "Job",
+    "JobRunner",
+    "JobStore",
+    "run_job",
+]
@@ -0,0 +1,109 @@
+"""CLI for the headless job runner.
+
+Usage:
+    python -m haytham.jobs submit "An app that ..." "A marketplace for ..."
+    python -m haytham.jobs submit --file ideas.txt --workflows idea-validation
+    python -m haytham.jobs run --workers 8
+    python -m haytham.jobs status
+    python -m haytham.jobs status <job_id>
+    python -m haytham.jobs cancel <job_id>
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from haytham.jobs.runner import JobRunner
+from haytham.jobs.store import JobStore
+
+
+def _submit(store: JobStore, args: argparse.Namespace) -> int:
+    ideas = list(args.ideas)
+    if args.file:
+        lines = Path(args.file).read_text(encoding="utf-8").splitlines()
+        ideas += [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+    if not ideas:
+        print("No ideas given", file=sys.stderr)
+        return 2
+    workflows = args.workflows.split(",") if args.workflows else None
+    for idea in ideas:
+        job = store.submit(idea, workflows=workflows, archetype=args.archetype)
+        print(job.id)
+    return 0
+
+
+def _status(store: JobStore, args: argparse.Namespace) -> int:
+    if args.job_id:
+        job = store.get(args.job_id)
+        if job is None:
+            print(f"Job not found: {args.job_id}", file=sys.stderr)
+            return 1
+        print(json.dumps(job.to_dict(), indent=2))
+        return 0
+
+    if args.json:
+        print(json.dumps([job.to_dict() for job in store.list()], indent=2))
+        return 0
+    for job in store.list():
+        idea = job.idea if len(job.idea) <= 50 else job.idea[:47] + "..."
+        print(f"{job.id}  {job.status:<9}  {job.execution_time:7.1f}s  {idea}")
+    counts = ", ".join(f"{n} {status}" for status, n in store.counts().items() if n)
+    print(counts or "No jobs")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Run Haytham workflows for many ideas in parallel",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--jobs-dir", help="Jobs root (default: JOBS_DIR or ./jobs)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    submit = sub.add_parser("submit", help="Queue one job per idea")
+    submit.add_argument("ideas", nargs="*", help="Idea descriptions")
+    submit.add_argument("--file", help="File with one idea per line")
+    submit.add_argument(
+        "--workflows", help="Comma-separated workflow types (default: all, in phase order)"
+    )
+    submit.add_argument("--archetype", default="", help="Idea archetype (default: auto-detect)")
+
+    run = sub.add_parser("run", help="Run queued jobs")
+    run.add_argument("--workers", type=int, help="Worker processes (default: JOB_WORKERS)")
+    run.add_argument("--watch", action="store_true", help="Keep waiting for new jobs")
+
+    status = sub.add_parser("status", help="Show job status")
+    status.add_argument("job_id", nargs="?", help="Show one job in full")
+    status.add_argument("--json", action="store_true", help="Print all jobs as JSON")
+
+    cancel = sub.add_parser("cancel", help="Cancel a queued job")
+    cancel.add_argument("job_id")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    store = JobStore(args.jobs_dir)
+
+    if args.command == "submit":
+        return _submit(store, args)
+    if args.command == "status":
+        return _status(store, args)
+    if args.command == "cancel":
+        if store.cancel(args.job_id):
+            return 0
+        print(f"Job {args.job_id} is not queued", file=sys.stderr)
+        return 1
+
+    finished = JobRunner(store, max_workers=args.workers).run(watch=args.watch)
+    failed = [job for job in finished if job.status != "completed"]
+    print(f"{len(finished) - len(failed)} completed, {len(failed)} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
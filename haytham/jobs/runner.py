@@ -0,0 +1,255 @@
+"""Process pool that drains the on-disk job queue.
+
+``JobRunner`` claims queued jobs from a ``JobStore`` and runs each in a
+worker process via ``run_job``, which executes the job's workflows with
+``run_workflows`` (linear or DAG per ``WORKFLOW_EXECUTION_MODE``) against
+the job's own session directory. Throughput scales with the number of
+workers rather than with browser tabs.
+
+Workers are started with the ``spawn`` method, so each has its own model
+client pool and LLM scheduler: lane limits (``LLM_MAX_CONCURRENCY``,
+``LLM_REQUESTS_PER_MINUTE``) apply per worker. Divide the account quota by
+``JOB_WORKERS`` when setting them for a batch.
+
+Only one runner may drain a jobs directory at a time (enforced with a lock
+file); any number of processes may submit jobs or poll their status.
+
+Settings:
+    JOBS_DIR     -- Jobs root (default ``jobs``)
+    JOB_WORKERS  -- Worker processes (default: CPU count)
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import UTC, datetime
+from pathlib import Path
+
+from .store import COMPLETED, FAILED, QUEUED, RUNNING, Job, JobStore, _pid_alive
+
+logger = logging.getLogger(__name__)
+
+_LOCK_FILE = ".runner.lock"
+
+# Dispatches per job when its worker process dies; one crashing job breaks
+# the whole pool, so jobs in flight alongside it get another attempt
+_MAX_ATTEMPTS = 2
+
+
+def get_job_workers() -> int:
+    """Worker processes from ``JOB_WORKERS`` (default: CPU count)."""
+    default = os.cpu_count() or 1
+    raw = os.getenv("JOB_WORKERS")
+    try:
+        value = int(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid JOB_WORKERS '%s', using default", raw)
+        return default
+    return value if value > 0 else default
+
+
+def run_job(jobs_dir: str, job_id: str) -> Job:
+    """Run one job's workflows. Executed in a worker process.
+
+    The job directory is the SessionManager base dir, so stage outputs land
+    in ``<job_dir>/session``. Log output goes to ``<job_dir>/job.log``.
+    """
+    # Lazy imports: keep the parent process light and let each spawned
+    # worker load the workflow stack itself
+    from haytham.agents.utils.web_search import reset_session_counter
+    from haytham.session.session_manager import SessionManager
+    from haytham.workflow.dag_executor import run_workflows
+    from haytham.workflow.stage_registry import WorkflowType
+
+    store = JobStore(jobs_dir)
+    with store.locked(job_id) as job:
+        if job is None:
+            raise ValueError(f"Job not found: {job_id}")
+        if job.status != RUNNING:
+            # Cancelled or requeued between dispatch and start
+            logger.info(f"Job {job_id} is {job.status}, not starting it")
+            return job
+        job.worker_pid = os.getpid()
+        job.started_at = datetime.now(UTC).isoformat()
+        store.save(job)
+
+    job_dir = store.job_dir(job_id)
+    handler = logging.FileHandler(job_dir / "job.log", encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    # A spawned worker's root logger starts at WARNING, which would drop the
+    # stages' INFO progress from job.log
+    root_level = root_logger.level
+    if root_logger.getEffectiveLevel() > logging.INFO:
+        root_logger.setLevel(logging.INFO)
+
+    start_time = time.time()
+    try:
+        session_manager = SessionManager(str(job_dir))
+        reset_session_counter(session_id=str(session_manager.session_dir))
+        workflow_types = [WorkflowType(w) for w in job.workflows]
+        if WorkflowType.IDEA_VALIDATION in workflow_types:
+            session_manager.set_system_goal(job.idea)
+            session_manager.create_session()
+            extra = {"archetype": job.archetype}
+        else:
+            extra = {}
+
+        result = run_workflows(workflow_types, session_manager, system_goal=job.idea, **extra)
+
+        job.stage_statuses = result.statuses
+        job.status = COMPLETED if result.completed else FAILED
+        if result.errors:
+            stage, message = next(iter(result.errors.items()))
+            job.error = f"{stage}: {message}"
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+        job.status = FAILED
+        job.error = str(e)
+    finally:
+        job.execution_time = time.time() - start_time
+        job.finished_at = datetime.now(UTC).isoformat()
+        with store.locked(job_id):
+            store.save(job)
+        root_logger.removeHandler(handler)
+        root_logger.setLevel(root_level)
+        handler.close()
+
+    return job
+
+
+class JobRunner:
+    """Dispatches queued jobs to a process pool until the queue is empty.
+
+    Args:
+        store: Job store to drain.
+        max_workers: Worker processes (default ``JOB_WORKERS``).
+        poll_interval: Seconds between queue scans while jobs run.
+        mp_context: Multiprocessing context (default ``spawn``).
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        max_workers: int | None = None,
+        poll_interval: float = 2.0,
+        mp_context=None,
+    ):
+        self.store = store
+        self.max_workers = max_workers or get_job_workers()
+        self.poll_interval = poll_interval
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+    def run(self, watch: bool = False) -> list[Job]:
+        """Run queued jobs, including ones submitted while running.
+
+        Args:
+            watch: Keep polling for new jobs instead of returning once the
+                queue is empty and all workers are idle.
+
+        Returns:
+            Jobs finished by this call, in completion order.
+
+        Raises:
+            RuntimeError: If another runner holds the jobs directory.
+        """
+        finished: list[Job] = []
+        with _RunnerLock(self.store.root):
+            self.store.requeue_stale()
+            while self._drain(watch, finished):
+                logger.warning("Worker pool broke; starting a new one")
+        return finished
+
+    def _drain(self, watch: bool, finished: list[Job]) -> bool:
+        """Run jobs on one pool. Returns True if the pool broke."""
+        running: dict[Future, str] = {}
+        broken = False
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=self.mp_context
+        ) as executor:
+            while not broken:
+                self._dispatch(executor, running)
+                if not running:
+                    if not watch:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+                done, _ = wait(running, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                broken = any(isinstance(f.exception(), BrokenProcessPool) for f in done)
+                if broken:
+                    # Every job still in flight died with the pool; collect them
+                    # all so none is left marked running on disk
+                    done, _ = wait(running)
+                for future in done:
+                    job = self._collect(future, running.pop(future))
+                    if job.finished:
+                        finished.append(job)
+        return broken
+
+    def _dispatch(self, executor: ProcessPoolExecutor, running: dict[Future, str]) -> None:
+        free = self.max_workers - len(running)
+        if free <= 0:
+            return
+        for queued in self.store.list(status=QUEUED)[:free]:
+            job = self.store.claim(queued.id)
+            if job is None:
+                continue  # cancelled since the scan
+            logger.info(f"Dispatching job {job.id} (attempt {job.attempts})")
+            future = executor.submit(run_job, str(self.store.root), job.id)
+            running[future] = job.id
+
+    def _collect(self, future: Future, job_id: str) -> Job:
+        try:
+            job = future.result()
+        except Exception as e:
+            # Worker died or run_job raised before recording the outcome
+            logger.error(f"Job {job_id} worker failed: {e}")
+            with self.store.locked(job_id) as job:
+                if job is None:
+                    raise
+                if isinstance(e, BrokenProcessPool) and job.attempts < _MAX_ATTEMPTS:
+                    job.status = QUEUED
+                    job.worker_pid = None
+                else:
+                    job.status = FAILED
+                    job.error = job.error or f"Worker failed: {e}"
+                    job.finished_at = datetime.now(UTC).isoformat()
+                self.store.save(job)
+            return job
+        logger.info(f"Job {job.id} {job.status} in {job.execution_time:.1f}s")
+        return job
+
+
+class _RunnerLock:
+    """Exclusive lock file naming the runner's PID."""
+
+    def __init__(self, root: Path):
+        self.path = root / _LOCK_FILE
+
+    def __enter__(self):
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self._holder_alive():
+                    raise RuntimeError(f"Another job runner is using {self.path.parent}") from None
+                self.path.unlink(missing_ok=True)  # left behind by a dead runner
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(str(os.getpid()))
+            return self
+        raise RuntimeError(f"Could not acquire {self.path}")
+
+    def __exit__(self, *exc):
+        self.path.unlink(missing_ok=True)
+
+    def _holder_alive(self) -> bool:
+        try:
+            pid = int(self.path.read_text().strip())
+        except (OSError, ValueError):
+            return False
+        return _pid_alive(pid)
@@ -0,0 +1,253 @@
+"""On-disk job queue for headless workflow runs.
+
+Each job is a directory under the jobs root::
+
+    <jobs_dir>/<job_id>/
+        job.json     -- Job record (status, workflows, timings, results)
+        job.log      -- Log output of the worker that ran the job
+        session/     -- SessionManager session (stage outputs, manifest)
+        outputs/
+
+The directory doubles as the job's SessionManager ``base_dir``, so every job
+has its own session and jobs never share state. ``job.json`` is rewritten
+atomically, and status transitions (claim, cancel, start, finish) re-read
+the record under an advisory ``flock`` on ``<job_id>/.job.lock``, so a
+cancel from another process cannot race the runner claiming the same job.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from datetime import UTC, datetime
+from pathlib import Path
+
+from haytham.workflow.stage_registry import WorkflowType
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATUSES = {COMPLETED, FAILED, CANCELLED}
+
+JOB_FILE = "job.json"
+_LOCK_FILE = ".job.lock"
+
+# Phase order used when a job does not list its workflows
+DEFAULT_WORKFLOWS: tuple[str, ...] = (
+    WorkflowType.IDEA_VALIDATION.value,
+    WorkflowType.MVP_SPECIFICATION.value,
+    WorkflowType.BUILD_BUY_ANALYSIS.value,
+    WorkflowType.ARCHITECTURE_DECISIONS.value,
+    WorkflowType.STORY_GENERATION.value,
+)
+
+
+def get_jobs_dir() -> Path:
+    """Jobs root from ``JOBS_DIR`` (default ``jobs``)."""
+    return Path(os.getenv("JOBS_DIR") or "jobs")
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+@dataclass
+class Job:
+    """One queued workflow run.
+
+    Attributes:
+        id: Job ID (also the directory name).
+        idea: System goal the workflows run against.
+        workflows: WorkflowType values, in phase order.
+        archetype: Optional idea archetype ("" = auto-detect).
+        status: queued, running, completed, failed or cancelled.
+        attempts: Times the job was dispatched to a worker.
+        stage_statuses: Action name -> final stage status.
+        error: First error message when the job failed.
+    """
+
+    id: str
+    idea: str
+    workflows: list[str] = field(default_factory=lambda: list(DEFAULT_WORKFLOWS))
+    archetype: str = ""
+    status: str = QUEUED
+    created_at: str = field(default_factory=_now)
+    started_at: str | None = None
+    finished_at: str | None = None
+    attempts: int = 0
+    worker_pid: int | None = None
+    stage_statuses: dict[str, str] = field(default_factory=dict)
+    error: str | None = None
+    execution_time: float = 0.0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Job":
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+class JobStore:
+    """Reads and writes job records under a jobs root directory."""
+
+    def __init__(self, root: Path | str | None = None):
+        self.root = Path(root) if root is not None else get_jobs_dir()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def job_dir(self, job_id: str) -> Path:
+        return self.root / job_id
+
+    # === Writes ===
+
+    def submit(self, idea: str, workflows: list[str] | None = None, archetype: str = "") -> Job:
+        """Queue a new job.
+
+        Raises:
+            ValueError: If the idea is empty or a workflow type is unknown.
+        """
+        if not idea or not idea.strip():
+            raise ValueError("Job idea must not be empty")
+        workflows = list(workflows or DEFAULT_WORKFLOWS)
+        for workflow in workflows:
+            WorkflowType(workflow)  # ValueError on unknown types
+
+        stamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        job = Job(
+            id=f"{stamp}-{uuid.uuid4().hex[:8]}",
+            idea=idea.strip(),
+            workflows=workflows,
+            archetype=archetype,
+        )
+        self.job_dir(job.id).mkdir(parents=True)
+        self.save(job)
+        logger.info(f"Queued job {job.id} ({', '.join(workflows)})")
+        return job
+
+    def save(self, job: Job) -> None:
+        """Write a job record atomically."""
+        path = self.job_dir(job.id) / JOB_FILE
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{JOB_FILE}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(job.to_dict(), f, indent=2)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @contextmanager
+    def locked(self, job_id: str) -> Iterator[Job | None]:
+        """Hold the job's lock and yield its current record (None if missing).
+
+        Status transitions read, check and save the record inside this block.
+        """
+        job_dir = self.job_dir(job_id)
+        if fcntl is None or not job_dir.is_dir():
+            yield self.get(job_id)
+            return
+        with open(job_dir / _LOCK_FILE, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield self.get(job_id)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def claim(self, job_id: str) -> Job | None:
+        """Mark a queued job running. Returns None if it is no longer queued."""
+        with self.locked(job_id) as job:
+            if job is None or job.status != QUEUED:
+                return None
+            job.status = RUNNING
+            job.attempts += 1
+            self.save(job)
+            return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job. Returns False if it already started."""
+        with self.locked(job_id) as job:
+            if job is None or job.status != QUEUED:
+                return False
+            job.status = CANCELLED
+            job.finished_at = _now()
+            self.save(job)
+            return True
+
+    def requeue_stale(self) -> list[Job]:
+        """Put running jobs whose worker process is gone back in the queue.
+
+        Called when a runner starts, so jobs interrupted by a crash or a
+        killed runner are retried.
+        """
+        requeued = []
+        for stale in self.list(status=RUNNING):
+            with self.locked(stale.id) as job:
+                if job is None or job.status != RUNNING:
+                    continue
+                if job.worker_pid and _pid_alive(job.worker_pid):
+                    continue
+                job.status = QUEUED
+                job.worker_pid = None
+                self.save(job)
+            requeued.append(job)
+            logger.warning(f"Requeued interrupted job {job.id}")
+        return requeued
+
+    # === Reads ===
+
+    def get(self, job_id: str) -> Job | None:
+        path = self.job_dir(job_id) / JOB_FILE
+        try:
+            return Job.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Unreadable job record {path}: {e}")
+            return None
+
+    def list(self, status: str | None = None) -> list[Job]:
+        """All jobs in submission order, optionally filtered by status."""
+        jobs = []
+        for entry in sorted(self.root.iterdir()):
+            if not entry.is_dir():
+                continue
+            job = self.get(entry.name)
+            if job and (status is None or job.status == status):
+                jobs.append(job)
+        return jobs
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs per status."""
+        counts = dict.fromkeys((QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED), 0)
+        for job in self.list():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -284,8 +284,10 @@ class PipelineOrchestrator:
         self._progress.stage = PipelineStage.TASK_GENERATION
         updater.set_current(story_id, "task-generation")
 
+        # Task generation and execution write many small updates; save each stage once
         task_generator = TaskGenerator(self.state, self._save)
-        task_result = task_generator.generate_and_apply(story_id)
+        with updater.batch():
+            task_result = task_generator.generate_and_apply(story_id)
 
         if task_result:
             result.tasks_created = task_result.task_count
@@ -296,7 +298,8 @@ class PipelineOrchestrator:
         updater.set_current(story_id, "implementation")
 
         executor = TaskExecutor(self.state, self._save)
-        execution_result = executor.execute_story_tasks(story_id, simulate_success=True)
+        with updater.batch():
+            execution_result = executor.execute_story_tasks(story_id, simulate_success=True)
 
         result.tasks_completed = execution_result.completed_count
 
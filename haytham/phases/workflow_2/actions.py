@@ -214,31 +214,38 @@ def store_decisions_in_vectordb(
     Returns:
         List of created decision IDs
     """
-    from haytham.state.vector_db import SystemStateDB
+    from haytham.state.vector_db import get_state_db
 
     db_path = session_manager.session_dir / "vector_db"
-    db = SystemStateDB(str(db_path))
-
-    created_ids = []
+    db = get_state_db(str(db_path))
 
+    entries = []
     for dec_data in decisions:
         try:
-            decision = create_decision(
-                name=dec_data.get("name", "Unnamed Decision"),
-                description=dec_data.get("description", ""),
-                rationale=dec_data.get("rationale", ""),
-                source_stage=source_stage,
-                affects=dec_data.get("affects", []),
-                alternatives_considered=dec_data.get("alternatives_considered", []),
-                serves_capabilities=dec_data.get("serves_capabilities", []),
+            entries.append(
+                create_decision(
+                    name=dec_data.get("name", "Unnamed Decision"),
+                    description=dec_data.get("description", ""),
+                    rationale=dec_data.get("rationale", ""),
+                    source_stage=source_stage,
+                    affects=dec_data.get("affects", []),
+                    alternatives_considered=dec_data.get("alternatives_considered", []),
+                    serves_capabilities=dec_data.get("serves_capabilities", []),
+                )
             )
+        except Exception as e:
+            logger.error(f"Failed to build decision: {e}")
 
-            entry_id = db.add_entry(decision)
-            created_ids.append(entry_id)
-            logger.info(f"Created decision: {entry_id} - {decision.name}")
+    try:
+        created_ids = db.add_entries(entries, skip_duplicates=True)
+    except Exception as e:
+        logger.error(f"Failed to store decisions: {e}")
+        return []
 
-        except Exception as e:
-            logger.error(f"Failed to store decision: {e}")
+    created = set(created_ids)
+    for entry in entries:
+        if entry.id in created:
+            logger.info(f"Created decision: {entry.id} - {entry.name}")
 
     return created_ids
 
@@ -258,29 +265,36 @@ def store_entities_in_vectordb(
     Returns:
         List of created entity IDs
     """
-    from haytham.state.vector_db import SystemStateDB
+    from haytham.state.vector_db import get_state_db
 
     db_path = session_manager.session_dir / "vector_db"
-    db = SystemStateDB(str(db_path))
-
-    created_ids = []
+    db = get_state_db(str(db_path))
 
+    entries = []
     for ent_data in entities:
         try:
-            entity = create_entity(
-                name=ent_data.get("name", "Unnamed Entity"),
-                description=ent_data.get("description", ""),
-                attributes=ent_data.get("attributes", []),
-                relationships=ent_data.get("relationships", []),
-                source_stage=source_stage,
+            entries.append(
+                create_entity(
+                    name=ent_data.get("name", "Unnamed Entity"),
+                    description=ent_data.get("description", ""),
+                    attributes=ent_data.get("attributes", []),
+                    relationships=ent_data.get("relationships", []),
+                    source_stage=source_stage,
+                )
             )
+        except Exception as e:
+            logger.error(f"Failed to build entity: {e}")
 
-            entry_id = db.add_entry(entity)
-            created_ids.append(entry_id)
-            logger.info(f"Created entity: {entry_id} - {entity.name}")
+    try:
+        created_ids = db.add_entries(entries, skip_duplicates=True)
+    except Exception as e:
+        logger.error(f"Failed to store entities: {e}")
+        return []
 
-        except Exception as e:
-            logger.error(f"Failed to store entity: {e}")
+    created = set(created_ids)
+    for entry in entries:
+        if entry.id in created:
+            logger.info(f"Created entity: {entry.id} - {entry.name}")
 
     return created_ids
 
@@ -945,10 +959,10 @@ def story_generation(state: State) -> tuple[dict, State]:
 
     if session_manager:
         try:
-            from haytham.state.vector_db import SystemStateDB
+            from haytham.state.vector_db import get_state_db
 
             db_path = session_manager.session_dir / "vector_db"
-            db = SystemStateDB(str(db_path))
+            db = get_state_db(str(db_path))
 
             # Fetch capabilities
             all_caps = db.get_capabilities()
@@ -1609,10 +1623,10 @@ def run_ai_judge_evaluation(session_manager, run_id: str = None) -> dict:
     system_goal = ""
 
     try:
-        from haytham.state.vector_db import SystemStateDB
+        from haytham.state.vector_db import get_state_db
 
         db_path = session_manager.session_dir / "vector_db"
-        db = SystemStateDB(str(db_path))
+        db = get_state_db(str(db_path))
         capabilities = db.get_capabilities()
         entities = db.get_entities()
 
@@ -1816,56 +1830,51 @@ def dependency_ordering(state: State) -> tuple[dict, State]:
 
     if session_manager and ordered_stories:
         try:
-            from haytham.backlog import BacklogCLI
+            from haytham.backlog import open_backlog
+            from haytham.backlog.cli import normalize_priority
 
             project_dir = session_manager.session_dir.parent
-            cli = BacklogCLI(project_dir)
+            cli = open_backlog(project_dir)
 
             # Ensure backlog is initialized
             if not cli.is_initialized():
                 cli.init("Haytham MVP")
                 logger.info("Initialized Backlog.md in project directory")
 
+            specs = []
             for story in ordered_stories:
-                try:
-                    title = story.get("title", "Untitled Story")
-                    description = story.get("description", "")
-                    priority = story.get("priority", "medium")
-                    story_points = story.get("story_points", 0)
-                    acceptance_criteria = story.get("acceptance_criteria", [])
-
-                    # Build labels from traceability
-                    labels = story.get("labels", [])
-
-                    # Add story points as label if present
-                    if story_points:
-                        labels.append(f"points:{story_points}")
-
-                    # Create draft task
-                    task_id = cli.create_task(
-                        title=title,
-                        description=description,
-                        priority=priority,
-                        labels=labels,
-                        acceptance_criteria=acceptance_criteria,
-                        draft=True,
-                    )
+                # Build labels from traceability
+                labels = list(story.get("labels", []))
 
-                    if task_id:
-                        backlog_created += 1
-                        logger.info(f"Created draft task {task_id}: {title}")
-                    else:
-                        backlog_failed += 1
-                        logger.warning(f"Failed to create task: {title}")
+                # Add story points as label if present
+                story_points = story.get("story_points", 0)
+                if story_points:
+                    labels.append(f"points:{story_points}")
 
-                except Exception as e:
-                    backlog_failed += 1
-                    logger.error(f"Error creating task for story: {e}")
+                specs.append(
+                    {
+                        "title": story.get("title", "Untitled Story"),
+                        "description": story.get("description", ""),
+                        "priority": normalize_priority(story.get("priority")),
+                        "labels": labels,
+                        "acceptance_criteria": story.get("acceptance_criteria", []),
+                    }
+                )
+
+            # Create all draft tasks as one validated batch
+            result = cli.create_drafts(specs)
+            for item in result.items:
+                if item.ok:
+                    logger.info(f"Created draft task {item.task_id}: {item.key}")
+                else:
+                    logger.warning(f"Failed to create task: {item.key} ({item.error})")
+            backlog_created = len(result.succeeded)
+            backlog_failed = len(result.failed)
 
             logger.info(f"Backlog.md: Created {backlog_created} drafts, {backlog_failed} failed")
 
         except ImportError:
-            logger.warning("BacklogCLI not available - stories not saved to Backlog.md")
+            logger.warning("Backlog integration not available - stories not saved to Backlog.md")
         except Exception as e:
             logger.error(f"Failed to create Backlog.md tasks: {e}")
 
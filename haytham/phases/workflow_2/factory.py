@@ -119,10 +119,10 @@ def load_workflow_context(session_manager, project_id: str = None) -> WorkflowCo
     logger.info("Loading Workflow 2 context...")
 
     # 1. Load from VectorDB
-    from haytham.state.vector_db import SystemStateDB
+    from haytham.state.vector_db import get_state_db
 
     db_path = session_manager.session_dir / "vector_db"
-    db = SystemStateDB(str(db_path))
+    db = get_state_db(str(db_path))
 
     capabilities = db.get_capabilities()
     decisions = db.get_decisions()
@@ -136,12 +136,12 @@ def load_workflow_context(session_manager, project_id: str = None) -> WorkflowCo
     # 2. Load from Backlog.md
     stories = []
     try:
-        from haytham.backlog import BacklogCLI
+        from haytham.backlog import get_task_index
 
-        cli = BacklogCLI(session_manager.session_dir.parent)
-        if cli.is_initialized():
+        index = get_task_index(session_manager.session_dir.parent)
+        if index.store.is_initialized():
             # Load all tasks and convert to dict format for diff computation
-            tasks = cli.list_tasks()
+            tasks = index.tasks()
             stories = [
                 {
                     "id": task.id,
@@ -156,7 +156,7 @@ def load_workflow_context(session_manager, project_id: str = None) -> WorkflowCo
         else:
             logger.info("Backlog.md not initialized - no stories to load")
     except ImportError:
-        logger.warning("BacklogCLI not available")
+        logger.warning("Backlog integration not available")
     except Exception as e:
         logger.warning(f"Could not load stories from Backlog.md: {e}")
 
@@ -12,6 +12,8 @@ from typing import Any
 
 import yaml
 
+from .yaml_store import load_yaml, write_yaml
+
 
 class ProjectManager:
     """Manages projects, sessions, and version tracking for Haytham.
@@ -439,8 +441,7 @@ class ProjectManager:
         if not config_path.exists():
             raise FileNotFoundError(f"Project configuration not found: {project_id}")
 
-        with open(config_path) as f:
-            return yaml.safe_load(f)
+        return load_yaml(config_path)
 
     def _save_project_config(self, project_id: str, config: dict[str, Any]) -> None:
         """Save project configuration to project.yaml.
@@ -449,10 +450,7 @@ class ProjectManager:
             project_id: The project identifier
             config: Project configuration dictionary
         """
-        config_path = self.base_dir / project_id / "project.yaml"
-
-        with open(config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        write_yaml(self.base_dir / project_id / "project.yaml", config)
 
     def _create_session_manifest(
         self, project_id: str, session_id: str, metadata: dict[str, Any]
@@ -9,7 +9,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import yaml
+from .state_journal import get_journal, replay
+from .yaml_store import load_yaml, write_yaml
 
 if TYPE_CHECKING:
     from .state_models import PipelineState
@@ -100,8 +101,8 @@ class ProjectStateManager:
         """
         if not self.exists():
             return False
-        state = self.load()
-        return state.system_goal is not None and len(state.system_goal.strip()) > 0
+        goal = (load_yaml(self.project_file, shared=True) or {}).get("system_goal")
+        return goal is not None and len(goal.strip()) > 0
 
     def load(self) -> ProjectState:
         """Load project state from project.yaml.
@@ -113,8 +114,7 @@ class ProjectStateManager:
         if not self.exists():
             return ProjectState()
 
-        with open(self.project_file) as f:
-            data = yaml.safe_load(f) or {}
+        data = load_yaml(self.project_file) or {}
 
         enriched_data_raw = data.get("enriched_data", {}) or {}
         enriched = EnrichedData(
@@ -157,9 +157,7 @@ class ProjectStateManager:
             },
         }
 
-        self.session_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.project_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        write_yaml(self.project_file, data)
 
     def set_system_goal(self, goal: str) -> ProjectState:
         """Set the system goal and initialize project state.
@@ -216,8 +214,9 @@ class ProjectStateManager:
         Returns:
             The system goal string, or None if not set
         """
-        state = self.load()
-        return state.system_goal
+        if not self.exists():
+            return None
+        return (load_yaml(self.project_file, shared=True) or {}).get("system_goal")
 
 
 class PipelineStateManager:
@@ -248,9 +247,16 @@ class PipelineStateManager:
         state = manager.load_pipeline_state()
         # ... modify state ...
         manager.save_pipeline_state(state)
+
+    States loaded or saved here carry the session's MutationJournal, so
+    changes made inside ``StateUpdater.batch()`` are appended to
+    pipeline_journal.jsonl until the batch saves (see state_journal).
+    Loading replays journal entries newer than the snapshot's
+    ``pipeline_journal_seq``.
     """
 
     PROJECT_FILE = "project.yaml"
+    JOURNAL_FILE = "pipeline_journal.jsonl"
 
     def __init__(self, session_dir: Path):
         """Initialize the PipelineStateManager.
@@ -260,6 +266,7 @@ class PipelineStateManager:
         """
         self.session_dir = session_dir
         self.project_file = session_dir / self.PROJECT_FILE
+        self.journal = get_journal(session_dir / self.JOURNAL_FILE)
 
     def exists(self) -> bool:
         """Check if project.yaml exists.
@@ -278,9 +285,7 @@ class PipelineStateManager:
         """
         if not self.exists():
             return False
-        with open(self.project_file) as f:
-            data = yaml.safe_load(f) or {}
-        return "pipeline" in data
+        return "pipeline" in (load_yaml(self.project_file, shared=True) or {})
 
     def load_pipeline_state(self) -> "PipelineState":
         """Load pipeline state from project.yaml.
@@ -300,10 +305,10 @@ class PipelineStateManager:
         if not self.exists():
             raise FileNotFoundError(f"project.yaml not found: {self.project_file}")
 
-        with open(self.project_file) as f:
-            data = yaml.safe_load(f) or {}
+        data = load_yaml(self.project_file) or {}
 
         pipeline_data = data.get("pipeline", {})
+        snapshot_seq = data.get("pipeline_journal_seq", 0)
 
         # Handle datetime serialization for decisions
         if "decisions" in pipeline_data:
@@ -318,21 +323,30 @@ class PipelineStateManager:
                     except (ValueError, AttributeError):
                         pass
 
-        return PipelineState(**pipeline_data)
+        state = PipelineState(**pipeline_data)
+
+        # Re-apply mutations journaled after the snapshot was written
+        pending = self.journal.read(after_seq=snapshot_seq)
+        if pending:
+            replay(state, pending)
+        self.journal.advance_to(snapshot_seq)
+        state._journal = self.journal
+        return state
 
     def save_pipeline_state(self, state: "PipelineState") -> None:
         """Save pipeline state to project.yaml, preserving other fields.
 
         This updates only the 'pipeline' section of project.yaml,
         leaving system_goal, status, enriched_data, etc. unchanged.
+        The write is atomic and folds in (then truncates) the mutation
+        journal.
 
         Args:
             state: PipelineState object to save
         """
-        # Load existing data to preserve other fields
+        # Load existing data to preserve other fields; only top-level keys change
         if self.exists():
-            with open(self.project_file) as f:
-                data = yaml.safe_load(f) or {}
+            data = dict(load_yaml(self.project_file, shared=True) or {})
         else:
             data = {}
 
@@ -349,12 +363,13 @@ class PipelineStateManager:
         # Update pipeline section
         data["pipeline"] = state_dict
 
-        # Ensure session directory exists
-        self.session_dir.mkdir(parents=True, exist_ok=True)
+        # The snapshot covers every journaled mutation so far
+        self.journal.advance_to(data.get("pipeline_journal_seq", 0))
+        data["pipeline_journal_seq"] = self.journal.last_seq
 
-        # Save back with preserved field order
-        with open(self.project_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        write_yaml(self.project_file, data)
+        self.journal.clear()
+        state._journal = self.journal
 
     def initialize_pipeline_state(self) -> "PipelineState":
         """Initialize empty pipeline state in project.yaml.
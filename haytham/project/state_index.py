@@ -0,0 +1,184 @@
+"""Lookup index over pipeline state.
+
+StateQueries answers ID, name, story→task, target→decision and status
+lookups from this index instead of scanning the state lists. One index is
+attached to each PipelineState and shared by every StateQueries and
+StateUpdater built on it; StateUpdater keeps it current as it mutates.
+
+Structural changes made outside StateUpdater (appending to or replacing a
+list) are detected by a cheap fingerprint check and trigger a rebuild.
+Field changes made outside StateUpdater (e.g. assigning ``story.status``
+directly) are not; call :func:`invalidate_state_index` after those.
+
+Reference: ADR-001c: Query Helpers
+"""
+
+from collections import defaultdict
+from typing import TypeVar
+
+from .state_models import Decision, Entity, PipelineState, Story, Task
+
+_T = TypeVar("_T", Entity, Story, Task)
+
+
+class StateIndex:
+    """Maps over a PipelineState kept consistent with it.
+
+    Lookups preserve the semantics of a linear scan: the first object with a
+    given ID or name wins, and multi-valued results keep state list order.
+    """
+
+    def __init__(self, state: PipelineState):
+        self.state = state
+        self.rebuild()
+
+    # ========== Build ==========
+
+    def _fingerprint(self) -> tuple[int, ...]:
+        s = self.state
+        return (
+            id(s.entities),
+            len(s.entities),
+            id(s.stories),
+            len(s.stories),
+            id(s.tasks),
+            len(s.tasks),
+            id(s.decisions),
+            len(s.decisions),
+        )
+
+    def rebuild(self) -> None:
+        """Rebuild every map from the state lists."""
+        self.entity_by_id: dict[str, Entity] = {}
+        self.entity_by_name: dict[str, Entity] = {}
+        self.story_by_id: dict[str, Story] = {}
+        self.task_by_id: dict[str, Task] = {}
+        self.decision_by_id: dict[str, Decision] = {}
+        self.tasks_by_story: defaultdict[str, list[Task]] = defaultdict(list)
+        self.decisions_by_target: defaultdict[str, list[Decision]] = defaultdict(list)
+
+        # status -> {object id(): object}; dicts keep insertion order
+        self._entities_by_status: defaultdict[str, dict[int, Entity]] = defaultdict(dict)
+        self._stories_by_status: defaultdict[str, dict[int, Story]] = defaultdict(dict)
+        self._tasks_by_status: defaultdict[str, dict[int, Task]] = defaultdict(dict)
+        # object id() -> position in its state list, for ordering buckets
+        self._position: dict[int, int] = {}
+
+        for pos, entity in enumerate(self.state.entities):
+            self._index_entity(entity, pos)
+        for pos, story in enumerate(self.state.stories):
+            self._index_story(story, pos)
+        for pos, task in enumerate(self.state.tasks):
+            self._index_task(task, pos)
+        for decision in self.state.decisions:
+            self._index_decision(decision)
+
+        self._built_for = self._fingerprint()
+
+    def ensure_fresh(self) -> None:
+        """Rebuild if the state lists were changed outside StateUpdater."""
+        if self._fingerprint() != self._built_for:
+            self.rebuild()
+
+    def _index_entity(self, entity: Entity, pos: int) -> None:
+        self.entity_by_id.setdefault(entity.id, entity)
+        self.entity_by_name.setdefault(entity.name, entity)
+        self._entities_by_status[entity.status][id(entity)] = entity
+        self._position[id(entity)] = pos
+
+    def _index_story(self, story: Story, pos: int) -> None:
+        self.story_by_id.setdefault(story.id, story)
+        self._stories_by_status[story.status][id(story)] = story
+        self._position[id(story)] = pos
+
+    def _index_task(self, task: Task, pos: int) -> None:
+        self.task_by_id.setdefault(task.id, task)
+        self.tasks_by_story[task.story_id].append(task)
+        self._tasks_by_status[task.status][id(task)] = task
+        self._position[id(task)] = pos
+
+    def _index_decision(self, decision: Decision) -> None:
+        self.decision_by_id.setdefault(decision.id, decision)
+        for target in dict.fromkeys(decision.affects):
+            self.decisions_by_target[target].append(decision)
+
+    # ========== Status Buckets ==========
+
+    def _ordered(self, bucket: dict[int, _T] | None) -> list[_T]:
+        if not bucket:
+            return []
+        return sorted(bucket.values(), key=lambda obj: self._position[id(obj)])
+
+    def entities_with_status(self, status: str) -> list[Entity]:
+        return self._ordered(self._entities_by_status.get(status))
+
+    def stories_with_status(self, status: str) -> list[Story]:
+        return self._ordered(self._stories_by_status.get(status))
+
+    def tasks_with_status(self, status: str) -> list[Task]:
+        return self._ordered(self._tasks_by_status.get(status))
+
+    # ========== Maintenance (called by StateUpdater) ==========
+
+    def added_entity(self, entity: Entity) -> None:
+        """Index an entity just appended to ``state.entities``."""
+        self._index_entity(entity, len(self.state.entities) - 1)
+        self._built_for = self._fingerprint()
+
+    def added_story(self, story: Story) -> None:
+        """Index a story just appended to ``state.stories``."""
+        self._index_story(story, len(self.state.stories) - 1)
+        self._built_for = self._fingerprint()
+
+    def added_task(self, task: Task) -> None:
+        """Index a task just appended to ``state.tasks``."""
+        self._index_task(task, len(self.state.tasks) - 1)
+        self._built_for = self._fingerprint()
+
+    def added_decision(self, decision: Decision) -> None:
+        """Index a decision just appended to ``state.decisions``."""
+        self._index_decision(decision)
+        self._built_for = self._fingerprint()
+
+    def entity_changed(self, entity: Entity, old_name: str, old_status: str) -> None:
+        """Re-key an entity after its name or status changed."""
+        if old_name != entity.name:
+            if self.entity_by_name.get(old_name) is entity:
+                del self.entity_by_name[old_name]
+                # Another entity may share the old name; first one wins again
+                for other in self.state.entities:
+                    if other.name == old_name:
+                        self.entity_by_name[old_name] = other
+                        break
+            self.entity_by_name.setdefault(entity.name, entity)
+        self._move(self._entities_by_status, entity, old_status, entity.status)
+
+    def story_status_changed(self, story: Story, old_status: str) -> None:
+        self._move(self._stories_by_status, story, old_status, story.status)
+
+    def task_status_changed(self, task: Task, old_status: str) -> None:
+        self._move(self._tasks_by_status, task, old_status, task.status)
+
+    @staticmethod
+    def _move(buckets: defaultdict[str, dict[int, _T]], obj: _T, old: str, new: str) -> None:
+        if old == new:
+            return
+        buckets[old].pop(id(obj), None)
+        buckets[new][id(obj)] = obj
+
+
+def get_state_index(state: PipelineState) -> StateIndex:
+    """Get the index attached to *state*, building or refreshing it as needed."""
+    index = state._index
+    # A shallow model_copy shares the private attr; never reuse another state's index
+    if index is None or index.state is not state:
+        index = StateIndex(state)
+        state._index = index
+    else:
+        index.ensure_fresh()
+    return index
+
+
+def invalidate_state_index(state: PipelineState) -> None:
+    """Drop the index after mutating state fields outside StateUpdater."""
+    state._index = None
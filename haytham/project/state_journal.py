@@ -0,0 +1,175 @@
+"""Append-only mutation journal for pipeline state.
+
+``StateUpdater.batch()`` writes project.yaml once, when the block exits,
+instead of after every mutation. So that a crash inside a long batch loses
+nothing, each mutation made in a batch is appended as one JSON line to
+``pipeline_journal.jsonl`` next to project.yaml (for states loaded or saved
+through PipelineStateManager). Outside a batch every mutation is saved
+directly, as before.
+
+project.yaml records the sequence number of the last journal entry it
+contains (``pipeline_journal_seq``). Loading replays only newer entries, so
+a crash between rewriting project.yaml and truncating the journal never
+applies a mutation twice. A torn final line from a crash mid-append is
+ignored.
+
+There is one journal per file in a process (``get_journal``), so managers
+for the same session never number entries twice.
+
+Reference: ADR-001c: Update Helpers
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from .state_models import Ambiguity, Decision, Entity, Stack, Story, Task
+
+if TYPE_CHECKING:
+    from .state_models import PipelineState
+
+logger = logging.getLogger(__name__)
+
+# StateUpdater methods that may be journaled and replayed
+REPLAYABLE_OPS = frozenset(
+    {
+        "add_entity",
+        "update_entity_status",
+        "update_entity",
+        "add_story",
+        "update_story_status",
+        "add_story_ambiguity",
+        "resolve_ambiguity",
+        "add_task",
+        "update_task_status",
+        "add_decision",
+        "set_current",
+        "clear_current",
+        "set_stack_from_object",
+    }
+)
+
+# Argument name -> model it is rebuilt into on replay
+_MODEL_ARGS: dict[str, type[BaseModel]] = {
+    "entity": Entity,
+    "story": Story,
+    "ambiguity": Ambiguity,
+    "task": Task,
+    "decision": Decision,
+    "stack": Stack,
+}
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert models (possibly nested in dicts and lists) to JSON-compatible data."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {k: to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [to_jsonable(v) for v in value]
+    return value
+
+
+class MutationJournal:
+    """JSON-lines log of StateUpdater mutations.
+
+    Thread-safe. Each entry is ``{"seq": n, "op": name, "args": {...}}``
+    with strictly increasing ``seq`` across snapshots. Use ``get_journal``
+    to share one instance per file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        entries = self.read()
+        self._last_seq = entries[-1]["seq"] if entries else 0
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    def advance_to(self, seq: int) -> None:
+        """Make sure new entries are numbered after *seq* (from a snapshot)."""
+        with self._lock:
+            self._last_seq = max(self._last_seq, seq)
+
+    def append(self, op: str, args: dict[str, Any]) -> int:
+        """Append one mutation. Returns its sequence number."""
+        if op not in REPLAYABLE_OPS:
+            raise ValueError(f"Mutation '{op}' cannot be journaled")
+        with self._lock:
+            seq = self._last_seq + 1
+            line = json.dumps({"seq": seq, "op": op, "args": to_jsonable(args)})
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._last_seq = seq
+        return seq
+
+    def read(self, after_seq: int = 0) -> list[dict[str, Any]]:
+        """Return entries with ``seq > after_seq``, skipping a torn last line."""
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+
+        entries = []
+        for i, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                if i == len(lines) - 1:
+                    logger.warning(f"Ignoring incomplete last entry in {self.path.name}")
+                    break
+                raise
+            if entry["seq"] > after_seq:
+                entries.append(entry)
+        return entries
+
+    def clear(self) -> None:
+        """Drop all entries after they were folded into a snapshot."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+
+_journals: dict[Path, MutationJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_journal(path: Path) -> MutationJournal:
+    """Return the process-wide journal for *path*."""
+    key = Path(path).resolve()
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = _journals[key] = MutationJournal(key)
+        return journal
+
+
+def replay(state: "PipelineState", entries: list[dict[str, Any]]) -> None:
+    """Apply journaled mutations to *state* in order, without saving."""
+    from .state_updater import StateUpdater
+
+    updater = StateUpdater(state, lambda s: None)
+    for entry in entries:
+        op = entry["op"]
+        if op not in REPLAYABLE_OPS:
+            raise ValueError(f"Unknown journal operation '{op}' (seq {entry['seq']})")
+
+        args = dict(entry["args"])
+        for name, model in _MODEL_ARGS.items():
+            if name in args:
+                args[name] = model.model_validate(args[name])
+        if op == "update_entity":
+            # Arbitrary Entity fields; restore their declared types
+            for key, value in list(args.items()):
+                field = Entity.model_fields.get(key)
+                if key != "entity_id" and field is not None:
+                    args[key] = TypeAdapter(field.annotation).validate_python(value)
+
+        getattr(updater, op)(**args)
@@ -7,8 +7,9 @@ Reference: ADR-001c: System State Model
 """
 
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class EntityAttribute(BaseModel):
@@ -206,3 +207,11 @@ class PipelineState(BaseModel):
 
     # Current processing context
     current: PipelineCurrent = Field(default_factory=PipelineCurrent)
+
+    # Runtime-only attributes; private attributes are never serialized.
+    # Lookup index (StateIndex), built lazily by state_index.get_state_index
+    _index: Any = PrivateAttr(default=None)
+    # MutationJournal attached by PipelineStateManager on load/save
+    _journal: Any = PrivateAttr(default=None)
+    # Active StateUpdater.batch() bookkeeping, shared by all updaters
+    _batch: Any = PrivateAttr(default=None)
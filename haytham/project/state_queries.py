@@ -1,11 +1,14 @@
 """Query helpers for reading pipeline state.
 
 This module provides read-only query operations on PipelineState.
-All queries are non-mutating and do not trigger saves.
+All queries are non-mutating and do not trigger saves. Lookups are served
+from the shared StateIndex (see state_index.py), so they are O(1) rather
+than scans over the state lists.
 
 Reference: ADR-001c: Query Helpers
 """
 
+from .state_index import StateIndex, get_state_index
 from .state_models import Decision, Entity, PipelineState, Story, Task
 
 
@@ -27,6 +30,11 @@ class StateQueries:
         """
         self.state = state
 
+    @property
+    def index(self) -> StateIndex:
+        """The state's lookup index, refreshed if the lists changed."""
+        return get_state_index(self.state)
+
     # ========== Entity Queries ==========
 
     def get_entity(self, entity_id: str) -> Entity | None:
@@ -40,10 +48,7 @@ class StateQueries:
         Returns:
             Entity if found, None otherwise
         """
-        for e in self.state.entities:
-            if e.id == entity_id:
-                return e
-        return None
+        return self.index.entity_by_id.get(entity_id)
 
     def get_entity_by_name(self, name: str) -> Entity | None:
         """Get entity by name.
@@ -54,10 +59,7 @@ class StateQueries:
         Returns:
             Entity if found, None otherwise
         """
-        for e in self.state.entities:
-            if e.name == name:
-                return e
-        return None
+        return self.index.entity_by_name.get(name)
 
     def entity_exists(self, name: str) -> bool:
         """Check if entity with given name exists.
@@ -70,7 +72,7 @@ class StateQueries:
         Returns:
             True if entity exists, False otherwise
         """
-        return any(e.name == name for e in self.state.entities)
+        return name in self.index.entity_by_name
 
     def get_implemented_entities(self) -> list[Entity]:
         """Get entities with status='implemented'.
@@ -78,7 +80,7 @@ class StateQueries:
         Returns:
             List of implemented entities
         """
-        return [e for e in self.state.entities if e.status == "implemented"]
+        return self.index.entities_with_status("implemented")
 
     def get_planned_entities(self) -> list[Entity]:
         """Get entities with status='planned'.
@@ -86,7 +88,7 @@ class StateQueries:
         Returns:
             List of planned entities
         """
-        return [e for e in self.state.entities if e.status == "planned"]
+        return self.index.entities_with_status("planned")
 
     # ========== Story Queries ==========
 
@@ -101,10 +103,7 @@ class StateQueries:
         Returns:
             Story if found, None otherwise
         """
-        for s in self.state.stories:
-            if s.id == story_id:
-                return s
-        return None
+        return self.index.story_by_id.get(story_id)
 
     def get_pending_stories(self) -> list[Story]:
         """Get all stories with status='pending', ordered by priority then ID.
@@ -114,7 +113,7 @@ class StateQueries:
         Returns:
             List of pending stories, sorted by priority (P0 first) then ID
         """
-        pending = [s for s in self.state.stories if s.status == "pending"]
+        pending = self.index.stories_with_status("pending")
         # Sort by priority (P0 < P1 < P2) then by ID
         return sorted(pending, key=lambda s: (s.priority, s.id))
 
@@ -127,7 +126,7 @@ class StateQueries:
         Returns:
             List of stories with matching status
         """
-        return [s for s in self.state.stories if s.status == status]
+        return self.index.stories_with_status(status)
 
     def get_completed_stories(self) -> list[Story]:
         """Get all stories with status='completed'.
@@ -135,7 +134,7 @@ class StateQueries:
         Returns:
             List of completed stories
         """
-        return [s for s in self.state.stories if s.status == "completed"]
+        return self.index.stories_with_status("completed")
 
     # ========== Task Queries ==========
 
@@ -148,10 +147,7 @@ class StateQueries:
         Returns:
             Task if found, None otherwise
         """
-        for t in self.state.tasks:
-            if t.id == task_id:
-                return t
-        return None
+        return self.index.task_by_id.get(task_id)
 
     def get_story_tasks(self, story_id: str) -> list[Task]:
         """Get all tasks for a story.
@@ -164,7 +160,7 @@ class StateQueries:
         Returns:
             List of tasks belonging to the story
         """
-        return [t for t in self.state.tasks if t.story_id == story_id]
+        return list(self.index.tasks_by_story.get(story_id, ()))
 
     def get_pending_tasks(self) -> list[Task]:
         """Get all tasks with status='pending'.
@@ -172,7 +168,7 @@ class StateQueries:
         Returns:
             List of pending tasks
         """
-        return [t for t in self.state.tasks if t.status == "pending"]
+        return self.index.tasks_with_status("pending")
 
     def get_tasks_by_status(self, status: str) -> list[Task]:
         """Get all tasks with given status.
@@ -183,7 +179,7 @@ class StateQueries:
         Returns:
             List of tasks with matching status
         """
-        return [t for t in self.state.tasks if t.status == status]
+        return self.index.tasks_with_status(status)
 
     # ========== Decision Queries ==========
 
@@ -196,10 +192,7 @@ class StateQueries:
         Returns:
             Decision if found, None otherwise
         """
-        for d in self.state.decisions:
-            if d.id == decision_id:
-                return d
-        return None
+        return self.index.decision_by_id.get(decision_id)
 
     def get_decisions_affecting(self, target_id: str) -> list[Decision]:
         """Get decisions that affect a specific entity/story/task.
@@ -212,7 +205,7 @@ class StateQueries:
         Returns:
             List of decisions affecting the target
         """
-        return [d for d in self.state.decisions if target_id in d.affects]
+        return list(self.index.decisions_by_target.get(target_id, ()))
 
     def get_decisions(self) -> list[Decision]:
         """Get all decisions.
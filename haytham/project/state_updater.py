@@ -1,13 +1,20 @@
 """Update helpers for modifying pipeline state.
 
 This module provides mutation operations on PipelineState.
-All updates trigger a save callback to persist changes immediately.
+All updates trigger a save callback to persist changes immediately, and
+keep the shared StateIndex in step so queries never need a rebuild.
+
+``StateUpdater.batch()`` defers saving until the end of a block. Updates
+made inside a batch are appended to the state's MutationJournal (attached by
+PipelineStateManager), so a crash before the block exits loses nothing.
 
 Reference: ADR-001c: Update Helpers
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
+from typing import Any
 
 from .id_generator import (
     next_decision_id,
@@ -15,8 +22,15 @@ from .id_generator import (
     next_story_id,
     next_task_id,
 )
+from .state_index import StateIndex, get_state_index
 from .state_models import Ambiguity, Decision, Entity, PipelineState, Stack, Story, Task
-from .state_queries import StateQueries
+
+
+class _WriteBatch:
+    """Deferred-save bookkeeping for an active ``StateUpdater.batch()``."""
+
+    def __init__(self) -> None:
+        self.save_callback: Callable[[PipelineState], None] | None = None
 
 
 class StateUpdater:
@@ -30,6 +44,11 @@ class StateUpdater:
         updater = StateUpdater(state, manager.save_pipeline_state)
         updater.add_entity(Entity(name="User"))
         # State is automatically saved after add_entity
+
+        with updater.batch():
+            updater.add_story(story)
+            updater.set_current(story.id, "story-interpretation")
+        # Saved once, when the block exits
     """
 
     def __init__(self, state: PipelineState, save_callback: Callable[[PipelineState], None]):
@@ -43,9 +62,49 @@ class StateUpdater:
         self.state = state
         self.save_callback = save_callback
 
-    def _save(self) -> None:
-        """Trigger save callback."""
-        self.save_callback(self.state)
+    @property
+    def index(self) -> StateIndex:
+        """The state's lookup index, shared with StateQueries."""
+        return get_state_index(self.state)
+
+    def _save(self, op: str, **args: Any) -> None:
+        """Persist mutation *op*, or journal it until the active batch ends.
+
+        Args:
+            op: Name of the StateUpdater method that made the change
+            **args: Arguments that replay the change (see state_journal.replay)
+        """
+        batch = self.state._batch
+        if batch is None:
+            self.save_callback(self.state)
+            return
+
+        journal = self.state._journal
+        if journal is not None:
+            journal.append(op, args)
+        batch.save_callback = self.save_callback
+
+    @contextmanager
+    def batch(self) -> Iterator["StateUpdater"]:
+        """Coalesce the saves of every update made inside the block.
+
+        The batch is shared by all updaters on the same state, so helpers
+        that create their own StateUpdater join it. Nested blocks are folded
+        into the outermost one. The state is saved once on exit, also when
+        the block raises, so completed updates are never lost.
+        """
+        if self.state._batch is not None:
+            yield self
+            return
+
+        batch = _WriteBatch()
+        self.state._batch = batch
+        try:
+            yield self
+        finally:
+            self.state._batch = None
+            if batch.save_callback is not None:
+                batch.save_callback(self.state)
 
     # ========== Entity Operations ==========
 
@@ -61,10 +120,12 @@ class StateUpdater:
         Returns:
             Entity with assigned ID
         """
+        index = self.index
         if not entity.id:
             entity.id = next_entity_id(self.state)
         self.state.entities.append(entity)
-        self._save()
+        index.added_entity(entity)
+        self._save("add_entity", entity=entity)
         return entity
 
     def update_entity_status(
@@ -82,13 +143,17 @@ class StateUpdater:
         Returns:
             True if entity was found and updated, False otherwise
         """
-        queries = StateQueries(self.state)
-        entity = queries.get_entity(entity_id)
+        index = self.index
+        entity = index.entity_by_id.get(entity_id)
         if entity:
+            old_status = entity.status
             entity.status = status
             if file_path:
                 entity.file_path = file_path
-            self._save()
+            index.entity_changed(entity, entity.name, old_status)
+            self._save(
+                "update_entity_status", entity_id=entity_id, status=status, file_path=file_path
+            )
             return True
         return False
 
@@ -102,13 +167,19 @@ class StateUpdater:
         Returns:
             True if entity was found and updated, False otherwise
         """
-        queries = StateQueries(self.state)
-        entity = queries.get_entity(entity_id)
+        index = self.index
+        entity = index.entity_by_id.get(entity_id)
         if entity:
+            old_name, old_status = entity.name, entity.status
             for key, value in kwargs.items():
                 if hasattr(entity, key):
                     setattr(entity, key, value)
-            self._save()
+            if entity.id != entity_id:
+                # Re-keyed by ID: rebuild rather than patch every map
+                index.rebuild()
+            else:
+                index.entity_changed(entity, old_name, old_status)
+            self._save("update_entity", entity_id=entity_id, **kwargs)
             return True
         return False
 
@@ -125,10 +196,12 @@ class StateUpdater:
         Returns:
             Story with assigned ID
         """
+        index = self.index
         if not story.id:
             story.id = next_story_id(self.state)
         self.state.stories.append(story)
-        self._save()
+        index.added_story(story)
+        self._save("add_story", story=story)
         return story
 
     def update_story_status(self, story_id: str, status: str) -> bool:
@@ -143,11 +216,13 @@ class StateUpdater:
         Returns:
             True if story was found and updated, False otherwise
         """
-        queries = StateQueries(self.state)
-        story = queries.get_story(story_id)
+        index = self.index
+        story = index.story_by_id.get(story_id)
         if story:
+            old_status = story.status
             story.status = status
-            self._save()
+            index.story_status_changed(story, old_status)
+            self._save("update_story_status", story_id=story_id, status=status)
             return True
         return False
 
@@ -163,11 +238,10 @@ class StateUpdater:
         Returns:
             True if story was found and ambiguity added, False otherwise
         """
-        queries = StateQueries(self.state)
-        story = queries.get_story(story_id)
+        story = self.index.story_by_id.get(story_id)
         if story:
             story.ambiguities.append(ambiguity)
-            self._save()
+            self._save("add_story_ambiguity", story_id=story_id, ambiguity=ambiguity)
             return True
         return False
 
@@ -182,14 +256,18 @@ class StateUpdater:
         Returns:
             True if ambiguity was found and resolved, False otherwise
         """
-        queries = StateQueries(self.state)
-        story = queries.get_story(story_id)
+        story = self.index.story_by_id.get(story_id)
         if story:
             for amb in story.ambiguities:
                 if amb.question == question:
                     amb.resolved = True
                     amb.resolution = resolution
-                    self._save()
+                    self._save(
+                        "resolve_ambiguity",
+                        story_id=story_id,
+                        question=question,
+                        resolution=resolution,
+                    )
                     return True
         return False
 
@@ -206,17 +284,18 @@ class StateUpdater:
         Returns:
             Task with assigned ID
         """
+        index = self.index
         if not task.id:
             task.id = next_task_id(self.state)
         self.state.tasks.append(task)
+        index.added_task(task)
 
         # Also update story's task list
-        queries = StateQueries(self.state)
-        story = queries.get_story(task.story_id)
+        story = index.story_by_id.get(task.story_id)
         if story and task.id not in story.tasks:
             story.tasks.append(task.id)
 
-        self._save()
+        self._save("add_task", task=task)
         return task
 
     def update_task_status(self, task_id: str, status: str, file_path: str | None = None) -> bool:
@@ -230,13 +309,15 @@ class StateUpdater:
         Returns:
             True if task was found and updated, False otherwise
         """
-        queries = StateQueries(self.state)
-        task = queries.get_task(task_id)
+        index = self.index
+        task = index.task_by_id.get(task_id)
         if task:
+            old_status = task.status
             task.status = status
             if file_path:
                 task.file_path = file_path
-            self._save()
+            index.task_status_changed(task, old_status)
+            self._save("update_task_status", task_id=task_id, status=status, file_path=file_path)
             return True
         return False
 
@@ -253,12 +334,14 @@ class StateUpdater:
         Returns:
             Decision with assigned ID and timestamp
         """
+        index = self.index
         if not decision.id:
             decision.id = next_decision_id(self.state)
         if not decision.made_at:
             decision.made_at = datetime.now(UTC)
         self.state.decisions.append(decision)
-        self._save()
+        index.added_decision(decision)
+        self._save("add_decision", decision=decision)
         return decision
 
     # ========== Current Context Operations ==========
@@ -274,7 +357,7 @@ class StateUpdater:
         """
         self.state.current.story = story_id
         self.state.current.chunk = chunk
-        self._save()
+        self._save("set_current", story_id=story_id, chunk=chunk)
 
     def clear_current(self) -> None:
         """Clear current processing context.
@@ -283,7 +366,7 @@ class StateUpdater:
         """
         self.state.current.story = None
         self.state.current.chunk = "ready"
-        self._save()
+        self._save("clear_current")
 
     # ========== Stack Operations ==========
 
@@ -308,7 +391,8 @@ class StateUpdater:
             return False
 
         self.state.stack = stack
-        self._save()
+        # Journal the resolved stack so replay does not depend on templates
+        self._save("set_stack_from_object", stack=stack)
         return True
 
     def set_stack_from_object(self, stack: Stack) -> None:
@@ -320,4 +404,4 @@ class StateUpdater:
             stack: Stack object to set
         """
         self.state.stack = stack
-        self._save()
+        self._save("set_stack_from_object", stack=stack)
@@ -0,0 +1,98 @@
+"""Cached project.yaml reads and atomic writes.
+
+project.yaml is read by several managers (ProjectStateManager,
+PipelineStateManager, ProjectManager) and, through them, by every dashboard
+rerun and context load. Parsed documents are cached per path and reused
+while the file's modification time, size and inode are unchanged, so a
+multi-hundred-KB file is parsed once per change rather than once per call.
+Parsing and dumping use the libyaml C bindings when PyYAML was built with
+them, falling back to the pure-Python implementations.
+
+Writes go through a temp file and ``os.replace`` so readers (and a crash
+mid-write) never see a truncated file.
+"""
+
+import copy
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml-backed classes parse several times faster; same semantics
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+_MAX_CACHED_FILES = 64
+
+# path -> ((mtime_ns, size, inode), parsed document)
+_cache: OrderedDict[Path, tuple[tuple[int, int, int], Any]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _signature(path: Path) -> tuple[int, int, int]:
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def load_yaml(path: Path, *, shared: bool = False) -> Any:
+    """Parse a YAML file, reusing the cached result while the file is unchanged.
+
+    Args:
+        path: File to read
+        shared: Return the cached object itself instead of a deep copy.
+            Only for callers that never mutate the result.
+
+    Returns:
+        The parsed document (``None`` for an empty file)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    key = Path(path).resolve()
+    signature = _signature(key)
+
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None and hit[0] == signature:
+            _cache.move_to_end(key)
+            return hit[1] if shared else copy.deepcopy(hit[1])
+
+    with open(key, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    with _cache_lock:
+        _cache[key] = (signature, data)
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_CACHED_FILES:
+            _cache.popitem(last=False)
+
+    return data if shared else copy.deepcopy(data)
+
+
+def write_yaml(path: Path, data: Any) -> None:
+    """Write *data* to *path* atomically and drop its cached parse."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.dump(data, f, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    finally:
+        invalidate_yaml_cache(path)
+
+
+def invalidate_yaml_cache(path: Path | None = None) -> None:
+    """Forget the cached parse of *path*, or of every file when omitted."""
+    with _cache_lock:
+        if path is None:
+            _cache.clear()
+        else:
+            _cache.pop(Path(path).resolve(), None)
@@ -5,5 +5,6 @@ in the meta-recursive system.
 """
 
 from haytham.session.session_manager import SessionManager
+from haytham.session.session_store import SessionStore
 
-__all__ = ["SessionManager"]
+__all__ = ["SessionManager", "SessionStore"]
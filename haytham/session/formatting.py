@@ -380,6 +380,67 @@ def update_manifest(
     return "\n".join(lines)
 
 
+def render_manifest(
+    state: dict[str, Any],
+    *,
+    stages: list[tuple[str, str]],
+) -> str:
+    """Render session_manifest.md content from a session store document.
+
+    Produces the same layout as ``create_manifest``/``update_manifest`` so
+    the file reads the same for humans; the store stays the source of truth.
+
+    Args:
+        state: Session document (see ``SessionStore``).
+        stages: List of ``(slug, display_name)`` tuples for all stages.
+    """
+    stage_records = state.get("stages", {})
+    stage_rows = []
+    for slug, display_name in stages:
+        record = stage_records.get(slug, {})
+        duration = record.get("duration")
+        stage_rows.append(
+            f"| {slug} | {display_name} | {record.get('status', 'pending')} | "
+            f"{record.get('started') or '-'} | {record.get('completed') or '-'} | "
+            f"{f'{int(duration)}s' if duration else '-'} |"
+        )
+    stage_table = "\n".join(stage_rows)
+
+    completed_count = sum(
+        1 for slug, _ in stages if stage_records.get(slug, {}).get("status") == "completed"
+    )
+    current = state.get("current_stage")
+    current_record = stage_records.get(current, {}) if current else {}
+    display_names = dict(stages)
+    system_goal_display = state.get("system_goal") or "(awaiting user input)"
+
+    return f"""# Session Manifest
+
+## Metadata
+- Created: {state.get("created")}
+- Last Updated: {state.get("last_updated")}
+- Status: {state.get("status")}
+- System Goal: {system_goal_display}
+
+## Stage Status
+
+| Stage | Name | Status | Started | Completed | Duration |
+|-------|------|--------|---------|-----------|----------|
+{stage_table}
+
+## Current Stage
+- Stage: {current or "(none)"}
+- Name: {display_names.get(current, "Not Started") if current else "Not Started"}
+- Status: {current_record.get("status", "pending")}
+- Progress: {completed_count} of {len(stages)}
+
+## Metrics
+- Total Duration: 0s
+- Total Tokens: 0
+- Total Cost: $0.00
+"""
+
+
 def parse_manifest(
     content: str,
     *,
@@ -4,6 +4,8 @@ This module provides session management for the simplified single-session archit
 It replaces both ProjectManager and CheckpointManager with a unified, simpler API.
 
 The system goal is stored in project.yaml as the single source of truth.
+Session and stage status live in session_state.json (see ``SessionStore``);
+session_manifest.md is a human-readable rendering of it.
 """
 
 import json
@@ -22,13 +24,11 @@ from haytham.config import (
 )
 from haytham.project.project_state import ProjectStateManager
 from haytham.session.formatting import (
-    create_manifest,
     format_agent_output,
     format_checkpoint,
     format_user_feedback,
-    parse_manifest,
-    update_manifest,
 )
+from haytham.session.session_store import SessionStore
 from haytham.session.workflow_runs import WorkflowRunTracker
 from haytham.workflow.stage_registry import (
     STAGES,
@@ -53,7 +53,8 @@ class SessionManager:
     Directory Structure:
         session/                          # Singular - ONE persistent project
         ├── project.yaml                  # System goal and project state
-        ├── session_manifest.md
+        ├── session_state.json            # Session and stage status (source of truth)
+        ├── session_manifest.md           # Rendered from session_state.json
         ├── preferences.json
         ├── idea-refinement/
         │   ├── checkpoint.md
@@ -96,6 +97,11 @@ class SessionManager:
         # Initialize WorkflowRunTracker for workflow state machine
         self.run_tracker = WorkflowRunTracker(self.session_dir)
 
+        # Session and stage status; safe for concurrent stage writers
+        self.session_store = SessionStore(
+            self.session_dir, stages=[(s.slug, s.display_name) for s in STAGES]
+        )
+
     def has_system_goal(self) -> bool:
         """Check if a system goal has been set.
 
@@ -126,18 +132,7 @@ class SessionManager:
         Returns:
             True if an incomplete session exists, False otherwise
         """
-        manifest_path = self.session_dir / "session_manifest.md"
-        if not manifest_path.exists():
-            return False
-
-        try:
-            session = parse_manifest(
-                manifest_path.read_text(), valid_stage_slugs={s.slug for s in STAGES}
-            )
-            return session.get("status") == "in_progress"
-        except (OSError, ValueError, KeyError) as e:
-            logger.warning("Failed to read session manifest: %s", e)
-            return False
+        return self.session_store.status() == "in_progress"
 
     def create_session(self) -> dict[str, Any]:
         """Create a new session (clears any existing session directory).
@@ -154,8 +149,12 @@ class SessionManager:
         if project_yaml_path.exists():
             project_yaml_content = project_yaml_path.read_text()
 
-        # Clear existing session directory
+        # Clear existing session directory, dropping the shared state DB
+        # handle that points into it
         if self.session_dir.exists():
+            from haytham.state.vector_db import release_state_db
+
+            release_state_db(self.session_dir / "vector_db")
             shutil.rmtree(self.session_dir)
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
@@ -174,14 +173,9 @@ class SessionManager:
         # Get system goal from project state (may be None if not set yet)
         system_goal = self.project_state.get_system_goal()
 
-        # Create session manifest
+        # Create session state (also renders session_manifest.md)
         now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-        manifest_content = create_manifest(
-            stages=[(s.slug, s.display_name) for s in STAGES],
-            created=now,
-            system_goal=system_goal,
-        )
-        (self.session_dir / "session_manifest.md").write_text(manifest_content)
+        self.session_store.create(created=now, system_goal=system_goal)
 
         # Create empty preferences file
         preferences_path = self.session_dir / "preferences.json"
@@ -194,22 +188,15 @@ class SessionManager:
         }
 
     def load_session(self) -> dict[str, Any] | None:
-        """Load current session state from manifest.
+        """Load current session state.
 
         Returns:
-            Dict containing session state, or None if no session exists
+            Dict with ``created``, ``last_updated``, ``status``, ``system_goal``,
+            ``current_stage``, ``completed_stages``, ``stage_statuses`` and
+            ``stages`` (per-stage timings and agent metadata), or None if no
+            session exists
         """
-        manifest_path = self.session_dir / "session_manifest.md"
-        if not manifest_path.exists():
-            return None
-
-        try:
-            return parse_manifest(
-                manifest_path.read_text(), valid_stage_slugs={s.slug for s in STAGES}
-            )
-        except (OSError, ValueError, KeyError) as e:
-            logger.warning("Failed to parse session manifest: %s", e)
-            return None
+        return self.session_store.summary()
 
     def clear_workflow_stages(self, workflow_type: str) -> None:
         """Clear all stage directories for a specific workflow.
@@ -335,22 +322,21 @@ class SessionManager:
         checkpoint_path = stage_dir / "checkpoint.md"
         checkpoint_path.write_text(checkpoint_content)
 
-        # Update session manifest
-        # Update session manifest
-        manifest_path = self.session_dir / "session_manifest.md"
-        if manifest_path.exists():
-            updated = update_manifest(
-                manifest_content=manifest_path.read_text(),
-                stage_slug=stage_slug,
-                stage_display_name=stage.display_name,
+        # Update session state
+        try:
+            self.session_store.update_stage(
+                stage_slug,
                 status=status,
                 started=started,
                 completed=completed,
                 duration=duration,
-                total_stages=len(STAGES),
-                stages_list=[(s.slug, s.display_name) for s in STAGES],
+                retry_count=retry_count,
+                execution_mode=execution_mode,
+                agents=agents,
+                errors=errors or [],
             )
-            manifest_path.write_text(updated)
+        except FileNotFoundError:
+            logger.debug("No session state; checkpoint for %s not recorded", stage_slug)
 
     def save_agent_output(
         self,
@@ -0,0 +1,285 @@
+"""Structured session state store.
+
+``session_state.json`` in the session directory is the source of truth for
+the session status and, per stage, status, timings and agent metadata.
+``session_manifest.md`` is rendered from it for humans and never read back.
+
+- Updates are read-modify-write under a lock shared by every store for the
+  same file in this process (the UI and the workflow thread each hold their
+  own ``SessionManager``) plus an advisory ``flock`` across processes, and
+  land with an atomic rename, so concurrent writers cannot lose updates or
+  leave a half-written file.
+- Reads are served from an in-memory copy that is reloaded only when the
+  file's stat signature changes, so status checks cost one ``stat()``.
+- Sessions created before the store existed are imported from their
+  ``session_manifest.md`` on first use.
+"""
+
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from haytham.session.formatting import parse_manifest, render_manifest
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "session_state.json"
+MANIFEST_FILE = "session_manifest.md"
+_LOCK_FILE = ".session_state.lock"
+_SCHEMA_VERSION = 1
+
+# One lock per state file, shared by all stores in the process
+_path_locks: dict[Path, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
+def _path_lock(path: Path) -> threading.Lock:
+    key = path.resolve()
+    with _path_locks_guard:
+        return _path_locks.setdefault(key, threading.Lock())
+
+
+class SessionStore:
+    """Reads and updates the session document of one session directory.
+
+    Document layout::
+
+        {
+          "version": 1,
+          "created": "...Z", "last_updated": "...Z",
+          "status": "in_progress",
+          "system_goal": "..." | null,
+          "current_stage": "idea-analysis" | null,
+          "stages": {
+            "idea-analysis": {
+              "status": "completed", "started": ..., "completed": ...,
+              "duration": 12.3, "retry_count": 0, "execution_mode": "single",
+              "agents": [...], "errors": [...], "updated": "...Z"
+            }
+          }
+        }
+
+    Args:
+        session_dir: Session directory holding the state file.
+        stages: ``(slug, display_name)`` for every stage, in workflow order.
+    """
+
+    def __init__(self, session_dir: Path, stages: list[tuple[str, str]]):
+        self.session_dir = Path(session_dir)
+        self.stages = stages
+        self.path = self.session_dir / STATE_FILE
+        self.manifest_path = self.session_dir / MANIFEST_FILE
+        self._lock = _path_lock(self.path)
+        self._owner: int | None = None
+        self._cache: dict[str, Any] | None = None
+        self._cache_key: tuple[int, int, int] | None = None
+
+    # === Reads ===
+
+    def read(self) -> dict[str, Any] | None:
+        """Return a copy of the session document, or None if there is no session."""
+        doc = self._current()
+        return copy.deepcopy(doc) if doc is not None else None
+
+    def status(self) -> str | None:
+        """Session status ("in_progress", "completed", ...), or None."""
+        doc = self._current()
+        return doc.get("status") if doc else None
+
+    def stage_statuses(self) -> dict[str, str]:
+        """Stage slug -> status, in workflow order."""
+        doc = self._current()
+        if not doc:
+            return {}
+        records = doc.get("stages", {})
+        return {slug: records.get(slug, {}).get("status", "pending") for slug, _ in self.stages}
+
+    def summary(self) -> dict[str, Any] | None:
+        """Session state in the shape ``SessionManager.load_session`` returns."""
+        doc = self._current()
+        if doc is None:
+            return None
+        statuses = self.stage_statuses()
+        return {
+            "created": doc.get("created"),
+            "last_updated": doc.get("last_updated"),
+            "status": doc.get("status"),
+            "system_goal": doc.get("system_goal"),
+            "current_stage": doc.get("current_stage"),
+            "completed_stages": [slug for slug, s in statuses.items() if s == "completed"],
+            "stage_statuses": statuses,
+            "stages": copy.deepcopy(doc.get("stages", {})),
+        }
+
+    # === Writes ===
+
+    def create(self, created: str, system_goal: str | None) -> dict[str, Any]:
+        """Start a new session document, replacing any existing one."""
+        doc = {
+            "version": _SCHEMA_VERSION,
+            "created": created,
+            "last_updated": created,
+            "status": "in_progress",
+            "system_goal": system_goal,
+            "current_stage": None,
+            "stages": {},
+        }
+        with self._locked():
+            self._write(doc)
+        return copy.deepcopy(doc)
+
+    def update_stage(self, stage_slug: str, **fields: Any) -> dict[str, Any]:
+        """Merge *fields* into a stage record and make it the current stage.
+
+        Raises:
+            FileNotFoundError: If there is no session document.
+        """
+
+        def apply(doc: dict[str, Any]) -> None:
+            record = doc.setdefault("stages", {}).setdefault(stage_slug, {})
+            record.update(fields)
+            record["updated"] = _now()
+            doc["current_stage"] = stage_slug
+
+        return self._update(apply)
+
+    def set_status(self, status: str) -> dict[str, Any]:
+        """Set the session status.
+
+        Raises:
+            FileNotFoundError: If there is no session document.
+        """
+        return self._update(lambda doc: doc.__setitem__("status", status))
+
+    def write_manifest(self) -> None:
+        """Render ``session_manifest.md`` from the current document."""
+        with self._locked():
+            doc = self._load()
+            if doc is not None:
+                self._write_manifest(doc)
+
+    # === Internals ===
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            self._owner = threading.get_ident()
+            try:
+                if fcntl is None or not self.session_dir.exists():
+                    yield
+                    return
+                with open(self.session_dir / _LOCK_FILE, "a") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+            finally:
+                self._owner = None
+
+    def _update(self, apply: Callable[[dict[str, Any]], None]) -> dict[str, Any]:
+        with self._locked():
+            doc = self._load()
+            if doc is None:
+                raise FileNotFoundError(f"No session state in {self.session_dir}")
+            doc = copy.deepcopy(doc)
+            apply(doc)
+            doc["last_updated"] = _now()
+            self._write(doc)
+        return copy.deepcopy(doc)
+
+    def _current(self) -> dict[str, Any] | None:
+        doc = self._load()
+        if doc is None and self.manifest_path.exists():
+            with self._locked():
+                doc = self._load()
+        return doc
+
+    def _load(self) -> dict[str, Any] | None:
+        """Cached document, reloaded when the file changes; imports legacy manifests.
+
+        Import writes the store, so callers that may import must hold the lock
+        (``_current`` re-enters here under the lock when a manifest exists).
+        """
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            self._cache, self._cache_key = None, None
+            if self._owner == threading.get_ident():
+                return self._import_manifest()
+            return None
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if key != self._cache_key:
+            try:
+                self._cache = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning("Failed to read session state: %s", e)
+                self._cache = None
+            self._cache_key = key
+        return self._cache
+
+    def _import_manifest(self) -> dict[str, Any] | None:
+        """Build the document from a pre-store session_manifest.md. Lock held."""
+        try:
+            parsed = parse_manifest(
+                self.manifest_path.read_text(), valid_stage_slugs={s for s, _ in self.stages}
+            )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Failed to read session manifest: %s", e)
+            return None
+        if not parsed.get("status"):
+            return None
+        doc = {
+            "version": _SCHEMA_VERSION,
+            "created": parsed["created"],
+            "last_updated": parsed["last_updated"],
+            "status": parsed["status"],
+            "system_goal": parsed["system_goal"],
+            "current_stage": parsed["current_stage"],
+            "stages": {slug: {"status": s} for slug, s in parsed["stage_statuses"].items()},
+        }
+        self._write(doc, render=False)
+        logger.info("Imported session state from %s", MANIFEST_FILE)
+        return self._cache
+
+    def _write(self, doc: dict[str, Any], render: bool = True) -> None:
+        """Write the document atomically and refresh the cache. Lock held."""
+        self._atomic_write(self.path, json.dumps(doc, indent=2))
+        st = self.path.stat()
+        self._cache, self._cache_key = doc, (st.st_ino, st.st_mtime_ns, st.st_size)
+        if render:
+            self._write_manifest(doc)
+
+    def _write_manifest(self, doc: dict[str, Any]) -> None:
+        try:
+            self._atomic_write(self.manifest_path, render_manifest(doc, stages=self.stages))
+        except OSError as e:
+            logger.warning("Failed to render session manifest: %s", e)
+
+    @staticmethod
+    def _atomic_write(path: Path, text: str) -> None:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
@@ -4,10 +4,10 @@ Provides vector database storage for system state (capabilities,
 decisions, entities, constraints) with semantic search capabilities.
 
 Example usage:
-    from haytham.state import SystemStateDB, create_capability
+    from haytham.state import create_capability, get_state_db
 
-    # Initialize database
-    db = SystemStateDB("session/vector_db")
+    # Get the shared database handle for a path
+    db = get_state_db("session/vector_db")
 
     # Create a capability
     cap = create_capability(
@@ -26,7 +26,8 @@ Example usage:
     current_caps = db.get_capabilities(subtype="functional")
 """
 
-from .embedder import TitanEmbedder, get_embedder
+from .embedder import EmbeddingBatchError, EmbeddingBatchResult, TitanEmbedder, get_embedder
+from .embedding_cache import EmbeddingCache
 from .schema import (
     CAPABILITY_SUBTYPES,
     CapabilitySubtype,
@@ -38,16 +39,29 @@ from .schema import (
     create_decision,
     create_entity,
 )
-from .vector_db import DuplicateEntryError, SystemStateDB
+from .vector_db import (
+    CompactionSettings,
+    DuplicateEntryError,
+    SystemStateDB,
+    VectorIndexSettings,
+    clear_state_db_registry,
+    get_state_db,
+    release_state_db,
+)
 
 __all__ = [
     # Main classes
     "SystemStateDB",
     "SystemStateEntry",
     "TitanEmbedder",
+    "EmbeddingBatchResult",
+    "EmbeddingCache",
     "IDGenerator",
+    "VectorIndexSettings",
+    "CompactionSettings",
     # Exceptions
     "DuplicateEntryError",
+    "EmbeddingBatchError",
     # Factory functions
     "create_capability",
     "create_decision",
@@ -55,6 +69,9 @@ __all__ = [
     "create_constraint",
     # Helpers
     "get_embedder",
+    "get_state_db",
+    "release_state_db",
+    "clear_state_db_registry",
     # Types and constants
     "EntryType",
     "CapabilitySubtype",
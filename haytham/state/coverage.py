@@ -142,17 +142,22 @@ def get_capability_coverage(
     logger.info("Computing capability coverage...")
 
     # 1. Load capabilities from VectorDB
-    from haytham.state.vector_db import SystemStateDB
+    from haytham.state.vector_db import get_state_db
 
     db_path = session_manager.session_dir / "vector_db"
     if not db_path.exists():
         logger.warning("VectorDB not found, returning empty coverage report")
         return CoverageReport()
 
-    db = SystemStateDB(str(db_path))
+    db = get_state_db(str(db_path))
 
-    capabilities = db.get_capabilities()
-    decisions = db.get_decisions()
+    # Project only what coverage needs; descriptions and vectors stay on disk
+    capabilities = db.get_current_state(
+        entry_type="capability", columns=["id", "name", "subtype", "superseded_by"]
+    )
+    decisions = db.get_current_state(
+        entry_type="decision", columns=["id", "superseded_by", "metadata_json"]
+    )
 
     logger.info(f"Loaded {len(capabilities)} capabilities, {len(decisions)} decisions")
 
@@ -177,26 +182,19 @@ def get_capability_coverage(
     story_status: dict[str, str] = {}  # story_id -> status
 
     try:
-        from haytham.backlog import BacklogCLI
-
-        cli = BacklogCLI(session_manager.session_dir.parent)
-        if cli.is_initialized():
-            # Get all tasks using list_tasks()
-            tasks = cli.list_tasks()
-            for task in tasks:
-                story_id = task.id
-                story_status[story_id] = task.status
-                for label in task.labels:
-                    if label.startswith("implements:"):
-                        cap_id = label.replace("implements:", "")
-                        if cap_id not in story_implements:
-                            story_implements[cap_id] = []
-                        story_implements[cap_id].append(story_id)
+        from haytham.backlog import get_task_index
+
+        # Cached index: only task files changed since the last report are re-parsed
+        index = get_task_index(session_manager.session_dir.parent)
+        if index.store.is_initialized():
+            story_status = index.status_by_id()
+            story_implements = index.capability_stories(refresh=False)
             logger.info(
-                f"Found {len(story_implements)} capabilities with stories from {len(tasks)} tasks"
+                f"Found {len(story_implements)} capabilities with stories "
+                f"from {len(story_status)} tasks"
             )
     except ImportError:
-        logger.warning("BacklogCLI not available")
+        logger.warning("Backlog integration not available")
     except Exception as e:
         logger.warning(f"Could not load stories from Backlog.md: {e}")
 
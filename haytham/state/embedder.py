@@ -4,16 +4,121 @@ Uses Amazon Titan Embeddings via AWS Bedrock to generate
 vector embeddings for semantic search.
 """
 
+import concurrent.futures
 import json
 import logging
 import os
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
 from functools import lru_cache
 
 import boto3
 from botocore.config import Config
 
+from .embedding_cache import EmbeddingCache, get_default_embedding_cache
+
 logger = logging.getLogger(__name__)
 
+# Concurrency and backoff for embed_batch
+_DEFAULT_MAX_CONCURRENCY = 8
+_THROTTLE_MAX_RETRIES = 5
+_THROTTLE_BASE_DELAY = 0.5
+_THROTTLE_MAX_DELAY = 8.0
+_THROTTLE_ERROR_CODES = frozenset(
+    {"ThrottlingException", "TooManyRequestsException", "ServiceUnavailableException"}
+)
+
+
+def _get_max_concurrency() -> int:
+    """Get the embedding pool size from ``EMBEDDING_MAX_CONCURRENCY``."""
+    raw = os.environ.get("EMBEDDING_MAX_CONCURRENCY", "")
+    try:
+        return max(1, int(raw)) if raw else _DEFAULT_MAX_CONCURRENCY
+    except ValueError:
+        logger.warning(f"Invalid EMBEDDING_MAX_CONCURRENCY={raw!r}, using default")
+        return _DEFAULT_MAX_CONCURRENCY
+
+
+def _is_throttling_error(error: Exception) -> bool:
+    """Check whether a Bedrock error is a throttle worth backing off for."""
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        code = response.get("Error", {}).get("Code", "")
+        if code in _THROTTLE_ERROR_CODES:
+            return True
+    return "throttl" in str(error).lower()
+
+
+@dataclass
+class EmbeddingBatchResult:
+    """Outcome of a concurrent batch embedding.
+
+    Attributes:
+        embeddings: One slot per input text, in input order. ``None`` where
+            embedding failed.
+        errors: Input index → error message for failed texts.
+    """
+
+    embeddings: list[list[float] | None]
+    errors: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class EmbeddingBatchError(Exception):
+    """Raised by ``embed_batch`` when some texts could not be embedded."""
+
+    def __init__(self, result: EmbeddingBatchResult):
+        self.result = result
+        first = next(iter(sorted(result.errors.items())))
+        super().__init__(
+            f"Failed to embed {len(result.errors)} of {len(result.embeddings)} texts "
+            f"(first: text {first[0]}: {first[1]})"
+        )
+
+
+class _AdaptiveLimiter:
+    """Shared concurrency cap that shrinks on throttles and recovers on success.
+
+    Additive increase / multiplicative decrease: each throttle halves the
+    number of in-flight requests allowed, each success grows it by one up to
+    the configured ceiling.
+    """
+
+    def __init__(self, ceiling: int):
+        self._ceiling = ceiling
+        self._limit = ceiling
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+        return False
+
+    def on_throttle(self) -> None:
+        with self._cond:
+            self._limit = max(1, self._limit // 2)
+
+    def on_success(self) -> None:
+        with self._cond:
+            if self._limit < self._ceiling:
+                self._limit += 1
+                self._cond.notify()
+
 
 class TitanEmbedder:
     """Generate embeddings using Amazon Titan via AWS Bedrock.
@@ -30,12 +135,15 @@ class TitanEmbedder:
         self,
         region: str | None = None,
         profile: str | None = None,
+        cache: EmbeddingCache | None = None,
     ):
         """Initialize the Titan embedder.
 
         Args:
             region: AWS region for Bedrock. Defaults to AWS_REGION env var.
             profile: AWS profile to use. Defaults to AWS_PROFILE env var.
+            cache: Embedding cache to consult before calling Bedrock.
+                Defaults to the environment-configured cache (may be disabled).
         """
         self.region = region or os.environ.get("AWS_REGION", "us-east-1")
         self.profile = profile or os.environ.get("AWS_PROFILE")
@@ -58,17 +166,33 @@ class TitanEmbedder:
             config=config,
         )
 
+        self._limiter = _AdaptiveLimiter(_get_max_concurrency())
+        self.cache = cache if cache is not None else get_default_embedding_cache()
+
         logger.info(f"TitanEmbedder initialized with region={self.region}")
 
     def embed(self, text: str) -> list[float]:
         """Generate embedding for a single text.
 
+        Consults the embedding cache first; only misses call Bedrock.
+
         Args:
             text: Text to embed (max 8,192 tokens)
 
         Returns:
             1024-dimension embedding vector
         """
+        text = self._prepare_text(text)
+
+        if self.cache is not None:
+            cached = self.cache.get(self.MODEL_ID, text)
+            if cached is not None:
+                return cached
+
+        return self._fetch(text)
+
+    def _prepare_text(self, text: str) -> str:
+        """Validate and truncate text before embedding."""
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
@@ -77,7 +201,21 @@ class TitanEmbedder:
         if len(text) > max_chars:
             logger.warning(f"Text truncated from {len(text)} to {max_chars} chars for embedding")
             text = text[:max_chars]
+        return text
+
+    def _fetch(self, text: str) -> list[float]:
+        """Embed prepared text via Bedrock and store the result in the cache."""
+        embedding = self._invoke_model(text)
+
+        if self.cache is not None:
+            try:
+                self.cache.put(self.MODEL_ID, text, embedding)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to cache embedding: {e}")
+        return embedding
 
+    def _invoke_model(self, text: str) -> list[float]:
+        """Call Bedrock to embed prepared text."""
         try:
             response = self.client.invoke_model(
                 modelId=self.MODEL_ID,
@@ -96,29 +234,129 @@ class TitanEmbedder:
             logger.error(f"Failed to generate embedding: {e}")
             raise
 
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    def _invoke_with_backoff(self, text: str) -> list[float]:
+        """Fetch an embedding with exponential backoff on throttling errors.
+
+        Each throttle also narrows the shared concurrency limiter so the
+        rest of the batch slows down instead of piling on more throttles.
+        """
+        delay = _THROTTLE_BASE_DELAY
+        attempt = 0
+        while True:
+            with self._limiter:
+                try:
+                    embedding = self._fetch(text)
+                except Exception as e:
+                    if not _is_throttling_error(e) or attempt >= _THROTTLE_MAX_RETRIES:
+                        raise
+                    self._limiter.on_throttle()
+                else:
+                    self._limiter.on_success()
+                    return embedding
+
+            attempt += 1
+            logger.warning(
+                "Embedding throttled (attempt %d/%d), backing off %.1fs",
+                attempt,
+                _THROTTLE_MAX_RETRIES + 1,
+                delay,
+            )
+            time.sleep(delay + random.uniform(0, delay / 2))
+            delay = min(delay * 2, _THROTTLE_MAX_DELAY)
+
+    def embed_batch_partial(
+        self,
+        texts: list[str],
+        max_workers: int | None = None,
+    ) -> "EmbeddingBatchResult":
+        """Generate embeddings concurrently, collecting failures instead of raising.
+
+        Titan has no batch API, so texts are embedded in a bounded thread
+        pool (boto3 clients are thread-safe). Cached texts are served
+        without a call and identical texts are embedded once. Results keep
+        input order.
+
+        Args:
+            texts: Texts to embed
+            max_workers: Pool size. Defaults to ``EMBEDDING_MAX_CONCURRENCY``
+                env var, then 8.
+
+        Returns:
+            EmbeddingBatchResult with one slot per input text (``None`` for
+            failures) and an index → error message map.
+        """
+        embeddings: list[list[float] | None] = [None] * len(texts)
+        errors: dict[int, str] = {}
+        if not texts:
+            return EmbeddingBatchResult(embeddings=embeddings, errors=errors)
+
+        positions: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            try:
+                prepared = self._prepare_text(text)
+            except ValueError as e:
+                errors[i] = str(e)
+                continue
+            positions.setdefault(prepared, []).append(i)
+
+        # Serve cache hits up front so only misses occupy the pool
+        if self.cache is not None:
+            for text, embedding in self.cache.get_many(self.MODEL_ID, list(positions)).items():
+                for i in positions.pop(text):
+                    embeddings[i] = embedding
+
+        if not positions:
+            return EmbeddingBatchResult(embeddings=embeddings, errors=errors)
+
+        workers = max(1, min(max_workers or _get_max_concurrency(), len(positions)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._invoke_with_backoff, text): text for text in positions}
+            for future in concurrent.futures.as_completed(futures):
+                text = futures[future]
+                try:
+                    embedding = future.result()
+                except Exception as e:
+                    for i in positions[text]:
+                        errors[i] = str(e)
+                    continue
+                for i in positions[text]:
+                    embeddings[i] = embedding
+
+        if errors:
+            logger.error(f"Failed to embed {len(errors)}/{len(texts)} texts")
+        return EmbeddingBatchResult(embeddings=embeddings, errors=errors)
+
+    def embed_batch(
+        self,
+        texts: list[str],
+        max_workers: int | None = None,
+    ) -> list[list[float]]:
         """Generate embeddings for multiple texts.
 
-        Note: Titan doesn't support batch embedding API, so this
-        calls embed() sequentially. For high-volume use cases,
-        consider parallelization.
+        Runs concurrently via ``embed_batch_partial`` and preserves input
+        order.
 
         Args:
             texts: List of texts to embed
+            max_workers: Optional pool size override
 
         Returns:
             List of embedding vectors
+
+        Raises:
+            EmbeddingBatchError: If any text failed to embed. The partial
+                result is available on the exception.
         """
-        embeddings = []
-        for i, text in enumerate(texts):
-            try:
-                embedding = self.embed(text)
-                embeddings.append(embedding)
-            except Exception as e:
-                logger.error(f"Failed to embed text {i}: {e}")
-                raise
+        result = self.embed_batch_partial(texts, max_workers=max_workers)
+        if result.errors:
+            raise EmbeddingBatchError(result)
+        return result.embeddings
 
-        return embeddings
+    def cache_stats(self) -> dict[str, int]:
+        """Return embedding cache hit/miss counters (zeros when disabled)."""
+        if self.cache is None:
+            return {"hits": 0, "misses": 0, "entries": 0}
+        return self.cache.stats()
 
     @property
     def dimension(self) -> int:
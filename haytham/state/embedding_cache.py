@@ -0,0 +1,149 @@
+"""Persistent embedding cache for System State.
+
+Embeddings are deterministic for a given model and input, so
+``TitanEmbedder`` stores every vector it fetches in a local SQLite table
+keyed by model ID + SHA-256 of the normalized text. Re-adding, superseding,
+or re-querying the same text then costs no Bedrock call.
+
+Configuration:
+    EMBEDDING_CACHE_ENABLED -- "false" disables the cache (default "true")
+    EMBEDDING_CACHE_PATH    -- SQLite file (default ``.cache/embeddings.sqlite``)
+"""
+
+import array
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CACHE_PATH = ".cache/embeddings.sqlite"
+
+# Hashes per lookup query; keeps IN (...) under SQLite's variable limit
+_LOOKUP_CHUNK_SIZE = 500
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different inputs share a cache entry.
+
+    Applies Unicode NFC, trims, and collapses whitespace runs to one space.
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def text_key(text: str) -> str:
+    """SHA-256 hex digest of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed vector store keyed by (model_id, text hash).
+
+    Safe to share across threads: a single connection is guarded by a lock.
+    Vectors are stored as packed float32 blobs.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model_id TEXT NOT NULL,"
+            " text_hash TEXT NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " PRIMARY KEY (model_id, text_hash))"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model_id: str, text: str) -> list[float] | None:
+        """Return the cached vector for *text*, or ``None``."""
+        return self.get_many(model_id, [text]).get(text)
+
+    def get_many(self, model_id: str, texts: list[str]) -> dict[str, list[float]]:
+        """Return cached vectors for whichever of *texts* are present.
+
+        A failed read is logged and treated as a miss for the whole batch.
+        """
+        if not texts:
+            return {}
+        keys = {text: text_key(text) for text in texts}
+        hashes = list(dict.fromkeys(keys.values()))
+        by_hash: dict[str, list[float]] = {}
+        with self._lock:
+            try:
+                for start in range(0, len(hashes), _LOOKUP_CHUNK_SIZE):
+                    chunk = hashes[start : start + _LOOKUP_CHUNK_SIZE]
+                    placeholders = ", ".join("?" for _ in chunk)
+                    rows = self._conn.execute(
+                        f"SELECT text_hash, vector FROM embeddings "
+                        f"WHERE model_id = ? AND text_hash IN ({placeholders})",
+                        [model_id, *chunk],
+                    ).fetchall()
+                    by_hash.update((text_hash, _unpack(blob)) for text_hash, blob in rows)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache read failed, treating as miss: {e}")
+                by_hash = {}
+            found = {text: by_hash[key] for text, key in keys.items() if key in by_hash}
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put(self, model_id: str, text: str, vector: list[float]) -> None:
+        """Store *vector* for *text*."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (model_id, text_hash, vector) VALUES (?, ?, ?)",
+                (model_id, text_key(text), _pack(vector)),
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the number of stored vectors."""
+        with self._lock:
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            return {"hits": self.hits, "misses": self.misses, "entries": size}
+
+    def clear(self) -> None:
+        """Delete all cached vectors and reset counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array.array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    values = array.array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+def get_default_embedding_cache() -> EmbeddingCache | None:
+    """Build the embedding cache from the environment, or ``None`` if disabled."""
+    if os.environ.get("EMBEDDING_CACHE_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+    path = os.environ.get("EMBEDDING_CACHE_PATH") or _DEFAULT_CACHE_PATH
+    try:
+        return EmbeddingCache(path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Embedding cache unavailable at {path}: {e}")
+        return None
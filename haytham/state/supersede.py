@@ -107,13 +107,13 @@ def find_superseded_capabilities(session_manager) -> list[SupersededCapability]:
     Returns:
         List of SupersededCapability objects
     """
-    from haytham.state.vector_db import SystemStateDB
+    from haytham.state.vector_db import get_state_db
 
     db_path = session_manager.session_dir / "vector_db"
     if not db_path.exists():
         return []
 
-    db = SystemStateDB(str(db_path))
+    db = get_state_db(str(db_path))
     capabilities = db.get_capabilities()
 
     superseded = []
@@ -150,16 +150,24 @@ def find_affected_stories(
     # Build a set for fast lookup
     superseded_set = set(superseded_cap_ids)
 
-    # Try to load stories from Backlog.md
-    tasks = []
+    # Load stories from the cached Backlog.md task index
     try:
-        from haytham.backlog import BacklogCLI
-
-        cli = BacklogCLI(session_manager.session_dir.parent)
-        if cli.is_initialized():
-            tasks = cli.list_tasks()
+        from haytham.backlog import get_task_index
+
+        index = get_task_index(session_manager.session_dir.parent)
+        if not index.store.is_initialized():
+            return []
+        # One refresh for the whole report; the lookups below reuse it
+        index.refresh()
+        # Only stories implementing a superseded capability need a closer look
+        candidates = {
+            story_id
+            for cap_id in superseded_set
+            for story_id in index.stories_for_capability(cap_id, refresh=False)
+        }
+        tasks = [task for task in index.tasks(refresh=False) if task.id in candidates]
     except ImportError:
-        logger.warning("BacklogCLI not available")
+        logger.warning("Backlog integration not available")
         return []
     except Exception as e:
         logger.warning(f"Could not load stories: {e}")
@@ -170,13 +178,12 @@ def find_affected_stories(
     for task in tasks:
         labels = task.labels
 
-        # Check for implements: labels that reference superseded capabilities
-        implementing_superseded = []
-        for label in labels:
-            if label.startswith("implements:"):
-                cap_id = label.replace("implements:", "")
-                if cap_id in superseded_set:
-                    implementing_superseded.append(cap_id)
+        # implements: labels that reference superseded capabilities
+        implementing_superseded = [
+            cap_id
+            for cap_id in index.implements(task.id, refresh=False)
+            if cap_id in superseded_set
+        ]
 
         if implementing_superseded:
             affected.append(
@@ -208,13 +215,13 @@ def find_affected_decisions(
     if not superseded_cap_ids:
         return []
 
-    from haytham.state.vector_db import SystemStateDB
+    from haytham.state.vector_db import get_state_db
 
     db_path = session_manager.session_dir / "vector_db"
     if not db_path.exists():
         return []
 
-    db = SystemStateDB(str(db_path))
+    db = get_state_db(str(db_path))
     decisions = db.get_decisions()
 
     superseded_set = set(superseded_cap_ids)
@@ -258,13 +265,13 @@ def find_affected_entities(
     if not affected_decision_ids:
         return []
 
-    from haytham.state.vector_db import SystemStateDB
+    from haytham.state.vector_db import get_state_db
 
     db_path = session_manager.session_dir / "vector_db"
     if not db_path.exists():
         return []
 
-    db = SystemStateDB(str(db_path))
+    db = get_state_db(str(db_path))
     entities = db.get_entities()
 
     decision_set = set(affected_decision_ids)
@@ -362,29 +369,29 @@ def add_review_labels_to_stories(
     updated = 0
 
     try:
-        from haytham.backlog import BacklogCLI
+        from haytham.backlog import open_backlog
 
-        cli = BacklogCLI(session_manager.session_dir.parent)
+        cli = open_backlog(session_manager.session_dir.parent)
 
         if not cli.is_initialized():
             logger.warning("Backlog not initialized, cannot add labels")
             return 0
 
-        for story in affected_stories:
-            if story.needs_review_added:
-                continue  # Already has the label
-
-            # Add the review label via CLI
-            if hasattr(cli, "add_label"):
-                try:
-                    cli.add_label(story.story_id, "needs-review:superseded")
-                    updated += 1
-                    logger.info(f"Added needs-review:superseded to {story.story_id}")
-                except Exception as e:
-                    logger.error(f"Failed to add label to {story.story_id}: {e}")
+        pending = {
+            story.story_id: ["needs-review:superseded"]
+            for story in affected_stories
+            if not story.needs_review_added  # Skip stories that already have the label
+        }
+        if not pending:
+            return 0
+
+        result = cli.add_labels_bulk(pending)
+        for item in result.items:
+            if item.ok:
+                updated += 1
+                logger.info(f"Added needs-review:superseded to {item.key}")
             else:
-                logger.warning("BacklogCLI does not have add_label method")
-                break
+                logger.error(f"Failed to add label to {item.key}: {item.error}")
 
     except Exception as e:
         logger.error(f"Failed to add review labels: {e}")
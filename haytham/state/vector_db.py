@@ -6,12 +6,20 @@ with semantic search capabilities.
 
 import json
 import logging
-from datetime import UTC, datetime
+import math
+import os
+import tempfile
+import threading
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import lancedb
 import pyarrow as pa
+from lancedb.index import Bitmap, BTree, IvfHnswPq, IvfHnswSq, IvfPq
 
 from .embedder import TitanEmbedder, get_embedder
 from .schema import IDGenerator, SystemStateEntry
@@ -61,6 +69,110 @@ ENTRIES_SCHEMA = pa.schema(
     ]
 )
 
+# Everything except the embedding. Non-similarity reads project to these so
+# the 1024-float vector column is never materialized.
+SCALAR_SCHEMA = pa.schema([f for f in ENTRIES_SCHEMA if f.name != "vector"])
+SCALAR_COLUMNS = SCALAR_SCHEMA.names
+
+# Scalar indexes backing the filters every lookup uses. BITMAP suits the
+# handful of entry types; the rest are high-cardinality, so BTREE.
+SCALAR_INDEXES = {
+    "id": "BTREE",
+    "name": "BTREE",
+    "type": "BITMAP",
+    "superseded_by": "BTREE",
+}
+_SCALAR_INDEX_CONFIGS = {"BTREE": BTree, "BITMAP": Bitmap}
+
+
+def _safe_int_env(name: str, default: int) -> int:
+    """Read an integer env var, falling back to *default* on bad values."""
+    raw = os.getenv(name, "")
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid integer for %s=%r, using default %d", name, raw, default)
+        return default
+
+
+_ANN_INDEX_TYPES = {"IVF_PQ": IvfPq, "IVF_HNSW_SQ": IvfHnswSq, "IVF_HNSW_PQ": IvfHnswPq}
+
+
+@dataclass(frozen=True)
+class VectorIndexSettings:
+    """ANN index and vector search tuning for SystemStateDB.
+
+    Attributes:
+        index_type: LanceDB vector index type (IVF_PQ, IVF_HNSW_SQ, IVF_HNSW_PQ)
+        min_rows: Row count at which the ANN index is first built. Below it,
+            exact (brute-force) search is fast enough and always correct.
+        refresh_rows: Rows appended since the last index build/refresh that
+            trigger folding them into the index.
+        nprobes: IVF partitions probed per query
+        refine_factor: Re-rank ``limit * refine_factor`` candidates with exact
+            distances (0 disables refinement)
+    """
+
+    index_type: str = "IVF_PQ"
+    min_rows: int = 5000
+    refresh_rows: int = 1000
+    nprobes: int = 20
+    refine_factor: int = 0
+
+    @classmethod
+    def from_env(cls) -> "VectorIndexSettings":
+        """Build settings from ``STATE_DB_*`` environment variables."""
+        index_type = os.getenv("STATE_DB_ANN_INDEX_TYPE", cls.index_type).strip().upper()
+        if index_type not in _ANN_INDEX_TYPES:
+            raise ValueError(
+                f"Unknown STATE_DB_ANN_INDEX_TYPE '{index_type}'. "
+                f"Valid options: {', '.join(_ANN_INDEX_TYPES)}"
+            )
+        return cls(
+            index_type=index_type,
+            min_rows=_safe_int_env("STATE_DB_ANN_MIN_ROWS", cls.min_rows),
+            refresh_rows=_safe_int_env("STATE_DB_ANN_REFRESH_ROWS", cls.refresh_rows),
+            nprobes=_safe_int_env("STATE_DB_NPROBES", cls.nprobes),
+            refine_factor=_safe_int_env("STATE_DB_REFINE_FACTOR", cls.refine_factor),
+        )
+
+
+@dataclass(frozen=True)
+class CompactionSettings:
+    """On-disk maintenance for SystemStateDB.
+
+    Every append, supersede and delete commits a new table version and
+    usually a new small fragment. Without maintenance the ``vector_db``
+    directory grows with every change request.
+
+    Attributes:
+        min_small_fragments: Compact once this many small fragments exist
+        retain_hours: Table versions older than this are deleted on compaction
+    """
+
+    min_small_fragments: int = 32
+    retain_hours: int = 24
+
+    @classmethod
+    def from_env(cls) -> "CompactionSettings":
+        """Build settings from ``STATE_DB_*`` environment variables."""
+        return cls(
+            min_small_fragments=_safe_int_env(
+                "STATE_DB_COMPACT_MIN_FRAGMENTS", cls.min_small_fragments
+            ),
+            retain_hours=_safe_int_env("STATE_DB_RETAIN_VERSIONS_HOURS", cls.retain_hours),
+        )
+
+
+def _track_id(prefix_max: dict[str, int], entry_id: str) -> None:
+    """Fold an ID like ``CAP-F-001`` into a prefix → max number map."""
+    if "-" in entry_id:
+        # Extract prefix and number (e.g., "CAP-F-001" -> "CAP-F-", 1)
+        parts = entry_id.rsplit("-", 1)
+        if len(parts) == 2 and parts[1].isdigit():
+            prefix = parts[0] + "-"
+            prefix_max[prefix] = max(prefix_max.get(prefix, 0), int(parts[1]))
+
 
 class SystemStateDB:
     """Vector database for system state management.
@@ -72,26 +184,51 @@ class SystemStateDB:
 
     TABLE_NAME = "system_state"
 
+    # Sidecar with the max ID number per prefix, tagged with the table version
+    # it was computed for. Lets a fresh handle skip the full ID scan.
+    ID_COUNTERS_FILE = "id_counters.json"
+
+    # Random token identifying this database directory, so a shared handle
+    # can tell when the directory was deleted and recreated under it.
+    INSTANCE_FILE = ".instance"
+
     def __init__(
         self,
         db_path: str | Path,
         embedder: TitanEmbedder | None = None,
+        index_settings: VectorIndexSettings | None = None,
+        compaction_settings: CompactionSettings | None = None,
     ):
         """Initialize the system state database.
 
+        Prefer :func:`get_state_db`, which reuses one open handle per path.
+
         Args:
             db_path: Path to the LanceDB database directory
             embedder: TitanEmbedder instance. If None, uses the cached singleton.
+            index_settings: ANN index tuning. Defaults to ``STATE_DB_*`` env vars.
+            compaction_settings: Fragment compaction and version retention.
+                Defaults to ``STATE_DB_*`` env vars.
         """
         self.db_path = Path(db_path)
         self.db_path.mkdir(parents=True, exist_ok=True)
 
-        self.db = lancedb.connect(str(self.db_path))
+        # Zero interval: every read checks for newer table versions, so writes
+        # from other handles (or processes) are visible to long-lived handles.
+        self.db = lancedb.connect(str(self.db_path), read_consistency_interval=timedelta(0))
         self.embedder = embedder or get_embedder()
+        self.index_settings = index_settings or VectorIndexSettings.from_env()
+        self.compaction_settings = compaction_settings or CompactionSettings.from_env()
         self.id_generator = IDGenerator()
 
+        # Serializes writes and ID allocation when the handle is shared
+        self._write_lock = threading.RLock()
+        self._prefix_max: dict[str, int] = {}
+        self._counters_version: int | None = None
+        self._indexes_ready = False
+
+        self._instance_id = self._read_instance_id()
         self._ensure_table()
-        self._sync_id_counters()
 
         logger.info(f"SystemStateDB initialized at {self.db_path}")
 
@@ -104,26 +241,187 @@ class SystemStateDB:
         else:
             self._table = self.db.open_table(self.TABLE_NAME)
             logger.info(f"Opened existing table {self.TABLE_NAME}")
+            self.ensure_scalar_indexes()
+
+    def ensure_scalar_indexes(self) -> list[str]:
+        """Create any missing scalar indexes from ``SCALAR_INDEXES``.
+
+        Rows appended after an index was built are still found (LanceDB
+        scans unindexed fragments), so indexes only need creating once.
+
+        Returns:
+            Columns that were newly indexed.
+        """
+        if self.table is None:
+            return []
+
+        try:
+            indexed = {col for idx in self.table.list_indices() for col in idx.columns}
+        except Exception as e:
+            logger.warning(f"Failed to list indexes: {e}")
+            return []
+
+        created = []
+        for column, index_type in SCALAR_INDEXES.items():
+            if column in indexed:
+                continue
+            try:
+                self.table.create_index(column, config=_SCALAR_INDEX_CONFIGS[index_type]())
+                created.append(column)
+            except Exception as e:
+                logger.warning(f"Failed to create {index_type} index on {column}: {e}")
+
+        if created:
+            logger.info(f"Created scalar indexes on {', '.join(created)}")
+        self._indexes_ready = indexed.union(created) >= SCALAR_INDEXES.keys()
+        return created
+
+    def _vector_index_name(self) -> str | None:
+        """Name of the ANN index on the vector column, if one exists."""
+        for idx in self.table.list_indices():
+            if idx.columns == ["vector"]:
+                return idx.name
+        return None
+
+    def ensure_vector_index(self, force: bool = False) -> bool:
+        """Build the ANN index past the row threshold, or refresh it.
+
+        Called after every write. Builds the index once the table holds
+        ``index_settings.min_rows`` rows; afterwards, folds newly appended
+        rows into it via :meth:`compact` once ``refresh_rows`` of them are
+        unindexed (until then they are searched exactly alongside the index).
+
+        Args:
+            force: Build regardless of row count, or refresh regardless of
+                how many rows are unindexed.
+
+        Returns:
+            True if the index was built or refreshed.
+        """
+        if self.table is None:
+            return False
+
+        settings = self.index_settings
+        with self._write_lock:
+            try:
+                name = self._vector_index_name()
+                if name is None:
+                    rows = self.table.count_rows()
+                    if rows < settings.min_rows and not force:
+                        return False
+                    self._build_vector_index(rows)
+                    return True
+
+                stats = self.table.index_stats(name)
+                unindexed = stats.num_unindexed_rows if stats else 0
+                if unindexed == 0 or (unindexed < settings.refresh_rows and not force):
+                    return False
+                # Compaction also merges unindexed fragments into the indexes
+                self.compact()
+                logger.info(f"Refreshed vector index with {unindexed} new rows")
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to maintain vector index: {e}")
+                return False
+
+    def compact(self, retain: timedelta | None = None) -> None:
+        """Compact fragments, fold new rows into indexes, drop old versions.
+
+        Args:
+            retain: Keep table versions newer than this. Defaults to
+                ``compaction_settings.retain_hours``.
+        """
+        if self.table is None:
+            return
+
+        if retain is None:
+            retain = timedelta(hours=self.compaction_settings.retain_hours)
+        with self._write_lock:
+            synced = self._counters_version == self.table.version
+            self.table.optimize(cleanup_older_than=retain)
+            if synced:
+                # Compaction rewrites files but not IDs; keep the sidecar valid
+                self._persist_counters()
+        logger.info(f"Compacted {self.TABLE_NAME} (kept versions from the last {retain})")
+
+    def maybe_compact(self) -> bool:
+        """Compact when enough small fragments have piled up.
+
+        Returns:
+            True if compaction ran.
+        """
+        if self.table is None:
+            return False
+
+        try:
+            fragments = self.table.stats()["fragment_stats"]["num_small_fragments"]
+            if fragments < self.compaction_settings.min_small_fragments:
+                return False
+            self.compact()
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to compact {self.TABLE_NAME}: {e}")
+            return False
+
+    def _build_vector_index(self, rows: int) -> None:
+        """Train and write the ANN index over the current table."""
+        settings = self.index_settings
+        params: dict[str, Any] = {
+            "distance_type": "l2",
+            # ~sqrt(N) partitions keeps each probed partition small
+            "num_partitions": max(1, int(math.sqrt(rows))),
+        }
+        if settings.index_type.endswith("PQ"):
+            # 16 dimensions per sub-vector (1024 -> 64 sub-vectors)
+            params["num_sub_vectors"] = self.embedder.dimension // 16
+        config = _ANN_INDEX_TYPES[settings.index_type](**params)
+        self.table.create_index("vector", config=config)
+        logger.info(f"Built {settings.index_type} vector index over {rows} rows")
+
+    def _read_instance_id(self) -> str:
+        """Read the directory's instance token, creating it if missing."""
+        path = self.db_path / self.INSTANCE_FILE
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            token = uuid.uuid4().hex
+            path.write_text(token, encoding="utf-8")
+            return token
+
+    def is_current(self) -> bool:
+        """Check that the directory this handle opened still exists unchanged."""
+        try:
+            token = (self.db_path / self.INSTANCE_FILE).read_text(encoding="utf-8")
+        except OSError:
+            return False
+        return token == self._instance_id
 
     def _sync_id_counters(self) -> None:
-        """Sync ID counters with existing data."""
-        if self._table is None:
+        """Sync ID counters with existing data.
+
+        Lazy: only runs before a write, and only when the table version has
+        moved since the last sync. A fresh handle first tries the persisted
+        counters sidecar; the full ID scan runs only when that is missing or
+        was written for a different table version.
+        """
+        if self.table is None:
             return
 
         try:
-            # Get all existing IDs to find max per prefix
-            results = self._table.search().limit(10000).to_list()
-
-            prefix_max: dict[str, int] = {}
-            for row in results:
-                entry_id = row.get("id", "")
-                if "-" in entry_id:
-                    # Extract prefix and number (e.g., "CAP-F-001" -> "CAP-F-", 1)
-                    parts = entry_id.rsplit("-", 1)
-                    if len(parts) == 2 and parts[1].isdigit():
-                        prefix = parts[0] + "-"
-                        num = int(parts[1])
-                        prefix_max[prefix] = max(prefix_max.get(prefix, 0), num)
+            version = self.table.version
+            if version == self._counters_version:
+                return
+
+            prefix_max = self._load_persisted_counters(version)
+            if prefix_max is None:
+                prefix_max = {}
+                ids = self._scan(columns=["id"]).column("id").to_pylist()
+                for entry_id in ids:
+                    _track_id(prefix_max, entry_id or "")
+                logger.debug(f"Scanned {len(ids)} IDs to sync counters")
+
+            self._prefix_max = prefix_max
+            self._counters_version = version
 
             # Set counters to start after max
             for prefix, max_num in prefix_max.items():
@@ -133,6 +431,44 @@ class SystemStateDB:
         except Exception as e:
             logger.warning(f"Failed to sync ID counters: {e}")
 
+    def _load_persisted_counters(self, version: int) -> dict[str, int] | None:
+        """Read the counters sidecar if it matches the current table version."""
+        path = self.db_path / self.ID_COUNTERS_FILE
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("table_version") != version:
+            return None
+        return {prefix: int(num) for prefix, num in data.get("prefix_max", {}).items()}
+
+    def _record_write(self, written_ids: list[str]) -> None:
+        """Update in-memory and persisted counters after this handle wrote."""
+        for entry_id in written_ids:
+            _track_id(self._prefix_max, entry_id)
+        if self.table is None:
+            return
+
+        if not self._indexes_ready:
+            # First write creates the table; index it before recording the version
+            self.ensure_scalar_indexes()
+        if not self.ensure_vector_index():
+            self.maybe_compact()
+        self._persist_counters()
+
+    def _persist_counters(self) -> None:
+        """Write the counters sidecar tagged with the current table version."""
+        self._counters_version = self.table.version
+        payload = {"table_version": self._counters_version, "prefix_max": self._prefix_max}
+        fd, tmp = tempfile.mkstemp(dir=self.db_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, self.db_path / self.ID_COUNTERS_FILE)
+        except OSError as e:
+            Path(tmp).unlink(missing_ok=True)
+            logger.warning(f"Failed to persist ID counters: {e}")
+
     @property
     def table(self):
         """Get the LanceDB table, creating if needed."""
@@ -217,7 +553,7 @@ class SystemStateDB:
         Returns:
             The entry as a dict, or None if not found
         """
-        if self._table is None:
+        if self.table is None:
             return None
 
         try:
@@ -231,7 +567,7 @@ class SystemStateDB:
                 filters.append(f"type = '{entry_type}'")
 
             where_clause = " AND ".join(filters)
-            results = self._table.search().where(where_clause).limit(1).to_list()
+            results = self._scan(where_clause, limit=1).to_pylist()
 
             if results:
                 return self._record_to_dict(results[0])
@@ -255,20 +591,124 @@ class SystemStateDB:
         Raises:
             DuplicateEntryError: If an entry with the same name+type already exists
         """
-        # Check for duplicate by name + type (only for non-superseded entries)
-        existing = self.find_by_name(
-            name=entry.name,
-            entry_type=entry.type,
-            include_superseded=False,
-        )
-
-        if existing:
-            raise DuplicateEntryError(
-                f"Entry with name '{entry.name}' and type '{entry.type}' already exists "
-                f"(id={existing['id']}). Use supersede_entry() to update instead."
+        with self._write_lock:
+            # Check for duplicate by name + type (only for non-superseded entries)
+            existing = self.find_by_name(
+                name=entry.name,
+                entry_type=entry.type,
+                include_superseded=False,
             )
 
-        return self._add_entry_unchecked(entry)
+            if existing:
+                raise DuplicateEntryError(
+                    f"Entry with name '{entry.name}' and type '{entry.type}' already exists "
+                    f"(id={existing['id']}). Use supersede_entry() to update instead."
+                )
+
+            return self._add_entry_unchecked(entry)
+
+    def add_entries(
+        self,
+        entries: list[SystemStateEntry],
+        skip_duplicates: bool = False,
+    ) -> list[str]:
+        """Add many entries with one concurrent embedding pass and one append.
+
+        All entries are validated before anything is written: duplicates of
+        existing current entries and repeated name+type pairs within the
+        batch are detected up front. Entries whose embedding fails are
+        logged and left out; the rest are still written.
+
+        Args:
+            entries: Entries to add. Empty ids are generated.
+            skip_duplicates: If True, log and drop duplicates instead of raising.
+
+        Returns:
+            IDs of the entries written, in input order.
+
+        Raises:
+            DuplicateEntryError: If a duplicate is found and skip_duplicates is False.
+                Nothing is written in that case.
+            Exception: If the duplicate check cannot read the table. Nothing
+                is written in that case.
+        """
+        if not entries:
+            return []
+
+        with self._write_lock:
+            return self._add_entries_locked(entries, skip_duplicates)
+
+    def _add_entries_locked(
+        self,
+        entries: list[SystemStateEntry],
+        skip_duplicates: bool,
+    ) -> list[str]:
+        """Body of add_entries; caller holds the write lock."""
+        existing = self._find_existing_names({e.name for e in entries})
+        seen: set[tuple[str, str]] = set()
+        accepted: list[SystemStateEntry] = []
+        for entry in entries:
+            key = (entry.name, entry.type)
+            duplicate_of = existing.get(key) or ("(same batch)" if key in seen else None)
+            if duplicate_of:
+                message = (
+                    f"Entry with name '{entry.name}' and type '{entry.type}' already exists "
+                    f"(id={duplicate_of}). Use supersede_entry() to update instead."
+                )
+                if not skip_duplicates:
+                    raise DuplicateEntryError(message)
+                logger.error(f"Skipping duplicate: {message}")
+                continue
+            seen.add(key)
+            accepted.append(entry)
+
+        self._sync_id_counters()
+        for entry in accepted:
+            if not entry.id:
+                entry.id = self.id_generator.next_id(entry.type, entry.subtype)
+
+        batch = self.embedder.embed_batch_partial([e.get_text_for_embedding() for e in accepted])
+
+        records = []
+        written_ids = []
+        for i, entry in enumerate(accepted):
+            vector = batch.embeddings[i]
+            if vector is None:
+                logger.error(f"Failed to embed {entry.id} ({entry.name}): {batch.errors[i]}")
+                continue
+            records.append(self._entry_to_record(entry, vector))
+            written_ids.append(entry.id)
+
+        if not records:
+            return []
+
+        if self.table is None:
+            self._table = self.db.create_table(self.TABLE_NAME, records)
+        else:
+            self.table.add(records)
+        self._record_write(written_ids)
+        logger.info(f"Added {len(records)} entries in one batch")
+
+        return written_ids
+
+    def _find_existing_names(self, names: set[str]) -> dict[tuple[str, str], str]:
+        """Map (name, type) → id for current entries whose name is in *names*.
+
+        Errors propagate: an empty result would let duplicates through.
+        """
+        if self.table is None or not names:
+            return {}
+
+        quoted = ", ".join("'" + name.replace("'", "''") + "'" for name in names)
+        try:
+            rows = self._scan(
+                f"name IN ({quoted}) AND superseded_by = ''",
+                columns=["id", "name", "type"],
+            ).to_pylist()
+        except Exception as e:
+            logger.error(f"Failed to check for existing entries: {e}")
+            raise
+        return {(row["name"], row["type"]): row["id"] for row in rows}
 
     def _add_entry_unchecked(self, entry: SystemStateEntry) -> str:
         """Internal method to add entry without duplicate checking.
@@ -281,26 +721,29 @@ class SystemStateDB:
         Returns:
             The ID of the added entry.
         """
-        # Generate ID if not provided
-        if not entry.id:
-            entry.id = self.id_generator.next_id(entry.type, entry.subtype)
-
-        # Generate embedding
-        text_to_embed = entry.get_text_for_embedding()
-        vector = self.embedder.embed(text_to_embed)
-
-        # Create record
-        record = self._entry_to_record(entry, vector)
-
-        # Add to table (create table if first entry)
-        if self._table is None:
-            self._table = self.db.create_table(self.TABLE_NAME, [record])
-            logger.info(f"Created table with first entry: {entry.id}")
-        else:
-            self._table.add([record])
-            logger.info(f"Added entry: {entry.id}")
+        with self._write_lock:
+            # Generate ID if not provided
+            if not entry.id:
+                self._sync_id_counters()
+                entry.id = self.id_generator.next_id(entry.type, entry.subtype)
+
+            # Generate embedding
+            text_to_embed = entry.get_text_for_embedding()
+            vector = self.embedder.embed(text_to_embed)
+
+            # Create record
+            record = self._entry_to_record(entry, vector)
+
+            # Add to table (create table if first entry)
+            if self.table is None:
+                self._table = self.db.create_table(self.TABLE_NAME, [record])
+                logger.info(f"Created table with first entry: {entry.id}")
+            else:
+                self.table.add([record])
+                logger.info(f"Added entry: {entry.id}")
 
-        return entry.id
+            self._record_write([entry.id])
+            return entry.id
 
     def supersede_entry(self, old_id: str, new_entry: SystemStateEntry) -> str:
         """Create a new version of an entry and mark the old one as superseded.
@@ -318,57 +761,86 @@ class SystemStateDB:
         Raises:
             ValueError: If old_id is not found
         """
-        # Get old entry first
-        old_entry = self.get_by_id(old_id)
-        if not old_entry:
-            raise ValueError(f"Entry {old_id} not found")
-
-        # Mark old entry as superseded FIRST (before adding new)
-        # This prevents the duplicate check from failing
-        # LanceDB doesn't support in-place updates well, so we use a workaround:
-        # Delete old, re-add with superseded_by set to a placeholder, then update
-
-        # Delete old entry
-        self._table.delete(f"id = '{old_id}'")
-
-        # Re-add with superseded_by set (placeholder - will update after new entry created)
-        old_entry_obj = SystemStateEntry(
-            id=old_id,
-            type=old_entry["type"],
-            subtype=old_entry.get("subtype"),
-            name=old_entry["name"],
-            description=old_entry["description"],
-            tags=old_entry.get("tags", []),
-            affects=old_entry.get("affects", []),
-            depends_on=old_entry.get("depends_on", []),
-            created_at=old_entry.get("created_at", datetime.now(UTC)),
-            supersedes=old_entry.get("supersedes"),
-            superseded_by="PENDING",  # Temporary placeholder
-            source_stage=old_entry.get("source_stage"),
-            rationale=old_entry.get("rationale"),
-            metadata=old_entry.get("metadata", {}),
-        )
+        new_id = self.supersede_entries([(old_id, new_entry)])[0]
+        logger.info(f"Superseded {old_id} with {new_id}")
+        return new_id
 
-        # Re-embed and add old entry (now marked as superseded)
-        text_to_embed = old_entry_obj.get_text_for_embedding()
-        vector = self.embedder.embed(text_to_embed)
-        record = self._entry_to_record(old_entry_obj, vector)
-        self._table.add([record])
+    def supersede_entries(self, pairs: list[tuple[str, SystemStateEntry]]) -> list[str]:
+        """Supersede many entries in one atomic table commit.
 
-        # Now add new entry (without duplicate check since old is superseded)
-        new_entry.supersedes = old_id
-        new_id = self._add_entry_unchecked(new_entry)
+        New entries are embedded in one concurrent batch. Old rows are not
+        re-embedded: they are written back whole, with their stored vectors
+        and only ``superseded_by`` changed, in the same ``merge_insert`` on
+        ``id`` as the new rows, so readers never see a half-applied supersede.
 
-        # Update old entry with correct superseded_by
-        self._table.delete(f"id = '{old_id}'")
-        old_entry_obj.superseded_by = new_id
-        text_to_embed = old_entry_obj.get_text_for_embedding()
-        vector = self.embedder.embed(text_to_embed)
-        record = self._entry_to_record(old_entry_obj, vector)
-        self._table.add([record])
+        Args:
+            pairs: (old_id, new_entry) pairs. ``supersedes`` is set on each
+                new entry automatically; empty ids are generated.
 
-        logger.info(f"Superseded {old_id} with {new_id}")
-        return new_id
+        Returns:
+            IDs of the new entries, in input order.
+
+        Raises:
+            ValueError: If an old_id is not found, is already superseded or
+                appears twice
+            EmbeddingBatchError: If any new entry failed to embed. Nothing
+                is written in that case.
+        """
+        if not pairs:
+            return []
+
+        old_ids = [old_id for old_id, _ in pairs]
+        if len(set(old_ids)) != len(old_ids):
+            raise ValueError("Each entry can only be superseded once per batch")
+
+        with self._write_lock:
+            old_rows = self._get_rows_with_vectors(old_ids)
+            missing = [old_id for old_id in old_ids if old_id not in old_rows]
+            if missing:
+                raise ValueError(f"Entry {missing[0]} not found")
+            for old_id in old_ids:
+                if old_rows[old_id]["superseded_by"]:
+                    raise ValueError(
+                        f"Entry {old_id} is already superseded by "
+                        f"{old_rows[old_id]['superseded_by']}"
+                    )
+
+            self._sync_id_counters()
+            new_entries = []
+            for old_id, new_entry in pairs:
+                if not new_entry.id:
+                    new_entry.id = self.id_generator.next_id(new_entry.type, new_entry.subtype)
+                new_entry.supersedes = old_id
+                new_entries.append(new_entry)
+
+            vectors = self.embedder.embed_batch([e.get_text_for_embedding() for e in new_entries])
+
+            records = []
+            for (old_id, new_entry), vector in zip(pairs, vectors, strict=True):
+                old_record = old_rows[old_id]
+                old_record["superseded_by"] = new_entry.id
+                records.append(old_record)
+                records.append(self._entry_to_record(new_entry, vector))
+
+            (
+                self.table.merge_insert("id")
+                .when_matched_update_all()
+                .when_not_matched_insert_all()
+                .execute(records)
+            )
+            new_ids = [e.id for e in new_entries]
+            self._record_write(new_ids)
+
+        logger.info(f"Superseded {len(new_ids)} entries in one commit")
+        return new_ids
+
+    def _get_rows_with_vectors(self, entry_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Read raw stored rows (vector included) keyed by id."""
+        if self.table is None or not entry_ids:
+            return {}
+        quoted = ", ".join("'" + entry_id.replace("'", "''") + "'" for entry_id in entry_ids)
+        rows = self._scan(f"id IN ({quoted})", columns=ENTRIES_SCHEMA.names).to_pylist()
+        return {row["id"]: row for row in rows}
 
     def delete_entry(self, entry_id: str) -> bool:
         """Delete an entry by ID.
@@ -379,11 +851,13 @@ class SystemStateDB:
         Returns:
             True if deleted, False if not found
         """
-        if self._table is None:
+        if self.table is None:
             return False
 
         try:
-            self._table.delete(f"id = '{entry_id}'")
+            with self._write_lock:
+                self.table.delete(f"id = '{entry_id}'")
+                self._record_write([])
             logger.info(f"Deleted entry: {entry_id}")
             return True
         except Exception as e:
@@ -403,11 +877,11 @@ class SystemStateDB:
         Returns:
             The entry as a dict, or None if not found
         """
-        if self._table is None:
+        if self.table is None:
             return None
 
         try:
-            results = self._table.search().where(f"id = '{entry_id}'").limit(1).to_list()
+            results = self._scan(f"id = '{entry_id}'", limit=1).to_pylist()
             if results:
                 return self._record_to_dict(results[0])
             return None
@@ -422,20 +896,28 @@ class SystemStateDB:
         subtype: str | None = None,
         include_superseded: bool = False,
         limit: int = 5,
+        nprobes: int | None = None,
+        refine_factor: int | None = None,
     ) -> list[dict]:
         """Find semantically similar entries.
 
+        Filters are applied before the vector search (prefilter), so
+        superseded generations never crowd current entries out of the
+        top ``limit``. Uses the ANN index when one has been built.
+
         Args:
             query: Text to search for
             entry_type: Filter by entry type (capability, decision, etc.)
             subtype: Filter by subtype (functional, non_functional, etc.)
             include_superseded: If True, include superseded entries
             limit: Maximum number of results
+            nprobes: IVF partitions to probe (default from index_settings)
+            refine_factor: Exact re-rank multiplier (default from index_settings)
 
         Returns:
             List of matching entries, ordered by similarity
         """
-        if self._table is None:
+        if self.table is None:
             return []
 
         # Generate query embedding
@@ -452,10 +934,17 @@ class SystemStateDB:
 
         where_clause = " AND ".join(filters) if filters else None
 
+        if nprobes is None:
+            nprobes = self.index_settings.nprobes
+        if refine_factor is None:
+            refine_factor = self.index_settings.refine_factor
+
         try:
-            search = self._table.search(vector).limit(limit)
+            search = self.table.search(vector).limit(limit).nprobes(nprobes)
+            if refine_factor > 0:
+                search = search.refine_factor(refine_factor)
             if where_clause:
-                search = search.where(where_clause)
+                search = search.where(where_clause, prefilter=True)
 
             results = search.to_list()
             return [self._record_to_dict(r) for r in results]
@@ -463,37 +952,115 @@ class SystemStateDB:
             logger.error(f"Similarity search failed: {e}")
             return []
 
+    def _scan(
+        self,
+        where: str | None = None,
+        columns: list[str] | None = None,
+        limit: int | None = None,
+    ) -> pa.Table:
+        """Run a filtered, projected scan without the vector column.
+
+        Args:
+            where: SQL filter, served by the scalar indexes where possible
+            columns: Columns to read. Defaults to ``SCALAR_COLUMNS``.
+            limit: Maximum rows, or None for all matches
+
+        Returns:
+            Arrow table of matching rows
+        """
+        query = self.table.search().select(columns or SCALAR_COLUMNS)
+        if where:
+            query = query.where(where)
+        return query.limit(limit).to_arrow()
+
+    @staticmethod
+    def _current_filter(entry_type: str | None, subtype: str | None) -> str:
+        filters = ["superseded_by = ''"]
+        if entry_type:
+            filters.append(f"type = '{entry_type}'")
+        if subtype:
+            filters.append(f"subtype = '{subtype}'")
+        return " AND ".join(filters)
+
     def get_current_state(
         self,
         entry_type: str | None = None,
         subtype: str | None = None,
+        columns: list[str] | None = None,
     ) -> list[dict]:
         """Get all current (non-superseded) entries.
 
         Args:
             entry_type: Filter by entry type
             subtype: Filter by subtype
+            columns: Only read these columns (default: all but the vector)
 
         Returns:
             List of current entries
         """
-        if self._table is None:
-            return []
+        table = self.get_current_state_arrow(entry_type, subtype, columns)
+        return [self._record_to_dict(r) for r in table.to_pylist()]
 
-        filters = ["superseded_by = ''"]
-        if entry_type:
-            filters.append(f"type = '{entry_type}'")
-        if subtype:
-            filters.append(f"subtype = '{subtype}'")
+    def get_current_state_arrow(
+        self,
+        entry_type: str | None = None,
+        subtype: str | None = None,
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """Get current entries as an Arrow table, without per-row dicts.
+
+        Columns are raw storage values (``metadata_json`` unparsed, empty
+        strings instead of None). Vectors are never read.
+
+        Args:
+            entry_type: Filter by entry type
+            subtype: Filter by subtype
+            columns: Only read these columns (default: all but the vector)
 
-        where_clause = " AND ".join(filters)
+        Returns:
+            Arrow table of current entries (empty on error or no table)
+        """
+        columns = columns or SCALAR_COLUMNS
+        if self.table is None:
+            return SCALAR_SCHEMA.empty_table().select(columns)
 
         try:
-            results = self._table.search().where(where_clause).limit(10000).to_list()
-            return [self._record_to_dict(r) for r in results]
+            return self._scan(self._current_filter(entry_type, subtype), columns)
         except Exception as e:
             logger.error(f"Failed to get current state: {e}")
-            return []
+            return SCALAR_SCHEMA.empty_table().select(columns)
+
+    def iter_current_batches(
+        self,
+        entry_type: str | None = None,
+        subtype: str | None = None,
+        columns: list[str] | None = None,
+        batch_size: int = 4096,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream current entries as Arrow record batches.
+
+        For whole-state computations that should not hold every row in
+        memory at once.
+
+        Args:
+            entry_type: Filter by entry type
+            subtype: Filter by subtype
+            columns: Only read these columns (default: all but the vector)
+            batch_size: Maximum rows per batch
+
+        Yields:
+            Record batches of current entries
+        """
+        if self.table is None:
+            return
+
+        query = (
+            self.table.search()
+            .select(columns or SCALAR_COLUMNS)
+            .where(self._current_filter(entry_type, subtype))
+            .limit(None)
+        )
+        yield from query.to_batches(batch_size)
 
     def get_capabilities(self, subtype: str | None = None) -> list[dict]:
         """Get all current capabilities.
@@ -570,20 +1137,57 @@ class SystemStateDB:
         Returns:
             Number of matching entries
         """
-        if self._table is None:
+        if self.table is None:
             return 0
 
         try:
-            if entry_type:
-                results = (
-                    self._table.search()
-                    .where(f"type = '{entry_type}' AND superseded_by = ''")
-                    .limit(100000)
-                    .to_list()
-                )
-            else:
-                results = self._table.search().where("superseded_by = ''").limit(100000).to_list()
-            return len(results)
+            return self.table.count_rows(self._current_filter(entry_type, None))
         except Exception as e:
             logger.error(f"Failed to count entries: {e}")
             return 0
+
+
+# =============================================================================
+# Handle Registry
+# =============================================================================
+
+_registry: dict[Path, SystemStateDB] = {}
+_registry_lock = threading.Lock()
+
+
+def get_state_db(db_path: str | Path, embedder: TitanEmbedder | None = None) -> SystemStateDB:
+    """Get the shared SystemStateDB handle for a path, opening it on first use.
+
+    Handles are process-wide and keyed by resolved path, so repeated report
+    and query calls reuse one LanceDB connection instead of reconnecting.
+    A handle whose directory has been deleted or recreated since it was
+    opened (e.g. session reset) is replaced, see
+    :meth:`SystemStateDB.is_current`. ``embedder`` only applies when the
+    handle is first opened.
+
+    Args:
+        db_path: Path to the LanceDB database directory
+        embedder: Optional TitanEmbedder for a newly opened handle
+
+    Returns:
+        Shared SystemStateDB instance
+    """
+    key = Path(db_path).resolve()
+    with _registry_lock:
+        db = _registry.get(key)
+        if db is None or not db.is_current():
+            db = SystemStateDB(key, embedder=embedder)
+            _registry[key] = db
+        return db
+
+
+def release_state_db(db_path: str | Path) -> None:
+    """Drop the shared handle for a path (e.g. before deleting the directory)."""
+    with _registry_lock:
+        _registry.pop(Path(db_path).resolve(), None)
+
+
+def clear_state_db_registry() -> None:
+    """Drop all shared handles."""
+    with _registry_lock:
+        _registry.clear()
@@ -14,11 +14,20 @@ Functions:
 """
 
 import concurrent.futures
+import contextvars
 import logging
 import time
 from datetime import UTC, datetime
 from typing import Any
 
+from haytham.agents.utils.llm_scheduler import backoff_delay, get_llm_scheduler, is_throttling_error
+from haytham.agents.utils.prompt_cache import record_cache_usage, result_usage
+from haytham.agents.utils.tokenizer import Tokenizer, get_tokenizer
+
+from .prompt_layout import assemble_prompt
+from .response_cache import CacheMissError, lookup_response, store_response
+from .stage_stream import current_stage_stream
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +45,10 @@ def _is_token_limit_error(error: Exception) -> bool:
     Returns:
         True if this is a token limit error
     """
+    # "Too many tokens" throttling is a rate limit, not an oversized request
+    if is_throttling_error(error):
+        return False
+
     error_str = str(error).lower()
 
     # Check for common token limit indicators from AWS Bedrock
@@ -110,6 +123,32 @@ def _is_transient_error(error: Exception) -> bool:
     return any(indicator in combined for indicator in _TRANSIENT_INDICATORS)
 
 
+def _is_retryable_error(error: Exception) -> bool:
+    """Check if ``run_agent`` should retry after *error*."""
+    if is_throttling_error(error):
+        return True
+    return _is_transient_error(error) and not _is_token_limit_error(error)
+
+
+def _agent_tier(agent_name: str) -> str:
+    """Model tier of a registered agent, used to pick its scheduler lane."""
+    from haytham.config import AGENT_CONFIGS
+
+    config = AGENT_CONFIGS.get(agent_name)
+    return config.model_tier.value if config else "light"
+
+
+def _agent_tokenizer(agent_name: str) -> Tokenizer:
+    """Tokenizer for the model a registered agent runs on."""
+    from haytham.agents.utils.model_provider import get_model_id_for_tier
+
+    try:
+        model_id = get_model_id_for_tier(_agent_tier(agent_name))
+    except ValueError:
+        model_id = None
+    return get_tokenizer(model_id=model_id)
+
+
 def _get_user_friendly_error(error: Exception, agent_name: str) -> str:
     """Get a user-friendly error message for display.
 
@@ -120,6 +159,12 @@ def _get_user_friendly_error(error: Exception, agent_name: str) -> str:
     Returns:
         User-friendly error message
     """
+    if is_throttling_error(error):
+        return (
+            f"{agent_name} was rate limited by the model provider. "
+            "Try again shortly, or lower LLM_MAX_CONCURRENCY / LLM_REQUESTS_PER_MINUTE in .env."
+        )
+
     if _is_token_limit_error(error):
         return (
             f"Token limit exceeded in {agent_name}. "
@@ -144,6 +189,7 @@ def run_agent(
     use_context_tools: bool = False,
     trace_attributes: dict[str, Any] | None = None,
     output_as_json: bool = False,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Execute an agent using the existing agent factory.
 
@@ -162,16 +208,49 @@ def run_agent(
         trace_attributes: Optional attributes for OpenTelemetry tracing
         output_as_json: If True, return JSON from Pydantic structured outputs
                        instead of rendering markdown
+        use_cache: If False, bypass the response cache for this call
+                   (see :mod:`haytham.workflow.response_cache`)
 
     Returns:
         Dict with agent output and metadata
     """
     # Lazy import: avoids circular dep (context_builder → stage_registry → ... → agent_runner)
-    from .context_builder import build_context_summary
+    from .context_builder import CONTEXT_TOKEN_BUDGETS, build_context_sections
 
     start_time = time.time()
 
     try:
+        # Build full query (layout and cache checkpoints: see prompt_layout)
+        if use_context_tools:
+            tools_hint = "Use the context retrieval tools to access relevant information from previous stages."
+            prompt = assemble_prompt(f"{query}\n\n{tools_hint}", [])
+        else:
+            tokenizer = _agent_tokenizer(agent_name)
+            sections = build_context_sections(
+                context,
+                token_budget=CONTEXT_TOKEN_BUDGETS.get(_agent_tier(agent_name)),
+                tokenizer=tokenizer,
+            )
+            prompt = assemble_prompt(query, sections, tokenizer=tokenizer)
+        full_query = prompt.text
+
+        cache_key = None
+        if use_cache:
+            cached_output, cache_key = lookup_response(
+                agent_name,
+                full_query,
+                output_as_json=output_as_json,
+                context=context if use_context_tools else None,
+            )
+            if cached_output is not None:
+                return {
+                    "output": cached_output,
+                    "agent_name": agent_name,
+                    "status": "completed",
+                    "execution_time": time.time() - start_time,
+                    "cached": True,
+                }
+
         # Lazy import: workflow/ → agents/ would create circular dep at module level
         from haytham.agents.factory.agent_factory import create_agent_by_name
 
@@ -180,9 +259,6 @@ def run_agent(
         if agent is None:
             raise ValueError(f"Agent factory returned None for {agent_name}")
 
-        # Build full query
-        full_query = query
-
         if use_context_tools:
             # Lazy import: workflow/ → agents/ would create circular dep at module level
             from haytham.agents.tools.context_retrieval import (
@@ -191,43 +267,46 @@ def run_agent(
             )
 
             set_context_store(context)
-            full_query += "\n\nUse the context retrieval tools to access relevant information from previous stages."
-        else:
-            context_summary = build_context_summary(context)
-            if context_summary:
-                full_query += f"\n\n## Context from Previous Stages:\n{context_summary}"
+
+        # Forward incremental tokens and tool calls to a live progress view
+        stream = current_stage_stream()
+        if stream is not None:
+            agent.callback_handler = stream.handler(agent_name)
 
         logger.info(f"Running agent {agent_name} with query length: {len(full_query)}")
 
         try:
             # Retry loop for transient errors: network drops (boto3 doesn't
-            # retry mid-stream failures) and structured output failures
-            # (reasoning models sometimes skip the structured output tool).
+            # retry mid-stream failures), structured output failures
+            # (reasoning models sometimes skip the structured output tool)
+            # and provider throttling. Each attempt waits for a scheduler
+            # slot; throttling also shrinks the lane's concurrency limit.
+            scheduler = get_llm_scheduler()
+            tier = _agent_tier(agent_name)
             for attempt in range(_MAX_RETRIES + 1):
                 try:
-                    result = agent(full_query)
+                    with scheduler.slot(tier):
+                        result = agent(prompt.content)
                     break
                 except Exception as e:
-                    if (
-                        attempt < _MAX_RETRIES
-                        and _is_transient_error(e)
-                        and not _is_token_limit_error(e)
-                    ):
+                    if attempt < _MAX_RETRIES and _is_retryable_error(e):
+                        delay = backoff_delay(attempt, _RETRY_DELAY_SECONDS)
                         logger.warning(
-                            "Agent %s transient error (attempt %d/%d): %s. Retrying in %ds...",
+                            "Agent %s transient error (attempt %d/%d): %s. Retrying in %.1fs...",
                             agent_name,
                             attempt + 1,
                             _MAX_RETRIES + 1,
                             e,
-                            _RETRY_DELAY_SECONDS,
+                            delay,
                         )
-                        time.sleep(_RETRY_DELAY_SECONDS)
+                        time.sleep(delay)
                         continue
                     raise
 
             # Lazy import: workflow/ → agents/ would create circular dep at module level
             from haytham.agents.output_utils import extract_text_from_result
 
+            record_cache_usage(result_usage(result))
             output_text = extract_text_from_result(result, output_as_json=output_as_json)
             execution_time = time.time() - start_time
 
@@ -241,6 +320,9 @@ def run_agent(
                     "execution_time": execution_time,
                 }
 
+            if cache_key is not None:
+                store_response(agent_name, cache_key, output_text)
+
             return {
                 "output": output_text,
                 "agent_name": agent_name,
@@ -251,6 +333,9 @@ def run_agent(
             if use_context_tools:
                 clear_context_store()
 
+    except CacheMissError:
+        # Replay mode must fail the run, not record a failed stage output
+        raise
     except Exception as e:
         execution_time = time.time() - start_time
         user_error = _get_user_friendly_error(e, agent_name)
@@ -286,6 +371,7 @@ def run_parallel_agents(
     context: dict[str, Any],
     session_manager: Any = None,
     use_context_tools: bool = False,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Execute multiple agents in parallel.
 
@@ -294,6 +380,7 @@ def run_parallel_agents(
         context: Shared context for all agents
         session_manager: Optional SessionManager for file operations
         use_context_tools: If True, set up context store for context retrieval tools
+        use_cache: If False, bypass the response cache for these agents
 
     Returns:
         Dict mapping agent_name -> result
@@ -310,21 +397,30 @@ def run_parallel_agents(
             context=frozen_context,
             session_manager=session_manager,
             use_context_tools=use_context_tools,
+            use_cache=use_cache,
         )
 
     results = {}
 
     try:
-        # Use ThreadPoolExecutor for parallel execution
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        # One thread per agent; the LLM scheduler bounds how many reach the
+        # provider at once (see haytham.agents.utils.llm_scheduler)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, len(agent_configs))
+        ) as executor:
+            # Each thread runs in a copy of this context so the current
+            # stage stream (see stage_stream) reaches every agent
             futures = {
-                executor.submit(run_single, config): config["name"] for config in agent_configs
+                executor.submit(contextvars.copy_context().run, run_single, config): config["name"]
+                for config in agent_configs
             }
 
             for future in concurrent.futures.as_completed(futures):
                 agent_name = futures[future]
                 try:
                     results[agent_name] = future.result()
+                except CacheMissError:
+                    raise
                 except Exception as e:
                     user_error = _get_user_friendly_error(e, agent_name)
                     is_token_error = _is_token_limit_error(e)
@@ -344,6 +440,8 @@ def run_parallel_agents(
                         "original_error": str(e),
                     }
 
+    except CacheMissError:
+        raise
     except Exception as e:
         logger.error(f"Parallel execution failed: {e}")
         # Fallback to sequential
@@ -354,6 +452,7 @@ def run_parallel_agents(
                 context=context,
                 session_manager=session_manager,
                 use_context_tools=use_context_tools,
+                use_cache=use_cache,
             )
 
     return results
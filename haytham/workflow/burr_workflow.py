@@ -22,6 +22,7 @@ from burr.core import State
 
 from haytham.agents.tools.metric_patterns import RE_RECOMMENDATION_PLAIN
 
+from .dag_executor import BLOCKED, SKIPPED, run_workflows
 from .stage_registry import WorkflowType, get_stage_registry
 from .workflow_factories import (
     WORKFLOW_TERMINAL_STAGES,
@@ -146,24 +147,8 @@ class BurrWorkflowRunner:
         self.on_stage_start = on_stage_start
         self.on_stage_complete = on_stage_complete
         self.on_feedback_request = on_feedback_request
-        self.app = None
         self._is_running = False
 
-    def create_workflow(self, system_goal: str) -> None:
-        """Create the workflow with the given system goal.
-
-        Delegates to :func:`workflow_factories.create_idea_validation_workflow`.
-
-        Args:
-            system_goal: The startup idea to validate
-        """
-        self.app = create_idea_validation_workflow(
-            system_goal=system_goal,
-            session_manager=self.session_manager,
-            on_stage_start=self.on_stage_start,
-            on_stage_complete=self.on_stage_complete,
-        )
-
     def run(
         self,
         system_goal: str,
@@ -199,21 +184,36 @@ class BurrWorkflowRunner:
             session_id=session_id,
         ) as span:
             try:
-                # Create workflow
-                self.create_workflow(system_goal)
-
                 logger.info("=" * 60)
                 logger.info("BURR WORKFLOW EXECUTION STARTED")
                 logger.info(f"System goal provided (length={len(system_goal)})")
                 logger.info(f"Session ID: {session_id}")
                 logger.info("=" * 60)
 
-                # Run workflow to completion
-                final_action, final_result, final_state = self.app.run(
-                    halt_after=[terminal],
-                    inputs={},
+                # Run workflow to completion (WORKFLOW_EXECUTION_MODE picks
+                # linear or DAG execution)
+                run = run_workflows(
+                    [WorkflowType.IDEA_VALIDATION],
+                    self.session_manager,
+                    system_goal=system_goal,
+                    enable_tracking=True,
+                    on_stage_start=self.on_stage_start,
+                    on_stage_complete=self.on_stage_complete,
+                )
+                stage_names = IDEA_VALIDATION_SPEC.stages
+                if all(run.statuses.get(stage) == BLOCKED for stage in stage_names):
+                    # Entry conditions not met
+                    raise ValueError(run.errors.get(stage_names[0], "Workflow blocked"))
+
+                final_state = run.state
+                final_stage = next(
+                    (
+                        s
+                        for s in reversed(stage_names)
+                        if run.statuses.get(s) not in (None, SKIPPED)
+                    ),
+                    terminal,
                 )
-
                 execution_time = time.time() - start_time
 
                 # Extract results from state
@@ -222,13 +222,12 @@ class BurrWorkflowRunner:
                 # Record workflow metrics in span
                 if hasattr(span, "set_attribute"):
                     span.set_attribute("workflow.duration_seconds", execution_time)
-                    span.set_attribute("workflow.final_stage", final_action.name)
+                    span.set_attribute("workflow.final_stage", final_stage)
                     risk_level = final_state.get("risk_level", "UNKNOWN")
                     span.set_attribute("workflow.risk_level", risk_level)
 
                 # Check for failures and identify which stage failed
                 registry = get_stage_registry()
-                stage_names = IDEA_VALIDATION_SPEC.stages
                 failed_stage = None
                 stage_error = None
 
@@ -255,7 +254,7 @@ class BurrWorkflowRunner:
 
                     return WorkflowResult(
                         status="FAILED",
-                        current_stage=final_action.name,
+                        current_stage=final_stage,
                         results=results,
                         error=error_msg,
                         failed_stage=failed_stage_display,
@@ -278,7 +277,7 @@ class BurrWorkflowRunner:
 
                 return WorkflowResult(
                     status="COMPLETED",
-                    current_stage=final_action.name,
+                    current_stage=final_stage,
                     results=results,
                     execution_time=execution_time,
                     recommendation=recommendation,
@@ -5,18 +5,35 @@ for downstream agents. Extracted from burr_actions.py (ADR-024).
 
 Key functions:
     build_context_summary    -- Main entry point, builds context from stage outputs.
+    build_context_sections   -- The same context as separate sections.
+    pack_context_sections    -- Fits prioritized sections into a token budget.
     render_validation_summary_from_json -- Public, used by mvp_scope_swarm and mvp_specification.
 """
 
 import json
 import logging
 import re
+from dataclasses import dataclass, replace
 from typing import Any
 
+from haytham.agents.utils.tokenizer import Tokenizer, get_tokenizer
 from haytham.workflow.stage_registry import get_stage_registry
 
 logger = logging.getLogger(__name__)
 
+# Token budget for the context summary, by agent model tier (ModelTier value)
+CONTEXT_TOKEN_BUDGETS: dict[str, int] = {
+    "light": 4000,
+    "heavy": 8000,
+    "reasoning": 12000,
+}
+
+# A section cut down to fit is dropped instead if fewer tokens than this remain
+_MIN_SECTION_TOKENS = 40
+
+_SECTION_SEPARATOR = "\n\n"
+_TRUNCATION_MARKER = "..."
+
 # Compiled regex for TL;DR extraction (ADR-022)
 _TLDR_PATTERN = re.compile(r"##\s*TL;?DR\s*\n(.*?)(?=\n##|\Z)", re.IGNORECASE | re.DOTALL)
 
@@ -168,8 +185,105 @@ def _try_render_json_context(key: str, content: str) -> str | None:
         return None
 
 
-def build_context_summary(context: dict[str, Any], max_chars: int = 200) -> str:
-    """Build a concise context summary from previous stage outputs.
+@dataclass
+class ContextSection:
+    """One block of a context summary.
+
+    Attributes:
+        text: Rendered block.
+        priority: Sections with lower values are packed first.
+        required: Always included in full; the budget covers the rest.
+    """
+
+    text: str
+    priority: int = 0
+    required: bool = False
+
+
+def fit_context_sections(
+    sections: list[ContextSection],
+    token_budget: int,
+    tokenizer: Tokenizer | None = None,
+) -> list[ContextSection]:
+    """Select and cut sections so that, joined, they fit a token budget.
+
+    Required sections are always kept. The others are packed by priority:
+    each is kept whole if it fits, cut down to the remaining budget if at
+    least ``_MIN_SECTION_TOKENS`` remain, and dropped otherwise.
+
+    Args:
+        sections: Sections in display order.
+        token_budget: Maximum tokens for the joined text.
+        tokenizer: Tokenizer to measure with (default: active provider's).
+
+    Returns:
+        Kept sections in display order; over budget only if the required
+        sections alone are.
+    """
+    tokenizer = tokenizer or get_tokenizer()
+    separator_tokens = tokenizer.count(_SECTION_SEPARATOR)
+
+    kept: dict[int, ContextSection] = {}
+    remaining = token_budget
+    for index, section in enumerate(sections):
+        if section.required:
+            kept[index] = section
+            remaining -= tokenizer.count(section.text) + separator_tokens
+
+    optional = sorted(
+        (index for index, section in enumerate(sections) if not section.required),
+        key=lambda index: (sections[index].priority, index),
+    )
+    for index in optional:
+        section = sections[index]
+        available = remaining - separator_tokens
+        cost = tokenizer.count(section.text)
+        if cost <= available:
+            kept[index] = section
+            remaining -= cost + separator_tokens
+        elif available >= _MIN_SECTION_TOKENS:
+            marker_tokens = tokenizer.count(_TRUNCATION_MARKER)
+            text = tokenizer.truncate(section.text, available - marker_tokens).rstrip()
+            kept[index] = replace(section, text=text + _TRUNCATION_MARKER)
+            remaining = 0
+
+    def join() -> str:
+        return _SECTION_SEPARATOR.join(kept[index].text for index in sorted(kept))
+
+    # Counts of the parts can differ slightly from the count of the whole
+    while tokenizer.count(join()) > token_budget:
+        droppable = [index for index in optional if index in kept]
+        if not droppable:
+            logger.warning(f"Required context sections exceed the {token_budget}-token budget")
+            break
+        del kept[droppable[-1]]
+
+    dropped = len(sections) - len(kept)
+    if dropped:
+        logger.info(f"Context packed to {token_budget} tokens: dropped {dropped} section(s)")
+    return [kept[index] for index in sorted(kept)]
+
+
+def pack_context_sections(
+    sections: list[ContextSection],
+    token_budget: int,
+    tokenizer: Tokenizer | None = None,
+) -> str:
+    """Join sections in their original order, fitted to a token budget.
+
+    See ``fit_context_sections`` for how sections are selected.
+    """
+    kept = fit_context_sections(sections, token_budget, tokenizer)
+    return _SECTION_SEPARATOR.join(section.text for section in kept)
+
+
+def build_context_sections(
+    context: dict[str, Any],
+    max_chars: int = 200,
+    token_budget: int | None = None,
+    tokenizer: Tokenizer | None = None,
+) -> list[ContextSection]:
+    """Build the sections of a context summary from previous stage outputs.
 
     ADR-022: Uses TL;DR sections when available, falls back to first-line
     truncation for backward compatibility. Always includes concept anchor.
@@ -177,25 +291,35 @@ def build_context_summary(context: dict[str, Any], max_chars: int = 200) -> str:
     When stage output is JSON (from output_model split), uses stage-specific
     renderers to extract the most useful fields for downstream agents.
 
+    With a token budget, stage sections are packed into it latest stage
+    first (later stages build on the earlier ones); the system goal and
+    concept anchor are never cut.
+
     Args:
         context: Dict with previous stage outputs
         max_chars: Maximum characters per context item (for fallback)
+        token_budget: Maximum tokens for the summary (None = unbounded)
+        tokenizer: Tokenizer for the budget (default: active provider's)
 
     Returns:
-        Concise summary string
+        Sections in display order: system goal and concept anchor (required),
+        then stage outputs in registry order
     """
-    summaries = []
+    sections: list[ContextSection] = []
 
     # System goal - ALWAYS include FULL text (this is the source of truth)
     # Never truncate the original idea - it contains critical user constraints
     if context.get("system_goal"):
-        summaries.append(
-            f"**ORIGINAL IDEA (Source of Truth - read carefully for explicit constraints):**\n{context['system_goal']}"
+        sections.append(
+            ContextSection(
+                f"**ORIGINAL IDEA (Source of Truth - read carefully for explicit constraints):**\n{context['system_goal']}",
+                required=True,
+            )
         )
 
     # ADR-022: Include concept anchor if available (non-truncatable)
     if context.get("concept_anchor"):
-        summaries.append(f"\n{context['concept_anchor']}")
+        sections.append(ContextSection(f"\n{context['concept_anchor']}", required=True))
 
     # Stage outputs - prefer JSON rendering, then TL;DR, then first paragraph
     # Derived from the registry so new stages are picked up automatically.
@@ -204,25 +328,52 @@ def build_context_summary(context: dict[str, Any], max_chars: int = 200) -> str:
         (s.state_key, s.display_name) for s in registry.all_stages(include_optional=False)
     ]
 
-    for key, label in stage_keys:
+    for position, (key, label) in enumerate(stage_keys):
         content = context.get(key)
         if not content:
             continue
+        # Later stages pack first
+        priority = len(stage_keys) - position
 
         # Try JSON rendering first (for stages with output_model)
         json_rendered = _try_render_json_context(key, content)
         if json_rendered:
-            summaries.append(f"**{label}:**\n{json_rendered}")
+            sections.append(ContextSection(f"**{label}:**\n{json_rendered}", priority))
             continue
 
         # Try TL;DR next (ADR-022)
         tldr = _extract_tldr(content)
         if tldr:
-            summaries.append(f"**{label} (TL;DR):**\n{tldr}")
+            sections.append(ContextSection(f"**{label} (TL;DR):**\n{tldr}", priority))
         else:
             # Fallback to first paragraph
             preview = _extract_first_paragraph(content, max_chars)
             if preview:
-                summaries.append(f"**{label}:** {preview}")
+                sections.append(ContextSection(f"**{label}:** {preview}", priority))
+
+    if token_budget is None:
+        return sections
+    return fit_context_sections(sections, token_budget, tokenizer)
+
+
+def build_context_summary(
+    context: dict[str, Any],
+    max_chars: int = 200,
+    token_budget: int | None = None,
+    tokenizer: Tokenizer | None = None,
+) -> str:
+    """Build a concise context summary from previous stage outputs.
 
-    return "\n\n".join(summaries)
+    Joins the sections from ``build_context_sections``.
+
+    Args:
+        context: Dict with previous stage outputs
+        max_chars: Maximum characters per context item (for fallback)
+        token_budget: Maximum tokens for the summary (None = unbounded)
+        tokenizer: Tokenizer for the budget (default: active provider's)
+
+    Returns:
+        Concise summary string
+    """
+    sections = build_context_sections(context, max_chars, token_budget, tokenizer)
+    return _SECTION_SEPARATOR.join(section.text for section in sections)
@@ -0,0 +1,447 @@
+"""Dependency-aware (DAG) execution of workflow stages.
+
+The Burr specs in ``workflow_specs`` chain every stage linearly, and each
+workflow runs as its own Burr Application. This module runs one or more
+workflows as a single dependency graph instead, starting every stage whose
+inputs are ready so independent stages overlap -- e.g. ``system_traits``
+alongside ``build_buy_analysis`` -> ``architecture_decisions`` in a full run.
+
+A stage depends on the stages in the run that it declares through
+``StageMetadata.required_context`` or reads from state in its Burr action
+(``validation_summary`` reads ``pivot_strategy``). Stages outside the run
+are loaded from the session as context, like ``WorkflowSpec.context_stages``.
+
+Conditional edges come from the specs: a stage whose incoming transitions all
+carry a condition (``risk_assessment -> pivot_strategy`` when
+``risk_level="HIGH"``) runs only if a condition holds once its source has
+finished; otherwise it is skipped and its dependents proceed without it.
+
+Each workflow's entry validator runs when its first stage becomes ready, so
+phase gates (e.g. NO-GO blocking MVP specification) still apply. Stages that
+fail, or whose workflow is blocked, block their dependents.
+
+Modes (``WORKFLOW_EXECUTION_MODE`` env var, used by ``run_workflows``):
+    linear -- Run each workflow's Burr Application in turn (default).
+    dag    -- Run all stages through ``run_stage_dag``.
+"""
+
+import contextvars
+import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from burr.core import State
+from burr.core.action import Condition
+
+from haytham.workflow.entry_validators import validate_workflow_entry
+from haytham.workflow.stage_registry import WorkflowType, get_stage_registry
+from haytham.workflow.stage_stream import StageStream, StreamUpdate, activate_stage_stream
+from haytham.workflow.workflow_builder import build_initial_state
+from haytham.workflow.workflow_specs import WORKFLOW_SPECS, WorkflowSpec
+
+if TYPE_CHECKING:
+    from haytham.session.session_manager import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionMode(Enum):
+    """How ``run_workflows`` executes stages."""
+
+    LINEAR = "linear"
+    DAG = "dag"
+
+
+def get_execution_mode() -> ExecutionMode:
+    """Return the execution mode from ``WORKFLOW_EXECUTION_MODE`` (default linear).
+
+    Raises:
+        ValueError: If the env var value is not a recognised mode.
+    """
+    raw = os.getenv("WORKFLOW_EXECUTION_MODE", "linear").strip().lower()
+    try:
+        return ExecutionMode(raw)
+    except ValueError:
+        valid = ", ".join(m.value for m in ExecutionMode)
+        raise ValueError(
+            f"Unknown WORKFLOW_EXECUTION_MODE '{raw}'. Valid options: {valid}"
+        ) from None
+
+
+# =============================================================================
+# Graph
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class StageNode:
+    """One stage in the execution graph.
+
+    Attributes:
+        name: Burr action name (also the state key of its output).
+        workflow_type: Workflow the stage belongs to.
+        action: Burr action callable.
+        depends_on: Action names that must finish (or be skipped) first.
+        gates: Conditional incoming edges as (source, condition). When
+            non-empty the stage runs only if one condition holds.
+    """
+
+    name: str
+    workflow_type: WorkflowType
+    action: Callable
+    depends_on: tuple[str, ...]
+    gates: tuple[tuple[str, Condition], ...] = ()
+
+
+def _action_reads(action: Callable) -> list[str]:
+    action_function = getattr(action, "action_function", None)
+    return list(getattr(action_function, "reads", []))
+
+
+def build_stage_dag(specs: list[WorkflowSpec]) -> dict[str, StageNode]:
+    """Derive the stage dependency graph for the given workflow specs.
+
+    Args:
+        specs: Workflow specs; their order breaks ties between ready stages.
+
+    Returns:
+        Nodes keyed by action name, in spec stage order.
+
+    Raises:
+        ValueError: If the dependencies contain a cycle.
+    """
+    registry = get_stage_registry()
+    in_run = {stage: spec for spec in specs for stage in spec.stages}
+
+    nodes: dict[str, StageNode] = {}
+    for spec in specs:
+        incoming: dict[str, list[tuple[str, Condition]]] = {}
+        for transition in spec.transitions:
+            source, target = transition[0], transition[1]
+            condition = transition[2] if len(transition) > 2 else None
+            incoming.setdefault(target, []).append((source, condition))
+
+        for stage in spec.stages:
+            meta = registry.get_by_action(stage)
+            deps = [registry.get_by_slug(slug).action_name for slug in meta.required_context]
+            deps += _action_reads(spec.actions[stage])
+            depends_on = tuple(dict.fromkeys(d for d in deps if d in in_run and d != stage))
+
+            edges = incoming.get(stage, [])
+            gated = bool(edges) and all(
+                condition is not None and condition.name != "default" for _, condition in edges
+            )
+            gates = tuple(edges) if gated else ()
+            for source, _ in gates:
+                if source not in depends_on:
+                    depends_on += (source,)
+
+            nodes[stage] = StageNode(
+                name=stage,
+                workflow_type=spec.workflow_type,
+                action=spec.actions[stage],
+                depends_on=depends_on,
+                gates=gates,
+            )
+
+    _check_acyclic(nodes)
+    return nodes
+
+
+def _check_acyclic(nodes: dict[str, StageNode]) -> None:
+    remaining = {name: set(node.depends_on) for name, node in nodes.items()}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Stage dependencies contain a cycle: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+# =============================================================================
+# Execution
+# =============================================================================
+
+# Terminal stage states in DagRunResult.statuses besides the stage's own
+# status ("completed", "failed", "partial", ...)
+SKIPPED = "skipped"
+BLOCKED = "blocked"
+
+_OK_STATUSES = {"completed", SKIPPED}
+
+
+@dataclass
+class DagRunResult:
+    """Outcome of ``run_stage_dag``.
+
+    Attributes:
+        state: Final merged state.
+        statuses: Action name -> final status (stage status, "skipped"
+            or "blocked").
+        errors: Action name -> error message for failed or blocked stages.
+        execution_time: Wall-clock seconds.
+    """
+
+    state: State
+    statuses: dict[str, str]
+    errors: dict[str, str] = field(default_factory=dict)
+    execution_time: float = 0.0
+
+    @property
+    def completed(self) -> bool:
+        return all(status in _OK_STATUSES for status in self.statuses.values())
+
+
+def _state_delta(before: State, after: State) -> dict[str, Any]:
+    """Keys an action added or replaced, for merging concurrent results."""
+    old = before.get_all()
+    return {
+        key: value
+        for key, value in after.get_all().items()
+        if key not in old or old[key] is not value
+    }
+
+
+def run_stage_dag(
+    workflow_types: list[WorkflowType],
+    session_manager: "SessionManager",
+    system_goal: str | None = None,
+    max_workers: int | None = None,
+    on_stage_start: Callable[[str, int, int], None] | None = None,
+    on_stage_complete: Callable[[str, int, int, dict], None] | None = None,
+    on_stage_stream: Callable[[StreamUpdate], None] | None = None,
+    force_override: bool = False,
+    **extra_state: Any,
+) -> DagRunResult:
+    """Run the stages of one or more workflows as a dependency graph.
+
+    Progress callbacks have the same signatures as ``WorkflowProgressHook``.
+    ``on_stage_start`` and ``on_stage_complete`` are always invoked from the
+    calling thread; ``on_stage_stream`` from the stages' agent threads.
+
+    Args:
+        workflow_types: Workflows to run, in phase order.
+        session_manager: SessionManager for persistence.
+        system_goal: System goal (loaded from the session when omitted).
+        max_workers: Maximum stages running at once (default: all ready).
+        on_stage_start: Callback when a stage starts.
+        on_stage_complete: Callback when a stage completes.
+        on_stage_stream: Callback receiving throttled StreamUpdates with
+            agents' incremental output while a stage runs.
+        force_override: Force past overridable failed entry conditions.
+        **extra_state: Extra state values (e.g., archetype="").
+
+    Returns:
+        DagRunResult with final state and per-stage statuses.
+    """
+    start_time = time.time()
+    specs = [WORKFLOW_SPECS[wt] for wt in workflow_types]
+    nodes = build_stage_dag(specs)
+    order = list(nodes)
+    total = len(order)
+
+    if system_goal is None:
+        system_goal = session_manager.get_system_goal() or ""
+    state = State(build_initial_state(specs, session_manager, system_goal, extra_state))
+
+    statuses: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    entered: dict[WorkflowType, bool] = {}
+    running: dict[Future, tuple[str, State]] = {}
+    streams: dict[str, StageStream] = {}
+
+    logger.info("=" * 60)
+    logger.info(f"DAG RUN: {', '.join(wt.value for wt in workflow_types)} ({total} stages)")
+    logger.info("=" * 60)
+
+    def finish(name: str, status: str, error: str | None = None) -> None:
+        statuses[name] = status
+        if error:
+            errors[name] = error
+        if status in _OK_STATUSES:
+            _record_workflow_if_done(nodes[name].workflow_type)
+
+    def _record_workflow_if_done(workflow_type: WorkflowType) -> None:
+        members = [n for n in order if nodes[n].workflow_type is workflow_type]
+        if all(statuses.get(n) in _OK_STATUSES for n in members):
+            session_manager.run_tracker.record_workflow_complete(workflow_type.value)
+
+    def can_enter(workflow_type: WorkflowType) -> bool:
+        if workflow_type not in entered:
+            validation = validate_workflow_entry(
+                workflow_type, session_manager, force_override=force_override
+            )
+            entered[workflow_type] = validation.passed
+            if not validation.passed:
+                # Same message as build_workflow's ValueError in linear mode
+                error_msg = validation.message
+                if validation.can_override:
+                    error_msg = f"OVERRIDABLE: {validation.message}"
+                logger.error(f"Entry conditions not met for {workflow_type.value}: {error_msg}")
+                for n in order:
+                    if nodes[n].workflow_type is workflow_type and n not in statuses:
+                        finish(n, BLOCKED, error_msg)
+        return entered[workflow_type]
+
+    def schedule(executor: ThreadPoolExecutor) -> None:
+        nonlocal state
+        progressed = True
+        while progressed:
+            progressed = False
+            for name in order:
+                node = nodes[name]
+                if name in statuses or any(name == n for n, _ in running.values()):
+                    continue
+                if any(dep not in statuses for dep in node.depends_on):
+                    continue
+                if any(statuses[dep] not in _OK_STATUSES for dep in node.depends_on):
+                    blocker = next(d for d in node.depends_on if statuses[d] not in _OK_STATUSES)
+                    finish(name, BLOCKED, f"Upstream stage {blocker} did not complete")
+                    progressed = True
+                    continue
+                if node.gates and not any(
+                    statuses[source] == "completed" and condition.run(state)[Condition.KEY]
+                    for source, condition in node.gates
+                ):
+                    logger.info(f"Skipping {name}: no conditional edge taken")
+                    finish(name, SKIPPED)
+                    progressed = True
+                    continue
+                if not can_enter(node.workflow_type):
+                    progressed = True
+                    continue
+                if max_workers is not None and len(running) >= max_workers:
+                    return
+
+                index = order.index(name)
+                logger.info(f"Starting: {name} ({index + 1}/{total})")
+                if on_stage_start:
+                    try:
+                        on_stage_start(name, index, total)
+                    except (TypeError, AttributeError, ValueError) as e:
+                        logger.error(f"on_stage_start callback failed: {e}")
+                # Fresh copy of the caller's context per stage so context-scoped
+                # tool accumulators (scorecard, competitors) never leak between
+                # stages sharing a worker thread
+                context = contextvars.copy_context()
+                if on_stage_stream:
+                    streams[name] = StageStream(name, on_stage_stream)
+                    context.run(activate_stage_stream, streams[name])
+                future = executor.submit(context.run, node.action, state)
+                running[future] = (name, state)
+
+    with ThreadPoolExecutor(max_workers=max_workers or total or 1) as executor:
+        schedule(executor)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, snapshot = running.pop(future)
+                if name in streams:
+                    streams.pop(name).close()
+                status_key = f"{name}_status"
+                try:
+                    new_state = future.result()
+                except Exception as e:  # Intentional catch-all: stage boundary
+                    logger.error(f"Stage {name} raised: {e}", exc_info=True)
+                    state = state.update(**{status_key: "failed"})
+                    finish(name, "failed", str(e))
+                else:
+                    state = state.update(**_state_delta(snapshot, new_state))
+                    status = state.get(status_key, "unknown")
+                    error = None if status == "completed" else str(state.get(name, ""))[:500]
+                    finish(name, status, error)
+
+                index = order.index(name)
+                logger.info(f"Completed: {name} (status={statuses[name]})")
+                if on_stage_complete:
+                    try:
+                        on_stage_complete(
+                            name,
+                            index,
+                            total,
+                            {"status": statuses[name], "output": state.get(name, "")},
+                        )
+                    except (TypeError, AttributeError, ValueError) as e:
+                        logger.error(f"on_stage_complete callback failed: {e}")
+            schedule(executor)
+
+    execution_time = time.time() - start_time
+    logger.info(f"DAG run finished in {execution_time:.1f}s: {statuses}")
+    return DagRunResult(
+        state=state, statuses=statuses, errors=errors, execution_time=execution_time
+    )
+
+
+def run_workflows(
+    workflow_types: list[WorkflowType],
+    session_manager: "SessionManager",
+    system_goal: str | None = None,
+    mode: ExecutionMode | None = None,
+    enable_tracking: bool = False,
+    **kwargs: Any,
+) -> DagRunResult:
+    """Run several workflows back to back in the configured execution mode.
+
+    Linear mode builds and runs each workflow's Burr Application to its
+    terminal stage, stopping at the first workflow that fails or whose entry
+    conditions are not met. DAG mode hands everything to ``run_stage_dag``.
+
+    Args:
+        workflow_types: Workflows to run, in phase order.
+        session_manager: SessionManager for persistence.
+        system_goal: System goal (required when running Idea Validation).
+        mode: Execution mode (default: ``WORKFLOW_EXECUTION_MODE``).
+        enable_tracking: Record linear runs in the Burr tracking UI under
+            each spec's ``tracking_project`` (DAG runs have no Burr
+            Application to track).
+        **kwargs: Passed to ``run_stage_dag`` or ``build_workflow``.
+
+    Returns:
+        DagRunResult (linear runs report per-stage statuses the same way).
+    """
+    mode = mode or get_execution_mode()
+    if mode is ExecutionMode.DAG:
+        return run_stage_dag(workflow_types, session_manager, system_goal=system_goal, **kwargs)
+
+    from haytham.workflow.workflow_factories import create_workflow_for_type, get_terminal_stage
+
+    start_time = time.time()
+    statuses: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    state = State({})
+    for workflow_type in workflow_types:
+        spec = WORKFLOW_SPECS[workflow_type]
+        try:
+            app = create_workflow_for_type(
+                workflow_type,
+                session_manager,
+                system_goal=system_goal,
+                enable_tracking=enable_tracking,
+                **kwargs,
+            )
+        except ValueError as e:
+            for stage in spec.stages:
+                statuses[stage] = BLOCKED
+                errors[stage] = str(e)
+            break
+
+        _, _, state = app.run(halt_after=[get_terminal_stage(workflow_type)])
+        for stage in spec.stages:
+            status = state.get(f"{stage}_status", "pending")
+            statuses[stage] = SKIPPED if status == "pending" else status
+            if status not in ("completed", "pending"):
+                errors[stage] = str(state.get(stage, ""))[:500]
+        if any(statuses[stage] not in _OK_STATUSES for stage in spec.stages):
+            break
+        session_manager.run_tracker.record_workflow_complete(workflow_type.value)
+
+    return DagRunResult(
+        state=state, statuses=statuses, errors=errors, execution_time=time.time() - start_time
+    )
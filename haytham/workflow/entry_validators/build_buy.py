@@ -70,14 +70,14 @@ class BuildBuyAnalysisEntryValidator(WorkflowEntryValidator):
     def _check_functional_capabilities(self) -> int:
         """Check that at least 1 functional capability exists."""
         try:
-            from haytham.state.vector_db import SystemStateDB
+            from haytham.state.vector_db import get_state_db
 
             db_path = self.session_manager.session_dir / "vector_db"
             if not db_path.exists():
                 self.errors.append("VectorDB directory not found")
                 return 0
 
-            db = SystemStateDB(str(db_path))
+            db = get_state_db(str(db_path))
             capabilities = db.get_capabilities()
 
             # Filter for functional capabilities
@@ -0,0 +1,140 @@
+"""Prompt layout for provider-side prompt-prefix caching.
+
+Bedrock and Anthropic cache the input tokens of a request up to a cache
+checkpoint and reuse them when a later request starts with the same prefix.
+``run_agent`` historically sent the stage query first and the context summary
+after it, so the large shared part of the prompt (system goal, concept
+anchor, upstream stage outputs) sat behind text that differs per stage and
+could never be served from the cache.
+
+``PROMPT_LAYOUT`` selects how ``assemble_prompt`` orders the prompt:
+
+- ``query_first`` (default): the query, then the context summary. Same text
+  as before, so existing response-cache entries stay valid.
+- ``context_first``: stable blocks first, most stable first, then the query:
+
+  1. system goal and concept anchor (identical for every stage of a session)
+  2. upstream stage outputs, in stage registry order (a later stage's
+     context extends an earlier stage's, instead of reordering it)
+  3. the stage query
+
+  On Bedrock a single ``cachePoint`` block sits between the context and the
+  query once the context is long enough to be cached
+  (``_MIN_CACHEABLE_TOKENS``). The model's ``auto`` cache strategy honours
+  the first checkpoint placed in the last user message and removes any
+  others, so one is all a prompt can carry. On later tool-loop turns the
+  strategy strips it and checkpoints the end of the conversation instead,
+  which covers the whole prompt. Other providers get the same ordering
+  without checkpoints; OpenAI caches matching prefixes automatically.
+
+The provider's cache key also covers the tools and system prompt, so a
+prefix is reused by the same agent: across its retries, feedback revisions
+and re-runs of a session. Cache hits per stage are reported by
+:mod:`haytham.agents.utils.prompt_cache`.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from haytham.agents.utils.tokenizer import Tokenizer, get_tokenizer
+
+if TYPE_CHECKING:
+    from .context_builder import ContextSection
+
+logger = logging.getLogger(__name__)
+
+QUERY_FIRST = "query_first"
+CONTEXT_FIRST = "context_first"
+PROMPT_LAYOUTS = (QUERY_FIRST, CONTEXT_FIRST)
+
+CONTEXT_HEADER = "## Context from Previous Stages:"
+TASK_HEADER = "## Your Task:"
+
+# Claude ignores checkpoints on shorter prefixes (Haiku needs 2048)
+_MIN_CACHEABLE_TOKENS = 1024
+
+_CACHE_POINT_PROVIDERS = {"bedrock"}
+
+
+@dataclass(frozen=True)
+class AssembledPrompt:
+    """A prompt ready to send to an agent.
+
+    Attributes:
+        text: Flat prompt text (response cache key, logging, length checks).
+        content: What the agent is invoked with: ``text`` itself, or a list
+            of Converse content blocks with cache checkpoints.
+        cache_points: Number of cache checkpoints in ``content`` (0 or 1).
+    """
+
+    text: str
+    content: str | list[dict[str, Any]]
+    cache_points: int = 0
+
+
+def get_prompt_layout() -> str:
+    """Prompt layout from ``PROMPT_LAYOUT`` (default ``query_first``)."""
+    layout = os.getenv("PROMPT_LAYOUT", QUERY_FIRST).strip().lower()
+    if layout not in PROMPT_LAYOUTS:
+        logger.warning("Invalid PROMPT_LAYOUT '%s', using %s", layout, QUERY_FIRST)
+        return QUERY_FIRST
+    return layout
+
+
+def supports_cache_points(provider: str | None = None) -> bool:
+    """Whether *provider* (default: ``LLM_PROVIDER``) accepts ``cachePoint`` blocks."""
+    provider = (provider or os.getenv("LLM_PROVIDER", "bedrock")).strip().lower()
+    return provider in _CACHE_POINT_PROVIDERS
+
+
+def assemble_prompt(
+    query: str,
+    sections: list["ContextSection"],
+    layout: str | None = None,
+    provider: str | None = None,
+    tokenizer: Tokenizer | None = None,
+) -> AssembledPrompt:
+    """Assemble an agent prompt from its query and context sections.
+
+    Args:
+        query: Stage query for the agent.
+        sections: Context sections in display order (see
+            ``context_builder.build_context_sections``).
+        layout: ``query_first`` or ``context_first`` (default: ``PROMPT_LAYOUT``).
+        provider: ``LLMProvider`` value (default: ``LLM_PROVIDER``).
+        tokenizer: Tokenizer for the cacheable-length check.
+
+    Returns:
+        The assembled prompt.
+    """
+    layout = layout or get_prompt_layout()
+    if layout != CONTEXT_FIRST or not sections:
+        text = query
+        if sections:
+            context = "\n\n".join(section.text for section in sections)
+            text += f"\n\n{CONTEXT_HEADER}\n{context}"
+        return AssembledPrompt(text=text, content=text)
+
+    stable = "\n\n".join(section.text for section in sections if section.required)
+    stages = "\n\n".join(section.text for section in sections if not section.required)
+    context_blocks = [block for block in (stable, stages) if block]
+    context_blocks[0] = f"{CONTEXT_HEADER}\n{context_blocks[0]}"
+    blocks = [*context_blocks, f"{TASK_HEADER}\n{query}"]
+    text = "\n\n".join(blocks)
+
+    if not supports_cache_points(provider):
+        return AssembledPrompt(text=text, content=text)
+
+    tokenizer = tokenizer or get_tokenizer(provider)
+    context = "\n\n".join(context_blocks)
+    if tokenizer.count(context) < _MIN_CACHEABLE_TOKENS:
+        return AssembledPrompt(text=text, content=text)
+
+    content: list[dict[str, Any]] = [
+        {"text": context},
+        {"cachePoint": {"type": "default"}},
+        {"text": blocks[-1]},
+    ]
+    return AssembledPrompt(text=text, content=content, cache_points=1)
@@ -0,0 +1,409 @@
+"""Content-addressed cache for agent responses.
+
+``run_agent`` consults this cache before invoking an LLM. Entries are keyed
+by a SHA-256 of everything that determines the response: agent name, system
+prompt, provider, model ID, agent settings (max tokens, tier, tool profile,
+structured output model), output format and the fully rendered query
+(including the context summary). Identical re-runs -- after a gate rejection
+or ``make resume`` -- are served from disk instead of paying model latency.
+
+Modes (``LLM_CACHE_MODE`` env var):
+    off        -- Never read or write the cache (default).
+    read_write -- Serve hits from disk, store completed responses on miss.
+    replay     -- Serve hits only; a miss raises ``CacheMissError`` so CI can
+                  replay whole workflows without any provider configured.
+
+Other settings:
+    LLM_CACHE_DIR          -- Cache directory (default ``.cache/llm_responses``)
+    LLM_CACHE_TTL_SECONDS  -- Entry lifetime; 0 disables expiry (default 7 days)
+    LLM_CACHE_MAX_ENTRIES  -- Oldest entries are evicted beyond this (default 2000).
+                              Eviction runs once the cache is 10% over, so the
+                              directory is not scanned on every write.
+
+Some tool profiles accumulate structured data server-side while the agent
+runs (Stage-Gate scorecard, competitor recording). For those, the
+accumulator state is captured alongside the response and restored on a hit
+so downstream ``build_scorer_output()`` / ``get_competitor_data()`` calls
+see the same data as the original run.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key composition or entry format changes.
+_CACHE_FORMAT_VERSION = 1
+
+_DEFAULT_CACHE_DIR = ".cache/llm_responses"
+_DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+_DEFAULT_MAX_ENTRIES = 2000
+
+# Entries allowed beyond max_entries between eviction scans, as a fraction
+_EVICT_SLACK = 0.1
+
+
+class CacheMode(Enum):
+    """Response cache operating modes."""
+
+    OFF = "off"
+    READ_WRITE = "read_write"
+    REPLAY = "replay"
+
+
+class CacheMissError(Exception):
+    """Raised in replay mode when no cached response exists for a request."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    """Resolved response cache configuration."""
+
+    mode: CacheMode
+    cache_dir: Path
+    ttl_seconds: int
+    max_entries: int
+
+    @classmethod
+    def from_env(cls) -> "CacheSettings":
+        """Build settings from ``LLM_CACHE_*`` environment variables."""
+        raw_mode = os.getenv("LLM_CACHE_MODE", "off").strip().lower()
+        try:
+            mode = CacheMode(raw_mode)
+        except ValueError:
+            valid = ", ".join(m.value for m in CacheMode)
+            raise ValueError(
+                f"Unknown LLM_CACHE_MODE '{raw_mode}'. Valid options: {valid}"
+            ) from None
+
+        return cls(
+            mode=mode,
+            cache_dir=Path(os.getenv("LLM_CACHE_DIR", _DEFAULT_CACHE_DIR)),
+            ttl_seconds=_safe_int_env("LLM_CACHE_TTL_SECONDS", _DEFAULT_TTL_SECONDS),
+            max_entries=_safe_int_env("LLM_CACHE_MAX_ENTRIES", _DEFAULT_MAX_ENTRIES),
+        )
+
+
+def _safe_int_env(name: str, default: int) -> int:
+    """Read an integer env var, falling back to *default* on bad values."""
+    raw = os.getenv(name, "")
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid integer for %s=%r, using default %d", name, raw, default)
+        return default
+
+
+# =============================================================================
+# Tool accumulator capture/restore
+# =============================================================================
+
+
+def _competitor_state_handlers() -> tuple[Callable[[], Any], Callable[[Any], None]]:
+    from haytham.agents.tools.competitor_recording import (
+        get_competitor_data,
+        restore_competitor_data,
+    )
+
+    return get_competitor_data, restore_competitor_data
+
+
+def _scorecard_state_handlers() -> tuple[Callable[[], Any], Callable[[Any], None]]:
+    from haytham.agents.tools.recommendation import get_scorecard, restore_scorecard
+
+    return get_scorecard, restore_scorecard
+
+
+# Keyed by ToolProfile value so this module doesn't import config at load time.
+_TOOL_STATE_HANDLERS: dict[str, Callable[[], tuple[Callable[[], Any], Callable[[Any], None]]]] = {
+    "competitor_research": _competitor_state_handlers,
+    "recommendation": _scorecard_state_handlers,
+}
+
+
+# =============================================================================
+# Cache key
+# =============================================================================
+
+
+def describe_agent(agent_name: str) -> dict[str, Any]:
+    """Return the agent settings that influence its response."""
+    # Lazy imports: workflow/ → agents/ would create circular dep at module level
+    from haytham.agents.utils.model_provider import get_active_provider, get_model_id_for_tier
+    from haytham.agents.utils.prompt_loader import load_agent_prompt
+    from haytham.config import AGENT_CONFIGS
+
+    config = AGENT_CONFIGS.get(agent_name)
+    if config is None:
+        raise ValueError(f"Unknown agent name: {agent_name}")
+
+    system_prompt = config.custom_system_prompt or load_agent_prompt(config.prompt_key)
+    structured = config.structured_output_model_path
+    if structured is None and config.structured_output_model is not None:
+        model = config.structured_output_model
+        structured = f"{model.__module__}:{model.__qualname__}"
+
+    return {
+        "agent_name": agent_name,
+        "provider": get_active_provider().value,
+        "model_id": get_model_id_for_tier(config.model_tier.value),
+        "model_tier": config.model_tier.value,
+        "max_tokens": config.max_tokens,
+        "tool_profile": config.tool_profile.value,
+        "structured_output_model": structured,
+        "system_prompt": system_prompt,
+    }
+
+
+def compute_cache_key(
+    agent_name: str,
+    full_query: str,
+    output_as_json: bool = False,
+    context: dict[str, Any] | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """Compute the content address for an agent invocation.
+
+    Args:
+        agent_name: Agent name as registered in ``AGENT_CONFIGS``.
+        full_query: The exact query passed to the agent.
+        output_as_json: Whether structured output is returned as JSON.
+        context: Context dict available through context retrieval tools.
+            Only needed when the context is not already rendered into
+            ``full_query``.
+
+    Returns:
+        Tuple of (hex digest, agent descriptor used to build it).
+    """
+    descriptor = describe_agent(agent_name)
+    payload = {
+        "version": _CACHE_FORMAT_VERSION,
+        **descriptor,
+        "output_as_json": output_as_json,
+        "query": full_query,
+    }
+    if context is not None:
+        payload["context"] = context
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest(), descriptor
+
+
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+
+class ResponseCache:
+    """On-disk store of agent responses addressed by content hash.
+
+    Each entry is a small JSON file under ``cache_dir/<key[:2]>/<key>.json``.
+    Writes go through a temp file + rename so concurrent readers never see a
+    partial entry.
+    """
+
+    def __init__(self, settings: CacheSettings):
+        self.settings = settings
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Entries on disk as of the last scan plus writes since; None = unknown
+        self._entry_count: int | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.mode is not CacheMode.OFF
+
+    @property
+    def replay_only(self) -> bool:
+        return self.settings.mode is CacheMode.REPLAY
+
+    def _path_for(self, key: str) -> Path:
+        return self.settings.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached entry for *key*, or ``None`` on miss/expiry."""
+        path = self._path_for(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self._record(hit=False)
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            self._record(hit=False)
+            return None
+
+        ttl = self.settings.ttl_seconds
+        if ttl > 0 and time.time() - entry.get("created_at", 0) > ttl:
+            path.unlink(missing_ok=True)
+            self._record(hit=False)
+            return None
+
+        self._record(hit=True)
+        return entry
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """Store *entry* under *key* and evict old entries if over capacity."""
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {**entry, "key": key, "created_at": time.time()}
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp, path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self._evict()
+
+    def clear(self) -> int:
+        """Delete all entries. Returns the number removed."""
+        removed = 0
+        for path in self.settings.cache_dir.glob("*/*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        with self._lock:
+            self._entry_count = None
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters for this process."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _evict(self) -> None:
+        """Drop the least recently written entries beyond ``max_entries``.
+
+        The cache directory is scanned on the first write and then only once
+        a running count of writes passes ``max_entries`` plus ``_EVICT_SLACK``.
+        Overwrites and other processes' writes make the count approximate;
+        each scan corrects it.
+        """
+        max_entries = self.settings.max_entries
+        if max_entries <= 0:
+            return
+        with self._lock:
+            if self._entry_count is not None:
+                self._entry_count += 1
+                if self._entry_count <= max_entries + int(max_entries * _EVICT_SLACK):
+                    return
+        entries = list(self.settings.cache_dir.glob("*/*.json"))
+        overflow = len(entries) - max_entries
+        with self._lock:
+            self._entry_count = min(len(entries), max_entries)
+        if overflow <= 0:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:overflow]:
+            path.unlink(missing_ok=True)
+        logger.info(f"Evicted {overflow} response cache entries")
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache, configured from the environment."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(CacheSettings.from_env())
+        return _cache
+
+
+def reset_response_cache() -> None:
+    """Drop the process-wide cache so settings are re-read (mainly for tests)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+# =============================================================================
+# run_agent integration
+# =============================================================================
+
+
+def lookup_response(
+    agent_name: str,
+    full_query: str,
+    output_as_json: bool = False,
+    context: dict[str, Any] | None = None,
+) -> tuple[str | None, str | None]:
+    """Look up a cached response for an agent invocation.
+
+    On a hit, any captured tool accumulator state is restored before
+    returning so post-run harvesting behaves as in the original run.
+
+    Returns:
+        Tuple of (cached output or None, cache key or None when disabled).
+
+    Raises:
+        CacheMissError: In replay mode when no entry exists.
+    """
+    cache = get_response_cache()
+    if not cache.enabled:
+        return None, None
+
+    key, descriptor = compute_cache_key(agent_name, full_query, output_as_json, context)
+    entry = cache.get(key)
+
+    if entry is None:
+        if cache.replay_only:
+            raise CacheMissError(
+                f"No cached response for {agent_name} (key {key[:12]}) in replay mode. "
+                "Record responses with LLM_CACHE_MODE=read_write first."
+            )
+        return None, key
+
+    handlers = _TOOL_STATE_HANDLERS.get(descriptor["tool_profile"])
+    if handlers and "tool_state" in entry:
+        _, restore = handlers()
+        restore(entry["tool_state"])
+
+    logger.info(f"Response cache hit for {agent_name} (key {key[:12]})")
+    return entry["output"], key
+
+
+def store_response(agent_name: str, key: str, output: str) -> None:
+    """Store a completed response, capturing tool accumulator state if any."""
+    cache = get_response_cache()
+    if not cache.enabled or cache.replay_only:
+        return
+
+    entry: dict[str, Any] = {"agent_name": agent_name, "output": output}
+
+    from haytham.config import AGENT_CONFIGS
+
+    config = AGENT_CONFIGS.get(agent_name)
+    handlers = _TOOL_STATE_HANDLERS.get(config.tool_profile.value) if config else None
+    if handlers:
+        capture, _ = handlers()
+        entry["tool_state"] = capture()
+
+    try:
+        cache.put(key, entry)
+    except OSError as e:
+        logger.warning(f"Failed to write response cache entry for {agent_name}: {e}")
@@ -21,12 +21,14 @@ from typing import Any
 from burr.core import State
 
 from haytham.agents.output_utils import extract_text_from_result
+from haytham.agents.utils.prompt_cache import track_prompt_cache
 
 from .agent_runner import (
     run_agent,
     run_parallel_agents,
     save_stage_output,
 )
+from .stage_fingerprint import compute_input_fingerprint, record_stage_inputs
 from .stage_registry import get_stage_registry
 
 logger = logging.getLogger(__name__)
@@ -87,6 +89,11 @@ class StageExecutionConfig:
     # consumption, but renders markdown via output_model.to_markdown() for disk save.
     output_model: type | None = None
 
+    # Opt out of the LLM response cache (see haytham.workflow.response_cache).
+    # Disable for stages whose output must be regenerated on every run even
+    # when the inputs are byte-identical.
+    use_response_cache: bool = True
+
 
 # =============================================================================
 # Stage Executor
@@ -102,7 +109,8 @@ class StageExecutor:
     3. Build context from previous stages
     4. Execute agent(s)
     5. Process output
-    6. Save results
+    6. Save results and record the input fingerprint (see
+       :mod:`haytham.workflow.stage_fingerprint`)
     7. Update state
     """
 
@@ -137,19 +145,23 @@ class StageExecutor:
         # 2. Execute within a stage span for observability
         start_time = time.time()
 
-        with stage_span(
-            stage_slug=self.stage.slug,
-            stage_name=self.stage.display_name,
-            workflow_type=self.stage.workflow_type.value,
-            agent_names=self.stage.agent_names,
-            execution_mode=self.stage.execution_mode,
-        ) as span:
+        with (
+            stage_span(
+                stage_slug=self.stage.slug,
+                stage_name=self.stage.display_name,
+                workflow_type=self.stage.workflow_type.value,
+                agent_names=self.stage.agent_names,
+                execution_mode=self.stage.execution_mode,
+            ) as span,
+            track_prompt_cache(self.stage.slug) as cache_stats,
+        ):
             # 3. Log execution start
             self._log_start()
 
             # 4. Get common inputs
             system_goal = state["system_goal"]
             session_manager = state.get("session_manager")
+            fingerprint = self.input_fingerprint(state)
 
             # 5. Build context
             context = self._build_context(state, system_goal)
@@ -171,6 +183,9 @@ class StageExecutor:
                 span.set_attribute("stage.duration_seconds", execution_time)
                 span.set_attribute("stage.status", status)
                 span.set_attribute("stage.output_length", len(output) if output else 0)
+                if cache_stats.invocations:
+                    span.set_attribute("stage.cache_hit_ratio", cache_stats.hit_ratio)
+                    span.set_attribute("stage.cache_read_tokens", cache_stats.cache_read_tokens)
 
             # 7. Post-process output if needed
             extra_state_updates = {}
@@ -225,6 +240,14 @@ class StageExecutor:
                 # Additional save operations (receive rendered markdown, not raw JSON)
                 if self.config.additional_save:
                     self.config.additional_save(session_manager, display_output)
+
+                # Lets a resumed run reuse this result while its inputs are unchanged
+                record_stage_inputs(
+                    session_manager,
+                    self.stage.slug,
+                    fingerprint,
+                    {self.stage.state_key: output, **extra_state_updates},
+                )
             else:
                 # Log why save was skipped - this helps diagnose file persistence issues
                 if not session_manager:
@@ -240,6 +263,8 @@ class StageExecutor:
                 f"Stage {self.stage.slug} completed in {execution_time:.2f}s "
                 f"(status={status}, output_length={len(output) if output else 0})"
             )
+            if cache_stats.invocations:
+                logger.info(f"Stage {self.stage.slug} {cache_stats.summary()}")
 
         # 9. Return updated state
         return state.update(
@@ -255,6 +280,19 @@ class StageExecutor:
         output = state.get(self.stage.state_key)
         return status == "completed" and bool(output)
 
+    def input_fingerprint(self, state: State) -> str:
+        """Fingerprint of this stage's inputs under *state*."""
+        if self.config.parallel_agents:
+            agent_names = [agent["name"] for agent in self.config.parallel_agents]
+        else:
+            agent_names = self.stage.agent_names
+        return compute_input_fingerprint(
+            self.stage,
+            state,
+            query_template=self.config.query_template,
+            agent_names=agent_names,
+        )
+
     def _log_start(self) -> None:
         """Log stage execution start."""
         logger.info("=" * 60)
@@ -317,6 +355,7 @@ class StageExecutor:
             session_manager,
             use_context_tools=self.config.use_context_tools,
             output_as_json=self.config.output_model is not None,
+            use_cache=self.config.use_response_cache,
         )
         return result["output"], result["status"]
 
@@ -332,6 +371,7 @@ class StageExecutor:
             context,
             session_manager,
             use_context_tools=self.config.use_context_tools,
+            use_cache=self.config.use_response_cache,
         )
 
         # Combine outputs
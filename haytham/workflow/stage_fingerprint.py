@@ -0,0 +1,282 @@
+"""Input fingerprints for incremental workflow re-execution.
+
+When a stage completes, ``StageExecutor`` records a fingerprint of its inputs
+next to the stage checkpoint (``<session>/<stage>/input_fingerprint.json``),
+together with the state values the stage wrote. On resume,
+``build_initial_state`` walks the workflow's stages in order and restores
+every stage whose current fingerprint matches its record, so its Burr action
+finds it completed and skips it. Stages downstream of a stage that re-runs
+see a different input and re-run too: make-style incremental rebuilds.
+
+The fingerprint covers:
+- the stage slug and query template
+- for each agent: provider, model ID, tier, settings and system prompt
+  (see :func:`haytham.workflow.response_cache.describe_agent`)
+- the system goal and concept anchor (for stages that don't produce it)
+- every state value the stage's Burr action reads, which includes the
+  outputs of its ``required_context`` stages
+
+A record is ignored once the stage's saved output differs from what was
+recorded (feedback revision, manual edit) or is gone (``make clear-from``),
+so that stage and everything that reads it run again.
+
+Pydantic models in the recorded state (the ``ConceptAnchor`` written by
+idea-analysis) are stored as JSON together with their class and rebuilt
+with ``model_validate`` on restore.
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from .stage_registry import StageMetadata, get_stage_registry
+
+if TYPE_CHECKING:
+    from haytham.session.session_manager import SessionManager
+    from haytham.workflow.workflow_specs import WorkflowSpec
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_FILE = "input_fingerprint.json"
+
+# Bump when the fingerprint composition or record format changes.
+_FINGERPRINT_VERSION = 2
+
+# State keys that never feed a stage's output
+_IGNORED_KEYS = {"session_manager", "current_stage", "concept_anchor"}
+
+
+def _to_json(value: Any) -> Any:
+    """``json.dumps`` default: Pydantic models as their JSON-mode dump."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _model_classes(state_updates: dict[str, Any]) -> dict[str, str]:
+    """``module:QualName`` of each Pydantic model value, keyed by state key."""
+    return {
+        key: f"{type(value).__module__}:{type(value).__qualname__}"
+        for key, value in state_updates.items()
+        if hasattr(value, "model_validate")
+    }
+
+
+def _restore_models(record: dict[str, Any]) -> dict[str, Any]:
+    """Recorded state with Pydantic model values rebuilt from their JSON.
+
+    Raises:
+        ValueError: If a model class cannot be resolved or rejects the data.
+    """
+    state = dict(record["state"])
+    for key, class_path in record.get("models", {}).items():
+        module_name, _, qualname = class_path.partition(":")
+        if not module_name.startswith("haytham."):
+            raise ValueError(f"Refusing to load model class {class_path}")
+        try:
+            model_class = getattr(importlib.import_module(module_name), qualname)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Unknown model class {class_path}") from e
+        # pydantic.ValidationError is a ValueError
+        state[key] = model_class.model_validate(state[key])
+    return state
+
+
+def _digest(payload: Any) -> str:
+    def default(value: Any) -> Any:
+        if hasattr(value, "model_dump"):
+            return value.model_dump(mode="json")
+        return str(value)
+
+    encoded = json.dumps(payload, sort_keys=True, default=default)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _action_io(stage: StageMetadata) -> tuple[list[str], list[str]]:
+    """State keys the stage's Burr action declares it reads and writes."""
+    from haytham.workflow.workflow_specs import WORKFLOW_SPECS
+
+    spec = WORKFLOW_SPECS.get(stage.workflow_type)
+    action = spec.actions.get(stage.action_name) if spec else None
+    action_function = getattr(action, "action_function", None)
+    return (
+        list(getattr(action_function, "reads", [])),
+        list(getattr(action_function, "writes", [])),
+    )
+
+
+def _describe_agents(agent_names: list[str]) -> list[dict[str, Any]]:
+    from haytham.agents.utils.prompt_loader import PromptLoadError
+    from haytham.workflow.response_cache import describe_agent
+
+    descriptors = []
+    for agent_name in agent_names:
+        try:
+            descriptor = describe_agent(agent_name)
+        except (ValueError, KeyError, OSError, PromptLoadError) as e:
+            logger.debug("Agent '%s' not described for fingerprint: %s", agent_name, e)
+            descriptor = {"agent_name": agent_name}
+        else:
+            prompt = descriptor.pop("system_prompt", "") or ""
+            descriptor["system_prompt_sha256"] = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        descriptors.append(descriptor)
+    return descriptors
+
+
+def compute_input_fingerprint(
+    stage: StageMetadata,
+    state: Mapping[str, Any],
+    query_template: str = "",
+    agent_names: list[str] | None = None,
+) -> str:
+    """Fingerprint everything a stage consumes.
+
+    Args:
+        stage: Stage metadata.
+        state: Burr state (or state dict) the stage would run with.
+        query_template: Query template the executor renders.
+        agent_names: Agents the stage invokes (defaults to ``stage.agent_names``).
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    reads, writes = _action_io(stage)
+    keys = set(reads) | {"system_goal", "concept_anchor_str"}
+    keys |= {
+        meta.state_key
+        for slug in stage.required_context
+        if (meta := get_stage_registry().get_by_slug_safe(slug)) is not None
+    }
+    # A stage's own outputs (the anchor, for idea-analysis) are not its inputs
+    keys -= _IGNORED_KEYS | set(writes) | {stage.state_key, stage.status_key}
+
+    payload = {
+        "version": _FINGERPRINT_VERSION,
+        "stage": stage.slug,
+        "query_template": query_template or stage.query_template,
+        "agents": _describe_agents(agent_names if agent_names is not None else stage.agent_names),
+        "inputs": {key: state.get(key) for key in sorted(keys)},
+    }
+    return _digest(payload)
+
+
+def output_digest(output: str | None) -> str:
+    """Digest of a stage's saved output, used to detect later edits."""
+    return hashlib.sha256((output or "").encode("utf-8")).hexdigest()
+
+
+def record_stage_inputs(
+    session_manager: "SessionManager",
+    stage_slug: str,
+    fingerprint: str,
+    state_updates: dict[str, Any],
+) -> bool:
+    """Record a completed stage's input fingerprint and the state it wrote.
+
+    Args:
+        session_manager: Session the stage saved its output to.
+        stage_slug: Stage slug.
+        fingerprint: Result of :func:`compute_input_fingerprint`.
+        state_updates: State values written by the stage.
+
+    Returns:
+        True if recorded; False if the state could not be serialized or
+        written (the stage then simply re-runs on resume).
+    """
+    try:
+        record = {
+            "version": _FINGERPRINT_VERSION,
+            "fingerprint": fingerprint,
+            "output_sha256": output_digest(session_manager.load_stage_output(stage_slug)),
+            "state": state_updates,
+            "models": _model_classes(state_updates),
+        }
+        text = json.dumps(record, indent=2, default=_to_json)
+        stage_dir = session_manager.session_dir / stage_slug
+        stage_dir.mkdir(parents=True, exist_ok=True)
+        (stage_dir / FINGERPRINT_FILE).write_text(text, encoding="utf-8")
+    except (TypeError, ValueError, OSError) as e:
+        logger.warning(f"Could not record input fingerprint for {stage_slug}: {e}")
+        return False
+    return True
+
+
+def load_stage_record(session_manager: "SessionManager", stage_slug: str) -> dict[str, Any] | None:
+    """Load a stage's fingerprint record if it is still valid.
+
+    Returns:
+        The record, or None if there is none, it is from another format
+        version, or the stage's saved output has changed since.
+    """
+    path = session_manager.session_dir / stage_slug / FINGERPRINT_FILE
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable fingerprint record for {stage_slug}: {e}")
+        return None
+
+    if record.get("version") != _FINGERPRINT_VERSION:
+        return None
+    if record.get("output_sha256") != output_digest(session_manager.load_stage_output(stage_slug)):
+        logger.info(f"Saved output of {stage_slug} changed since it ran - will re-run")
+        return None
+    return record
+
+
+def restore_unchanged_stages(
+    specs: list["WorkflowSpec"],
+    session_manager: "SessionManager",
+    state: dict[str, Any],
+) -> list[str]:
+    """Restore stages whose inputs are unchanged since they last completed.
+
+    Walks the specs' stages in order. A stage whose fingerprint under the
+    state built so far matches its record gets its recorded state applied
+    to *state* (status ``completed``), so later stages are fingerprinted
+    against the restored outputs.
+
+    Args:
+        specs: Workflow specs in execution order.
+        session_manager: Session holding the records.
+        state: Initial state dict; updated in place.
+
+    Returns:
+        Action names of the restored stages.
+    """
+    from .stage_executor import get_stage_executor
+
+    registry = get_stage_registry()
+    restored = []
+    for spec in specs:
+        for action_name in spec.stages:
+            stage = registry.get_by_action_safe(action_name)
+            if stage is None:
+                continue
+            record = load_stage_record(session_manager, stage.slug)
+            if record is None:
+                continue
+            try:
+                executor = get_stage_executor(stage.slug)
+            except KeyError:
+                continue
+            if executor.input_fingerprint(state) != record["fingerprint"]:
+                logger.info(f"Inputs of {stage.slug} changed - will re-run")
+                continue
+            try:
+                recorded_state = _restore_models(record)
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Cannot restore recorded state of {stage.slug}: {e} - will re-run")
+                continue
+
+            state.update(recorded_state)
+            state[stage.status_key] = "completed"
+            restored.append(action_name)
+
+    if restored:
+        logger.info(f"Reusing {len(restored)} unchanged stage(s): {restored}")
+    return restored
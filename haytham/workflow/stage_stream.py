@@ -0,0 +1,184 @@
+"""Incremental agent output for live progress views.
+
+``run_agent`` blocks until the agent finishes, so a progress view only hears
+about a stage when it completes. While a StageStream is active for the
+current context (``WorkflowProgressHook`` opens one per stage when given
+``on_stage_stream``), ``run_agent`` installs ``StageStream.handler`` as the
+agent's Strands callback handler, which forwards text deltas and tool calls.
+
+The model stream never waits on the consumer:
+
+- events are coalesced into a per-agent buffer that keeps only the last
+  ``STREAM_TAIL_CHARS`` characters (the full output still arrives with
+  ``on_stage_complete``);
+- the consumer receives a ``StreamUpdate`` at most once every
+  ``STREAM_UPDATE_INTERVAL`` seconds, the first one immediately;
+- if the consumer is still rendering the previous update, producers keep
+  buffering and the next update carries everything since.
+
+The consumer runs on whichever thread produced the event (a Strands event
+loop thread), so UI callbacks must be safe to call off the main thread.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_UPDATE_INTERVAL = 0.5
+_DEFAULT_TAIL_CHARS = 1500
+_MAX_TOOL_EVENTS = 20
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    try:
+        value = float(raw) if raw else default
+    except ValueError:
+        logger.warning("Invalid %s '%s', using default", name, raw)
+        return default
+    return value if value >= 0 else default
+
+
+def get_update_interval() -> float:
+    """Minimum seconds between updates from ``STREAM_UPDATE_INTERVAL`` (default 0.5)."""
+    return _env_number("STREAM_UPDATE_INTERVAL", _DEFAULT_UPDATE_INTERVAL)
+
+
+def get_tail_chars() -> int:
+    """Characters of text kept per agent from ``STREAM_TAIL_CHARS`` (default 1500)."""
+    return max(1, int(_env_number("STREAM_TAIL_CHARS", _DEFAULT_TAIL_CHARS)))
+
+
+@dataclass(frozen=True)
+class StreamUpdate:
+    """Snapshot of a stage's streamed output.
+
+    Attributes:
+        stage: Burr action name of the stage.
+        text: Agent name -> tail of the text streamed so far.
+        tools: Recent tool calls as ``"agent: tool"``, oldest first.
+        chars: Total characters streamed so far across agents.
+        final: True for the last update, sent when the stage finishes.
+    """
+
+    stage: str
+    text: dict[str, str]
+    tools: tuple[str, ...]
+    chars: int
+    final: bool = False
+
+
+class StageStream:
+    """Buffers one stage's streamed agent events and throttles delivery."""
+
+    def __init__(
+        self,
+        stage: str,
+        on_update: Callable[[StreamUpdate], None],
+        interval: float | None = None,
+        tail_chars: int | None = None,
+    ):
+        self.stage = stage
+        self.on_update = on_update
+        self.interval = get_update_interval() if interval is None else interval
+        self.tail_chars = get_tail_chars() if tail_chars is None else tail_chars
+        self._lock = threading.Lock()
+        self._emit_lock = threading.Lock()
+        self._text: dict[str, str] = {}
+        self._tools: deque[str] = deque(maxlen=_MAX_TOOL_EVENTS)
+        self._chars = 0
+        self._dirty = False
+        self._last_emit = -math.inf
+
+    def handler(self, agent_name: str) -> Callable[..., None]:
+        """Strands callback handler forwarding *agent_name*'s events here."""
+
+        def callback(**kwargs) -> None:
+            data = kwargs.get("data")
+            if data:
+                self.push_text(agent_name, data)
+            tool_use = kwargs.get("event", {}).get("contentBlockStart", {}).get("start", {})
+            tool_use = tool_use.get("toolUse")
+            if tool_use:
+                self.push_tool(agent_name, tool_use.get("name", "tool"))
+
+        return callback
+
+    def push_text(self, agent_name: str, text: str) -> None:
+        with self._lock:
+            tail = self._text.get(agent_name, "") + text
+            self._text[agent_name] = tail[-self.tail_chars :]
+            self._chars += len(text)
+            self._dirty = True
+        self._maybe_flush()
+
+    def push_tool(self, agent_name: str, tool_name: str) -> None:
+        with self._lock:
+            self._tools.append(f"{agent_name}: {tool_name}")
+            self._dirty = True
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_emit >= self.interval:
+            self.flush()
+
+    def flush(self, final: bool = False) -> None:
+        """Deliver pending events to the consumer.
+
+        Non-final flushes return immediately if another thread is already
+        delivering an update; the final flush waits for it.
+        """
+        if not self._emit_lock.acquire(blocking=final):
+            return
+        try:
+            with self._lock:
+                if not self._dirty and not final:
+                    return
+                update = StreamUpdate(
+                    stage=self.stage,
+                    text=dict(self._text),
+                    tools=tuple(self._tools),
+                    chars=self._chars,
+                    final=final,
+                )
+                self._dirty = False
+                self._last_emit = time.monotonic()
+            try:
+                self.on_update(update)
+            except Exception as e:
+                logger.error(f"on_stage_stream callback failed: {e}")
+        finally:
+            self._emit_lock.release()
+
+    def close(self) -> None:
+        """Send the final update."""
+        self.flush(final=True)
+
+
+_current_stream: ContextVar[StageStream | None] = ContextVar("stage_stream", default=None)
+
+
+def current_stage_stream() -> StageStream | None:
+    """The StageStream active in this context, if any."""
+    return _current_stream.get()
+
+
+def activate_stage_stream(stream: StageStream | None) -> Token:
+    """Make *stream* current; pass the token to ``deactivate_stage_stream``."""
+    return _current_stream.set(stream)
+
+
+def deactivate_stage_stream(token: Token) -> None:
+    try:
+        _current_stream.reset(token)
+    except ValueError:
+        # Token from another context (hook ran on a different thread)
+        _current_stream.set(None)
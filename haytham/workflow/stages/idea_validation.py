@@ -165,7 +165,7 @@ def _extract_jtbd_section(market_intelligence_output: str) -> str:
 def extract_competitor_data_processor(output: str, state: State) -> dict[str, Any]:
     """Post-processor: extract structured competitor data from accumulator.
 
-    Reads the module-level accumulator populated by the recording tools
+    Reads the context-scoped accumulator populated by the recording tools
     during the competitor_analysis agent run.  Falls back silently if the
     accumulator is empty (agent didn't call the tools, or old session).
     """
@@ -312,12 +312,12 @@ def store_capabilities_in_vector_db(session_manager: Any, output: str) -> None:
     try:
         # Import state infrastructure
         from haytham.agents.state_writer.state_writer_agent import StateWriterAgent
-        from haytham.state import DuplicateEntryError, SystemStateDB, get_embedder
+        from haytham.state import DuplicateEntryError, get_embedder, get_state_db
 
         # Initialize vector DB
         db_path = session_manager.session_dir / "vector_db"
         embedder = get_embedder()
-        db = SystemStateDB(db_path, embedder=embedder)
+        db = get_state_db(db_path, embedder=embedder)
         writer = StateWriterAgent(db)
 
         stored_ids = []
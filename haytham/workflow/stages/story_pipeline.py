@@ -577,21 +577,20 @@ def create_backlog_drafts_from_stories(
     Returns:
         Dict with created_count, failed_count, and draft_ids
     """
-    from haytham.backlog.cli import BacklogCLI
+    from haytham.backlog import open_backlog
 
     if project_dir is None:
         project_dir = Path.cwd()
 
-    cli = BacklogCLI(project_dir)
+    cli = open_backlog(project_dir)
 
     # Ensure backlog is initialized
     if not cli.is_initialized():
         logger.warning("Backlog not initialized, attempting to initialize...")
         cli.init("Haytham Generated MVP")
 
-    created_count = 0
-    failed_count = 0
-    draft_ids = []
+    specs = []
+    story_refs = []  # (story_id, title) per spec, for logging
 
     for story in stories:
         # Handle both Story objects and dicts
@@ -680,31 +679,34 @@ def create_backlog_drafts_from_stories(
         if depends_on:
             dep_notes = f"\n**Depends on stories:** {', '.join(depends_on)}"
 
-        try:
-            draft_id = cli.create_draft(
-                title=f"[{story_id}] {title}",
-                description=full_description + dep_notes,
-                priority="medium" if layer > 1 else "high",
-                labels=labels,
-                acceptance_criteria=acceptance_criteria,
-            )
+        specs.append(
+            {
+                "title": f"[{story_id}] {title}",
+                "description": full_description + dep_notes,
+                "priority": "medium" if layer > 1 else "high",
+                "labels": labels,
+                "acceptance_criteria": acceptance_criteria,
+            }
+        )
+        story_refs.append((story_id, title))
 
-            if draft_id:
-                draft_ids.append(draft_id)
-                created_count += 1
-                logger.info(f"Created draft {draft_id} for {story_id}: {title}")
-            else:
-                failed_count += 1
-                logger.warning(f"Failed to create draft for {story_id}: {title}")
+    # One validated batch instead of one write (or CLI process) per story
+    try:
+        result = cli.create_drafts(specs)
+    except Exception as e:
+        logger.error(f"Error creating backlog drafts: {e}")
+        return {"created_count": 0, "failed_count": len(specs), "draft_ids": []}
 
-        except Exception as e:
-            failed_count += 1
-            logger.error(f"Error creating draft for {story_id}: {e}")
+    for (story_id, title), item in zip(story_refs, result.items, strict=True):
+        if item.ok:
+            logger.info(f"Created draft {item.task_id} for {story_id}: {title}")
+        else:
+            logger.warning(f"Failed to create draft for {story_id}: {title} ({item.error})")
 
     return {
-        "created_count": created_count,
-        "failed_count": failed_count,
-        "draft_ids": draft_ids,
+        "created_count": len(result.succeeded),
+        "failed_count": len(result.failed),
+        "draft_ids": result.ids,
     }
 
 
@@ -9,7 +9,7 @@ import json
 import logging
 import uuid
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from burr.core import ApplicationBuilder
@@ -17,6 +17,13 @@ from burr.lifecycle import PostRunStepHook, PreRunStepHook
 from burr.tracking import LocalTrackingClient
 
 from haytham.workflow.entry_validators import validate_workflow_entry
+from haytham.workflow.stage_fingerprint import restore_unchanged_stages
+from haytham.workflow.stage_stream import (
+    StageStream,
+    StreamUpdate,
+    activate_stage_stream,
+    deactivate_stage_stream,
+)
 from haytham.workflow.workflow_specs import WorkflowSpec
 
 if TYPE_CHECKING:
@@ -70,11 +77,18 @@ def _load_anchor_from_disk(
 
 @dataclass
 class WorkflowProgressHook(PostRunStepHook, PreRunStepHook):
-    """Hook to track stage progress within a workflow."""
+    """Hook to track stage progress within a workflow.
+
+    When ``on_stage_stream`` is set, a StageStream is active while each
+    stage runs, so agents started by the stage report incremental output
+    (see :mod:`haytham.workflow.stage_stream`).
+    """
 
     on_stage_start: Callable[[str, int, int], None] | None = None
     on_stage_complete: Callable[[str, int, int, dict], None] | None = None
     stage_order: list[str] | None = None
+    on_stage_stream: Callable[[StreamUpdate], None] | None = None
+    _streams: dict[str, tuple[StageStream, Any]] = field(default_factory=dict, repr=False)
 
     def pre_run_step(self, *, action, **kwargs):
         """Called before each action runs."""
@@ -90,12 +104,22 @@ class WorkflowProgressHook(PostRunStepHook, PreRunStepHook):
             except (TypeError, AttributeError, ValueError) as e:
                 logger.error(f"on_stage_start callback failed: {e}")
 
+        if self.on_stage_stream:
+            stream = StageStream(stage_name, self.on_stage_stream)
+            self._streams[stage_name] = (stream, activate_stage_stream(stream))
+
     def post_run_step(self, *, action, state, result, **kwargs):
         """Called after each action completes."""
         stage_name = action.name
         stage_index = self._get_stage_index(stage_name)
         total_stages = len(self.stage_order) if self.stage_order else 1
 
+        active = self._streams.pop(stage_name, None)
+        if active:
+            stream, token = active
+            deactivate_stage_stream(token)
+            stream.close()
+
         status_key = f"{stage_name}_status"
         status = state.get(status_key, "unknown")
 
@@ -126,6 +150,69 @@ class WorkflowProgressHook(PostRunStepHook, PreRunStepHook):
 # ---------------------------------------------------------------------------
 
 
+def build_initial_state(
+    specs: list[WorkflowSpec],
+    session_manager: "SessionManager",
+    system_goal: str,
+    extra_state: dict[str, Any] | None = None,
+    reuse_unchanged: bool = True,
+) -> dict[str, Any]:
+    """Build the starting state for running one or more workflow specs.
+
+    Loads the concept anchor (ADR-022) and the outputs of each spec's
+    ``context_stages`` from the session, then layers the specs' default
+    stage state and *extra_state* on top. Context stages produced by one of
+    the given specs are left to that spec's defaults.
+
+    With *reuse_unchanged*, stages that completed before with the same
+    input fingerprint are restored as completed so the run skips them
+    (see :mod:`haytham.workflow.stage_fingerprint`).
+
+    Args:
+        specs: Workflow specs in execution order.
+        session_manager: SessionManager to load anchor and context from.
+        system_goal: Resolved system goal.
+        extra_state: Extra state values (e.g., archetype="").
+        reuse_unchanged: Skip stages whose inputs are unchanged since they
+            last completed.
+
+    Returns:
+        State dict suitable for ``ApplicationBuilder.with_state``.
+    """
+    loaded_anchor, loaded_anchor_str = _load_anchor_from_disk(session_manager)
+
+    produced = {stage for spec in specs for stage in spec.stages}
+    context: dict[str, Any] = {}
+    for spec in specs:
+        for stage_slug in spec.context_stages:
+            key = stage_slug.replace("-", "_")
+            if key not in produced:
+                context[key] = session_manager.load_stage_output(stage_slug) or ""
+
+    # NOTE: session_manager is a non-serializable Python object stored in Burr
+    # state. This prevents Burr's built-in state serialization (checkpoints,
+    # persistence). Refactoring it out requires changing 12+ Burr actions that
+    # declare reads=["session_manager"]. Tracked for a future PR; the current
+    # approach works because we only use in-process state, not Burr persistence.
+    state: dict[str, Any] = {
+        "system_goal": system_goal,
+        "session_manager": session_manager,
+        "workflow_type": specs[0].workflow_type.value,
+        "concept_anchor": loaded_anchor,
+        "concept_anchor_str": loaded_anchor_str,
+        "current_stage": "",
+        "user_approved": True,
+        "user_feedback": "",
+    }
+    state.update(context)
+    for spec in specs:
+        state.update(spec.build_default_state())
+    state.update(extra_state or {})
+    if reuse_unchanged:
+        restore_unchanged_stages(specs, session_manager, state)
+    return state
+
+
 def build_workflow(
     spec: WorkflowSpec,
     session_manager: "SessionManager",
@@ -136,6 +223,8 @@ def build_workflow(
     enable_tracking: bool = True,
     tracking_project: str | None = None,
     force_override: bool = False,
+    on_stage_stream: Callable | None = None,
+    reuse_unchanged: bool = True,
     **extra_state: Any,
 ) -> Any:
     """Build a Burr Application from a WorkflowSpec.
@@ -151,6 +240,10 @@ def build_workflow(
         enable_tracking: Enable Burr tracking UI.
         tracking_project: Override spec's tracking_project.
         force_override: Force past overridable failed entry conditions.
+        on_stage_stream: Callback receiving throttled StreamUpdates with
+            agents' incremental output while a stage runs.
+        reuse_unchanged: Skip stages whose inputs are unchanged since they
+            last completed (make-style incremental resume).
         **extra_state: Extra state values (e.g., archetype="").
 
     Returns:
@@ -206,36 +299,17 @@ def build_workflow(
         on_stage_start=on_stage_start,
         on_stage_complete=on_stage_complete,
         stage_order=spec.stages,
+        on_stage_stream=on_stage_stream,
     )
 
-    # 6. Load anchor from disk (ADR-022)
-    loaded_anchor, loaded_anchor_str = _load_anchor_from_disk(session_manager)
-
-    # 7. Load context from previous workflows
-    context: dict[str, Any] = {}
-    for stage_slug in spec.context_stages:
-        key = stage_slug.replace("-", "_")
-        context[key] = session_manager.load_stage_output(stage_slug) or ""
-
-    # 8. Build state
-    # NOTE: session_manager is a non-serializable Python object stored in Burr
-    # state. This prevents Burr's built-in state serialization (checkpoints,
-    # persistence). Refactoring it out requires changing 12+ Burr actions that
-    # declare reads=["session_manager"]. Tracked for a future PR; the current
-    # approach works because we only use in-process state, not Burr persistence.
-    state: dict[str, Any] = {
-        "system_goal": system_goal,
-        "session_manager": session_manager,
-        "workflow_type": spec.workflow_type.value,
-        "concept_anchor": loaded_anchor,
-        "concept_anchor_str": loaded_anchor_str,
-        "current_stage": "",
-        "user_approved": True,
-        "user_feedback": "",
-    }
-    state.update(context)
-    state.update(spec.build_default_state())
-    state.update(extra_state)
+    # 6-8. Anchor, prior-workflow context and default stage state
+    state = build_initial_state(
+        [spec],
+        session_manager,
+        system_goal=system_goal,
+        extra_state=extra_state,
+        reuse_unchanged=reuse_unchanged,
+    )
 
     # 9. Build app
     builder = (
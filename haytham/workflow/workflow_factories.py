@@ -73,6 +73,7 @@ def create_idea_validation_workflow(
     enable_tracking: bool = True,
     tracking_project: str = "haytham-validation",
     archetype: str | None = None,
+    on_stage_stream: Callable | None = None,
 ) -> Any:
     """Create the Idea Validation workflow (Workflow 1).
 
@@ -88,6 +89,7 @@ def create_idea_validation_workflow(
         enable_tracking: Enable Burr tracking UI
         tracking_project: Project name for tracking
         archetype: User-selected archetype (empty string = auto-detect)
+        on_stage_stream: Callback for incremental agent output
 
     Returns:
         Burr Application instance
@@ -101,6 +103,7 @@ def create_idea_validation_workflow(
         on_stage_complete=on_stage_complete,
         enable_tracking=enable_tracking,
         tracking_project=tracking_project,
+        on_stage_stream=on_stage_stream,
         archetype=archetype or "",
     )
 
@@ -11,7 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from haytham.backlog.cli import BacklogCLI
+from haytham.backlog.cli import BacklogCLI, normalize_priority
 
 # ========== Fixtures ==========
 
@@ -202,6 +202,66 @@ class TestTaskUpdates:
         assert args[:3] == ["backlog", "task", "archive"]
 
 
+# ========== Bulk Operation Tests ==========
+
+
+class TestBulkOperations:
+    """Test bulk draft creation and labelling through the CLI."""
+
+    def test_create_drafts_validates_before_running(self, cli, mock_run):
+        """Invalid specs never reach the CLI and are reported per item."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="Created draft 4: Good")
+
+        result = cli.create_drafts([{"title": "Good"}, {"title": "Bad", "priority": "urgent"}])
+
+        assert mock_run.call_count == 1
+        assert result.ids == ["draft-4"]
+        assert not result.items[1].ok
+
+    def test_create_drafts_manual_fallback_allocates_once(self, tmp_path, mock_run):
+        """Drafts the CLI fails on get consecutive manual IDs from one scan."""
+        cli = BacklogCLI(tmp_path)
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="no backlog")
+
+        with patch.object(cli, "_get_next_draft_id", return_value="3") as next_id:
+            result = cli.create_drafts([{"title": "A"}, {"title": "B"}])
+
+        assert next_id.call_count == 1
+        assert result.ids == ["draft-3", "draft-4"]
+        assert (tmp_path / "backlog" / "drafts" / "4.md").exists()
+
+    def test_create_drafts_manual_fallback_defaults_priority(self, tmp_path, mock_run):
+        """A spec with priority=None gets the same medium default as create_draft."""
+        cli = BacklogCLI(tmp_path)
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="no backlog")
+
+        result = cli.create_drafts([{"title": "A", "priority": None}])
+
+        draft = (tmp_path / "backlog" / "drafts" / f"{result.ids[0].split('-')[1]}.md").read_text()
+        assert "priority: medium\n" in draft
+
+    def test_generated_priority_normalized(self, cli, mock_run, caplog):
+        """LLM-style priorities map onto valid ones instead of failing the draft."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="Created draft 4: Story")
+
+        specs = [{"title": "Story", "priority": normalize_priority(p)} for p in (" High", "urgent")]
+        result = cli.create_drafts(specs)
+
+        assert [spec["priority"] for spec in specs] == ["high", "medium"]
+        assert all(item.ok for item in result.items)
+        assert "Unknown priority 'urgent'" in caplog.text
+
+    def test_add_labels_bulk_one_call_per_task(self, cli, mock_run):
+        """All of a task's labels go in one edit call."""
+        mock_run.return_value = MagicMock(returncode=0, stderr="")
+
+        result = cli.add_labels_bulk({"task-1": ["a", "b"], "task-2": "c", "task-3": []})
+
+        assert mock_run.call_count == 2
+        assert mock_run.call_args_list[0][0][0][-2:] == ["-l", "a,b"]
+        assert [item.ok for item in result.items] == [True, True, False]
+
+
 # ========== Task Query Tests ==========
 
 
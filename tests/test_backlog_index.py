@@ -0,0 +1,119 @@
+"""Unit tests for the change-aware Backlog.md task index.
+
+Run with: pytest tests/test_backlog_index.py -v
+"""
+
+import os
+from unittest import mock
+
+import pytest
+
+from haytham.backlog import BacklogStore, get_task_index
+from haytham.backlog.index import TaskIndex, clear_task_index_registry
+from haytham.state.supersede import find_affected_stories
+
+# ========== Fixtures ==========
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Backlog with two stories implementing overlapping capabilities."""
+    clear_task_index_registry()
+    store = BacklogStore(tmp_path)
+    store.init("Test Project")
+    store.create_task("Login", labels=["implements:CAP-F-001", "layer-1"])
+    store.create_task("Profile", labels=["implements:CAP-F-001", "implements:CAP-F-002"])
+    yield store
+    clear_task_index_registry()
+
+
+# ========== Index Tests ==========
+
+
+class TestTaskIndex:
+    """Test incremental refresh and reverse maps."""
+
+    def test_capability_reverse_map(self, store):
+        index = TaskIndex(store.project_dir)
+
+        assert index.capability_stories() == {
+            "CAP-F-001": ["task-1", "task-2"],
+            "CAP-F-002": ["task-2"],
+        }
+        assert index.implements("task-2") == ["CAP-F-001", "CAP-F-002"]
+        assert index.status_by_id() == {"task-1": "To Do", "task-2": "To Do"}
+
+    def test_unchanged_files_not_reparsed(self, store):
+        index = TaskIndex(store.project_dir)
+        index.tasks()
+        parsed = index.parse_count
+
+        assert not index.refresh()
+        index.capability_stories()
+
+        assert index.parse_count == parsed
+
+    def test_only_changed_file_reparsed(self, store):
+        index = TaskIndex(store.project_dir)
+        index.tasks()
+        parsed = index.parse_count
+
+        store.add_label("task-1", "implements:CAP-F-003")
+
+        assert index.stories_for_capability("CAP-F-003") == ["task-1"]
+        assert index.parse_count == parsed + 1
+
+    def test_removed_and_added_files(self, store):
+        index = TaskIndex(store.project_dir)
+        index.tasks()
+
+        store.archive_task("task-2")
+        store.create_task("Settings", labels=["implements:CAP-F-002"])
+
+        assert index.stories_for_capability("CAP-F-002") == ["task-3"]
+        assert [t.id for t in index.tasks()] == ["task-1", "task-3"]
+
+    def test_same_size_edit_detected(self, store):
+        """Edits that keep the file size are caught by mtime."""
+        index = TaskIndex(store.project_dir)
+        index.tasks()
+        path = next(store.tasks_dir.glob("task-1 *.md"))
+        text = path.read_text().replace("status: To Do", "status: Do It")
+        path.write_text(text)
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert index.get("task-1").status == "Do It"
+
+    def test_lookups_without_refresh_use_last_scan(self, store):
+        index = TaskIndex(store.project_dir)
+        index.refresh()
+
+        store.add_label("task-1", "implements:CAP-F-003")
+
+        assert index.stories_for_capability("CAP-F-003", refresh=False) == []
+        assert index.stories_for_capability("CAP-F-003") == ["task-1"]
+
+    def test_affected_stories_scan_backlog_once(self, store):
+        index = get_task_index(store.project_dir)
+        session_manager = mock.Mock(session_dir=store.project_dir / "session")
+
+        with mock.patch.object(TaskIndex, "refresh", wraps=index.refresh) as refresh:
+            affected = find_affected_stories(session_manager, ["CAP-F-001", "CAP-F-002"])
+
+        assert [story.story_id for story in affected] == ["task-1", "task-2"]
+        assert refresh.call_count == 1
+
+    def test_returned_tasks_are_copies(self, store):
+        index = TaskIndex(store.project_dir)
+        index.tasks()[0].labels.append("mutated")
+        assert "mutated" not in index.get("task-1").labels
+
+    def test_registry_shares_index_and_list_tasks_uses_it(self, store):
+        index = get_task_index(store.project_dir)
+        assert get_task_index(store.project_dir) is index
+
+        store.list_tasks()
+        parsed = index.parse_count
+        assert [t.id for t in store.list_tasks(status="to do")] == ["task-1", "task-2"]
+        assert index.parse_count == parsed
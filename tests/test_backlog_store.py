@@ -0,0 +1,250 @@
+"""Unit tests for the in-process Backlog.md backend.
+
+Tests BacklogStore against a temporary backlog folder; no Backlog.md
+installation required.
+
+Run with: pytest tests/test_backlog_store.py -v
+"""
+
+import pytest
+
+from haytham.backlog import BacklogCLI, BacklogStore, open_backlog
+
+# ========== Fixtures ==========
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Initialized BacklogStore in a temporary project directory."""
+    store = BacklogStore(tmp_path)
+    assert store.init("Test Project")
+    return store
+
+
+# ========== Backend Selection Tests ==========
+
+
+class TestOpenBacklog:
+    """Test backend selection."""
+
+    def test_native_is_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("BACKLOG_BACKEND", raising=False)
+        assert isinstance(open_backlog(tmp_path), BacklogStore)
+
+    def test_cli_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("BACKLOG_BACKEND", "cli")
+        assert isinstance(open_backlog(tmp_path), BacklogCLI)
+
+    def test_unknown_backend_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="BACKLOG_BACKEND"):
+            open_backlog(tmp_path, backend="jira")
+
+
+# ========== Task File Tests ==========
+
+
+class TestTaskFiles:
+    """Test creating and reading task files."""
+
+    def test_init_creates_structure(self, store):
+        assert store.is_initialized()
+        assert store.tasks_dir.is_dir()
+        assert store.drafts_dir.is_dir()
+        assert (store.backlog_dir / "config.yml").exists()
+
+    def test_create_and_get_round_trip(self, store):
+        """All task fields survive a write/read cycle."""
+        task_id = store.create_task(
+            "Implement login",
+            description="Add auth.\n\n## Technical Specification\n\n- `auth.py`",
+            priority="high",
+            labels=["backend", "implements:CAP-F-001"],
+            acceptance_criteria=["Users can log in", "Sessions persist"],
+            dependencies=["1"],
+        )
+
+        task = store.get_task(task_id)
+
+        assert task_id == "task-1"
+        assert task.title == "Implement login"
+        assert task.priority == "high"
+        assert "## Technical Specification" in task.description
+        assert task.labels == ["backend", "implements:CAP-F-001"]
+        assert task.acceptance_criteria == ["Users can log in", "Sessions persist"]
+        assert task.dependencies == ["task-1"]
+        assert not task.is_draft
+
+    def test_file_uses_backlog_md_layout(self, store):
+        task_id = store.create_task("Add search", labels=["layer-1"])
+        files = list(store.tasks_dir.glob("*.md"))
+
+        assert [f.name for f in files] == ["task-1 - Add-search.md"]
+        text = files[0].read_text()
+        assert text.startswith("---\nid: task-1\n")
+        assert "## Description" in text
+        assert store.get_task(task_id.removeprefix("task-")).title == "Add search"
+
+    def test_ids_increment(self, store):
+        ids = [store.create_task(f"Task {i}") for i in range(3)]
+        assert ids == ["task-1", "task-2", "task-3"]
+        assert [t.id for t in store.list_tasks()] == ids
+
+    def test_reads_legacy_manual_draft(self, store):
+        """Drafts written by BacklogCLI's manual fallback are readable."""
+        (store.drafts_dir / "1.md").write_text(
+            '---\ntitle: "Old draft"\nstatus: "To Do"\npriority: high\n'
+            "labels: [layer-0, generated]\ndependencies: []\n---\n\n"
+            "# Old draft\n\nLegacy body\n\n## Acceptance Criteria\n\n- [ ] Works\n\n## Notes\n\n"
+        )
+
+        (draft,) = store.list_drafts()
+
+        assert draft.id == "draft-1"
+        assert draft.title == "Old draft"
+        assert draft.description == "Legacy body"
+        assert draft.labels == ["layer-0", "generated"]
+        assert draft.acceptance_criteria == ["Works"]
+        assert store.create_draft("Next") == "draft-2"
+
+
+# ========== Update Tests ==========
+
+
+class TestUpdates:
+    """Test read-modify-write operations."""
+
+    def test_update_status_and_filter(self, store):
+        first = store.create_task("First")
+        store.create_task("Second")
+
+        assert store.update_status(first, "In Progress")
+
+        assert [t.id for t in store.list_tasks(status="in progress")] == [first]
+
+    def test_add_label_is_idempotent(self, store):
+        task_id = store.create_task("Task", labels=["a"])
+        assert store.add_label(task_id, "needs-review:superseded")
+        assert store.add_label(task_id, "needs-review:superseded")
+        assert store.get_task(task_id).labels == ["a", "needs-review:superseded"]
+
+    def test_acceptance_criteria_checks_persist(self, store):
+        task_id = store.create_task("Task", acceptance_criteria=["One", "Two"])
+
+        assert store.check_acceptance_criteria(task_id, 2)
+        assert not store.check_acceptance_criteria(task_id, 3)
+        store.add_notes(task_id, "Done with JWT")
+
+        text = next(store.tasks_dir.glob("*.md")).read_text()
+        assert "- [ ] #1 One" in text
+        assert "- [x] #2 Two" in text
+        assert store.get_task(task_id).notes == "Done with JWT"
+
+    def test_unknown_fields_preserved(self, store):
+        task_id = store.create_task("Task")
+        path = next(store.tasks_dir.glob("*.md"))
+        path.write_text(path.read_text().replace("assignee: []", "assignee:\n- '@alice'"))
+
+        store.update_status(task_id, "Done")
+
+        assert "'@alice'" in path.read_text()
+        assert [t.id for t in store.list_tasks(assignee="@alice")] == [task_id]
+
+    def test_promote_draft(self, store):
+        store.create_task("Existing")
+        draft_id = store.create_draft("Idea", acceptance_criteria=["Works"])
+
+        assert store.promote_draft(draft_id)
+
+        assert store.list_drafts() == []
+        promoted = store.get_task("task-2")
+        assert promoted.title == "Idea"
+        assert promoted.status == "To Do"
+        assert promoted.acceptance_criteria == ["Works"]
+
+    def test_archive_task(self, store):
+        task_id = store.create_task("Old")
+        assert store.archive_task(task_id)
+        assert store.list_tasks() == []
+        assert store.create_task("New") == "task-2"
+
+    def test_missing_task_returns_false(self, store):
+        assert not store.update_status("task-99", "Done")
+        assert store.get_task("task-99") is None
+
+    def test_no_temp_files_left_after_edits(self, store):
+        task_id = store.create_task("Task")
+        store.append_notes(task_id, "a")
+        store.append_notes(task_id, "b")
+        assert [p.name for p in store.tasks_dir.iterdir()] == ["task-1 - Task.md"]
+        assert store.get_task(task_id).notes == "a\n\nb"
+
+
+# ========== Bulk Operation Tests ==========
+
+
+class TestBulkOperations:
+    """Test create_drafts and add_labels_bulk."""
+
+    def test_create_drafts_allocates_sequential_ids(self, store):
+        store.create_draft("Existing")
+        specs = [{"title": f"Story {i}", "labels": ["generated"]} for i in range(80)]
+
+        result = store.create_drafts(specs)
+
+        assert result.failed == []
+        assert result.ids[:2] == ["draft-2", "draft-3"]
+        assert result.ids[-1] == "draft-81"
+        assert len(store.list_drafts()) == 81
+
+    def test_invalid_specs_reported_and_skipped(self, store):
+        result = store.create_drafts(
+            [
+                {"title": "Good", "priority": "high"},
+                {"title": ""},
+                {"title": "Bad priority", "priority": "urgent"},
+                {"title": "Bad field", "owner": "me"},
+                {"title": "Comma label", "labels": ["a,b"]},
+            ]
+        )
+
+        assert [item.ok for item in result.items] == [True, False, False, False, False]
+        assert result.ids == ["draft-1"]
+        assert "priority" in result.items[2].error
+        assert "owner" in result.items[3].error
+        assert [d.title for d in store.list_drafts()] == ["Good"]
+
+    def test_failed_batch_writes_nothing(self, store, monkeypatch):
+        import haytham.backlog.store as store_module
+
+        real_fdopen = store_module.os.fdopen
+        calls = []
+
+        def flaky_fdopen(fd, *args, **kwargs):
+            calls.append(fd)
+            if len(calls) == 3:
+                raise OSError("disk full")
+            return real_fdopen(fd, *args, **kwargs)
+
+        monkeypatch.setattr(store_module.os, "fdopen", flaky_fdopen)
+        result = store.create_drafts([{"title": f"Story {i}"} for i in range(5)])
+
+        assert len(result.failed) == 5
+        assert list(store.drafts_dir.iterdir()) == []
+
+    def test_add_labels_bulk(self, store):
+        first = store.create_task("First", labels=["a"])
+        second = store.create_task("Second")
+
+        result = store.add_labels_bulk(
+            {
+                first: ["needs-review:superseded", "a"],
+                second: "x",
+                "task-99": ["y"],
+                first + "x": [],
+            }
+        )
+
+        assert [item.ok for item in result.items] == [True, True, False, False]
+        assert "not found" in result.items[2].error
+        assert store.get_task(first).labels == ["a", "needs-review:superseded"]
+        assert store.get_task(second).labels == ["x"]
@@ -0,0 +1,81 @@
+"""Tests for token-budgeted context packing in haytham.workflow.context_builder."""
+
+from haytham.agents.utils.tokenizer import ApproximateTokenizer
+from haytham.workflow.context_builder import (
+    ContextSection,
+    build_context_summary,
+    pack_context_sections,
+)
+
+TOKENIZER = ApproximateTokenizer()
+
+
+def _words(n: int, word: str = "word") -> str:
+    return " ".join([word] * n)
+
+
+class TestPackContextSections:
+    def test_everything_fits(self):
+        sections = [ContextSection("alpha"), ContextSection("beta")]
+        assert pack_context_sections(sections, 100, TOKENIZER) == "alpha\n\nbeta"
+
+    def test_result_within_budget(self):
+        sections = [ContextSection(_words(200), priority=i) for i in range(4)]
+        packed = pack_context_sections(sections, 300, TOKENIZER)
+        assert TOKENIZER.count(packed) <= 300
+
+    def test_lower_priority_value_packs_first(self):
+        sections = [
+            ContextSection(_words(100, "early"), priority=2),
+            ContextSection(_words(100, "late"), priority=1),
+        ]
+        packed = pack_context_sections(sections, 120, TOKENIZER)
+        assert packed.startswith(_words(100, "late"))
+        assert "early" not in packed
+
+    def test_partial_section_is_truncated(self):
+        sections = [
+            ContextSection(_words(100, "late"), priority=1),
+            ContextSection(_words(200, "early"), priority=2),
+        ]
+        packed = pack_context_sections(sections, 200, TOKENIZER)
+        assert "early" in packed
+        assert packed.endswith("...")
+        assert TOKENIZER.count(packed) <= 200
+
+    def test_required_sections_never_cut(self):
+        goal = _words(150, "goal")
+        sections = [ContextSection(goal, required=True), ContextSection(_words(50), priority=1)]
+        assert pack_context_sections(sections, 100, TOKENIZER) == goal
+
+    def test_display_order_preserved(self):
+        sections = [
+            ContextSection("goal", required=True),
+            ContextSection("first stage", priority=2),
+            ContextSection("second stage", priority=1),
+        ]
+        assert (
+            pack_context_sections(sections, 100, TOKENIZER) == "goal\n\nfirst stage\n\nsecond stage"
+        )
+
+
+class TestBuildContextSummaryBudget:
+    CONTEXT = {
+        "system_goal": "A scheduling SaaS for remote teams",
+        "concept_anchor": "## Concept Anchor\n- Remote-first",
+        "idea_analysis": "## TL;DR\n" + _words(250, "idea"),
+        "market_context": "## TL;DR\n" + _words(250, "market"),
+    }
+
+    def test_unbounded_matches_previous_format(self):
+        summary = build_context_summary(self.CONTEXT)
+        assert summary.startswith("**ORIGINAL IDEA")
+        assert "idea idea" in summary and "market market" in summary
+
+    def test_budget_keeps_goal_and_latest_stage(self):
+        summary = build_context_summary(self.CONTEXT, token_budget=200, tokenizer=TOKENIZER)
+        assert TOKENIZER.count(summary) <= 200
+        assert "A scheduling SaaS for remote teams" in summary
+        assert "Remote-first" in summary
+        assert "market market" in summary
+        assert "idea idea" not in summary
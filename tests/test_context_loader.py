@@ -313,7 +313,14 @@ class TestContextLoader:
         context = loader.load_context(stage_slug="risk-assessment")
 
         assert context["_summarized"]
-        assert context["_context_size_tokens"] < 100
+        assert set(context["agent_outputs"]) == {
+            "concept_expansion",
+            "market_intelligence",
+            "competitor_analysis",
+        }
+        # Preferences are passed through; only the agent outputs are summarized
+        preferences_tokens = loader._estimate_tokens({}, context["preferences"])
+        assert context["_context_size_tokens"] - preferences_tokens <= 5
 
     def test_disable_summarization(self, sample_session):
         """Test disabling automatic summarization."""
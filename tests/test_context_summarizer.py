@@ -163,6 +163,14 @@ class TestContextSummarizerBasics:
         assert summarizer._format_agent_name("market_intelligence") == "Market Intelligence"
         assert summarizer._format_agent_name("simple") == "Simple"
 
+    def test_small_target_keeps_agent_headers(self):
+        """The token cut never reaches the headers ContextLoader parses names from."""
+        summarizer = ContextSummarizer(target_tokens=5)
+        result = summarizer.summarize_agent_outputs(
+            {"market_intelligence": "## Summary\n" + "Market findings. " * 50}
+        )
+        assert result.startswith("## Market Intelligence")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,270 @@
+"""Tests for dependency-aware (DAG) stage execution.
+
+Covers graph derivation from required_context and action reads, conditional
+edges, concurrent execution of independent stages, failure propagation and
+entry-condition gating. Stage actions are replaced with fakes; no LLM calls.
+"""
+
+import threading
+from dataclasses import replace
+from unittest import mock
+
+import pytest
+
+from haytham.workflow import dag_executor
+from haytham.workflow.dag_executor import (
+    BLOCKED,
+    SKIPPED,
+    ExecutionMode,
+    build_stage_dag,
+    get_execution_mode,
+    run_stage_dag,
+)
+from haytham.workflow.entry_validators.base import EntryConditionResult
+from haytham.workflow.stage_registry import WorkflowType
+from haytham.workflow.stage_stream import current_stage_stream
+from haytham.workflow.workflow_specs import WORKFLOW_SPECS
+
+FULL_RUN = [
+    WorkflowType.IDEA_VALIDATION,
+    WorkflowType.MVP_SPECIFICATION,
+    WorkflowType.BUILD_BUY_ANALYSIS,
+    WorkflowType.ARCHITECTURE_DECISIONS,
+    WorkflowType.STORY_GENERATION,
+]
+
+
+def _fake_action(name, real, behaviour=None, calls=None):
+    """Stage action that records its call and marks the stage completed."""
+
+    def run(state):
+        if calls is not None:
+            calls.append(name)
+        updates = {name: f"{name} output", f"{name}_status": "completed"}
+        if behaviour:
+            updates.update(behaviour(state) or {})
+        return state.update(**updates)
+
+    run.action_function = real.action_function  # keep declared reads
+    return run
+
+
+@pytest.fixture
+def fake_specs(monkeypatch):
+    """Swap every spec's actions for fakes; returns (behaviours, calls)."""
+    behaviours: dict = {}
+    calls: list = []
+    specs = {}
+    for wt, spec in WORKFLOW_SPECS.items():
+        actions = {
+            name: _fake_action(
+                name, real, lambda state, n=name: behaviours.get(n, lambda s: None)(state), calls
+            )
+            for name, real in spec.actions.items()
+        }
+        specs[wt] = replace(spec, actions=actions)
+    monkeypatch.setattr(dag_executor, "WORKFLOW_SPECS", specs)
+    monkeypatch.setattr(
+        dag_executor,
+        "build_initial_state",
+        lambda specs, sm, goal, extra: {
+            "system_goal": goal,
+            **{k: v for s in specs for k, v in s.build_default_state().items()},
+            **(extra or {}),
+        },
+    )
+    monkeypatch.setattr(
+        dag_executor,
+        "validate_workflow_entry",
+        lambda *a, **k: EntryConditionResult(passed=True, message="ok"),
+    )
+    return behaviours, calls
+
+
+@pytest.fixture
+def session_manager():
+    return mock.MagicMock()
+
+
+class TestBuildStageDag:
+    def test_full_run_dependencies(self):
+        nodes = build_stage_dag([WORKFLOW_SPECS[wt] for wt in FULL_RUN])
+
+        assert "build_buy_analysis" not in nodes["system_traits"].depends_on
+        assert "system_traits" not in nodes["build_buy_analysis"].depends_on
+        assert "system_traits" not in nodes["architecture_decisions"].depends_on
+        assert nodes["architecture_decisions"].depends_on == (
+            "mvp_scope",
+            "capability_model",
+            "build_buy_analysis",
+        )
+
+    def test_action_reads_add_dependencies(self):
+        """validation_summary reads pivot_strategy though it is not required context."""
+        nodes = build_stage_dag([WORKFLOW_SPECS[WorkflowType.IDEA_VALIDATION]])
+        assert "pivot_strategy" in nodes["validation_summary"].depends_on
+
+    def test_conditional_edge_becomes_gate(self):
+        nodes = build_stage_dag([WORKFLOW_SPECS[WorkflowType.IDEA_VALIDATION]])
+
+        (source, condition) = nodes["pivot_strategy"].gates[0]
+        assert source == "risk_assessment"
+        assert condition.name == "risk_level=HIGH"
+        assert nodes["validation_summary"].gates == ()
+
+    def test_stages_outside_run_are_not_dependencies(self):
+        nodes = build_stage_dag([WORKFLOW_SPECS[WorkflowType.ARCHITECTURE_DECISIONS]])
+        assert nodes["architecture_decisions"].depends_on == ()
+
+
+class TestRunStageDag:
+    def test_independent_stages_run_concurrently(self, fake_specs, session_manager):
+        behaviours, _ = fake_specs
+        build_buy_started = threading.Event()
+
+        def system_traits(state):
+            # Only passes if build_buy_analysis starts while this stage runs
+            assert build_buy_started.wait(timeout=5)
+
+        behaviours["build_buy_analysis"] = lambda state: build_buy_started.set()
+        behaviours["system_traits"] = system_traits
+
+        result = run_stage_dag(FULL_RUN[1:4], session_manager, system_goal="idea")
+
+        assert result.completed
+        assert result.statuses["system_traits"] == "completed"
+        assert result.state["architecture_decisions"] == "architecture_decisions output"
+
+    def test_dependencies_run_first(self, fake_specs, session_manager):
+        _, calls = fake_specs
+        run_stage_dag(FULL_RUN, session_manager, system_goal="idea", max_workers=1)
+
+        assert calls.index("build_buy_analysis") < calls.index("architecture_decisions")
+        assert calls.index("architecture_decisions") < calls.index("story_generation")
+        assert calls[-1] == "dependency_ordering"
+
+    @pytest.mark.parametrize("risk_level,pivot_status", [("HIGH", "completed"), ("LOW", SKIPPED)])
+    def test_pivot_follows_conditional_edge(
+        self, fake_specs, session_manager, risk_level, pivot_status
+    ):
+        behaviours, calls = fake_specs
+        behaviours["risk_assessment"] = lambda state: {"risk_level": risk_level}
+
+        result = run_stage_dag([WorkflowType.IDEA_VALIDATION], session_manager, system_goal="x")
+
+        assert result.statuses["pivot_strategy"] == pivot_status
+        assert result.statuses["validation_summary"] == "completed"
+        assert result.completed
+        if pivot_status == "completed":
+            assert calls.index("pivot_strategy") < calls.index("validation_summary")
+        session_manager.run_tracker.record_workflow_complete.assert_called_once_with(
+            "idea-validation"
+        )
+
+    def test_failed_stage_blocks_dependents(self, fake_specs, session_manager):
+        behaviours, calls = fake_specs
+        behaviours["build_buy_analysis"] = lambda state: {"build_buy_analysis_status": "failed"}
+
+        result = run_stage_dag(FULL_RUN[1:4], session_manager, system_goal="idea")
+
+        assert result.statuses["build_buy_analysis"] == "failed"
+        assert result.statuses["architecture_decisions"] == BLOCKED
+        assert result.statuses["system_traits"] == "completed"
+        assert "architecture_decisions" not in calls
+        assert not result.completed
+
+    def test_raising_stage_marked_failed(self, fake_specs, session_manager):
+        behaviours, _ = fake_specs
+
+        def boom(state):
+            raise RuntimeError("agent crashed")
+
+        behaviours["mvp_scope"] = boom
+
+        result = run_stage_dag([WorkflowType.MVP_SPECIFICATION], session_manager, system_goal="x")
+
+        assert result.statuses["mvp_scope"] == "failed"
+        assert result.errors["mvp_scope"] == "agent crashed"
+        assert result.statuses["system_traits"] == BLOCKED
+
+    def test_entry_conditions_gate_workflows(self, fake_specs, session_manager, monkeypatch):
+        _, calls = fake_specs
+
+        def validate(workflow_type, *args, **kwargs):
+            passed = workflow_type is not WorkflowType.MVP_SPECIFICATION
+            return EntryConditionResult(passed=passed, message="NO-GO")
+
+        monkeypatch.setattr(dag_executor, "validate_workflow_entry", validate)
+
+        result = run_stage_dag(FULL_RUN[:2], session_manager, system_goal="idea")
+
+        assert result.statuses["validation_summary"] == "completed"
+        assert result.statuses["mvp_scope"] == BLOCKED
+        assert result.errors["mvp_scope"] == "NO-GO"
+        assert "mvp_scope" not in calls
+
+    def test_progress_callbacks(self, fake_specs, session_manager):
+        started, completed = [], []
+
+        run_stage_dag(
+            [WorkflowType.STORY_GENERATION],
+            session_manager,
+            system_goal="x",
+            on_stage_start=lambda name, i, total: started.append((name, i, total)),
+            on_stage_complete=lambda name, i, total, r: completed.append((name, r["status"])),
+        )
+
+        assert started[0] == ("story_generation", 0, 3)
+        assert completed[-1] == ("dependency_ordering", "completed")
+
+    def test_stream_active_per_stage(self, fake_specs, session_manager):
+        behaviours, _ = fake_specs
+        updates = []
+
+        def push(state):
+            current_stage_stream().push_text("agent", "partial")
+
+        behaviours["build_buy_analysis"] = push
+
+        run_stage_dag(
+            [WorkflowType.BUILD_BUY_ANALYSIS],
+            session_manager,
+            system_goal="x",
+            on_stage_stream=updates.append,
+        )
+
+        assert updates[-1].stage == "build_buy_analysis"
+        assert updates[-1].final
+        assert updates[-1].text == {"agent": "partial"}
+        assert current_stage_stream() is None
+
+
+class TestExecutionMode:
+    def test_default_is_linear(self, monkeypatch):
+        monkeypatch.delenv("WORKFLOW_EXECUTION_MODE", raising=False)
+        assert get_execution_mode() is ExecutionMode.LINEAR
+
+    def test_invalid_raises(self, monkeypatch):
+        monkeypatch.setenv("WORKFLOW_EXECUTION_MODE", "parallel")
+        with pytest.raises(ValueError, match="WORKFLOW_EXECUTION_MODE"):
+            get_execution_mode()
+
+    def test_dag_mode_dispatches(self, fake_specs, session_manager):
+        result = dag_executor.run_workflows(
+            [WorkflowType.BUILD_BUY_ANALYSIS], session_manager, mode=ExecutionMode.DAG
+        )
+        assert result.statuses == {"build_buy_analysis": "completed"}
+
+    def test_linear_mode_passes_tracking(self, session_manager):
+        app = mock.MagicMock()
+        app.run.return_value = (None, None, {"build_buy_analysis_status": "completed"})
+        with mock.patch(
+            "haytham.workflow.workflow_factories.create_workflow_for_type", return_value=app
+        ) as create:
+            dag_executor.run_workflows(
+                [WorkflowType.BUILD_BUY_ANALYSIS],
+                session_manager,
+                mode=ExecutionMode.LINEAR,
+                enable_tracking=True,
+            )
+        assert create.call_args.kwargs["enable_tracking"] is True
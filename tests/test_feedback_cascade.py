@@ -2,6 +2,7 @@
 
 Tests cover:
 - get_downstream_stages: finding stages after a given stage
+- get_stage_dependencies: upstream stages each stage reads
 - get_stages_to_revise: calculating full cascade scope
 - is_cascade_needed: determining if cascading is required
 - get_cascade_summary: generating human-readable summaries
@@ -9,6 +10,7 @@ Tests cover:
 
 from haytham.feedback.cascade_engine import (
     get_downstream_stages,
+    get_stage_dependencies,
     get_stages_to_revise,
     is_cascade_needed,
 )
@@ -61,6 +63,27 @@ class TestGetDownstreamStages:
         assert result == []
 
 
+class TestGetStageDependencies:
+    """Tests for get_stage_dependencies() function."""
+
+    def test_follows_required_context(self):
+        """Dependencies come from required_context, limited to the workflow."""
+        deps = get_stage_dependencies(IDEA_VALIDATION_STAGES)
+        assert deps["idea-analysis"] == []
+        assert deps["market-context"] == ["idea-analysis"]
+        assert deps["validation-summary"] == ["idea-analysis", "market-context", "risk-assessment"]
+
+    def test_includes_state_reads(self):
+        """validation-summary reads pivot-strategy from state."""
+        stages = [*IDEA_VALIDATION_STAGES[:3], "pivot-strategy", "validation-summary"]
+        assert "pivot-strategy" in get_stage_dependencies(stages)["validation-summary"]
+
+    def test_unknown_stage_depends_on_all_before(self):
+        """Stages missing from the registry keep the linear cascade."""
+        deps = get_stage_dependencies(["idea-analysis", "custom-stage"])
+        assert deps["custom-stage"] == ["idea-analysis"]
+
+
 class TestGetStagesToRevise:
     """Tests for get_stages_to_revise() function."""
 
@@ -87,6 +110,21 @@ class TestGetStagesToRevise:
         )
         assert result == ["market-context", "risk-assessment", "validation-summary"]
 
+    def test_stages_not_reading_revised_output_are_kept(self):
+        """Stages that don't depend on a revised stage are not re-run."""
+        result = get_stages_to_revise(
+            ["system-traits"], MVP_SPECIFICATION_STAGES + ["system-traits"]
+        )
+        assert result == ["system-traits"]
+
+    def test_sibling_cascades_through_dependency(self):
+        """Revising pivot-strategy re-runs validation-summary, which reads it."""
+        stages = [*IDEA_VALIDATION_STAGES[:3], "pivot-strategy", "validation-summary"]
+        assert get_stages_to_revise(["pivot-strategy"], stages) == [
+            "pivot-strategy",
+            "validation-summary",
+        ]
+
     def test_empty_affected_returns_empty(self):
         """Empty affected stages should return empty list."""
         result = get_stages_to_revise([], IDEA_VALIDATION_STAGES)
@@ -0,0 +1,160 @@
+"""Tests for FeedbackProcessor revision scheduling.
+
+Covers dependency-ordered, concurrent revision of stages and early cutoff
+when a revised stage's output is materially unchanged. execute_revision is
+replaced with a fake; no LLM calls.
+"""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from haytham.feedback.feedback_processor import FeedbackProcessor
+from haytham.feedback.feedback_router import FeedbackRouteResult
+from haytham.feedback.revision_executor import RevisionResult, output_fingerprint
+
+IDEA_VALIDATION_STAGES = [
+    "idea-analysis",
+    "market-context",
+    "risk-assessment",
+    "pivot-strategy",
+    "validation-summary",
+]
+
+
+class FakeRevisions:
+    """Records revision calls; stages in ``unchanged`` report no material change
+    and stages in ``failing`` fail."""
+
+    def __init__(self, unchanged=(), delay=0.0, failing=()):
+        self.unchanged = set(unchanged)
+        self.failing = set(failing)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, stage_slug, feedback, session_manager, system_goal, **kwargs):
+        with self._lock:
+            self.calls.append((stage_slug, feedback, kwargs.get("upstream_context")))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if stage_slug in self.failing:
+            return RevisionResult(
+                stage_slug=stage_slug, agent_name="agent", output="", success=False, error="boom"
+            )
+        return RevisionResult(
+            stage_slug=stage_slug,
+            agent_name="agent",
+            output=f"revised {stage_slug}",
+            success=True,
+            changed=stage_slug not in self.unchanged,
+        )
+
+
+def run_processor(affected, fake, stages=IDEA_VALIDATION_STAGES):
+    session_manager = mock.Mock()
+    session_manager.load_stage_output.side_effect = lambda slug: f"output of {slug}"
+    processor = FeedbackProcessor(
+        session_manager=session_manager,
+        workflow_type="idea-validation",
+        workflow_stages=stages,
+        system_goal="A habit tracker",
+    )
+    started, completed = [], []
+    route = FeedbackRouteResult(affected_stages=affected, reasoning="test")
+    with (
+        mock.patch("haytham.feedback.feedback_processor.execute_revision", fake),
+        mock.patch.object(processor, "_route_feedback", return_value=route),
+    ):
+        result = processor.process_feedback(
+            "Focus on B2B",
+            on_stage_start=started.append,
+            on_stage_complete=completed.append,
+        )
+    return result, started, completed
+
+
+class TestFeedbackProcessor:
+    def test_revises_downstream_in_dependency_order(self):
+        fake = FakeRevisions()
+        result, started, _ = run_processor(["market-context"], fake)
+
+        assert result.status == "completed"
+        assert result.revised_stages == [
+            "market-context",
+            "risk-assessment",
+            "pivot-strategy",
+            "validation-summary",
+        ]
+        assert started.index("market-context") < started.index("risk-assessment")
+        assert started.index("pivot-strategy") < started.index("validation-summary")
+        # Only the affected stage gets the feedback text
+        feedback_by_stage = {slug: feedback for slug, feedback, _ in fake.calls}
+        assert feedback_by_stage["market-context"] == "Focus on B2B"
+        assert feedback_by_stage["risk-assessment"] is None
+
+    def test_independent_stages_run_concurrently(self):
+        fake = FakeRevisions(delay=0.2)
+        stages = ["mvp-scope", "capability-model", "build-buy-analysis"]
+        with mock.patch(
+            "haytham.feedback.feedback_processor.get_stage_dependencies",
+            return_value={"mvp-scope": [], "capability-model": [], "build-buy-analysis": []},
+        ):
+            result, _, _ = run_processor(stages, fake, stages=stages)
+
+        assert result.revised_stages == stages
+        assert fake.max_active == 3
+
+    def test_early_cutoff_when_output_unchanged(self):
+        fake = FakeRevisions(unchanged={"market-context"})
+        result, started, completed = run_processor(["market-context"], fake)
+
+        assert result.revised_stages == ["market-context"]
+        assert result.skipped_stages == ["risk-assessment", "pivot-strategy", "validation-summary"]
+        assert result.success
+        assert started == ["market-context"]
+        assert sorted(completed) == sorted(["market-context", *result.skipped_stages])
+
+    def test_failed_revision_blocks_dependents(self):
+        fake = FakeRevisions(failing={"market-context"})
+        result, started, completed = run_processor(["market-context"], fake)
+
+        assert result.status == "failed"
+        assert result.revised_stages == []
+        assert result.skipped_stages == []
+        assert started == ["market-context"]
+        blocked = {
+            r.stage_slug: r for r in result.revision_results if r.stage_slug != "market-context"
+        }
+        assert not any(r.success for r in blocked.values())
+        assert blocked["risk-assessment"].error == "Upstream stage 'market-context' revision failed"
+        assert sorted(completed) == sorted(IDEA_VALIDATION_STAGES[1:])
+
+    def test_cascade_context_only_from_changed_upstream(self):
+        fake = FakeRevisions(unchanged={"risk-assessment"})
+        result, _, _ = run_processor(["market-context"], fake)
+
+        # validation-summary still reads the changed market-context
+        assert "validation-summary" in result.revised_stages
+        # pivot-strategy reads risk-assessment (unchanged) and market-context (changed)
+        contexts = {slug: context for slug, _, context in fake.calls}
+        assert "output of market-context" in contexts["validation-summary"]
+        assert "output of risk-assessment" not in contexts["validation-summary"]
+
+
+class TestOutputFingerprint:
+    def test_ignores_formatting_only_changes(self):
+        before = "## Risks\n\n* Churn is high\n*   Pricing unclear\n"
+        after = "## Risks\n- Churn is high\n\n- Pricing unclear"
+        assert output_fingerprint(before) == output_fingerprint(after)
+
+    @pytest.mark.parametrize("after", ["## Risks\n- Churn is low", "## Risks\n- churn is high"])
+    def test_detects_content_changes(self, after):
+        assert output_fingerprint("## Risks\n- Churn is high") != output_fingerprint(after)
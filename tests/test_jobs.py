@@ -0,0 +1,211 @@
+"""Tests for the headless job runner (haytham.jobs).
+
+Covers the on-disk job store, run_job against a per-job session directory,
+and JobRunner draining the queue in worker processes. Workflows are
+replaced with a fake; no LLM calls.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, wait
+from unittest import mock
+
+import pytest
+from burr.core import State
+
+from haytham.jobs import JobRunner, JobStore, run_job
+from haytham.jobs.runner import _LOCK_FILE
+from haytham.jobs.store import CANCELLED, COMPLETED, FAILED, QUEUED, RUNNING
+from haytham.workflow.dag_executor import DagRunResult
+
+
+def fake_run_workflows(workflow_types, session_manager, system_goal=None, **kwargs):
+    """Stand-in for run_workflows; fails ideas containing "fail"."""
+    status = "failed" if "fail" in system_goal else "completed"
+    (session_manager.session_dir / "ran.txt").write_text(system_goal)
+    return DagRunResult(
+        state=State({}),
+        statuses={"idea_analysis": status},
+        errors={"idea_analysis": "boom"} if status == "failed" else {},
+    )
+
+
+def crashing_run_workflows(workflow_types, session_manager, system_goal=None, **kwargs):
+    """Kills its worker on the first attempt at a "crash" idea; others take a while."""
+    marker = session_manager.session_dir.parent / "crashed"
+    if "crash" in system_goal and not marker.exists():
+        marker.touch()
+        os._exit(1)
+    time.sleep(0.5)
+    return fake_run_workflows(workflow_types, session_manager, system_goal, **kwargs)
+
+
+def one_at_a_time_wait(fs, timeout=None, return_when=ALL_COMPLETED):
+    """concurrent.futures.wait that reports one future per FIRST_COMPLETED wait."""
+    done, pending = wait(fs, timeout=timeout, return_when=return_when)
+    if return_when == FIRST_COMPLETED and len(done) > 1:
+        first = next(iter(done))
+        return {first}, (done - {first}) | pending
+    return done, pending
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(tmp_path / "jobs")
+
+
+@pytest.fixture
+def fake_workflows():
+    with mock.patch("haytham.workflow.dag_executor.run_workflows", fake_run_workflows):
+        yield
+
+
+class TestJobStore:
+    def test_submit_and_get(self, store):
+        job = store.submit("  A habit tracker  ", workflows=["idea-validation"])
+
+        loaded = store.get(job.id)
+        assert loaded == job
+        assert loaded.idea == "A habit tracker"
+        assert loaded.status == QUEUED
+        assert (store.job_dir(job.id) / "job.json").exists()
+
+    def test_defaults_to_all_workflows(self, store):
+        job = store.submit("idea")
+        assert job.workflows[0] == "idea-validation"
+        assert job.workflows[-1] == "story-generation"
+
+    def test_rejects_unknown_workflow(self, store):
+        with pytest.raises(ValueError):
+            store.submit("idea", workflows=["nonsense"])
+        assert store.list() == []
+
+    def test_cancel_only_queued(self, store):
+        job = store.submit("idea")
+        assert store.cancel(job.id)
+        assert store.get(job.id).status == CANCELLED
+        assert not store.cancel(job.id)
+
+    def test_claim_only_queued(self, store):
+        job = store.submit("idea")
+        assert store.claim(job.id).attempts == 1
+        assert store.claim(job.id) is None
+        assert not store.cancel(job.id)
+        assert store.get(job.id).status == RUNNING
+
+    def test_cancel_waits_for_job_lock(self, store):
+        job = store.submit("idea")
+        cancelled = []
+        with store.locked(job.id):
+            thread = threading.Thread(target=lambda: cancelled.append(store.cancel(job.id)))
+            thread.start()
+            thread.join(timeout=0.2)
+            assert thread.is_alive()
+            loaded = store.get(job.id)
+            loaded.status = RUNNING
+            store.save(loaded)
+        thread.join(timeout=5)
+        assert cancelled == [False]
+
+    def test_counts(self, store):
+        store.submit("one")
+        store.cancel(store.submit("two").id)
+        assert store.counts()[QUEUED] == 1
+        assert store.counts()[CANCELLED] == 1
+
+    def test_requeue_stale(self, store):
+        dead, alive = store.submit("dead"), store.submit("alive")
+        for job, pid in ((dead, 2**22 + 12345), (alive, os.getpid())):
+            job.status = RUNNING
+            job.worker_pid = pid
+            store.save(job)
+
+        with mock.patch("haytham.jobs.store._pid_alive", lambda pid: pid == os.getpid()):
+            requeued = store.requeue_stale()
+
+        assert [job.id for job in requeued] == [dead.id]
+        assert store.get(dead.id).status == QUEUED
+        assert store.get(alive.id).status == RUNNING
+
+
+class TestRunJob:
+    def test_runs_in_job_session(self, store, fake_workflows):
+        job = store.submit("A habit tracker", workflows=["idea-validation"])
+        store.claim(job.id)
+
+        result = run_job(str(store.root), job.id)
+
+        session_dir = store.job_dir(job.id) / "session"
+        assert result.status == COMPLETED
+        assert (session_dir / "ran.txt").read_text() == "A habit tracker"
+        assert store.get(job.id).stage_statuses == {"idea_analysis": "completed"}
+        assert store.get(job.id).worker_pid == os.getpid()
+        assert (store.job_dir(job.id) / "job.log").exists()
+
+    def test_failed_workflow_recorded(self, store, fake_workflows):
+        job = store.submit("please fail", workflows=["idea-validation"])
+        store.claim(job.id)
+
+        result = run_job(str(store.root), job.id)
+
+        assert result.status == FAILED
+        assert store.get(job.id).error == "idea_analysis: boom"
+
+    def test_skips_job_no_longer_running(self, store, fake_workflows):
+        job = store.submit("A habit tracker", workflows=["idea-validation"])
+        store.cancel(job.id)
+
+        result = run_job(str(store.root), job.id)
+
+        assert result.status == CANCELLED
+        assert result.worker_pid is None
+        assert not (store.job_dir(job.id) / "session").exists()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork to share the fake"
+)
+class TestJobRunner:
+    def test_drains_queue_in_worker_processes(self, store, fake_workflows):
+        ids = [store.submit(f"idea {i}", workflows=["idea-validation"]).id for i in range(3)]
+        failing = store.submit("please fail", workflows=["idea-validation"]).id
+
+        runner = JobRunner(
+            store, max_workers=2, poll_interval=0.05, mp_context=multiprocessing.get_context("fork")
+        )
+        finished = runner.run()
+
+        assert sorted(job.id for job in finished) == sorted([*ids, failing])
+        assert {store.get(i).status for i in ids} == {COMPLETED}
+        assert store.get(failing).status == FAILED
+        assert all(store.get(i).worker_pid != os.getpid() for i in ids)
+        assert not (store.root / _LOCK_FILE).exists()
+
+    def test_broken_pool_requeues_every_running_job(self, store):
+        crash = store.submit("crash", workflows=["idea-validation"]).id
+        slow = store.submit("slow idea", workflows=["idea-validation"]).id
+
+        runner = JobRunner(
+            store, max_workers=2, poll_interval=0.05, mp_context=multiprocessing.get_context("fork")
+        )
+        with (
+            mock.patch("haytham.workflow.dag_executor.run_workflows", crashing_run_workflows),
+            mock.patch("haytham.jobs.runner.wait", one_at_a_time_wait),
+        ):
+            runner.run()
+
+        assert store.get(crash).status == COMPLETED
+        assert store.get(slow).status == COMPLETED
+        assert store.get(slow).attempts == 2
+
+    def test_refuses_second_runner(self, store):
+        (store.root / _LOCK_FILE).write_text(str(os.getpid()))
+        with pytest.raises(RuntimeError, match="Another job runner"):
+            JobRunner(store, max_workers=1).run()
+
+    def test_clears_lock_from_dead_runner(self, store):
+        (store.root / _LOCK_FILE).write_text("999999999")
+        with mock.patch("haytham.jobs.runner._pid_alive", return_value=False):
+            assert JobRunner(store, max_workers=1).run() == []
@@ -0,0 +1,188 @@
+"""Tests for haytham.agents.utils.llm_scheduler.
+
+Covers lane settings resolution, AIMD limit adjustment, the token bucket,
+concurrency bounds under threads, and run_agent's throttling retries.
+"""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from haytham.agents.utils.llm_scheduler import (
+    Lane,
+    LaneSettings,
+    LLMScheduler,
+    is_throttling_error,
+    reset_llm_scheduler,
+)
+from haytham.workflow.agent_runner import _is_token_limit_error, run_agent
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ("LLM_MAX_CONCURRENCY", "LLM_INITIAL_CONCURRENCY", "LLM_REQUESTS_PER_MINUTE"):
+        monkeypatch.delenv(name, raising=False)
+    reset_llm_scheduler()
+    yield
+    reset_llm_scheduler()
+
+
+def _lane(max_concurrency=8, initial=2, rpm=0.0) -> Lane:
+    return Lane(LaneSettings(max_concurrency, initial, rpm))
+
+
+class ThrottlingException(Exception):
+    pass
+
+
+class TestLaneSettings:
+    def test_defaults(self):
+        settings = LaneSettings.from_env("bedrock", "heavy")
+        assert settings == LaneSettings(16, 4, 50)
+
+    def test_lane_specific_overrides_global(self, monkeypatch):
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY", "10")
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY_BEDROCK_HEAVY", "3")
+        monkeypatch.setenv("LLM_REQUESTS_PER_MINUTE_BEDROCK", "120")
+
+        heavy = LaneSettings.from_env("bedrock", "heavy")
+        light = LaneSettings.from_env("bedrock", "light")
+
+        assert heavy.max_concurrency == 3
+        assert heavy.initial_concurrency == 3  # clamped to the ceiling
+        assert light.max_concurrency == 10
+        assert heavy.requests_per_minute == light.requests_per_minute == 120
+
+    def test_invalid_value_falls_back(self, monkeypatch):
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY", "many")
+        assert LaneSettings.from_env("openai", "light").max_concurrency == 16
+
+
+class TestThrottlingClassification:
+    def test_by_type_and_message(self):
+        assert is_throttling_error(ThrottlingException("slow down"))
+        assert is_throttling_error(RuntimeError("Too many requests, please wait"))
+        assert not is_throttling_error(RuntimeError("connection reset"))
+
+    def test_walks_cause_chain(self):
+        try:
+            try:
+                raise ThrottlingException("quota")
+            except ThrottlingException as inner:
+                raise RuntimeError("event loop failed") from inner
+        except RuntimeError as outer:
+            assert is_throttling_error(outer)
+
+    def test_too_many_tokens_is_not_a_token_limit_error(self):
+        error = RuntimeError("ThrottlingException: Too many tokens, please wait")
+        assert not _is_token_limit_error(error)
+
+
+class TestAIMD:
+    def test_success_increases_additively(self):
+        lane = _lane(initial=2)
+        lane.acquire()
+        lane.release("ok")
+        assert lane.limit == pytest.approx(2.5)
+
+    def test_throttle_halves_once_per_cooldown(self):
+        lane = _lane(initial=8)
+        for _ in range(2):
+            lane.acquire()
+            lane.release("throttled")
+        assert lane.limit == 4
+        assert lane.stats().throttled == 2
+
+    def test_limit_bounded(self):
+        lane = _lane(max_concurrency=3, initial=3)
+        for _ in range(10):
+            lane.acquire()
+            lane.release("ok")
+        assert lane.limit == 3
+
+    def test_errors_do_not_change_limit(self):
+        lane = _lane(initial=2)
+        lane.acquire()
+        lane.release("error")
+        assert lane.limit == 2
+        assert lane.stats().failed == 1
+
+
+class TestAdmission:
+    def test_concurrency_never_exceeds_limit(self):
+        scheduler = LLMScheduler()
+        lane = scheduler.lane("light", "ollama")
+        lane._limit = 2.0
+        lane.settings = LaneSettings(2, 2, 0)
+        peak = 0
+        current = 0
+        lock = threading.Lock()
+
+        def call():
+            nonlocal peak, current
+            with scheduler.slot("light", "ollama"):
+                with lock:
+                    current += 1
+                    peak = max(peak, current)
+                time.sleep(0.02)
+                with lock:
+                    current -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = lane.stats()
+        assert peak == 2
+        assert stats.completed == 6
+        assert stats.max_queue_depth >= 3
+        assert stats.in_flight == 0
+
+    def test_token_bucket_paces_calls(self):
+        lane = _lane(max_concurrency=1, initial=1, rpm=1200)  # 20/s, burst 1
+        started = time.monotonic()
+        for _ in range(3):
+            lane.acquire()
+            lane.release("ok")
+        assert time.monotonic() - started >= 0.09
+
+    def test_slot_records_throttle(self):
+        scheduler = LLMScheduler()
+        with pytest.raises(ThrottlingException):
+            with scheduler.slot("heavy", "bedrock"):
+                raise ThrottlingException("rate exceeded")
+        assert scheduler.metrics()["bedrock/heavy"].throttled == 1
+
+    def test_slot_is_reentrant_per_thread(self):
+        scheduler = LLMScheduler()
+        scheduler.lane("light", "ollama")._limit = 1.0
+        with scheduler.slot("light", "ollama"):
+            with scheduler.slot("light", "ollama"):
+                pass
+        assert scheduler.metrics()["ollama/light"].completed == 1
+
+    def test_worker_count_capped_by_lane(self, monkeypatch):
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY", "5")
+        scheduler = LLMScheduler()
+        assert scheduler.worker_count(25, "light", "bedrock") == 5
+        assert scheduler.worker_count(2, "light", "bedrock") == 2
+
+
+class TestRunAgentRetries:
+    @mock.patch("haytham.workflow.agent_runner.time.sleep")
+    @mock.patch("haytham.agents.factory.agent_factory.create_agent_by_name")
+    def test_throttled_call_retried(self, mock_create, mock_sleep, monkeypatch):
+        monkeypatch.setenv("LLM_PROVIDER", "bedrock")
+        agent = mock.MagicMock(side_effect=[ThrottlingException("Too many tokens"), "result"])
+        mock_create.return_value = agent
+
+        with mock.patch("haytham.agents.output_utils.extract_text_from_result", return_value="ok"):
+            result = run_agent("concept_expansion", "q", {}, use_cache=False)
+
+        assert result["status"] == "completed"
+        assert agent.call_count == 2
+        assert mock_sleep.call_count == 1
@@ -0,0 +1,173 @@
+"""Tests for the background log writer and the loggers that use it."""
+
+import gzip
+import json
+import threading
+from unittest import mock
+
+import pytest
+
+from haytham.agents.utils.log_writer import (
+    LogWriter,
+    LogWriterSettings,
+    get_log_writer,
+    reset_log_writer,
+)
+from haytham.agents.utils.logging_utils import AgentLogger, SessionManager
+from haytham.agents.utils.phase_logger import StageLogger
+
+
+@pytest.fixture
+def writer():
+    w = LogWriter(settings=LogWriterSettings(flush_interval=0.05))
+    yield w
+    w.close()
+
+
+class TestLogWriter:
+    def test_appends_in_order_after_flush(self, writer, tmp_path):
+        path = tmp_path / "nested" / "agent.log"
+        for i in range(50):
+            writer.append(path, f"{i}\n")
+
+        assert writer.flush()
+        assert path.read_text().splitlines() == [str(i) for i in range(50)]
+        # Queued entries were coalesced into far fewer batches than writes
+        assert writer.batches < 50
+
+    def test_append_does_not_wait_for_disk(self, writer, tmp_path):
+        release = threading.Event()
+        original = writer._append
+
+        def slow_append(path, text):
+            release.wait(5)
+            original(path, text)
+
+        with mock.patch.object(writer, "_append", slow_append):
+            writer.append(tmp_path / "a.log", "first\n")
+            writer.append(tmp_path / "a.log", "second\n")  # returns while the disk is "stuck"
+            release.set()
+            writer.flush()
+
+        assert (tmp_path / "a.log").read_text() == "first\nsecond\n"
+
+    def test_replace_lands_after_earlier_appends(self, writer, tmp_path):
+        path = tmp_path / "metrics.json"
+        writer.append(path, "partial")
+        writer.replace(path, '{"done": true}')
+        writer.flush()
+
+        assert json.loads(path.read_text()) == {"done": True}
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_rotates_and_compresses(self, tmp_path):
+        settings = LogWriterSettings(flush_interval=0, max_bytes=100, backup_count=2)
+        writer = LogWriter(background=False, settings=settings)
+        path = tmp_path / "agent.log"
+        for chunk in "abcd":
+            writer.append(path, chunk * 60)
+
+        assert writer.rotations == 3
+        assert path.read_text() == "d" * 60
+        with gzip.open(tmp_path / "agent.log.1.gz", "rt") as f:
+            assert f.read() == "c" * 60
+        with gzip.open(tmp_path / "agent.log.2.gz", "rt") as f:
+            assert f.read() == "b" * 60
+        assert not (tmp_path / "agent.log.3.gz").exists()
+
+    def test_rotation_without_compression(self, tmp_path):
+        settings = LogWriterSettings(max_bytes=10, backup_count=1, compress_rotated=False)
+        writer = LogWriter(background=False, settings=settings)
+        path = tmp_path / "events.jsonl"
+        writer.append(path, "x" * 8)
+        writer.append(path, "y" * 8)
+
+        assert (tmp_path / "events.jsonl.1").read_text() == "x" * 8
+        assert path.read_text() == "y" * 8
+
+    def test_write_errors_are_not_raised(self, writer, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        writer.append(blocker / "agent.log", "entry")
+        assert writer.flush()
+
+    @pytest.mark.parametrize("background", [True, False])
+    def test_unencodable_text_does_not_stop_the_batch(self, tmp_path, background):
+        writer = LogWriter(background, LogWriterSettings(flush_interval=0.05))
+        writer.append(tmp_path / "bad.log", "lone \ud800 surrogate")
+        writer.append(tmp_path / "good.log", "entry")
+        writer.replace(tmp_path / "status.json", '{"x": "\udc80"}')
+        assert writer.flush(timeout=2)
+        writer.close()
+        assert (tmp_path / "bad.log").read_text() == "lone ? surrogate"
+        assert (tmp_path / "good.log").read_text() == "entry"
+        assert (tmp_path / "status.json").exists()
+
+    def test_failed_write_does_not_stop_the_thread(self, writer, tmp_path):
+        with mock.patch.object(writer, "_blob", side_effect=RuntimeError("boom")):
+            writer.write_blob(tmp_path / "body.gz", "payload")
+            writer.append(tmp_path / "agent.log", "entry")
+            assert writer.flush(timeout=2)
+        writer.append(tmp_path / "agent.log", "+more")
+        assert writer.flush(timeout=2)
+        assert (tmp_path / "agent.log").read_text() == "entry+more"
+
+    def test_close_flushes_pending_writes(self, tmp_path):
+        writer = LogWriter(settings=LogWriterSettings(flush_interval=1.0))
+        writer.append(tmp_path / "a.log", "pending")
+        writer.close()
+        assert (tmp_path / "a.log").read_text() == "pending"
+        # Writes after close fall back to inline
+        writer.append(tmp_path / "a.log", "+inline")
+        assert (tmp_path / "a.log").read_text() == "pending+inline"
+
+    def test_shared_writer_settings_from_env(self, monkeypatch):
+        reset_log_writer()
+        monkeypatch.setenv("LOG_WRITER_ASYNC", "false")
+        monkeypatch.setenv("LOG_MAX_BYTES", "not-a-number")
+        try:
+            writer = get_log_writer()
+            assert writer.background is False
+            assert writer.settings.max_bytes == LogWriterSettings().max_bytes
+            assert get_log_writer() is writer
+        finally:
+            reset_log_writer()
+
+
+class TestLoggersWithBackgroundWriter:
+    def test_stage_logger_reads_flush(self, writer, tmp_path):
+        stage_logger = StageLogger(base_log_dir=tmp_path, writer=writer)
+        stage_logger.log_stage_start("idea-analysis", "Idea Analysis")
+        stage_logger.log_stage_complete("idea-analysis", "Idea Analysis", 1.5)
+
+        metrics = stage_logger.get_stage_metrics("idea-analysis")
+
+        assert metrics["status"] == "completed"
+        events = (tmp_path / "idea-analysis" / "stage_events.jsonl").read_text().splitlines()
+        assert [json.loads(line)["event_type"] for line in events] == [
+            "stage_start",
+            "stage_complete",
+        ]
+
+    def test_agent_logger_compresses_large_bodies(self, writer, tmp_path):
+        sessions = SessionManager(base_log_dir=str(tmp_path))
+        sessions.start_session()
+        agent_logger = AgentLogger(
+            "market_intelligence", sessions, writer=writer, compress_over=100
+        )
+
+        agent_logger.log_llm_input("short prompt")
+        agent_logger.log_llm_output("r" * 500)
+        agent_logger.write_token_summary()
+        writer.flush()
+
+        session_dir = sessions.get_session_dir()
+        log_text = (session_dir / "market_intelligence.log").read_text()
+        assert "short prompt" in log_text
+        assert "r" * 500 not in log_text
+        assert "[500 chars, gzip-compressed: market_intelligence_bodies/" in log_text
+        (body_file,) = (session_dir / "market_intelligence_bodies").iterdir()
+        with gzip.open(body_file, "rt") as f:
+            assert f.read() == "r" * 500
+        summary = json.loads((session_dir / "market_intelligence_token_summary.json").read_text())
+        assert summary["output_tokens"] == 125
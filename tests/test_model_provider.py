@@ -1,12 +1,14 @@
 """Tests for multi-provider LLM model factory."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import boto3
 import pytest
 
 from haytham.agents.utils.model_provider import (
     _PROVIDER_FACTORIES,
     LLMProvider,
+    ModelClientPool,
     create_model,
     create_model_for_file_operations,
     get_active_provider,
@@ -165,3 +167,72 @@ class TestCreateModelForFileOperations:
         monkeypatch.setitem(_PROVIDER_FACTORIES, LLMProvider.ANTHROPIC, mock)
         create_model_for_file_operations(model_id="claude-sonnet-4-20250514")
         mock.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# ModelClientPool
+# ---------------------------------------------------------------------------
+
+
+class TestModelClientPool:
+    @pytest.fixture(autouse=True)
+    def _bedrock_env(self, monkeypatch):
+        monkeypatch.setenv("AWS_REGION", "us-east-1")
+        monkeypatch.delenv("AWS_PROFILE", raising=False)
+        monkeypatch.delenv("MODEL_CLIENT_MAX_CONNECTIONS", raising=False)
+
+    def test_same_config_shares_client(self):
+        pool = ModelClientPool()
+        first = pool.bedrock_model(model_id="m1", max_tokens=100)
+        second = pool.bedrock_model(model_id="m2", max_tokens=200, temperature=0.1)
+
+        assert first.client is second.client
+        assert second.config["model_id"] == "m2"
+        assert len(pool) == 1
+
+    def test_client_built_once_per_key(self):
+        pool = ModelClientPool()
+        real_client = boto3.session.Session.client
+        with patch.object(
+            boto3.session.Session, "client", autospec=True, side_effect=real_client
+        ) as client:
+            for model_id in ("m1", "m2", "m3"):
+                pool.bedrock_model(model_id=model_id)
+
+        assert client.call_count == 1
+
+    def test_timeouts_and_region_key_the_pool(self):
+        pool = ModelClientPool()
+        default = pool.bedrock_model(model_id="m")
+        file_ops = pool.bedrock_model(model_id="m", read_timeout=600.0)
+        other_region = pool.bedrock_model(model_id="m", region_name="eu-west-1")
+
+        assert file_ops.client is not default.client
+        assert file_ops.client.meta.config.read_timeout == 600.0
+        assert other_region.client.meta.region_name == "eu-west-1"
+        assert len(pool) == 3
+
+    def test_max_connections_from_env(self, monkeypatch):
+        monkeypatch.setenv("MODEL_CLIENT_MAX_CONNECTIONS", "64")
+        model = ModelClientPool().bedrock_model(model_id="m")
+        assert model.client.meta.config.max_pool_connections == 64
+
+    def test_invalid_max_connections_uses_default(self, monkeypatch):
+        monkeypatch.setenv("MODEL_CLIENT_MAX_CONNECTIONS", "lots")
+        assert ModelClientPool().max_connections == 32
+
+    def test_custom_endpoint_not_pooled(self):
+        pool = ModelClientPool()
+        model = pool.bedrock_model(model_id="m", endpoint_url="https://vpce.example.com")
+
+        assert model.client.meta.endpoint_url == "https://vpce.example.com"
+        assert len(pool) == 0
+
+    def test_create_model_uses_pool(self, monkeypatch):
+        monkeypatch.setenv("LLM_PROVIDER", "bedrock")
+        monkeypatch.setattr("haytham.agents.utils.model_provider._client_pool", ModelClientPool())
+
+        first = create_model(model_id="m1")
+        second = create_model(model_id="m2", tier="heavy")
+
+        assert first.client is second.client
@@ -25,6 +25,8 @@ from haytham.project.id_generator import (
     next_task_id,
 )
 from haytham.project.project_state import PipelineStateManager
+from haytham.project.state_index import get_state_index, invalidate_state_index
+from haytham.project.state_journal import MutationJournal
 from haytham.project.state_models import (
     Ambiguity,
     Decision,
@@ -37,6 +39,7 @@ from haytham.project.state_models import (
 )
 from haytham.project.state_queries import StateQueries
 from haytham.project.state_updater import StateUpdater
+from haytham.project.yaml_store import load_yaml, write_yaml
 
 # ========== Fixtures ==========
 
@@ -511,6 +514,284 @@ class TestStateUpdater:
         assert notes_app_state.stories[2].ambiguities[0].resolution == "Title and content"
 
 
+# ========== State Index Tests ==========
+
+
+class TestStateIndex:
+    """Test the shared lookup index behind StateQueries."""
+
+    def test_index_shared_across_queries(self, notes_app_state):
+        """All StateQueries on one state share one index."""
+        assert StateQueries(notes_app_state).index is StateQueries(notes_app_state).index
+
+    def test_updater_keeps_status_buckets_current(self, notes_app_state):
+        """Status changes through StateUpdater move objects between buckets."""
+        queries = StateQueries(notes_app_state)
+        updater = StateUpdater(notes_app_state, lambda s: None)
+        pending_before = [s.id for s in queries.get_pending_stories()]
+
+        updater.update_story_status("S-001", "completed")
+
+        assert "S-001" not in [s.id for s in queries.get_pending_stories()]
+        assert [s.id for s in queries.get_completed_stories()] == ["S-001"]
+        assert len(queries.get_pending_stories()) == len(pending_before) - 1
+
+    def test_added_task_visible_without_rebuild(self, notes_app_state):
+        """Tasks added through StateUpdater are indexed incrementally."""
+        queries = StateQueries(notes_app_state)
+        index = queries.index
+        updater = StateUpdater(notes_app_state, lambda s: None)
+
+        task = updater.add_task(Task(story_id="S-002", title="List notes"))
+
+        assert queries.index is index
+        assert queries.get_task(task.id) is task
+        assert queries.get_story_tasks("S-002")[-1] is task
+        assert task in queries.get_pending_tasks()
+
+    def test_entity_rename_rekeys_name(self, notes_app_state):
+        """Renaming an entity updates name lookups."""
+        queries = StateQueries(notes_app_state)
+        updater = StateUpdater(notes_app_state, lambda s: None)
+
+        updater.update_entity("E-002", name="Memo")
+
+        assert queries.get_entity_by_name("Memo").id == "E-002"
+        assert not queries.entity_exists("Note")
+
+    def test_decisions_by_target(self, notes_app_state):
+        """Decisions are indexed by every ID they affect."""
+        queries = StateQueries(notes_app_state)
+        updater = StateUpdater(notes_app_state, lambda s: None)
+
+        decision = updater.add_decision(
+            Decision(title="Soft delete", rationale="Undo", affects=["E-002", "S-001", "E-002"])
+        )
+
+        assert decision in queries.get_decisions_affecting("S-001")
+        assert queries.get_decisions_affecting("E-002").count(decision) == 1
+
+    def test_direct_list_changes_trigger_rebuild(self, notes_app_state):
+        """Appending or replacing lists outside StateUpdater is detected."""
+        queries = StateQueries(notes_app_state)
+        assert queries.get_entity("E-003") is None
+
+        notes_app_state.entities.append(Entity(id="E-003", name="Tag"))
+        assert queries.get_entity("E-003").name == "Tag"
+
+        notes_app_state.stories = []
+        assert queries.get_story("S-001") is None
+
+    def test_status_order_follows_state_order(self, notes_app_state):
+        """Bucket results keep state list order after status moves."""
+        updater = StateUpdater(notes_app_state, lambda s: None)
+        queries = StateQueries(notes_app_state)
+        ids = [s.id for s in notes_app_state.stories]
+
+        for story_id in reversed(ids):
+            updater.update_story_status(story_id, "designed")
+
+        assert [s.id for s in queries.get_stories_by_status("designed")] == ids
+
+    def test_invalidate_after_direct_field_change(self, notes_app_state):
+        """Direct field assignments need an explicit invalidate."""
+        queries = StateQueries(notes_app_state)
+        notes_app_state.stories[0].status = "completed"
+        invalidate_state_index(notes_app_state)
+        assert notes_app_state.stories[0] in queries.get_completed_stories()
+
+    def test_copied_state_gets_own_index(self, notes_app_state):
+        """A model copy never reuses the original state's index."""
+        original = get_state_index(notes_app_state)
+        copy = notes_app_state.model_copy()
+        assert get_state_index(copy) is not original
+        assert get_state_index(copy).state is copy
+
+
+# ========== Write Batching & Journal Tests ==========
+
+
+class TestWriteBatchingAndJournal:
+    """Test batched saves, the mutation journal and atomic project.yaml writes."""
+
+    @pytest.fixture
+    def counting_save(self):
+        calls = []
+        return calls, calls.append
+
+    def test_batch_saves_once(self, notes_app_state, counting_save):
+        """Updates inside batch() save once when the block exits."""
+        calls, save = counting_save
+        updater = StateUpdater(notes_app_state, save)
+
+        with updater.batch():
+            updater.update_story_status("S-001", "completed")
+            updater.set_current("S-002", "interpretation")
+            assert calls == []
+
+        assert len(calls) == 1
+
+    def test_nested_batches_and_other_updaters_join(self, notes_app_state, counting_save):
+        """Nested blocks and other updaters on the same state share one batch."""
+        calls, save = counting_save
+        updater = StateUpdater(notes_app_state, save)
+
+        with updater.batch():
+            with updater.batch():
+                updater.update_story_status("S-001", "completed")
+            StateUpdater(notes_app_state, save).add_task(Task(story_id="S-001", title="X"))
+            assert calls == []
+
+        assert len(calls) == 1
+
+    def test_batch_saves_on_exception(self, notes_app_state, counting_save):
+        """Completed updates are saved even when the block raises."""
+        calls, save = counting_save
+        updater = StateUpdater(notes_app_state, save)
+
+        with pytest.raises(RuntimeError):
+            with updater.batch():
+                updater.update_story_status("S-001", "completed")
+                raise RuntimeError("boom")
+
+        assert len(calls) == 1
+        assert notes_app_state._batch is None
+
+    def test_journal_replayed_after_crash(self, temp_project_yaml, notes_app_state):
+        """Mutations of an unfinished batch survive without a project.yaml rewrite."""
+        manager = PipelineStateManager(temp_project_yaml.parent)
+        manager.save_pipeline_state(notes_app_state)
+        state = manager.load_pipeline_state()
+        updater = StateUpdater(state, manager.save_pipeline_state)
+
+        with updater.batch():
+            updater.update_story_status("S-001", "completed")
+            entity = updater.add_entity(Entity(name="Tag"))
+            updater.update_entity(entity.id, status="implemented", file_path="models/tag.py")
+            updater.add_decision(Decision(title="Use tags", rationale="Grouping"))
+            before = yaml.safe_load(temp_project_yaml.read_text())
+
+            # A fresh process (after a crash here) sees every change
+            loaded = PipelineStateManager(temp_project_yaml.parent).load_pipeline_state()
+
+        assert before["pipeline"]["stories"][0]["status"] == "pending"
+        assert loaded.model_dump() == state.model_dump()
+
+    def test_replay_skips_entries_in_snapshot(self, temp_project_yaml, notes_app_state):
+        """A crash before the journal is truncated never applies twice."""
+        manager = PipelineStateManager(temp_project_yaml.parent)
+        manager.save_pipeline_state(notes_app_state)
+        state = manager.load_pipeline_state()
+        updater = StateUpdater(state, manager.save_pipeline_state)
+        with updater.batch():
+            updater.add_task(Task(story_id="S-001", title="Create note"))
+            journal_text = manager.journal.path.read_text()
+
+        manager.journal.path.write_text(journal_text)  # truncate "never happened"
+
+        loaded = PipelineStateManager(temp_project_yaml.parent).load_pipeline_state()
+        assert len(loaded.tasks) == len(state.tasks)
+
+    def test_torn_last_line_ignored(self, temp_session_dir):
+        """An incomplete trailing entry from a crash mid-append is skipped."""
+        journal = MutationJournal(temp_session_dir / "journal.jsonl")
+        journal.append("clear_current", {})
+        with open(journal.path, "a") as f:
+            f.write('{"seq": 2, "op": "set_cur')
+
+        assert [e["seq"] for e in journal.read()] == [1]
+
+    def test_saved_on_every_mutation_outside_batch(self, temp_project_yaml):
+        """Readers of project.yaml see each change made outside a batch at once."""
+        manager = PipelineStateManager(temp_project_yaml.parent)
+        state = manager.initialize_pipeline_state()
+        updater = StateUpdater(state, manager.save_pipeline_state)
+
+        updater.add_story(Story(title="Story 0", user_story="As a user..."))
+
+        data = yaml.safe_load(temp_project_yaml.read_text())
+        assert len(data["pipeline"]["stories"]) == 1
+        assert not manager.journal.path.exists()
+
+    def test_managers_share_the_journal(self, temp_project_yaml, notes_app_state):
+        """Managers for one session never assign the same sequence number."""
+        first = PipelineStateManager(temp_project_yaml.parent)
+        second = PipelineStateManager(temp_project_yaml.parent)
+        assert first.journal is second.journal
+
+        first.save_pipeline_state(notes_app_state)
+        a = first.load_pipeline_state()
+        b = second.load_pipeline_state()
+        with StateUpdater(a, first.save_pipeline_state).batch() as updater:
+            updater.clear_current()
+            with StateUpdater(b, second.save_pipeline_state).batch() as other:
+                other.set_current("S-001", "task-generation")
+                seqs = [entry["seq"] for entry in first.journal.read()]
+
+        assert seqs == [1, 2]
+
+    def test_atomic_write_leaves_no_temp_files(self, temp_project_yaml, notes_app_state):
+        """Saving replaces project.yaml without leaving temp files behind."""
+        manager = PipelineStateManager(temp_project_yaml.parent)
+        manager.save_pipeline_state(notes_app_state)
+
+        assert sorted(p.name for p in temp_project_yaml.parent.iterdir()) == ["project.yaml"]
+
+
+# ========== Cached YAML Store Tests ==========
+
+
+class TestYamlStore:
+    """Test the mtime/size-validated project.yaml parse cache."""
+
+    def test_unchanged_file_parsed_once(self, temp_project_yaml, monkeypatch):
+        """Repeated loads of an unchanged file reuse the cached parse."""
+        calls = []
+        real_load = yaml.load
+        monkeypatch.setattr(yaml, "load", lambda *a, **kw: calls.append(1) or real_load(*a, **kw))
+
+        first = load_yaml(temp_project_yaml)
+        second = load_yaml(temp_project_yaml)
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_returns_independent_copies(self, temp_project_yaml):
+        """Mutating a loaded document does not leak into the cache."""
+        load_yaml(temp_project_yaml)["system_goal"] = "Changed"
+        assert load_yaml(temp_project_yaml)["system_goal"] == "Test Notes App"
+
+    def test_external_write_invalidates(self, temp_project_yaml):
+        """A write outside the store is picked up on the next load."""
+        load_yaml(temp_project_yaml)
+        data = yaml.safe_load(temp_project_yaml.read_text())
+        data["system_goal"] = "A different and longer goal"
+        temp_project_yaml.write_text(yaml.dump(data))
+
+        assert load_yaml(temp_project_yaml)["system_goal"] == "A different and longer goal"
+
+    def test_managers_see_each_others_writes(self, temp_project_yaml, notes_app_state):
+        """Pipeline and project managers stay consistent through the cache."""
+        from haytham.project.project_state import ProjectStateManager
+
+        pipeline = PipelineStateManager(temp_project_yaml.parent)
+        project = ProjectStateManager(temp_project_yaml.parent)
+        assert not pipeline.has_pipeline_state()
+
+        pipeline.save_pipeline_state(notes_app_state)
+
+        assert pipeline.has_pipeline_state()
+        assert project.get_system_goal() == "Test Notes App"
+
+    def test_write_yaml_round_trip(self, temp_session_dir):
+        """write_yaml output loads back unchanged."""
+        path = temp_session_dir / "nested" / "data.yaml"
+        data = {"b": [1, 2, {"c": "x"}], "a": None}
+        write_yaml(path, data)
+        assert load_yaml(path) == data
+        assert list(load_yaml(path)) == ["b", "a"]
+
+
 # ========== ID Generator Tests ==========
 
 
@@ -0,0 +1,55 @@
+"""Tests for per-stage prompt cache accounting in haytham.agents.utils.prompt_cache."""
+
+import concurrent.futures
+import contextvars
+
+from haytham.agents.utils.prompt_cache import (
+    cache_hit_ratio,
+    record_cache_usage,
+    track_prompt_cache,
+)
+
+USAGE = {"inputTokens": 100, "cacheReadInputTokens": 800, "cacheWriteInputTokens": 100}
+
+
+def test_hit_ratio():
+    assert cache_hit_ratio(100, 800, 100) == 0.8
+    assert cache_hit_ratio(0, 0, 0) == 0.0
+
+
+def test_usage_accumulates_within_scope():
+    with track_prompt_cache("market-context") as stats:
+        record_cache_usage(USAGE)
+        record_cache_usage({"inputTokens": 1000})
+    assert stats.invocations == 2
+    assert stats.cache_read_tokens == 800
+    assert stats.hit_ratio == 0.4
+
+
+def test_usage_outside_scope_is_ignored():
+    record_cache_usage(USAGE)
+    with track_prompt_cache("risk-assessment") as stats:
+        pass
+    assert stats.invocations == 0
+
+
+def test_nested_scopes_are_separate():
+    with track_prompt_cache("outer") as outer:
+        with track_prompt_cache("inner") as inner:
+            record_cache_usage(USAGE)
+        record_cache_usage(USAGE)
+    assert inner.invocations == 1
+    assert outer.invocations == 1
+
+
+def test_parallel_agents_count_towards_their_stage():
+    with track_prompt_cache("validation-summary") as stats:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, record_cache_usage, USAGE)
+                for _ in range(8)
+            ]
+            for future in futures:
+                future.result()
+    assert stats.invocations == 8
+    assert stats.cache_read_tokens == 6400
@@ -0,0 +1,106 @@
+"""Tests for haytham.workflow.prompt_layout."""
+
+import logging
+
+import pytest
+from strands.models.bedrock import BedrockModel
+from strands.models.model import CacheConfig
+
+from haytham.agents.utils.tokenizer import ApproximateTokenizer
+from haytham.workflow.context_builder import ContextSection
+from haytham.workflow.prompt_layout import (
+    CONTEXT_FIRST,
+    QUERY_FIRST,
+    assemble_prompt,
+    get_prompt_layout,
+)
+
+TOKENIZER = ApproximateTokenizer()
+
+GOAL = ContextSection("**ORIGINAL IDEA:**\nA scheduling SaaS for remote teams", required=True)
+ANCHOR = ContextSection("\n## Concept Anchor\n- Remote-first", required=True)
+
+
+def _stage(label: str, words: int = 10) -> ContextSection:
+    return ContextSection(f"**{label}:**\n" + " ".join(["word"] * words), priority=1)
+
+
+def _text_blocks(content):
+    return [block["text"] for block in content if "text" in block]
+
+
+class TestQueryFirst:
+    def test_matches_previous_format(self):
+        prompt = assemble_prompt("Analyze the market", [GOAL, _stage("Idea")], QUERY_FIRST)
+        assert prompt.text.startswith("Analyze the market\n\n## Context from Previous Stages:\n")
+        assert prompt.content == prompt.text
+
+    def test_without_context(self):
+        prompt = assemble_prompt("Analyze the market", [], CONTEXT_FIRST)
+        assert prompt.text == "Analyze the market"
+
+
+class TestContextFirst:
+    def test_stable_blocks_before_query(self):
+        prompt = assemble_prompt(
+            "Analyze the market", [GOAL, ANCHOR, _stage("Idea")], CONTEXT_FIRST, "openai"
+        )
+        assert prompt.text.index("ORIGINAL IDEA") < prompt.text.index("Idea:")
+        assert prompt.text.endswith("## Your Task:\nAnalyze the market")
+        assert prompt.content == prompt.text
+
+    def test_shared_prefix_across_stages(self):
+        """A later stage's prompt starts with an earlier stage's context."""
+        earlier = assemble_prompt("Query A", [GOAL, ANCHOR, _stage("Idea")], CONTEXT_FIRST)
+        later = assemble_prompt(
+            "Query B", [GOAL, ANCHOR, _stage("Idea"), _stage("Market")], CONTEXT_FIRST
+        )
+        shared = earlier.text.split("## Your Task:")[0].rstrip()
+        assert later.text.startswith(shared)
+
+    def test_cache_point_before_task_on_bedrock(self):
+        sections = [GOAL, ANCHOR, _stage("Idea", 3000), _stage("Market", 3000)]
+        prompt = assemble_prompt("Analyze", sections, CONTEXT_FIRST, "bedrock", TOKENIZER)
+        assert prompt.cache_points == 1
+        assert prompt.content[-2] == {"cachePoint": {"type": "default"}}
+        assert prompt.content[-1] == {"text": "## Your Task:\nAnalyze"}
+        assert "\n\n".join(_text_blocks(prompt.content)) == prompt.text
+
+    def test_cache_point_kept_by_auto_strategy(self, caplog):
+        """The SDK's auto cache strategy sends the checkpoint as placed."""
+        model = BedrockModel(
+            model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
+            region_name="us-east-1",
+            cache_config=CacheConfig(strategy="auto"),
+        )
+        sections = [GOAL, ANCHOR, _stage("Idea", 3000), _stage("Market", 3000)]
+        prompt = assemble_prompt("Analyze", sections, CONTEXT_FIRST, "bedrock", TOKENIZER)
+
+        with caplog.at_level(logging.WARNING):
+            messages = model._format_bedrock_messages([{"role": "user", "content": prompt.content}])
+
+        assert messages[0]["content"] == prompt.content
+        assert not caplog.records
+
+    def test_short_context_has_no_cache_points(self):
+        prompt = assemble_prompt("Analyze", [GOAL, _stage("Idea")], CONTEXT_FIRST, "bedrock")
+        assert prompt.cache_points == 0
+        assert prompt.content == prompt.text
+
+    def test_no_cache_points_for_other_providers(self):
+        sections = [GOAL, _stage("Idea", 3000)]
+        prompt = assemble_prompt("Analyze", sections, CONTEXT_FIRST, "anthropic", TOKENIZER)
+        assert prompt.content == prompt.text
+
+
+class TestGetPromptLayout:
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv("PROMPT_LAYOUT", raising=False)
+        assert get_prompt_layout() == QUERY_FIRST
+
+    @pytest.mark.parametrize(
+        "value,expected", [("CONTEXT_FIRST", CONTEXT_FIRST), ("bogus", QUERY_FIRST)]
+    )
+    def test_from_env(self, monkeypatch, value, expected):
+        monkeypatch.setenv("PROMPT_LAYOUT", value)
+        assert get_prompt_layout() == expected
@@ -0,0 +1,251 @@
+"""Tests for haytham.workflow.response_cache.
+
+Covers cache key composition, TTL/size eviction, replay mode, tool
+accumulator capture/restore, and the run_agent integration (hits skip agent
+creation, per-call opt-out bypasses the cache).
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from haytham.workflow import response_cache
+from haytham.workflow.agent_runner import run_agent
+from haytham.workflow.response_cache import (
+    CacheMissError,
+    CacheMode,
+    CacheSettings,
+    ResponseCache,
+    compute_cache_key,
+    get_response_cache,
+    lookup_response,
+    reset_response_cache,
+    store_response,
+)
+
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    """Point the process-wide cache at a temp dir in read_write mode."""
+    monkeypatch.setenv("LLM_CACHE_MODE", "read_write")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("LLM_PROVIDER", "bedrock")
+    reset_response_cache()
+    yield tmp_path / "cache"
+    reset_response_cache()
+
+
+def _settings(tmp_path, **overrides) -> CacheSettings:
+    defaults = {
+        "mode": CacheMode.READ_WRITE,
+        "cache_dir": tmp_path,
+        "ttl_seconds": 3600,
+        "max_entries": 100,
+    }
+    defaults.update(overrides)
+    return CacheSettings(**defaults)
+
+
+class TestCacheSettings:
+    def test_defaults_to_off(self, monkeypatch):
+        monkeypatch.delenv("LLM_CACHE_MODE", raising=False)
+        assert CacheSettings.from_env().mode is CacheMode.OFF
+
+    def test_invalid_mode_raises(self, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE_MODE", "sometimes")
+        with pytest.raises(ValueError, match="LLM_CACHE_MODE"):
+            CacheSettings.from_env()
+
+    def test_bad_integer_falls_back(self, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE_TTL_SECONDS", "soon")
+        assert CacheSettings.from_env().ttl_seconds == response_cache._DEFAULT_TTL_SECONDS
+
+
+class TestComputeCacheKey:
+    def test_stable_for_identical_inputs(self, cache_env):
+        key1, _ = compute_cache_key("concept_expansion", "query")
+        key2, _ = compute_cache_key("concept_expansion", "query")
+        assert key1 == key2
+
+    def test_changes_with_query(self, cache_env):
+        key1, _ = compute_cache_key("concept_expansion", "query")
+        key2, _ = compute_cache_key("concept_expansion", "query!")
+        assert key1 != key2
+
+    def test_changes_with_model_id(self, cache_env, monkeypatch):
+        key1, _ = compute_cache_key("concept_expansion", "query")
+        monkeypatch.setenv("BEDROCK_HEAVY_MODEL_ID", "some-other-model")
+        key2, _ = compute_cache_key("concept_expansion", "query")
+        assert key1 != key2
+
+    def test_changes_with_output_format(self, cache_env):
+        key1, _ = compute_cache_key("system_traits", "query", output_as_json=False)
+        key2, _ = compute_cache_key("system_traits", "query", output_as_json=True)
+        assert key1 != key2
+
+    def test_changes_with_tool_context(self, cache_env):
+        key1, _ = compute_cache_key("concept_expansion", "q", context={"a": "1"})
+        key2, _ = compute_cache_key("concept_expansion", "q", context={"a": "2"})
+        assert key1 != key2
+
+    def test_unknown_agent_raises(self, cache_env):
+        with pytest.raises(ValueError, match="Unknown agent"):
+            compute_cache_key("nonexistent_agent", "query")
+
+
+class TestResponseCache:
+    def test_roundtrip(self, tmp_path):
+        cache = ResponseCache(_settings(tmp_path))
+        cache.put("ab" * 32, {"output": "hello"})
+        assert cache.get("ab" * 32)["output"] == "hello"
+        assert cache.stats() == {"hits": 1, "misses": 0}
+
+    def test_miss_counted(self, tmp_path):
+        cache = ResponseCache(_settings(tmp_path))
+        assert cache.get("cd" * 32) is None
+        assert cache.stats() == {"hits": 0, "misses": 1}
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        cache = ResponseCache(_settings(tmp_path, ttl_seconds=10))
+        cache.put("ab" * 32, {"output": "old"})
+        with mock.patch("haytham.workflow.response_cache.time.time", return_value=time.time() + 60):
+            assert cache.get("ab" * 32) is None
+
+    def test_corrupt_entry_is_discarded(self, tmp_path):
+        cache = ResponseCache(_settings(tmp_path))
+        cache.put("ab" * 32, {"output": "x"})
+        path = cache._path_for("ab" * 32)
+        path.write_text("{not json")
+        assert cache.get("ab" * 32) is None
+        assert not path.exists()
+
+    def test_evicts_oldest_beyond_max_entries(self, tmp_path):
+        cache = ResponseCache(_settings(tmp_path, max_entries=2))
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, {"output": str(i)})
+            os.utime(cache._path_for(key), (1000 + i, 1000 + i))
+        cache.put("99" * 32, {"output": "new"})
+
+        remaining = {p.stem for p in tmp_path.glob("*/*.json")}
+        assert len(remaining) == 2
+        assert keys[0] not in remaining
+        assert "99" * 32 in remaining
+
+    def test_scans_only_when_over_max_entries_plus_slack(self, tmp_path):
+        cache = ResponseCache(_settings(tmp_path, max_entries=20))
+        with mock.patch.object(Path, "glob", autospec=True, side_effect=Path.glob) as glob:
+            for i in range(25):
+                cache.put(f"{i:02d}" * 32, {"output": str(i)})
+
+        # The first write and the 23rd (22 allowed), which evicts down to 20
+        assert glob.call_count == 2
+        assert len(list(tmp_path.glob("*/*.json"))) == 22
+
+    def test_clear(self, tmp_path):
+        cache = ResponseCache(_settings(tmp_path))
+        cache.put("ab" * 32, {"output": "x"})
+        assert cache.clear() == 1
+        assert cache.get("ab" * 32) is None
+
+
+class TestLookupAndStore:
+    def test_disabled_returns_no_key(self, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE_MODE", "off")
+        reset_response_cache()
+        try:
+            assert lookup_response("concept_expansion", "q") == (None, None)
+        finally:
+            reset_response_cache()
+
+    def test_store_then_lookup(self, cache_env):
+        output, key = lookup_response("concept_expansion", "q")
+        assert output is None and key
+        store_response("concept_expansion", key, "answer")
+        assert lookup_response("concept_expansion", "q") == ("answer", key)
+
+    def test_replay_miss_raises(self, cache_env, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE_MODE", "replay")
+        reset_response_cache()
+        with pytest.raises(CacheMissError):
+            lookup_response("concept_expansion", "never seen")
+
+    def test_replay_does_not_write(self, cache_env, monkeypatch):
+        _, key = compute_cache_key("concept_expansion", "q")
+        monkeypatch.setenv("LLM_CACHE_MODE", "replay")
+        reset_response_cache()
+        store_response("concept_expansion", key, "answer")
+        assert not list(cache_env.glob("*/*.json"))
+
+    def test_competitor_accumulator_restored_on_hit(self, cache_env):
+        from haytham.agents.tools.competitor_recording import (
+            clear_competitor_accumulator,
+            get_competitor_data,
+            restore_competitor_data,
+        )
+
+        restore_competitor_data({"market_positioning": {"switching_cost": "High"}})
+        _, key = lookup_response("competitor_analysis", "q")
+        store_response("competitor_analysis", key, "answer")
+
+        clear_competitor_accumulator()
+        output, _ = lookup_response("competitor_analysis", "q")
+        assert output == "answer"
+        assert get_competitor_data()["market_positioning"] == {"switching_cost": "High"}
+        clear_competitor_accumulator()
+
+    def test_scorecard_restored_on_hit(self, cache_env):
+        from haytham.agents.tools.recommendation import (
+            clear_scorecard,
+            get_scorecard,
+            init_scorecard,
+        )
+
+        init_scorecard(risk_level="LOW")
+        _, key = lookup_response("validation_scorer", "q")
+        store_response("validation_scorer", key, "answer")
+
+        clear_scorecard()
+        lookup_response("validation_scorer", "q")
+        assert get_scorecard()["risk_level"] == "LOW"
+        clear_scorecard()
+
+
+class TestRunAgentIntegration:
+    @mock.patch("haytham.agents.factory.agent_factory.create_agent_by_name")
+    def test_hit_skips_agent_creation(self, mock_create, cache_env):
+        agent = mock.MagicMock(return_value="fresh output")
+        mock_create.return_value = agent
+
+        with mock.patch(
+            "haytham.agents.output_utils.extract_text_from_result", return_value="fresh output"
+        ):
+            first = run_agent("concept_expansion", "q", {"system_goal": "idea"})
+            second = run_agent("concept_expansion", "q", {"system_goal": "idea"})
+
+        assert first["status"] == "completed"
+        assert second["output"] == "fresh output"
+        assert second["cached"] is True
+        assert mock_create.call_count == 1
+        assert get_response_cache().stats()["hits"] == 1
+
+    @mock.patch("haytham.agents.factory.agent_factory.create_agent_by_name")
+    def test_use_cache_false_bypasses(self, mock_create, cache_env):
+        mock_create.return_value = mock.MagicMock(return_value="out")
+
+        with mock.patch("haytham.agents.output_utils.extract_text_from_result", return_value="out"):
+            run_agent("concept_expansion", "q", {}, use_cache=False)
+            run_agent("concept_expansion", "q", {}, use_cache=False)
+
+        assert mock_create.call_count == 2
+        assert not list(cache_env.glob("*/*.json"))
+
+    def test_replay_miss_fails_without_provider(self, cache_env, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE_MODE", "replay")
+        reset_response_cache()
+
+        with pytest.raises(CacheMissError):
+            run_agent("concept_expansion", "uncached", {})
@@ -45,12 +45,10 @@ class TestHasActiveSession:
     def test_completed_session_returns_false(self, session_manager):
         """has_active_session returns False when session is completed."""
         session_manager.create_session()
-        # Manually update manifest to completed status
-        manifest_path = session_manager.session_dir / "session_manifest.md"
-        content = manifest_path.read_text()
-        content = content.replace("- Status: in_progress", "- Status: completed")
-        manifest_path.write_text(content)
+        session_manager.session_store.set_status("completed")
         assert not session_manager.has_active_session()
+        manifest_path = session_manager.session_dir / "session_manifest.md"
+        assert "- Status: completed" in manifest_path.read_text()
 
     def test_corrupted_manifest_returns_false(self, session_manager):
         """has_active_session returns False when manifest is corrupted."""
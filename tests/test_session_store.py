@@ -0,0 +1,114 @@
+"""Tests for SessionStore, the structured session state behind SessionManager."""
+
+import concurrent.futures
+import json
+from unittest import mock
+
+import pytest
+
+from haytham.session.formatting import create_manifest, update_manifest
+from haytham.session.session_manager import SessionManager
+from haytham.session.session_store import STATE_FILE, SessionStore
+from haytham.workflow.stage_registry import STAGES
+
+STAGE_LIST = [(s.slug, s.display_name) for s in STAGES]
+
+
+@pytest.fixture
+def session_manager(tmp_path):
+    manager = SessionManager(base_dir=str(tmp_path))
+    manager.create_session()
+    return manager
+
+
+class TestSessionStore:
+    def test_checkpoint_records_timings_and_agents(self, session_manager):
+        session_manager.save_checkpoint(
+            stage_slug="idea-analysis",
+            status="completed",
+            agents=[{"agent_name": "concept_expansion", "status": "completed"}],
+            started="2024-01-15T10:00:00Z",
+            completed="2024-01-15T10:03:00Z",
+            duration=180.0,
+            retry_count=1,
+        )
+
+        state = json.loads((session_manager.session_dir / STATE_FILE).read_text())
+        record = state["stages"]["idea-analysis"]
+        assert record["status"] == "completed"
+        assert record["duration"] == 180.0
+        assert record["retry_count"] == 1
+        assert record["agents"] == [{"agent_name": "concept_expansion", "status": "completed"}]
+        assert state["current_stage"] == "idea-analysis"
+
+        session = session_manager.load_session()
+        assert session["completed_stages"] == ["idea-analysis"]
+        assert session["stage_statuses"]["market-context"] == "pending"
+        manifest = (session_manager.session_dir / "session_manifest.md").read_text()
+        assert "| idea-analysis | Idea Analysis | completed | 2024-01-15T10:00:00Z |" in manifest
+        assert f"- Progress: 1 of {len(STAGES)}" in manifest
+
+    def test_status_checks_do_not_reparse(self, session_manager):
+        session_manager.has_active_session()
+        with mock.patch("haytham.session.session_store.json.loads") as loads:
+            for _ in range(20):
+                assert session_manager.has_active_session()
+        loads.assert_not_called()
+
+    def test_sees_writes_from_other_instances(self, session_manager, tmp_path):
+        other = SessionManager(base_dir=str(tmp_path))
+        assert other.has_active_session()
+
+        other.session_store.set_status("completed")
+
+        assert not session_manager.has_active_session()
+
+    def test_concurrent_writers_do_not_lose_updates(self, session_manager, tmp_path):
+        slugs = [s.slug for s in STAGES]
+        managers = [SessionManager(base_dir=str(tmp_path)) for _ in range(4)]
+
+        def checkpoint(i):
+            managers[i % len(managers)].save_checkpoint(
+                stage_slug=slugs[i], status="completed", agents=[]
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(checkpoint, range(len(slugs))))
+
+        assert session_manager.load_session()["completed_stages"] == slugs
+
+    def test_corrupted_state_reads_as_no_session(self, session_manager):
+        (session_manager.session_dir / STATE_FILE).write_text("{not json")
+        assert session_manager.load_session() is None
+        assert not session_manager.has_active_session()
+
+    def test_imports_legacy_manifest(self, tmp_path):
+        session_dir = tmp_path / "session"
+        session_dir.mkdir()
+        manifest = create_manifest(
+            stages=STAGE_LIST, created="2024-01-15T09:00:00Z", system_goal="X"
+        )
+        manifest = update_manifest(
+            manifest_content=manifest,
+            stage_slug="idea-analysis",
+            stage_display_name="Idea Analysis",
+            status="completed",
+            started=None,
+            completed=None,
+            duration=None,
+            total_stages=len(STAGE_LIST),
+            stages_list=STAGE_LIST,
+        )
+        (session_dir / "session_manifest.md").write_text(manifest)
+
+        store = SessionStore(session_dir, stages=STAGE_LIST)
+
+        assert store.status() == "in_progress"
+        assert store.summary()["completed_stages"] == ["idea-analysis"]
+        assert store.summary()["system_goal"] == "X"
+        assert (session_dir / STATE_FILE).exists()
+
+    def test_update_without_session_raises(self, tmp_path):
+        store = SessionStore(tmp_path, stages=STAGE_LIST)
+        with pytest.raises(FileNotFoundError):
+            store.update_stage("idea-analysis", status="completed")
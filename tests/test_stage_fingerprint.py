@@ -0,0 +1,198 @@
+"""Tests for haytham.workflow.stage_fingerprint.
+
+Covers input fingerprints, fingerprint records next to the stage checkpoint,
+and restoring unchanged stages when a workflow resumes.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from haytham.workflow import response_cache
+from haytham.workflow.anchor_schema import ConceptAnchor, Intent
+from haytham.workflow.stage_fingerprint import (
+    FINGERPRINT_FILE,
+    compute_input_fingerprint,
+    load_stage_record,
+    record_stage_inputs,
+    restore_unchanged_stages,
+)
+from haytham.workflow.stage_registry import get_stage_registry
+from haytham.workflow.workflow_specs import IDEA_VALIDATION_SPEC
+
+GOAL = "A scheduling SaaS for remote teams"
+
+
+class FakeSession:
+    """Minimal session: one ``output.md`` per stage directory."""
+
+    def __init__(self, session_dir: Path):
+        self.session_dir = session_dir
+
+    def save(self, stage_slug: str, output: str) -> None:
+        stage_dir = self.session_dir / stage_slug
+        stage_dir.mkdir(parents=True, exist_ok=True)
+        (stage_dir / "output.md").write_text(output)
+
+    def load_stage_output(self, stage_slug: str) -> str | None:
+        path = self.session_dir / stage_slug / "output.md"
+        return path.read_text() if path.exists() else None
+
+
+@pytest.fixture(autouse=True)
+def fixed_agents(monkeypatch):
+    """Describe agents without loading prompts or provider config."""
+    monkeypatch.setattr(
+        response_cache,
+        "describe_agent",
+        lambda name: {"agent_name": name, "model_id": "test-model", "system_prompt": "prompt"},
+    )
+
+
+@pytest.fixture
+def session(tmp_path):
+    return FakeSession(tmp_path)
+
+
+def _stage(slug):
+    return get_stage_registry().get_by_slug(slug)
+
+
+def _initial_state(session, **overrides):
+    state = {
+        "system_goal": GOAL,
+        "session_manager": session,
+        "concept_anchor": None,
+        "concept_anchor_str": "",
+        "archetype": "",
+        **IDEA_VALIDATION_SPEC.build_default_state(),
+    }
+    state.update(overrides)
+    return state
+
+
+def _complete(session, slug, state, output, **extra):
+    """Simulate a completed run of *slug* under *state*."""
+    from haytham.workflow.stage_executor import get_stage_executor
+
+    stage = _stage(slug)
+    fingerprint = get_stage_executor(slug).input_fingerprint(state)
+    session.save(slug, output)
+    record_stage_inputs(session, slug, fingerprint, {stage.state_key: output, **extra})
+    state.update({stage.state_key: output, stage.status_key: "completed", **extra})
+
+
+class TestComputeInputFingerprint:
+    def test_stable_for_same_inputs(self):
+        stage = _stage("market-context")
+        state = {"system_goal": GOAL, "idea_analysis": "analysis"}
+        assert compute_input_fingerprint(stage, state) == compute_input_fingerprint(
+            stage, dict(state)
+        )
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"system_goal": "Something else"},
+            {"idea_analysis": "revised analysis"},
+            {"concept_anchor_str": "anchor"},
+        ],
+    )
+    def test_changes_with_inputs(self, change):
+        stage = _stage("market-context")
+        state = {"system_goal": GOAL, "idea_analysis": "analysis"}
+        assert compute_input_fingerprint(stage, state) != compute_input_fingerprint(
+            stage, {**state, **change}
+        )
+
+    def test_changes_with_model(self, monkeypatch):
+        stage = _stage("market-context")
+        state = {"system_goal": GOAL, "idea_analysis": "analysis"}
+        before = compute_input_fingerprint(stage, state)
+        monkeypatch.setattr(
+            response_cache,
+            "describe_agent",
+            lambda name: {"agent_name": name, "model_id": "other-model", "system_prompt": "prompt"},
+        )
+        assert compute_input_fingerprint(stage, state) != before
+
+    def test_ignores_outputs_of_the_stage_itself(self):
+        """idea-analysis writes the anchor, so the anchor is not its input."""
+        stage = _stage("idea-analysis")
+        state = {"system_goal": GOAL, "idea_analysis": "", "concept_anchor_str": ""}
+        resumed = {**state, "idea_analysis": "old output", "concept_anchor_str": "anchor"}
+        assert compute_input_fingerprint(stage, state) == compute_input_fingerprint(stage, resumed)
+
+
+class TestStageRecord:
+    def test_record_written_next_to_checkpoint(self, session):
+        session.save("idea-analysis", "analysis")
+        assert record_stage_inputs(session, "idea-analysis", "abc", {"idea_analysis": "analysis"})
+        assert (session.session_dir / "idea-analysis" / FINGERPRINT_FILE).exists()
+        assert load_stage_record(session, "idea-analysis")["fingerprint"] == "abc"
+
+    def test_edited_output_invalidates_record(self, session):
+        session.save("idea-analysis", "analysis")
+        record_stage_inputs(session, "idea-analysis", "abc", {"idea_analysis": "analysis"})
+        session.save("idea-analysis", "edited by feedback")
+        assert load_stage_record(session, "idea-analysis") is None
+
+    def test_unserializable_state_not_recorded(self, session):
+        session.save("idea-analysis", "analysis")
+        assert not record_stage_inputs(session, "idea-analysis", "abc", {"x": object()})
+        assert load_stage_record(session, "idea-analysis") is None
+
+
+class TestRestoreUnchangedStages:
+    def test_unchanged_stages_restored(self, session):
+        first_run = _initial_state(session)
+        _complete(session, "idea-analysis", first_run, "analysis", concept_anchor_str="anchor")
+        _complete(session, "market-context", first_run, "market", switching_cost="low")
+
+        state = _initial_state(session, concept_anchor_str="anchor")
+        restored = restore_unchanged_stages([IDEA_VALIDATION_SPEC], session, state)
+
+        assert restored == ["idea_analysis", "market_context"]
+        assert state["market_context"] == "market"
+        assert state["market_context_status"] == "completed"
+        assert state["switching_cost"] == "low"
+        assert state["risk_assessment_status"] == "pending"
+
+    def test_restored_anchor_is_a_model(self, session):
+        anchor = ConceptAnchor(intent=Intent(goal="Schedule remote teams"))
+        first_run = _initial_state(session)
+        _complete(
+            session,
+            "idea-analysis",
+            first_run,
+            "analysis",
+            concept_anchor=anchor,
+            concept_anchor_str="anchor",
+        )
+
+        state = _initial_state(session, concept_anchor_str="anchor")
+        assert restore_unchanged_stages([IDEA_VALIDATION_SPEC], session, state) == ["idea_analysis"]
+        assert isinstance(state["concept_anchor"], ConceptAnchor)
+        assert state["concept_anchor"] == anchor
+
+    def test_changed_goal_restores_nothing(self, session):
+        first_run = _initial_state(session)
+        _complete(session, "idea-analysis", first_run, "analysis")
+
+        state = _initial_state(session, system_goal="A different idea")
+        assert restore_unchanged_stages([IDEA_VALIDATION_SPEC], session, state) == []
+        assert state["idea_analysis_status"] == "pending"
+
+    def test_rerun_upstream_invalidates_downstream(self, session):
+        """An edited market-context re-runs along with the stages that read it."""
+        first_run = _initial_state(session)
+        _complete(session, "idea-analysis", first_run, "analysis")
+        _complete(session, "market-context", first_run, "market")
+        _complete(session, "risk-assessment", first_run, "risks", risk_level="LOW")
+
+        session.save("market-context", "market, revised by feedback")
+        state = _initial_state(session)
+        restored = restore_unchanged_stages([IDEA_VALIDATION_SPEC], session, state)
+
+        assert restored == ["idea_analysis"]
+        assert state["risk_assessment_status"] == "pending"
@@ -0,0 +1,163 @@
+"""Tests for incremental agent output (haytham.workflow.stage_stream).
+
+Covers buffering and throttling in StageStream, the Strands callback
+handler, stream activation by WorkflowProgressHook, and run_agent /
+run_parallel_agents picking up the current stream.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from haytham.workflow.agent_runner import run_agent, run_parallel_agents
+from haytham.workflow.stage_stream import (
+    StageStream,
+    activate_stage_stream,
+    current_stage_stream,
+    deactivate_stage_stream,
+)
+from haytham.workflow.workflow_builder import WorkflowProgressHook
+
+
+def _stream(interval=0.0, tail_chars=1000):
+    updates = []
+    return StageStream("market_context", updates.append, interval, tail_chars), updates
+
+
+class TestStageStream:
+    def test_first_event_delivered_immediately(self):
+        stream, updates = _stream(interval=60)
+        stream.push_text("market_intelligence", "Hello")
+        stream.push_text("market_intelligence", " world")
+
+        assert len(updates) == 1
+        assert updates[0].text == {"market_intelligence": "Hello"}
+
+    def test_throttled_events_coalesce_into_next_update(self):
+        stream, updates = _stream(interval=60)
+        for chunk in ["a", "b", "c"]:
+            stream.push_text("agent", chunk)
+        stream.close()
+
+        assert len(updates) == 2
+        assert updates[-1].final
+        assert updates[-1].text == {"agent": "abc"}
+        assert updates[-1].chars == 3
+
+    def test_keeps_only_tail(self):
+        stream, updates = _stream(tail_chars=5)
+        stream.push_text("agent", "0123456789")
+        assert updates[-1].text["agent"] == "56789"
+        assert updates[-1].chars == 10
+
+    def test_handler_forwards_text_and_tools(self):
+        stream, updates = _stream()
+        handler = stream.handler("competitor_analysis")
+
+        handler(data="Searching")
+        handler(event={"contentBlockStart": {"start": {"toolUse": {"name": "web_search"}}}})
+        handler(result=object())  # final result events carry nothing to show
+
+        assert updates[-1].text == {"competitor_analysis": "Searching"}
+        assert updates[-1].tools == ("competitor_analysis: web_search",)
+        assert len(updates) == 2
+
+    def test_busy_consumer_does_not_block_producers(self):
+        release = threading.Event()
+        updates = []
+
+        def slow_consumer(update):
+            updates.append(update)
+            if len(updates) == 1:
+                release.wait(timeout=5)
+
+        stream = StageStream("stage", slow_consumer, interval=0.0)
+        consumer = threading.Thread(target=stream.push_text, args=("agent", "first"))
+        consumer.start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        stream.push_text("agent", " second")  # consumer still busy: buffered
+        assert time.monotonic() - started < 1
+
+        release.set()
+        consumer.join()
+        stream.close()
+        assert updates[-1].text == {"agent": "first second"}
+
+    def test_consumer_errors_are_logged_not_raised(self):
+        stream = StageStream("stage", mock.Mock(side_effect=RuntimeError("ui gone")), 0.0)
+        stream.push_text("agent", "x")
+        stream.close()
+
+
+class TestWorkflowProgressHook:
+    def test_stream_active_only_while_stage_runs(self):
+        updates = []
+        hook = WorkflowProgressHook(stage_order=["risk_assessment"], on_stage_stream=updates.append)
+        action = SimpleNamespace(name="risk_assessment")
+
+        hook.pre_run_step(action=action)
+        stream = current_stage_stream()
+        assert stream is not None and stream.stage == "risk_assessment"
+        stream.push_text("startup_validator", "Risk")
+
+        hook.post_run_step(action=action, state={}, result=None)
+
+        assert current_stage_stream() is None
+        assert updates[-1].final
+        assert updates[-1].text == {"startup_validator": "Risk"}
+
+    def test_no_stream_without_callback(self):
+        hook = WorkflowProgressHook(stage_order=["risk_assessment"])
+        hook.pre_run_step(action=SimpleNamespace(name="risk_assessment"))
+        assert current_stage_stream() is None
+
+
+class TestRunAgentStreaming:
+    def _run(self, stream=None):
+        agent = mock.MagicMock(return_value="result")
+        token = activate_stage_stream(stream)
+        try:
+            with (
+                mock.patch(
+                    "haytham.agents.factory.agent_factory.create_agent_by_name",
+                    return_value=agent,
+                ),
+                mock.patch(
+                    "haytham.agents.output_utils.extract_text_from_result", return_value="ok"
+                ),
+            ):
+                run_agent("concept_expansion", "q", {}, use_cache=False)
+        finally:
+            deactivate_stage_stream(token)
+        return agent
+
+    def test_installs_handler_when_stream_active(self):
+        stream, updates = _stream()
+        agent = self._run(stream)
+
+        agent.callback_handler(data="token")
+        assert updates[-1].text == {"concept_expansion": "token"}
+
+    def test_leaves_agent_untouched_without_stream(self):
+        agent = self._run()
+        assert isinstance(agent.callback_handler, mock.MagicMock)
+
+    def test_parallel_agents_see_current_stream(self):
+        stream, _ = _stream()
+        seen = []
+
+        def fake_run_agent(agent_name, **kwargs):
+            seen.append(current_stage_stream())
+            return {"status": "completed"}
+
+        token = activate_stage_stream(stream)
+        try:
+            with mock.patch("haytham.workflow.agent_runner.run_agent", side_effect=fake_run_agent):
+                run_parallel_agents([{"name": "a", "query": "q"}, {"name": "b", "query": "q"}], {})
+        finally:
+            deactivate_stage_stream(token)
+
+        assert seen == [stream, stream]
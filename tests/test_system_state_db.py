@@ -0,0 +1,624 @@
+"""Tests for haytham.state embedding and SystemStateDB bulk operations.
+
+Uses a deterministic fake embedder so LanceDB can be exercised locally
+without Bedrock.
+"""
+
+import hashlib
+import threading
+import warnings
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+
+from haytham.state.embedder import (
+    EmbeddingBatchError,
+    TitanEmbedder,
+    _AdaptiveLimiter,
+    _is_throttling_error,
+)
+from haytham.state.embedding_cache import EmbeddingCache, normalize_text
+from haytham.state.schema import create_decision, create_entity
+from haytham.state.vector_db import (
+    CompactionSettings,
+    DuplicateEntryError,
+    SystemStateDB,
+    VectorIndexSettings,
+    clear_state_db_registry,
+    get_state_db,
+)
+
+DIM = 1024
+
+
+def _vector_for(text: str) -> list[float]:
+    digest = hashlib.sha256(text.encode()).digest()
+    return [digest[i % len(digest)] / 255.0 for i in range(DIM)]
+
+
+class FakeEmbedder(TitanEmbedder):
+    """TitanEmbedder with the Bedrock call replaced by a hash-based vector."""
+
+    def __init__(self, fail_on: set[str] | None = None, cache: EmbeddingCache | None = None):
+        self._limiter = _AdaptiveLimiter(4)
+        self.cache = cache
+        self.fail_on = fail_on or set()
+        self.calls: list[str] = []
+        self._calls_lock = threading.Lock()
+
+    def _invoke_model(self, text: str) -> list[float]:
+        with self._calls_lock:
+            self.calls.append(text)
+        if any(marker in text for marker in self.fail_on):
+            raise RuntimeError(f"boom: {text[:20]}")
+        return _vector_for(text)
+
+
+class ThrottlingError(Exception):
+    def __init__(self):
+        super().__init__("ThrottlingException")
+        self.response = {"Error": {"Code": "ThrottlingException"}}
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SystemStateDB(tmp_path / "vector_db", embedder=FakeEmbedder())
+
+
+def _decision(name: str):
+    return create_decision(name=name, description=f"{name} description", rationale="because")
+
+
+# =============================================================================
+# TitanEmbedder.embed_batch
+# =============================================================================
+
+
+class TestEmbedBatch:
+    def test_preserves_order(self):
+        embedder = FakeEmbedder()
+        texts = [f"text {i}" for i in range(20)]
+        assert embedder.embed_batch(texts) == [_vector_for(t) for t in texts]
+
+    def test_identical_texts_embedded_once(self):
+        embedder = FakeEmbedder()
+        result = embedder.embed_batch(["same", "same", "other"])
+        assert result[0] == result[1]
+        assert sorted(embedder.calls) == ["other", "same"]
+
+    def test_partial_failure_reported(self):
+        embedder = FakeEmbedder(fail_on={"bad"})
+        result = embedder.embed_batch_partial(["good 1", "bad", "good 2"])
+        assert not result.ok
+        assert set(result.errors) == {1}
+        assert result.embeddings[1] is None
+        assert result.embeddings[0] == _vector_for("good 1")
+
+    def test_embed_batch_raises_with_partial_result(self):
+        embedder = FakeEmbedder(fail_on={"bad"})
+        with pytest.raises(EmbeddingBatchError) as exc_info:
+            embedder.embed_batch(["good", "bad"])
+        assert exc_info.value.result.embeddings[0] == _vector_for("good")
+
+    def test_empty_batch(self):
+        assert FakeEmbedder().embed_batch([]) == []
+
+    @mock.patch("haytham.state.embedder.time.sleep")
+    def test_throttle_retried_with_backoff(self, mock_sleep):
+        embedder = FakeEmbedder()
+        attempts = {"n": 0}
+        original = FakeEmbedder._invoke_model
+
+        def flaky(self, text):
+            attempts["n"] += 1
+            if attempts["n"] < 3:
+                raise ThrottlingError()
+            return original(self, text)
+
+        with mock.patch.object(FakeEmbedder, "_invoke_model", flaky):
+            assert embedder.embed_batch(["x"]) == [_vector_for("x")]
+        assert mock_sleep.call_count == 2
+
+    def test_non_throttle_error_not_retried(self):
+        embedder = FakeEmbedder(fail_on={"x"})
+        embedder.embed_batch_partial(["x"])
+        assert embedder.calls == ["x"]
+
+
+class TestEmbeddingCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.sqlite")
+        yield cache
+        cache.close()
+
+    def test_normalize_text(self):
+        assert normalize_text("  a \n\t b  ") == "a b"
+
+    def test_roundtrip_float32(self, cache):
+        cache.put("model", "text", [0.5, 0.25])
+        assert cache.get("model", "text") == [0.5, 0.25]
+
+    def test_keyed_by_model(self, cache):
+        cache.put("model-a", "text", [1.0])
+        assert cache.get("model-b", "text") is None
+
+    def test_whitespace_variants_share_entry(self, cache):
+        cache.put("model", "hello  world", [1.0])
+        assert cache.get("model", " hello world\n") == [1.0]
+
+    def test_get_many_chunks_large_lookups(self, cache):
+        texts = [f"text {i}" for i in range(1200)]
+        for i, text in enumerate(texts):
+            cache.put("model", text, [float(i)])
+
+        found = cache.get_many("model", [*texts, "missing"])
+
+        assert len(found) == 1200
+        assert found["text 1199"] == [1199.0]
+
+    def test_read_error_is_a_miss(self, cache):
+        cache.put("model", "text", [1.0])
+        cache._conn.execute("DROP TABLE embeddings")
+
+        assert cache.get_many("model", ["text"]) == {}
+        assert cache.misses == 1
+
+    def test_embed_hits_cache(self, cache):
+        embedder = FakeEmbedder(cache=cache)
+        first = embedder.embed("repeated query")
+        second = embedder.embed("repeated query")
+        assert embedder.calls == ["repeated query"]
+        assert second == pytest.approx(first)
+        assert embedder.cache_stats()["hits"] == 1
+
+    def test_batch_only_fetches_misses(self, cache):
+        embedder = FakeEmbedder(cache=cache)
+        embedder.embed("seen")
+        embedder.calls.clear()
+        result = embedder.embed_batch(["seen", "new"])
+        assert embedder.calls == ["new"]
+        assert result[0] == pytest.approx(_vector_for("seen"))
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "embeddings.sqlite"
+        FakeEmbedder(cache=EmbeddingCache(path)).embed("durable")
+        embedder = FakeEmbedder(cache=EmbeddingCache(path))
+        embedder.embed("durable")
+        assert embedder.calls == []
+
+    def test_supersede_cycle_reuses_embeddings(self, tmp_path, cache):
+        embedder = FakeEmbedder(cache=cache)
+        db = SystemStateDB(tmp_path / "vector_db", embedder=embedder)
+        old_id = db.add_entry(_decision("A"))
+        embedder.calls.clear()
+        db.supersede_entry(old_id, _decision("A"))
+        # The new entry has identical text, so its embedding is a cache hit
+        assert embedder.calls == []
+
+    def test_disabled_by_env(self, monkeypatch):
+        from haytham.state.embedding_cache import get_default_embedding_cache
+
+        monkeypatch.setenv("EMBEDDING_CACHE_ENABLED", "false")
+        assert get_default_embedding_cache() is None
+
+
+class TestAdaptiveLimiter:
+    def test_throttle_halves_and_success_recovers(self):
+        limiter = _AdaptiveLimiter(8)
+        limiter.on_throttle()
+        assert limiter._limit == 4
+        limiter.on_throttle()
+        limiter.on_throttle()
+        limiter.on_throttle()
+        assert limiter._limit == 1
+        for _ in range(20):
+            limiter.on_success()
+        assert limiter._limit == 8
+
+    def test_is_throttling_error(self):
+        assert _is_throttling_error(ThrottlingError())
+        assert not _is_throttling_error(ValueError("bad input"))
+
+
+# =============================================================================
+# SystemStateDB.add_entries
+# =============================================================================
+
+
+class TestAddEntries:
+    def test_bulk_add_assigns_ids_in_order(self, db):
+        ids = db.add_entries([_decision("A"), _decision("B"), _decision("C")])
+        assert ids == ["DEC-001", "DEC-002", "DEC-003"]
+        assert db.count("decision") == 3
+        assert db.get_by_id("DEC-002")["name"] == "B"
+
+    def test_bulk_add_single_table_append(self, db):
+        db.add_entry(_decision("Seed"))
+        with mock.patch.object(db._table, "add", wraps=db._table.add) as spy:
+            db.add_entries([_decision(f"D{i}") for i in range(5)])
+        assert spy.call_count == 1
+
+    def test_existing_duplicate_raises_before_writing(self, db):
+        db.add_entry(_decision("A"))
+        with pytest.raises(DuplicateEntryError):
+            db.add_entries([_decision("B"), _decision("A")])
+        assert db.count("decision") == 1
+
+    def test_in_batch_duplicate_detected(self, db):
+        with pytest.raises(DuplicateEntryError):
+            db.add_entries([_decision("A"), _decision("A")])
+
+    def test_skip_duplicates(self, db):
+        db.add_entry(_decision("A"))
+        ids = db.add_entries([_decision("A"), _decision("B")], skip_duplicates=True)
+        assert ids == ["DEC-002"]
+
+    def test_failed_duplicate_check_writes_nothing(self, db):
+        db.add_entry(_decision("A"))
+        with (
+            mock.patch.object(db, "_scan", side_effect=OSError("table unreadable")),
+            pytest.raises(OSError),
+        ):
+            db.add_entries([_decision("A"), _decision("B")], skip_duplicates=True)
+        assert db.count("decision") == 1
+
+    def test_same_name_different_type_allowed(self, db):
+        entity = create_entity(name="A", description="entity A")
+        ids = db.add_entries([_decision("A"), entity])
+        assert len(ids) == 2
+
+    def test_embedding_failures_skipped(self, tmp_path):
+        db = SystemStateDB(tmp_path / "vdb", embedder=FakeEmbedder(fail_on={"Broken"}))
+        ids = db.add_entries([_decision("Fine"), _decision("Broken")])
+        assert ids == ["DEC-001"]
+        assert db.count("decision") == 1
+
+    def test_empty(self, db):
+        assert db.add_entries([]) == []
+
+
+# =============================================================================
+# Handle registry and lazy ID counters
+# =============================================================================
+
+
+class TestStateDBRegistry:
+    @pytest.fixture(autouse=True)
+    def _clean_registry(self):
+        clear_state_db_registry()
+        yield
+        clear_state_db_registry()
+
+    def test_same_path_returns_same_handle(self, tmp_path):
+        path = tmp_path / "vector_db"
+        first = get_state_db(path, embedder=FakeEmbedder())
+        assert get_state_db(str(path)) is first
+        assert get_state_db(tmp_path / "." / "vector_db") is first
+
+    def test_recreated_directory_gets_new_handle(self, tmp_path):
+        import shutil
+
+        path = tmp_path / "vector_db"
+        first = get_state_db(path, embedder=FakeEmbedder())
+        first.add_entry(_decision("A"))
+        shutil.rmtree(path)
+        path.mkdir()
+
+        second = get_state_db(path, embedder=FakeEmbedder())
+        assert second is not first
+        assert second.count() == 0
+
+    def test_session_reset_releases_handle(self, tmp_path):
+        from haytham.session.session_manager import SessionManager
+        from haytham.state import vector_db
+
+        session_manager = SessionManager(str(tmp_path))
+        session_manager.create_session()
+        get_state_db(session_manager.session_dir / "vector_db", embedder=FakeEmbedder())
+
+        session_manager.create_session()
+
+        assert vector_db._registry == {}
+
+    def test_reads_see_table_created_by_other_handle(self, tmp_path):
+        reader = SystemStateDB(tmp_path / "vector_db", embedder=FakeEmbedder())
+        writer = SystemStateDB(tmp_path / "vector_db", embedder=FakeEmbedder())
+        entry_id = writer.add_entry(_decision("A"))
+
+        assert reader.count() == 1
+        assert reader.get_by_id(entry_id)["name"] == "A"
+        assert len(reader.get_current_state_arrow()) == 1
+
+    def test_concurrent_writers_get_unique_ids(self, tmp_path):
+        db = get_state_db(tmp_path / "vector_db", embedder=FakeEmbedder())
+        ids: list[str] = []
+        ids_lock = threading.Lock()
+
+        def add(i):
+            entry_id = db.add_entry(_decision(f"D{i}"))
+            with ids_lock:
+                ids.append(entry_id)
+
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(set(ids)) == 8
+        assert db.count("decision") == 8
+
+
+class TestLazyIdCounters:
+    def test_open_does_not_scan(self, tmp_path):
+        path = tmp_path / "vector_db"
+        SystemStateDB(path, embedder=FakeEmbedder()).add_entry(_decision("A"))
+        with mock.patch.object(SystemStateDB, "_sync_id_counters") as sync:
+            db = SystemStateDB(path, embedder=FakeEmbedder())
+            db.get_current_state()
+        sync.assert_not_called()
+
+    def test_reopen_continues_numbering(self, tmp_path):
+        path = tmp_path / "vector_db"
+        SystemStateDB(path, embedder=FakeEmbedder()).add_entries([_decision("A"), _decision("B")])
+        assert SystemStateDB(path, embedder=FakeEmbedder()).add_entry(_decision("C")) == "DEC-003"
+
+    def test_sidecar_skips_scan(self, tmp_path):
+        path = tmp_path / "vector_db"
+        SystemStateDB(path, embedder=FakeEmbedder()).add_entry(_decision("A"))
+        db = SystemStateDB(path, embedder=FakeEmbedder())
+        with mock.patch.object(db._table, "search", wraps=db._table.search) as search:
+            db._sync_id_counters()
+        search.assert_not_called()
+        assert db.id_generator.next_id("decision") == "DEC-002"
+
+    def test_stale_sidecar_triggers_rescan(self, tmp_path):
+        path = tmp_path / "vector_db"
+        writer = SystemStateDB(path, embedder=FakeEmbedder())
+        writer.add_entry(_decision("A"))
+        stale = (path / SystemStateDB.ID_COUNTERS_FILE).read_text()
+        writer.add_entry(_decision("B"))
+        (path / SystemStateDB.ID_COUNTERS_FILE).write_text(stale)
+
+        assert SystemStateDB(path, embedder=FakeEmbedder()).add_entry(_decision("C")) == "DEC-003"
+
+    def test_sees_writes_from_other_handle(self, tmp_path):
+        path = tmp_path / "vector_db"
+        first = SystemStateDB(path, embedder=FakeEmbedder())
+        first.add_entry(_decision("A"))
+        second = SystemStateDB(path, embedder=FakeEmbedder())
+        second.add_entry(_decision("B"))
+
+        assert first.add_entry(_decision("C")) == "DEC-003"
+
+
+# =============================================================================
+# Scalar indexes and projected reads
+# =============================================================================
+
+
+class TestScalarIndexesAndProjection:
+    def test_indexes_created_on_first_write(self, db):
+        db.add_entry(_decision("A"))
+        indexed = {col for idx in db._table.list_indices() for col in idx.columns}
+        assert {"id", "name", "type", "superseded_by"} <= indexed
+
+    def test_indexes_added_when_opening_unindexed_table(self, tmp_path):
+        path = tmp_path / "vector_db"
+        db = SystemStateDB(path, embedder=FakeEmbedder())
+        db.add_entry(_decision("A"))
+        for idx in db._table.list_indices():
+            db._table.drop_index(idx.name)
+
+        reopened = SystemStateDB(path, embedder=FakeEmbedder())
+        assert {c for idx in reopened._table.list_indices() for c in idx.columns} >= {"id", "type"}
+
+    def test_lookup_uses_scalar_index(self, db):
+        db.add_entry(_decision("A"))
+        plan = db._table.search().select(["id"]).where("id = 'DEC-001'").explain_plan()
+        assert "ScalarIndexQuery" in plan
+
+    def test_reads_never_materialize_vectors(self, db):
+        db.add_entries([_decision("A"), _decision("B")])
+        assert "vector" not in db.get_current_state_arrow().column_names
+        assert "vector" not in db.get_by_id("DEC-001")
+        assert db.find_by_name("B")["id"] == "DEC-002"
+
+    def test_column_projection(self, db):
+        db.add_entry(_decision("A"))
+        rows = db.get_current_state(entry_type="decision", columns=["id", "name"])
+        assert rows == [{"id": "DEC-001", "name": "A"}]
+
+    def test_arrow_excludes_superseded(self, db):
+        old_id = db.add_entry(_decision("A"))
+        new_id = db.supersede_entry(old_id, _decision("A"))
+        table = db.get_current_state_arrow(entry_type="decision", columns=["id"])
+        assert table.column("id").to_pylist() == [new_id]
+
+    def test_batches_cover_all_rows(self, db):
+        db.add_entries([_decision(f"D{i}") for i in range(10)])
+        batches = list(db.iter_current_batches(columns=["id"], batch_size=3))
+        assert sum(b.num_rows for b in batches) == 10
+
+    def test_count_uses_count_rows(self, db):
+        db.add_entries([_decision("A"), create_entity(name="E", description="e")])
+        assert db.count() == 2
+        assert db.count("entity") == 1
+
+    def test_empty_database(self, tmp_path):
+        db = SystemStateDB(tmp_path / "empty", embedder=FakeEmbedder())
+        assert db.get_current_state_arrow(columns=["id"]).num_rows == 0
+        assert list(db.iter_current_batches()) == []
+        assert db.count() == 0
+
+
+# =============================================================================
+# ANN index management and filtered search
+# =============================================================================
+
+
+class TestVectorIndex:
+    @pytest.fixture
+    def small_index_db(self, tmp_path):
+        settings = VectorIndexSettings(index_type="IVF_PQ", min_rows=300, refresh_rows=50)
+        return SystemStateDB(
+            tmp_path / "vector_db", embedder=FakeEmbedder(), index_settings=settings
+        )
+
+    def test_no_index_below_threshold(self, db):
+        db.add_entries([_decision(f"D{i}") for i in range(5)])
+        assert db._vector_index_name() is None
+
+    def test_index_built_when_threshold_crossed(self, small_index_db):
+        small_index_db.add_entries([_decision(f"D{i}") for i in range(300)])
+        assert small_index_db._vector_index_name() is not None
+
+    @pytest.mark.parametrize(
+        "index_type,built", [("IVF_PQ", "IvfPq"), ("IVF_HNSW_SQ", "IvfHnswSq")]
+    )
+    def test_index_types_without_deprecated_api(self, tmp_path, index_type, built):
+        settings = VectorIndexSettings(index_type=index_type, min_rows=300)
+        db = SystemStateDB(tmp_path / "vector_db", embedder=FakeEmbedder(), index_settings=settings)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            db.add_entries([_decision(f"D{i}") for i in range(300)])
+
+        index_types = {idx.columns[0]: idx.index_type for idx in db._table.list_indices()}
+        assert index_types["vector"] == built
+        assert index_types["type"] == "Bitmap"
+        assert not [w for w in caught if "index" in str(w.message).lower()]
+
+    def test_index_refreshed_after_bulk_insert(self, small_index_db):
+        db = small_index_db
+        db.add_entries([_decision(f"D{i}") for i in range(300)])
+        name = db._vector_index_name()
+        db.add_entries([_decision(f"E{i}") for i in range(60)])
+        assert db._table.index_stats(name).num_unindexed_rows == 0
+
+    def test_small_append_left_unindexed(self, small_index_db):
+        db = small_index_db
+        db.add_entries([_decision(f"D{i}") for i in range(300)])
+        db.add_entry(_decision("Late"))
+        assert db._table.index_stats(db._vector_index_name()).num_unindexed_rows == 1
+
+    def test_indexed_search_finds_exact_match(self, small_index_db):
+        db = small_index_db
+        db.add_entries([_decision(f"D{i}") for i in range(300)])
+        target = db.get_by_id("DEC-042")
+        query = create_decision(name="D41", description="D41 description", rationale="because")
+        results = db.find_similar(query.get_text_for_embedding(), limit=1, refine_factor=5)
+        assert results[0]["id"] == target["id"]
+
+    def test_prefilter_excludes_superseded(self, db):
+        old_id = db.add_entry(_decision("A"))
+        new_id = db.supersede_entry(old_id, _decision("A"))
+        db.add_entry(create_entity(name="A", description="A description"))
+
+        results = db.find_similar("A description", entry_type="decision", limit=5)
+        assert [r["id"] for r in results] == [new_id]
+
+    def test_settings_from_env(self, monkeypatch):
+        monkeypatch.setenv("STATE_DB_ANN_INDEX_TYPE", "ivf_hnsw_sq")
+        monkeypatch.setenv("STATE_DB_NPROBES", "40")
+        settings = VectorIndexSettings.from_env()
+        assert settings.index_type == "IVF_HNSW_SQ"
+        assert settings.nprobes == 40
+
+    def test_invalid_index_type(self, monkeypatch):
+        monkeypatch.setenv("STATE_DB_ANN_INDEX_TYPE", "FLAT")
+        with pytest.raises(ValueError, match="STATE_DB_ANN_INDEX_TYPE"):
+            VectorIndexSettings.from_env()
+
+
+# =============================================================================
+# Supersede and compaction
+# =============================================================================
+
+
+class TestSupersede:
+    def test_single_commit_per_supersede(self, db):
+        old_id = db.add_entry(_decision("A"))
+        version = db._table.version
+        new_id = db.supersede_entry(old_id, _decision("A"))
+
+        assert db._table.version == version + 1
+        assert db.get_by_id(old_id)["superseded_by"] == new_id
+        assert db.get_by_id(new_id)["supersedes"] == old_id
+
+    def test_old_vector_not_re_embedded(self, db):
+        old_id = db.add_entry(_decision("A"))
+        db.embedder.calls.clear()
+        db.supersede_entry(old_id, _decision("A v2"))
+        assert len(db.embedder.calls) == 1
+        assert "A v2" in db.embedder.calls[0]
+
+    def test_batch_supersede(self, db):
+        ids = db.add_entries([_decision("A"), _decision("B")])
+        version = db._table.version
+        new_ids = db.supersede_entries([(ids[0], _decision("A")), (ids[1], _decision("B"))])
+
+        assert new_ids == ["DEC-003", "DEC-004"]
+        assert db._table.version == version + 1
+        assert {e["id"] for e in db.get_decisions()} == set(new_ids)
+        assert [e["id"] for e in db.get_history("DEC-004")] == ["DEC-004", "DEC-002"]
+
+    def test_missing_old_id_writes_nothing(self, db):
+        old_id = db.add_entry(_decision("A"))
+        version = db._table.version
+        with pytest.raises(ValueError, match="DEC-999"):
+            db.supersede_entries([(old_id, _decision("A")), ("DEC-999", _decision("Z"))])
+        assert db._table.version == version
+
+    def test_repeated_old_id_rejected(self, db):
+        old_id = db.add_entry(_decision("A"))
+        with pytest.raises(ValueError, match="once"):
+            db.supersede_entries([(old_id, _decision("A")), (old_id, _decision("A"))])
+
+    def test_already_superseded_rejected(self, db):
+        old_id = db.add_entry(_decision("A"))
+        new_id = db.supersede_entry(old_id, _decision("A"))
+        version = db._table.version
+        with pytest.raises(ValueError, match=f"already superseded by {new_id}"):
+            db.supersede_entry(old_id, _decision("A"))
+        assert db._table.version == version
+        assert [e["id"] for e in db.get_decisions()] == [new_id]
+
+    def test_embedding_failure_writes_nothing(self, tmp_path):
+        db = SystemStateDB(tmp_path / "vdb", embedder=FakeEmbedder(fail_on={"Broken"}))
+        old_id = db.add_entry(_decision("A"))
+        with pytest.raises(EmbeddingBatchError):
+            db.supersede_entry(old_id, _decision("Broken"))
+        assert db.get_by_id(old_id)["superseded_by"] is None
+
+
+class TestCompaction:
+    def test_compacts_after_small_fragments_pile_up(self, tmp_path):
+        db = SystemStateDB(
+            tmp_path / "vector_db",
+            embedder=FakeEmbedder(),
+            compaction_settings=CompactionSettings(min_small_fragments=5),
+        )
+        for i in range(6):
+            db.add_entry(_decision(f"D{i}"))
+
+        assert db._table.stats()["fragment_stats"]["num_fragments"] < 5
+        assert db.count() == 6
+
+    def test_compact_drops_old_versions(self, db):
+        old_id = db.add_entry(_decision("A"))
+        for _ in range(3):
+            old_id = db.supersede_entry(old_id, _decision("A"))
+        before = len(db._table.list_versions())
+
+        db.compact(retain=timedelta(0))
+
+        assert len(db._table.list_versions()) < before
+        assert db.get_decisions()[0]["id"] == old_id
+
+    def test_ids_continue_after_compaction(self, db):
+        db.add_entries([_decision("A"), _decision("B")])
+        db.compact(retain=timedelta(0))
+        reopened = SystemStateDB(db.db_path, embedder=FakeEmbedder())
+        assert reopened.add_entry(_decision("C")) == "DEC-003"
@@ -0,0 +1,140 @@
+"""Tests for haytham.agents.utils.tokenizer.
+
+Covers the BPE-style approximation, per-provider tokenizer selection,
+cached counting, and token-exact truncation.
+"""
+
+import pytest
+
+from haytham.agents.utils import tokenizer as tokenizer_module
+from haytham.agents.utils.tokenizer import (
+    ApproximateTokenizer,
+    Tokenizer,
+    clear_token_cache,
+    count_tokens,
+    get_tokenizer,
+    register_tokenizer,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+class CountingTokenizer(Tokenizer):
+    """One token per character; records how often it is asked to count."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text):
+        self.calls += 1
+        return len(text)
+
+
+class TestApproximateTokenizer:
+    def test_letter_runs_at_four_chars_per_token(self):
+        assert ApproximateTokenizer().count("a" * 400) == 100
+
+    def test_empty_text(self):
+        assert ApproximateTokenizer().count("") == 0
+
+    def test_symbols_digits_and_newlines_cost_more_than_chars_over_four(self):
+        text = '{"arr": 1234567, "tam": "$2.5B"}\n\n- item\n- item'
+        assert ApproximateTokenizer().count(text) > len(text) // 4
+
+    def test_single_spaces_merge_into_words(self):
+        tokenizer = ApproximateTokenizer()
+        assert tokenizer.count("the cat is big") == 4
+
+    def test_accented_latin_costed_like_ascii(self):
+        tokenizer = ApproximateTokenizer()
+        accented = "Der Bär läuft schnell über die Straße"
+        assert tokenizer.count(accented) == tokenizer.count(
+            "Der Bar lauft schnell uber die Strasse"
+        )
+
+    def test_cjk_costs_one_token_per_character(self):
+        assert ApproximateTokenizer().count("日本語のテキスト") == 8
+
+    def test_truncate_fits_budget(self):
+        tokenizer = ApproximateTokenizer()
+        text = "Revenue grew quickly. " * 50
+        truncated = tokenizer.truncate(text, 20)
+        assert text.startswith(truncated)
+        assert tokenizer.count(truncated) <= 20
+        assert tokenizer.count(text[: len(truncated) + 8]) > 20
+
+    def test_truncate_keeps_short_text(self):
+        assert ApproximateTokenizer().truncate("short text", 100) == "short text"
+
+
+class TestGenericTruncate:
+    def test_binary_search_finds_longest_prefix(self):
+        assert CountingTokenizer().truncate("abcdefghij", 4) == "abcd"
+
+    def test_zero_budget(self):
+        assert CountingTokenizer().truncate("abc", 0) == ""
+
+    def test_count_is_abstract(self):
+        with pytest.raises(TypeError):
+            Tokenizer()
+
+
+class TestGetTokenizer:
+    @pytest.mark.parametrize("provider", ["bedrock", "anthropic"])
+    def test_claude_providers_share_approximation(self, provider):
+        assert get_tokenizer(provider).name == "claude-approx"
+
+    def test_defaults_to_env_provider(self, monkeypatch):
+        monkeypatch.setenv("LLM_PROVIDER", "anthropic")
+        assert get_tokenizer() is get_tokenizer("anthropic")
+
+    def test_unknown_provider_falls_back(self):
+        assert isinstance(get_tokenizer("mystery"), ApproximateTokenizer)
+
+    def test_openai_without_tiktoken_approximates(self, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def no_tiktoken(name, *args, **kwargs):
+            if name == "tiktoken":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_tiktoken)
+        assert isinstance(get_tokenizer("openai", "gpt-4o"), ApproximateTokenizer)
+
+    def test_register_tokenizer(self, monkeypatch):
+        monkeypatch.setattr(tokenizer_module, "_TOKENIZER_FACTORIES", {})
+        custom = CountingTokenizer()
+        register_tokenizer("ollama", lambda model_id: custom)
+        assert get_tokenizer("ollama", "llama3.1:8b") is custom
+
+
+class TestCountTokens:
+    def test_long_texts_counted_once(self):
+        tokenizer = CountingTokenizer()
+        text = "x" * 1000
+        assert count_tokens(text, tokenizer) == 1000
+        assert count_tokens(text, tokenizer) == 1000
+        assert tokenizer.calls == 1
+
+    def test_short_texts_not_cached(self):
+        tokenizer = CountingTokenizer()
+        count_tokens("short", tokenizer)
+        count_tokens("short", tokenizer)
+        assert tokenizer.calls == 2
+
+    def test_lone_surrogate_is_hashable(self):
+        text = "x" * 300 + "\ud83d"
+        assert count_tokens(text, CountingTokenizer()) == 301
+
+    def test_none_is_zero(self):
+        assert count_tokens(None) == 0
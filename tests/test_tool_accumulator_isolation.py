@@ -0,0 +1,91 @@
+"""Tests for context-scoped tool accumulators.
+
+The Stage-Gate scorecard and competitor accumulator must be shared between a
+stage and the tool calls of the agent it runs (Strands copies the caller's
+context into its worker threads) but isolated between concurrent sessions.
+"""
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from haytham.agents.tools.competitor_recording import (
+    clear_competitor_accumulator,
+    get_competitor_data,
+    record_competitor,
+)
+from haytham.agents.tools.recommendation import (
+    get_scorecard,
+    init_scorecard,
+    record_knockout,
+)
+
+
+def _run_like_strands(fn, *args):
+    """Run fn in a worker thread with a copy of the caller's context."""
+    with ThreadPoolExecutor() as executor:
+        return executor.submit(contextvars.copy_context().run, fn, *args).result()
+
+
+def _record(name: str) -> None:
+    record_competitor(name=name, url="", traction="", target_segment="", jtbd_match="Direct")
+
+
+class TestSharedWithAgentTools:
+    def test_tool_calls_in_worker_thread_reach_caller(self):
+        clear_competitor_accumulator()
+        _run_like_strands(_record, "Acme")
+
+        assert [c["name"] for c in get_competitor_data()["competitors"]] == ["Acme"]
+
+    def test_scorecard_initialized_by_caller_seen_by_tools(self):
+        init_scorecard(risk_level="low")
+        _run_like_strands(record_knockout, "Problem Reality", "PASS", "Users complain")
+
+        scorecard = get_scorecard()
+        assert scorecard["risk_level"] == "LOW"
+        assert len(scorecard["knockouts"]) == 1
+
+
+class TestIsolatedBetweenSessions:
+    def test_concurrent_validations_do_not_mix(self):
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def session(name: str, risk: str) -> None:
+            clear_competitor_accumulator()
+            init_scorecard(risk_level=risk)
+            barrier.wait()  # both sessions initialized before either records
+            _run_like_strands(_record, name)
+            _run_like_strands(record_knockout, f"{name} check", "PASS", "evidence")
+            barrier.wait()
+            results[name] = (get_competitor_data(), get_scorecard())
+
+        threads = [
+            threading.Thread(target=session, args=("Acme", "HIGH")),
+            threading.Thread(target=session, args=("Globex", "LOW")),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for name, risk in (("Acme", "HIGH"), ("Globex", "LOW")):
+            competitors, scorecard = results[name]
+            assert [c["name"] for c in competitors["competitors"]] == [name]
+            assert scorecard["risk_level"] == risk
+            assert [k["criterion"] for k in scorecard["knockouts"]] == [f"{name} check"]
+
+    def test_reinitializing_in_copied_context_leaves_caller_untouched(self):
+        clear_competitor_accumulator()
+        _record("Caller")
+
+        def other_stage():
+            clear_competitor_accumulator()
+            _record("Other")
+            return get_competitor_data()
+
+        other = _run_like_strands(other_stage)
+
+        assert [c["name"] for c in other["competitors"]] == ["Other"]
+        assert [c["name"] for c in get_competitor_data()["competitors"]] == ["Caller"]